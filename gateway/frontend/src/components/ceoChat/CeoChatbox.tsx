@@ -12,6 +12,7 @@ import {
   createCeoConsoleApi,
   getAttachedPreviewPayload,
 } from "./api";
+import { applyStreamChunk } from "./normalize";
 import { defaultStrings } from "./strings";
 import { useAutoScroll } from "./hooks";
 import { useSpeechSynthesis } from "../../hooks/useSpeechSynthesis";
@@ -2197,7 +2198,7 @@ export const CeoChatbox: React.FC<CeoChatboxProps> = ({
         let acc = "";
         try {
           for await (const chunk of (resp as any).stream) {
-            acc += chunk;
+            acc = applyStreamChunk(acc, chunk);
             updateItem(placeholderId, { content: acc, status: "streaming" });
             if (isPinnedToBottom) scrollToBottom(false);
           }
@@ -12,6 +12,7 @@
 // - NEW: daje helper metodu za Notion page read (POST /api/notion/read) — SAFE READ
 
 import { normalizeConsoleResponse, streamTextFromResponse } from "./normalize";
+import type { StreamReset } from "./normalize";
 
 export type ProposedCommand = {
   command?: string;
@@ -103,8 +104,8 @@ export type NormalizedConsoleResponse = {
   raw?: any;
   source_endpoint?: string;
 
-  // streaming (UI reads this)
-  stream?: AsyncIterable<string>;
+  // streaming (UI reads this; fold chunks with applyStreamChunk)
+  stream?: AsyncIterable<string | StreamReset>;
 };
 
 export type CeoCommandRequest = {
@@ -882,7 +883,8 @@ export function createCeoConsoleApi(opts: {
             url: streamUrl,
             payload,
             signal,
-            headers,
+            // Live token deltas; the stream reader handles assistant.reset.
+            headers: { ...headers, "X-Live-Deltas": "1" },
           });
         } catch (e: any) {
           const msg = typeof e?.message === "string" ? e.message : String(e);
@@ -151,10 +151,21 @@ export function normalizeConsoleResponse(
   return [normalizeCeoConsoleMessage(input, "m_0")];
 }
 
+/**
+ * assistant.reset: already streamed text diverged from the final answer,
+ * drop the last discardChars characters before appending further deltas.
+ */
+export type StreamReset = { reset: true; discardChars: number };
+
+export function applyStreamChunk(acc: string, chunk: string | StreamReset): string {
+  if (typeof chunk === "string") return acc + chunk;
+  return acc.slice(0, Math.max(0, acc.length - chunk.discardChars));
+}
+
 /**
  * api.ts očekuje string → stream helper
  */
-export function streamTextFromResponse(input: any): AsyncIterable<string> {
+export function streamTextFromResponse(input: any): AsyncIterable<string | StreamReset> {
   // Back-compat: if this isn't a fetch Response-like object, keep legacy behavior.
   const body = (input as any)?.body;
   const hasReader = body && typeof body.getReader === "function";
@@ -211,6 +222,16 @@ export function streamTextFromResponse(input: any): AsyncIterable<string> {
             continue;
           }
 
+          if (type === "assistant.reset") {
+            const n = Number(evt?.data?.discard_chars);
+            const reset: StreamReset = {
+              reset: true,
+              discardChars: Number.isFinite(n) && n >= 0 ? n : Number.MAX_SAFE_INTEGER,
+            };
+            yield reset;
+            continue;
+          }
+
           if (type === "assistant.final") {
             finalRaw = evt?.data?.response ?? evt?.data ?? null;
             if (!finalSettled) {
@@ -1,5 +1,7 @@
 // gateway/frontend/src/components/ceoChat/types.ts
 
+import type { StreamReset } from "./normalize";
+
 export type BusyState = "idle" | "submitting" | "streaming" | "error";
 
 export type ChatStatus = "delivered" | "streaming" | "final" | "error";
@@ -183,8 +185,8 @@ export type NormalizedConsoleResponse = {
 
   governance?: GovernanceCard;
 
-  // opciono za streaming
-  stream?: AsyncIterable<string>;
+  // opciono za streaming (assistant.reset stiže kao StreamReset)
+  stream?: AsyncIterable<string | StreamReset>;
 
   // omogućava UI da renderuje proposals i kad nisu mapirani u governance
   proposed_commands?: ProposedCommand[];
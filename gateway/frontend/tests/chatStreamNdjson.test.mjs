@@ -1,7 +1,10 @@
 import test from "node:test";
 import assert from "node:assert/strict";
 
-import { streamTextFromResponse } from "../.node-test-dist-chat-stream/components/ceoChat/normalize.js";
+import {
+  applyStreamChunk,
+  streamTextFromResponse,
+} from "../.node-test-dist-chat-stream/components/ceoChat/normalize.js";
 import {
   createCeoConsoleApi,
   getAttachedPreviewPayload,
@@ -49,6 +52,23 @@ test("streamTextFromResponse: yields assistant.delta and exposes assistant.final
   assert.deepEqual(finalRaw, final);
 });
 
+test("streamTextFromResponse: assistant.reset discards already streamed text", async () => {
+  const res = ndjsonResponseFromLines([
+    JSON.stringify({ type: "assistant.delta", data: { delta_text: "nacrt " } }),
+    JSON.stringify({ type: "assistant.delta", data: { delta_text: "odgovora" } }),
+    JSON.stringify({ type: "assistant.reset", data: { reason: "final_text_diverged", discard_chars: 14 } }),
+    JSON.stringify({ type: "assistant.delta", data: { delta_text: "konacni odgovor" } }),
+    JSON.stringify({ type: "assistant.final", data: { text: "konacni odgovor", response: { text: "konacni odgovor" } } }),
+    JSON.stringify({ type: "done" }),
+  ]);
+
+  const stream = streamTextFromResponse(res);
+  let acc = "";
+  for await (const chunk of stream) acc = applyStreamChunk(acc, chunk);
+
+  assert.equal(acc, "konacni odgovor");
+});
+
 test("streamTextFromResponse: error event throws and rejects finalResponse", async () => {
   const res = ndjsonResponseFromLines([
     JSON.stringify({ type: "assistant.delta", data: { delta_text: "Hi" } }),
@@ -263,9 +283,11 @@ test("createCeoConsoleApi.sendCommand: single-create preview stays attached on g
 
 test("createCeoConsoleApi.sendCommand: returns stream when NDJSON content-type", async () => {
   const originalFetch = globalThis.fetch;
+  let streamHeaders = null;
   try {
-    globalThis.fetch = async (url, _opts) => {
+    globalThis.fetch = async (url, opts) => {
       if (String(url).includes("/api/chat/stream") || String(url).endsWith("/chat/stream")) {
+        streamHeaders = opts?.headers;
         return ndjsonResponseFromLines([
           JSON.stringify({ type: "meta", data: { request_id: "r2" } }),
           JSON.stringify({ type: "assistant.delta", data: { delta_text: "A" } }),
@@ -282,9 +304,10 @@ test("createCeoConsoleApi.sendCommand: returns stream when NDJSON content-type",
     const resp = await api.sendCommand({ text: "hi" });
 
     assert.ok(resp.stream);
+    assert.equal(streamHeaders?.["X-Live-Deltas"], "1");
 
     let acc = "";
-    for await (const c of resp.stream) acc += c;
+    for await (const c of resp.stream) acc = applyStreamChunk(acc, c);
     assert.equal(acc, "AB");
 
     const finalRaw = await resp.stream.finalResponse;
@@ -15,6 +15,7 @@ import socket
 import threading
 import traceback
 import uuid
+import weakref
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -25,6 +26,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 # Ensure clients (PowerShell 5.1 / curl / browsers) decode BHS special chars correctly.
@@ -38,6 +40,13 @@ from models.ceo_console_snapshot import CeoConsoleSnapshotResponse
 from services.auth.dependencies import require_principal, require_role, require_scope
 from services.auth.principal import Principal
 from services.audit_log_service import AuditEvent, get_audit_log_service
+from services.prompt_features import analyze_prompt, prompt_pattern
+from services.response_contract_hook import (
+    begin_chat_contract_turn,
+    current_chat_contract_turn,
+    end_chat_contract_turn,
+    enforce_with_turn,
+)
 
 
 # ================================================================
@@ -271,7 +280,7 @@ def _apply_gateway_fallback_memory_patch(
     return False
 
 
-def _build_ceo_read_context(
+async def _build_ceo_read_context(
     *, prompt: str, session_id: Optional[str], request_headers: Optional[Dict[str, str]]
 ) -> Dict[str, Any]:
     """Best-effort context collector for gateway fallback.
@@ -279,7 +288,7 @@ def _build_ceo_read_context(
     Reuses existing read paths:
     - SystemReadExecutor.snapshot (identity_pack, knowledge_snapshot, ceo_notion_snapshot)
     - ReadOnlyMemoryService.export_public_snapshot
-    - GroundingPackService.build (deterministic KB retrieval + wrappers)
+    - GroundingPackService.abuild (deterministic KB retrieval + wrappers)
     """
 
     out: Dict[str, Any] = {
@@ -360,7 +369,7 @@ def _build_ceo_read_context(
     try:
         from services.grounding_pack_service import GroundingPackService  # type: ignore
 
-        gp = GroundingPackService.build(
+        gp = await GroundingPackService.abuild(
             prompt=(prompt or "").strip(),
             knowledge_snapshot=knowledge_snapshot,
             memory_public_snapshot=mem_public,
@@ -1176,6 +1185,7 @@ from services.ceo_console_snapshot_service import CEOConsoleSnapshotService
 # NOTION SERVICE (KANONSKI INIT) — NO SIDE EFFECTS AT IMPORT
 # ================================================================
 from services.knowledge_snapshot_service import KnowledgeSnapshotService
+from services.notion_query_cache import get_notion_query_cache
 from services.notion_service import (
     init_notion_service_from_env_or_raise,
     try_get_notion_service,
@@ -2831,27 +2841,43 @@ async def _shutdown_event() -> None:
 # ================================================================
 # REQUEST TRACE
 # ================================================================
-@app.middleware("http")
-async def request_trace_middleware(request: Request, call_next):
-    existing = request.headers.get("X-Request-ID")
-    req_id = (
-        existing.strip() if isinstance(existing, str) and existing.strip() else None
-    )
-    if req_id is None:
-        req_id = str(uuid.uuid4())
+class RequestTraceMiddleware:
+    """Pure-ASGI request correlation id + lazy boot (no per-request task hop)."""
 
-    # Canonical request correlation id for the full lifecycle.
-    request.state.req_id = req_id
+    def __init__(self, app: Any) -> None:
+        self.app = app
 
-    await _ensure_boot_if_needed(request)
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
 
-    try:
-        resp = await call_next(request)
-        resp.headers["X-Request-ID"] = req_id
-        return resp
-    except Exception:
-        logger.exception("REQ_FAIL req_id=%s path=%s", req_id, request.url.path)
-        raise
+        request = Request(scope)
+        existing = request.headers.get("X-Request-ID")
+        req_id = (
+            existing.strip() if isinstance(existing, str) and existing.strip() else None
+        )
+        if req_id is None:
+            req_id = str(uuid.uuid4())
+
+        # Canonical request correlation id for the full lifecycle.
+        request.state.req_id = req_id
+
+        await _ensure_boot_if_needed(request)
+
+        async def _send(message: Dict[str, Any]) -> None:
+            if message.get("type") == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = req_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        except Exception:
+            logger.exception("REQ_FAIL req_id=%s path=%s", req_id, request.url.path)
+            raise
+
+
+app.add_middleware(RequestTraceMiddleware)
 
 
 # ================================================================
@@ -3207,6 +3233,74 @@ def enforce_response_contract_integrity(
     return out
 
 
+_RS_STREAM_MEMORY_MARKERS: Tuple[str, ...] = (
+    "Memory types I use",
+    "I have two kinds of memory",
+) + _INTERNAL_MEMORY_BOILERPLATE_MARKERS
+_RS_STREAM_MAX_MARKER_LEN = max(
+    len(m) for m in _RS_STREAM_MEMORY_MARKERS + _INTERNAL_CEO_INTRO_TEMPLATE_MARKERS
+)
+
+
+class IncrementalResponseSanitizer:
+    """Streaming (segment-aware) front of enforce_response_contract_integrity.
+
+    Live text is released a line at a time. If any internal-template marker
+    appears in a segment (and this prompt does not allowlist that marker
+    kind), live release stops for the rest of the turn; the final event then
+    carries the fully sanitized contract. Each check also spans the tail of
+    already released text, so a marker straddling two segments is caught.
+    """
+
+    def __init__(self, *, prompt: str, max_line_chars: int = 160) -> None:
+        self._prompt = prompt or ""
+        self._max_line_chars = max(int(max_line_chars), _RS_STREAM_MAX_MARKER_LEN)
+        self._pending = ""
+        self._released_tail = ""
+        self.released = ""
+        self.withheld = False
+
+    def _is_suspect(self, text: str) -> bool:
+        if any(m in text for m in _RS_STREAM_MEMORY_MARKERS):
+            if not _rs_allowlisted_this_turn(
+                prompt=self._prompt, marker_kind=_RS_MARKER_MEMORY
+            ):
+                return True
+        if any(m in text for m in _INTERNAL_CEO_INTRO_TEMPLATE_MARKERS):
+            if not _rs_allowlisted_this_turn(
+                prompt=self._prompt, marker_kind=_RS_MARKER_CEO_INTRO
+            ):
+                return True
+        return False
+
+    def _release(self, cut: int) -> str:
+        seg = self._pending[:cut]
+        if self._is_suspect(self._released_tail + seg):
+            self.withheld = True
+            return ""
+        self._pending = self._pending[cut:]
+        self.released += seg
+        self._released_tail = self.released[-_RS_STREAM_MAX_MARKER_LEN:]
+        return seg
+
+    def feed(self, text: str) -> str:
+        """Add raw text; return the part that is safe to show now."""
+        if self.withheld or not text:
+            return ""
+        self._pending += text
+        cut = self._pending.rfind("\n") + 1
+        if cut == 0 and len(self._pending) > self._max_line_chars:
+            cut = len(self._pending) - _RS_STREAM_MAX_MARKER_LEN
+        if cut <= 0:
+            return ""
+        return self._release(cut)
+
+    def flush(self) -> str:
+        if self.withheld or not self._pending:
+            return ""
+        return self._release(len(self._pending))
+
+
 def _bhs_normalize(text: str) -> str:
     t0 = (text or "").strip().lower()
     return (
@@ -3218,20 +3312,40 @@ def _bhs_normalize(text: str) -> str:
     )
 
 
+_PF_MEMORY_OR_SNAPSHOT_BHS = prompt_pattern(
+    r"(?i)\b(pamcenj\w*|memorij\w*|snapshot|grounding|governance|sistemsk\w*\s+tekst|system\s+text)\b",
+    view="bhs",
+)
+
+
 def _user_explicitly_asked_memory_or_snapshot(prompt: str) -> bool:
-    t = _bhs_normalize(prompt)
-    if not t:
+    pf = analyze_prompt(prompt)
+    if not pf.bhs:
         return False
-    return bool(
-        re.search(
-            r"(?i)\b(pamcenj\w*|memorij\w*|snapshot|grounding|governance|sistemsk\w*\s+tekst|system\s+text)\b",
-            t,
-        )
-    )
+    return pf.has(_PF_MEMORY_OR_SNAPSHOT_BHS)
+
+
+_PF_PLAN_ANALYSIS_BHS = prompt_pattern(
+    r"(?i)\b(plan|analiz\w*|analysis|review|procitaj)\b", view="bhs"
+)
+_PF_IDENTITY_OR_HOWTO_BHS = prompt_pattern(
+    r"(?i)\b("
+    r"ko\s+si|"
+    r"sta\s+si|"
+    r"\u0161ta\s+si|"
+    r"kako\s+radis|"
+    r"kako\s+da\s+pitam|"
+    r"uputstv\w*|"
+    r"help|guidelines|"
+    r"who\s+are\s+you|how\s+do\s+you\s+work|how\s+to\s+ask"
+    r")\b",
+    view="bhs",
+)
 
 
 def _user_explicitly_asked_identity_or_howto(prompt: str) -> bool:
-    t = _bhs_normalize(prompt)
+    pf = analyze_prompt(prompt)
+    t = pf.bhs
     if not t:
         return False
 
@@ -3241,25 +3355,11 @@ def _user_explicitly_asked_identity_or_howto(prompt: str) -> bool:
         return False
 
     # Never allowlist plan-analysis prompts.
-    if re.search(r"(?i)\b(plan|analiz\w*|analysis|review|procitaj)\b", t):
+    if pf.has(_PF_PLAN_ANALYSIS_BHS):
         return False
 
     # Strict allowlist (enterprise): only allow intro/how-to template when explicitly asked.
-    return bool(
-        re.search(
-            r"(?i)\b("
-            r"ko\s+si|"
-            r"sta\s+si|"
-            r"\u0161ta\s+si|"
-            r"kako\s+radis|"
-            r"kako\s+da\s+pitam|"
-            r"uputstv\w*|"
-            r"help|guidelines|"
-            r"who\s+are\s+you|how\s+do\s+you\s+work|how\s+to\s+ask"
-            r")\b",
-            t,
-        )
-    )
+    return pf.has(_PF_IDENTITY_OR_HOWTO_BHS)
 
 
 def _is_canonical_ceo_advisor_identity_response(*, body_obj: Dict[str, Any]) -> bool:
@@ -3502,109 +3602,85 @@ def _clear_sticky_meta_intent(conversation_id: str) -> None:
         pass
 
 
-@app.middleware("http")
-async def prevent_internal_text_leak_middleware(request: Request, call_next):
-    # Block 2 contract: apply only to canonical chat endpoints.
-    if (request.method or "").upper() != "POST":
-        return await call_next(request)
+def _is_chat_contract_path(path: str) -> bool:
+    return path.startswith("/api/chat") or path == "/chat" or path.startswith("/chat/")
 
-    pth = getattr(request.url, "path", "") or ""
-    if not (pth.startswith("/api/chat") or pth == "/chat" or pth.startswith("/chat/")):
-        return await call_next(request)
 
-    # Best-effort extract prompt + ids from request JSON.
-    prompt = ""
-    session_id = (request.headers.get("X-Session-Id") or "").strip()
-    conversation_id = ""
+def _enforce_chat_json_body(body_bytes: bytes, turn: Dict[str, Any]) -> bytes:
     try:
-        raw = await request.body()
-        if raw:
-            req_obj = json.loads(raw.decode("utf-8"))
-            if isinstance(req_obj, dict):
-                prompt = str(
-                    req_obj.get("message")
-                    or req_obj.get("input_text")
-                    or req_obj.get("text")
-                    or ""
-                )
-                conversation_id = str(req_obj.get("conversation_id") or "").strip()
-                sid0 = str(req_obj.get("session_id") or "").strip()
-                if sid0:
-                    session_id = sid0
+        body_obj = json.loads(body_bytes.decode("utf-8"))
     except Exception:
-        pass
+        return body_bytes
+    if not isinstance(body_obj, dict):
+        return body_bytes
+    text = body_obj.get("text")
+    if not isinstance(text, str) or not text.strip():
+        return body_bytes
+    return JSONResponse(content=enforce_with_turn(turn, body_obj)).body
 
-    if not conversation_id:
-        conversation_id = session_id
 
-    resp = await call_next(request)
+class ResponseContractMiddleware:
+    """Pure-ASGI Block 2 contract enforcer for chat endpoints.
 
-    ctype = (resp.headers.get("content-type") or "").lower()
-    if "application/json" not in ctype:
-        return resp
+    Non-chat requests pass straight through. For chat POSTs this only opens a
+    contract turn: the chat route records its parsed prompt/ids and its
+    ContractJSONResponse sanitizes the dict before first serialization
+    (services.response_contract_hook). The request body is never re-read.
+    Only a chat JSON response that bypassed the hook is buffered and enforced
+    on the way out.
+    """
 
-    # Extract body bytes (works for JSONResponse and StreamingResponse).
-    body_bytes: bytes = b""
-    consumed_iterator = False
-    try:
-        body_attr = getattr(resp, "body", None)
-        if isinstance(body_attr, (bytes, bytearray, memoryview)):
-            body_bytes = bytes(body_attr)
-
-        if (not body_bytes) and hasattr(resp, "body_iterator"):
-            chunks: List[bytes] = []
-            async for chunk in resp.body_iterator:  # type: ignore[attr-defined]
-                if isinstance(chunk, (bytes, bytearray)):
-                    chunks.append(bytes(chunk))
-            body_bytes = b"".join(chunks)
-            consumed_iterator = True
-    except Exception:
-        return resp
-
-    if not body_bytes:
-        return resp
-
-    # If we consumed the iterator, we must rebuild the response; otherwise downstream
-    # (TestClient/proxies) will receive an empty body.
-    if consumed_iterator:
-        rebuilt = Response(
-            content=body_bytes,
-            status_code=resp.status_code,
-            media_type=getattr(resp, "media_type", None),
-            background=getattr(resp, "background", None),
-        )
-        for k, v in resp.headers.items():
-            if k.lower() == "content-length":
-                continue
-            rebuilt.headers[k] = v
-        resp = rebuilt
+    def __init__(self, app: Any) -> None:
+        self.app = app
 
-    try:
-        body_obj = json.loads(body_bytes.decode("utf-8"))
-    except Exception:
-        return resp
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if (
+            scope.get("type") != "http"
+            or (scope.get("method") or "").upper() != "POST"
+            or not _is_chat_contract_path(scope.get("path") or "")
+        ):
+            await self.app(scope, receive, send)
+            return
 
-    if not isinstance(body_obj, dict):
-        return resp
+        session_id = Headers(scope=scope).get("x-session-id") or ""
+        token = begin_chat_contract_turn(
+            enforce=enforce_response_contract_integrity, session_id=session_id
+        )
+        turn = current_chat_contract_turn() or {}
+        held: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def _send(message: Dict[str, Any]) -> None:
+            mtype = message.get("type")
+            if mtype == "http.response.start":
+                hdrs = Headers(raw=message.get("headers") or [])
+                ctype = (hdrs.get("content-type") or "").lower()
+                if not turn.get("enforced") and "application/json" in ctype:
+                    held["start"] = message
+                    return
+            elif mtype == "http.response.body" and "start" in held:
+                chunks.append(bytes(message.get("body") or b""))
+                if message.get("more_body"):
+                    return
+                body = b"".join(chunks)
+                try:
+                    body = _enforce_chat_json_body(body, turn)
+                except Exception:
+                    pass
+                start = held.pop("start")
+                MutableHeaders(scope=start)["content-length"] = str(len(body))
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                return
+            await send(message)
 
-    text = body_obj.get("text")
-    if not isinstance(text, str) or not text.strip():
-        return resp
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            end_chat_contract_turn(token)
 
-    enforced = enforce_response_contract_integrity(
-        body_obj=body_obj,
-        prompt=prompt,
-        session_id=session_id,
-        conversation_id=conversation_id,
-    )
 
-    # Rebuild JSON response, preserving headers/status.
-    new_resp = JSONResponse(content=enforced, status_code=resp.status_code)
-    for k, v in resp.headers.items():
-        if k.lower() == "content-length":
-            continue
-        new_resp.headers[k] = v
-    return new_resp
+app.add_middleware(ResponseContractMiddleware)
 
 
 # ================================================================
@@ -7327,35 +7403,129 @@ async def _call_maybe_async(fn: Any, *args: Any, **kwargs: Any) -> Any:
     return out
 
 
-async def _query_notion_database(db_key: str, query: Dict[str, Any]) -> Dict[str, Any]:
-    from services.notion_service import get_notion_service
+# NotionService query adapter, resolved once per query function instead of
+# probing call signatures via TypeError on every call.
+#   kw_query:   fn(db_key=..., query={...})
+#   kw_spread:  fn(db_key=..., **query)
+#   positional: fn(db_key, query)
+_NOTION_QUERY_METHOD_NAMES: Tuple[str, ...] = (
+    "query_database",
+    "database_query",
+    "query_db",
+    "query",
+)
+_NOTION_QUERY_STYLES: Tuple[str, ...] = ("kw_query", "kw_spread", "positional")
+_NOTION_QUERY_ADAPTERS: "weakref.WeakKeyDictionary[Any, str]" = (
+    weakref.WeakKeyDictionary()
+)
+_NOTION_SDK_CLIENTS: Dict[str, Any] = {}
 
-    notion_service = get_notion_service()
 
-    for name in ("query_database", "database_query", "query_db", "query"):
+def _notion_query_style_from_signature(fn: Any) -> Optional[str]:
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return None
+
+    kinds = {p.kind for p in params.values()}
+    by_kw = {
+        n
+        for n, p in params.items()
+        if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+    }
+    if {"db_key", "query"} <= by_kw:
+        return "kw_query"
+    positional = [
+        p
+        for p in params.values()
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+    ]
+    if inspect.Parameter.VAR_KEYWORD in kinds:
+        if "db_key" in by_kw:
+            return "kw_spread"
+        if not any(p.default is p.empty for p in positional):
+            # Generic (*args, **kwargs) wrapper: same first choice as before.
+            return "kw_query"
+    if len(positional) >= 2 or inspect.Parameter.VAR_POSITIONAL in kinds:
+        return "positional"
+    return None
+
+
+async def _invoke_notion_query(
+    fn: Any, style: str, db_key: str, query: Dict[str, Any]
+) -> Any:
+    if style == "kw_query":
+        return await _call_maybe_async(fn, db_key=db_key, query=query)
+    if style == "kw_spread":
+        return await _call_maybe_async(fn, db_key=db_key, **query)
+    return await _call_maybe_async(fn, db_key, query)
+
+
+def _remember_notion_query_style(fn: Any, style: str) -> None:
+    try:
+        _NOTION_QUERY_ADAPTERS[getattr(fn, "__func__", fn)] = style
+    except TypeError:
+        # Not weak-referenceable (rare callables); resolve again next time.
+        pass
+
+
+async def _query_via_notion_service(
+    notion_service: Any, db_key: str, query: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    for name in _NOTION_QUERY_METHOD_NAMES:
         fn = getattr(notion_service, name, None)
-        if callable(fn):
-            try:
-                res = await _call_maybe_async(fn, db_key=db_key, query=query)
-                if isinstance(res, dict):
-                    return res
-            except TypeError:
-                pass
-            try:
-                res = await _call_maybe_async(fn, db_key=db_key, **query)
-                if isinstance(res, dict):
-                    return res
-            except TypeError:
-                pass
+        if not callable(fn):
+            continue
+
+        try:
+            style = _NOTION_QUERY_ADAPTERS.get(getattr(fn, "__func__", fn))
+        except TypeError:
+            style = None
+        if style is None:
+            style = _notion_query_style_from_signature(fn)
+            if style is not None:
+                _remember_notion_query_style(fn, style)
+
+        if style is not None:
+            res = await _invoke_notion_query(fn, style, db_key, query)
+            if isinstance(res, dict):
+                return res
+            continue
+
+        # Opaque signature: probe once and remember what worked.
+        for cand in _NOTION_QUERY_STYLES:
             try:
-                res = await _call_maybe_async(fn, db_key, query)
-                if isinstance(res, dict):
-                    return res
+                res = await _invoke_notion_query(fn, cand, db_key, query)
             except TypeError:
-                pass
+                continue
+            if isinstance(res, dict):
+                _remember_notion_query_style(fn, cand)
+                return res
+    return None
 
-    try:
+
+def _notion_sdk_client(api_key: str) -> Any:
+    client = _NOTION_SDK_CLIENTS.get(api_key)
+    if client is None:
         from notion_client import Client  # type: ignore
+
+        client = Client(auth=api_key)
+        _NOTION_SDK_CLIENTS.clear()
+        _NOTION_SDK_CLIENTS[api_key] = client
+    return client
+
+
+async def _query_notion_database(db_key: str, query: Dict[str, Any]) -> Dict[str, Any]:
+    from services.notion_service import get_notion_service
+
+    notion_service = get_notion_service()
+
+    res0 = await _query_via_notion_service(notion_service, db_key, query)
+    if res0 is not None:
+        return res0
+
+    try:
+        from notion_client import Client  # type: ignore  # noqa: F401
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(
             status_code=500,
@@ -7376,11 +7546,15 @@ async def _query_notion_database(db_key: str, query: Dict[str, Any]) -> Dict[str
         )
 
     db_id = _resolve_db_id_from_service(notion_service, db_key)
-    client = Client(auth=api_key.strip())
+    client = _notion_sdk_client(api_key.strip())
 
     try:
-        res = await asyncio.to_thread(
-            lambda: client.databases.query(database_id=db_id, **(query or {}))
+        res = await get_notion_query_cache().read_through(
+            db_id,
+            query or {},
+            lambda: asyncio.to_thread(
+                lambda: client.databases.query(database_id=db_id, **(query or {}))
+            ),
         )
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(
@@ -7399,31 +7573,156 @@ async def _query_notion_database(db_key: str, query: Dict[str, Any]) -> Dict[str
     return res
 
 
+# Bulk query knobs:
+#   NOTION_BULK_QUERY_CONCURRENCY  parallel Notion calls per request (default 4)
+#   NOTION_BULK_QUERY_MAX_ITEMS    hard cap for paginate=true (default 1000)
+#   NOTION_BULK_QUERY_COMPACT      "true" -> compact results by default
+_NOTION_PAGE_SIZE_MAX = 100
+
+
+def _bulk_query_opts(q0: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    paginate = q0.get("paginate", defaults.get("paginate"))
+    cap_hard = max(1, _env_int("NOTION_BULK_QUERY_MAX_ITEMS", 1000))
+    max_items = q0.get("max_items", defaults.get("max_items"))
+    if not isinstance(max_items, int) or isinstance(max_items, bool) or max_items <= 0:
+        max_items = cap_hard
+    return {"paginate": paginate is True, "max_items": min(max_items, cap_hard)}
+
+
+async def _query_notion_database_paged(
+    db_key: str, query: Dict[str, Any], *, max_items: int
+) -> Tuple[Dict[str, Any], int]:
+    """Follow next_cursor until exhausted or `max_items` results are held.
+
+    Every page, the first included, is sized to the remaining budget, so the
+    result never exceeds `max_items`, cursors stay exact and nothing is
+    fetched only to be dropped.
+    """
+
+    first = dict(query)
+    cap = min(_NOTION_PAGE_SIZE_MAX, max_items)
+    ps = first.get("page_size")
+    if isinstance(ps, int) and not isinstance(ps, bool) and ps > 0:
+        first["page_size"] = min(ps, cap)
+    elif cap < _NOTION_PAGE_SIZE_MAX:
+        # Notion's default page size is the max; only send it when smaller.
+        first["page_size"] = cap
+    res = await _query_notion_database(db_key, first)
+    items: List[Any] = list(res.get("results") or [])
+    pages = 1
+    while len(items) < max_items:
+        cursor = res.get("next_cursor")
+        if res.get("has_more") is not True or not isinstance(cursor, str) or not cursor:
+            break
+        nq = dict(query)
+        nq["start_cursor"] = cursor
+        nq["page_size"] = min(_NOTION_PAGE_SIZE_MAX, max_items - len(items))
+        res = await _query_notion_database(db_key, nq)
+        items.extend(res.get("results") or [])
+        pages += 1
+
+    if pages == 1:
+        return res, pages
+    merged = dict(res)
+    merged["results"] = items
+    return merged, pages
+
+
+def _bulk_query_entry(
+    query: Any,
+    db_key: Optional[str],
+    res: Dict[str, Any],
+    *,
+    compact: bool,
+    pages: int = 1,
+) -> Dict[str, Any]:
+    items = res.get("results") if isinstance(res.get("results"), list) else []
+    entry: Dict[str, Any] = {"query": query, "db_key": db_key, "items": items}
+    if compact:
+        # `items` already carries the results; only keep pagination metadata.
+        entry["has_more"] = res.get("has_more") is True
+        entry["next_cursor"] = res.get("next_cursor")
+        if res.get("database_id") is not None:
+            entry["database_id"] = res.get("database_id")
+    else:
+        entry["notion"] = res
+        entry["response"] = res
+    if pages > 1:
+        entry["pages"] = pages
+    return entry
+
+
+async def _run_bulk_query(
+    q0: Dict[str, Any], defaults: Dict[str, Any], *, compact: bool
+) -> Dict[str, Any]:
+    db_key = _extract_db_key_or_database_id(q0)
+    if not isinstance(db_key, str) or not db_key.strip():
+        empty = {"results": [], "has_more": False, "next_cursor": None}
+        return _bulk_query_entry(q0, None, empty, compact=compact)
+
+    db_key = db_key.strip()
+    nq = _normalize_notion_query_payload(q0)
+    opts = _bulk_query_opts(q0, defaults)
+    if opts["paginate"]:
+        res, pages = await _query_notion_database_paged(
+            db_key, nq, max_items=opts["max_items"]
+        )
+    else:
+        res, pages = await _query_notion_database(db_key, nq), 1
+    return _bulk_query_entry(
+        {"db_key": db_key, **nq}, db_key, res, compact=compact, pages=pages
+    )
+
+
+async def _gather_bounded(coros: List[Any], limit: int) -> List[Any]:
+    """gather() under a semaphore; the first failure cancels the rest."""
+
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def _one(coro: Any) -> Any:
+        async with sem:
+            return await coro
+
+    tasks = [asyncio.ensure_future(_one(c)) for c in coros]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 @app.post("/api/notion-ops/bulk/query", dependencies=[Depends(require_principal)])
 @app.post("/notion-ops/bulk/query", dependencies=[Depends(require_principal)])
 async def notion_bulk_query(payload: Any = Body(None)):
+    """Run Notion database queries (flat single query or `queries[]`).
+
+    Optional knobs (top level, or per query for paginate/max_items):
+    - compact: drop the duplicated raw `notion`/`response` payloads.
+    - paginate: follow next_cursor up to `max_items` (NOTION_BULK_QUERY_MAX_ITEMS).
+    """
     if payload is None:
         return {"results": []}
 
     if not isinstance(payload, dict):
         raise HTTPException(status_code=400, detail="payload must be an object")
 
+    compact_raw = payload.get("compact")
+    compact = (
+        compact_raw is True
+        if isinstance(compact_raw, bool)
+        else _env_true("NOTION_BULK_QUERY_COMPACT")
+    )
+    defaults = {
+        "paginate": payload.get("paginate"),
+        "max_items": payload.get("max_items"),
+    }
+
     top_db_key = _extract_db_key_or_database_id(payload)
     if isinstance(top_db_key, str) and top_db_key.strip():
-        q = _normalize_notion_query_payload(payload)
-        res = await _query_notion_database(top_db_key.strip(), q)
-        items = res.get("results") if isinstance(res.get("results"), list) else []
-        return {
-            "results": [
-                {
-                    "query": {"db_key": top_db_key.strip(), **q},
-                    "db_key": top_db_key.strip(),
-                    "items": items,
-                    "notion": res,
-                    "response": res,
-                }
-            ]
-        }
+        entry = await _run_bulk_query(payload, defaults, compact=compact)
+        return {"results": [entry]}
 
     queries = payload.get("queries")
     if queries is None:
@@ -7434,37 +7733,15 @@ async def notion_bulk_query(payload: Any = Body(None)):
     if len(queries) == 0:
         return {"results": []}
 
-    out: List[Dict[str, Any]] = []
+    # Validate everything before dispatching anything.
     for q0 in queries:
         if not isinstance(q0, dict):
             raise HTTPException(status_code=400, detail="each query must be an object")
 
-        db_key = _extract_db_key_or_database_id(q0)
-        if not isinstance(db_key, str) or not db_key.strip():
-            out.append(
-                {
-                    "query": q0,
-                    "db_key": None,
-                    "items": [],
-                    "notion": {"results": [], "has_more": False, "next_cursor": None},
-                    "response": {"results": [], "has_more": False, "next_cursor": None},
-                }
-            )
-            continue
-
-        nq = _normalize_notion_query_payload(q0)
-        res = await _query_notion_database(db_key.strip(), nq)
-        items = res.get("results") if isinstance(res.get("results"), list) else []
-        out.append(
-            {
-                "query": {"db_key": db_key.strip(), **nq},
-                "db_key": db_key.strip(),
-                "items": items,
-                "notion": res,
-                "response": res,
-            }
-        )
-
+    out = await _gather_bounded(
+        [_run_bulk_query(q0, defaults, compact=compact) for q0 in queries],
+        _env_int("NOTION_BULK_QUERY_CONCURRENCY", 4),
+    )
     return {"results": out}
 
 
@@ -7729,7 +8006,7 @@ async def _ceo_command_core(
                 if request is not None:
                     headers_dict = {k: v for k, v in request.headers.items()}
 
-                ctx_bridge = _build_ceo_read_context(
+                ctx_bridge = await _build_ceo_read_context(
                     prompt=cleaned_text.strip(),
                     session_id=session_id if isinstance(session_id, str) else None,
                     request_headers=headers_dict,
@@ -8068,14 +8345,10 @@ async def ceo_console_status_public():
 @app.get("/api/ceo/console/snapshot", dependencies=[Depends(require_principal)])
 async def ceo_console_snapshot() -> CeoConsoleSnapshotResponse:
     approval_state = get_approval_state()
-    approvals_map: Dict[str, Dict[str, Any]] = getattr(approval_state, "_approvals", {})
-    approvals_list = list(approvals_map.values())
-
-    pending = [a for a in approvals_list if a.get("status") == "pending"]
-    approved = [a for a in approvals_list if a.get("status") == "approved"]
-    rejected = [a for a in approvals_list if a.get("status") == "rejected"]
-    failed = [a for a in approvals_list if a.get("status") == "failed"]
-    completed = [a for a in approvals_list if a.get("status") == "completed"]
+    # Counts cover the hot set and the archive (rejected/expired and executed
+    # approvals leave the hot set) without reading archived records.
+    approval_counts = approval_state.count_by_status()
+    pending: List[Dict[str, Any]] = approval_state.list_pending()
 
     ks = KnowledgeSnapshotService.get_snapshot()
 
@@ -8108,7 +8381,7 @@ async def ceo_console_snapshot() -> CeoConsoleSnapshotResponse:
             },
         }
 
-    ceo_dash = CEOConsoleSnapshotService().snapshot()
+    ceo_dash = await CEOConsoleSnapshotService().asnapshot()
     legacy = _derive_legacy_goal_task_summaries_from_ceo_snapshot(ceo_dash)
 
     snapshot: Dict[str, Any] = {
@@ -8126,12 +8399,12 @@ async def ceo_console_snapshot() -> CeoConsoleSnapshotResponse:
         "mode": _to_serializable(mode),
         "state": _to_serializable(state),
         "approvals": {
-            "total": len(approvals_list),
+            "total": sum(approval_counts.values()),
             "pending_count": len(pending),
-            "approved_count": len(approved),
-            "rejected_count": len(rejected),
-            "failed_count": len(failed),
-            "completed_count": len(completed),
+            "approved_count": approval_counts.get("approved", 0),
+            "rejected_count": approval_counts.get("rejected", 0),
+            "failed_count": approval_counts.get("failed", 0),
+            "completed_count": approval_counts.get("completed", 0),
             "pending": pending,
         },
         "snapshot_meta": snapshot_meta,
@@ -8152,7 +8425,7 @@ async def ceo_console_snapshot() -> CeoConsoleSnapshotResponse:
         mem_ro = get_memory_read_only_service()
         mem_snapshot = mem_ro.export_public_snapshot() if mem_ro else {}
 
-        gp = GroundingPackService.build(
+        gp = await GroundingPackService.abuild(
             prompt="ceo_console_snapshot",
             knowledge_snapshot=knowledge_snapshot
             if isinstance(knowledge_snapshot, dict)
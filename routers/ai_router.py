@@ -77,7 +77,7 @@ def _knowledge_bundle() -> Dict[str, Any]:
     return {"knowledge_snapshot": ks, "snapshot_meta": meta}
 
 
-def _grounding_bundle(*, prompt: str, kb: Dict[str, Any]) -> Dict[str, Any]:
+async def _grounding_bundle(*, prompt: str, kb: Dict[str, Any]) -> Dict[str, Any]:
     try:
         mem_ro = get_memory_read_only_service()
         mem_snapshot = mem_ro.export_public_snapshot() if mem_ro else {}
@@ -93,7 +93,7 @@ def _grounding_bundle(*, prompt: str, kb: Dict[str, Any]) -> Dict[str, Any]:
             GroundingPackService,
         )
 
-        gp = GroundingPackService.build(
+        gp = await GroundingPackService.abuild(
             prompt=prompt,
             knowledge_snapshot=ks,
             memory_public_snapshot=mem_snapshot,
@@ -367,7 +367,7 @@ async def run_ai(req: AIRequest) -> Dict[str, Any]:
     logger.info("[AI] UX request received")
 
     kb = _knowledge_bundle()
-    grounding = _grounding_bundle(prompt=(req.text or "").strip(), kb=kb)
+    grounding = await _grounding_bundle(prompt=(req.text or "").strip(), kb=kb)
 
     # READ-ONLY FALLBACK UMJESTO 500:
     if (
@@ -51,7 +51,7 @@ def alerting_status() -> Dict[str, Any]:
         # fallback na kanonske metode koje postoje u ApprovalStateService
         pending = approval_service.list_pending()
         approvals_overview = {
-            "total": len(approval_service.list_approvals()),
+            "total": sum(approval_service.count_by_status().values()),
             "pending_count": len(pending),
             "pending": pending,
         }
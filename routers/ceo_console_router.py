@@ -330,7 +330,7 @@ async def ceo_command(req: CEOCommandRequest = Body(...)) -> CEOCommandResponse:
     try:
         from services.grounding_pack_service import GroundingPackService  # type: ignore
 
-        grounding_pack = GroundingPackService.build(
+        grounding_pack = await GroundingPackService.abuild(
             prompt=req.text,
             knowledge_snapshot=knowledge_snapshot,
             memory_public_snapshot=memory_public,
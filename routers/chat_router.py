@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -26,7 +27,21 @@ from services.ceo_advisor_agent import (
     _render_snapshot_summary,
 )
 from dependencies import get_memory_read_only_service
-from services.ceo_conversation_state_store import ConversationStateStore
+from services.ceo_conversation_state_store import (
+    ConversationStateStore,
+    aconversation_state_turn,
+    conversation_state_turn_stats,
+)
+from services.prompt_features import analyze_prompt, prompt_pattern
+from services.agent_router.openai_streaming import (
+    JsonTextFieldDecoder,
+    reset_token_sink,
+    set_token_sink,
+)
+from services.response_contract_hook import (
+    ContractJSONResponse,
+    note_chat_contract_request,
+)
 from services.turn_interpretation_authority_gate import (
     GateInput,
     evaluate_turn_gate,
@@ -98,60 +113,59 @@ _TOP_GOAL_RE = re.compile(
 )
 
 
+_PF_TOP_GOAL = prompt_pattern(_TOP_GOAL_RE.pattern, view="stripped")
+_PF_WHY_FOLLOWUP = prompt_pattern(r"(?i)\b(zasto|zašto)\b", view="stripped")
+
+
 def _is_top_goal_intent(text: str) -> bool:
-    t = (text or "").strip()
-    if not t:
+    pf = analyze_prompt(text)
+    if not pf.stripped:
         return False
     # Guard: "Zašto je ... cilj glavni?" is a WHY follow-up, not a top-goal listing request.
-    if re.search(r"(?i)\b(zasto|zašto)\b", t):
+    if pf.has(_PF_WHY_FOLLOWUP):
         return False
-    return bool(_TOP_GOAL_RE.search(t))
+    return pf.has(_PF_TOP_GOAL)
+
+
+_PF_SHOW_GOALS_TASKS = prompt_pattern(_SHOW_GOALS_TASKS_RE.pattern, view="stripped")
+_PF_TASK_SUBJECT_BHS = prompt_pattern(
+    r"(?i)\b(task\w*|zadat\w*|zadac\w*)\b", view="bhs"
+)
+_PF_GOAL_SCOPED_BHS = prompt_pattern(
+    r"(?i)\b(ovaj|ovom|ovog|ovome|ovo|taj|tom|tog|tome|ovim)\b(?:\W+\w+){0,3}\W+\b(cilj\w*|goal\w*)\b",
+    view="bhs",
+)
+_PF_SHOW_CUE_BHS = prompt_pattern(
+    r"(?i)\b(pokaz\w*|prikaz\w*|izlistaj|navedi|lista|pregled|overview)\b",
+    view="bhs",
+)
+_PF_SUBJECT_BHS = prompt_pattern(
+    r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*)\b", view="bhs"
+)
+_PF_HAVE_QUESTION_BHS = prompt_pattern(
+    r"(?i)\b(kakv\w*|koje|koji|sta|shta)\b\s+\b(imamo|su)\b", view="bhs"
+)
 
 
 def _is_show_goals_tasks_intent(text: str) -> bool:
     """Return True when the prompt is a Bosnian/English show/list goals+tasks intent."""
-    t = (text or "").strip()
-    if not t:
+    pf = analyze_prompt(text)
+    if not pf.stripped:
         return False
 
-    def _norm_bhs_ascii(text: str) -> str:
-        s = (text or "").strip().lower()
-        return (
-            s.replace("č", "c")
-            .replace("ć", "c")
-            .replace("š", "s")
-            .replace("đ", "dj")
-            .replace("ž", "z")
-        )
-
     # Guard: do NOT treat goal-scoped task follow-ups as a global "show goals+tasks" intent.
     # Examples:
     #   - "Koji su zadaci povezani sa ovim ciljem?"
     #   - "Imamo li aktivne zadatke za taj cilj?"
-    t0 = _norm_bhs_ascii(t)
-    if re.search(r"(?i)\b(task\w*|zadat\w*|zadac\w*)\b", t0) and re.search(
-        r"(?i)\b(ovaj|ovom|ovog|ovome|ovo|taj|tom|tog|tome|ovim)\b(?:\W+\w+){0,3}\W+\b(cilj\w*|goal\w*)\b",
-        t0,
-    ):
+    if pf.has(_PF_TASK_SUBJECT_BHS) and pf.has(_PF_GOAL_SCOPED_BHS):
         return False
 
-    if _SHOW_GOALS_TASKS_RE.search(t):
+    if pf.has(_PF_SHOW_GOALS_TASKS):
         return True
 
-    has_show_cue = bool(
-        re.search(
-            r"(?i)\b(pokaz\w*|prikaz\w*|izlistaj|navedi|lista|pregled|overview)\b",
-            t0,
-        )
+    return pf.has(_PF_SUBJECT_BHS) and (
+        pf.has(_PF_SHOW_CUE_BHS) or pf.has(_PF_HAVE_QUESTION_BHS)
     )
-    has_subject = bool(
-        re.search(r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*)\b", t0)
-    )
-    has_have_question = bool(
-        re.search(r"(?i)\b(kakv\w*|koje|koji|sta|shta)\b\s+\b(imamo|su)\b", t0)
-    )
-
-    return bool((has_show_cue and has_subject) or (has_have_question and has_subject))
 
 
 def _compute_ceo_view(snapshot: Any) -> Dict[str, Any]:
@@ -386,6 +400,48 @@ def _compute_ceo_view(snapshot: Any) -> Dict[str, Any]:
     }
 
 
+class _LiveAnswerSink:
+    """Token sink for /chat/stream: JSON "text" field -> leak filter -> queue.
+
+    Only the first executor stream of a turn is shown live; anything later
+    (retries, secondary calls) is reconciled by the final event instead.
+    """
+
+    def __init__(self, *, prompt: str) -> None:
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._opened = False
+        try:
+            from gateway.gateway_server import (  # type: ignore
+                IncrementalResponseSanitizer,
+            )
+
+            self._sanitizer: Any = IncrementalResponseSanitizer(prompt=prompt)
+        except Exception:
+            # Fail-safe: without the leak filter nothing is streamed live.
+            self._sanitizer = None
+
+    @property
+    def released(self) -> str:
+        return self._sanitizer.released if self._sanitizer is not None else ""
+
+    def open(self) -> Optional[Callable[[str], None]]:
+        if self._opened or self._sanitizer is None:
+            return None
+        self._opened = True
+        decoder = JsonTextFieldDecoder("text")
+        sanitizer = self._sanitizer
+        loop = asyncio.get_running_loop()
+
+        def _on_token(raw: str) -> None:
+            piece = sanitizer.feed(decoder.feed(raw))
+            if decoder.done:
+                piece += sanitizer.flush()
+            if piece:
+                loop.call_soon_threadsafe(self.queue.put_nowait, piece)
+
+        return _on_token
+
+
 def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
     router = APIRouter()
 
@@ -393,6 +449,18 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
         raw = (os.getenv("CHAT_STREAMING_ENABLED") or "").strip().lower()
         return raw in {"1", "true", "yes", "on"}
 
+    def _live_deltas_requested(request: Request) -> bool:
+        # Live deltas may be followed by assistant.reset, so only clients that
+        # handle it get them.
+        truthy = {"1", "true", "yes", "on"}
+        try:
+            if (request.headers.get("X-Live-Deltas") or "").strip().lower() in truthy:
+                return True
+            qp = request.query_params.get("live_deltas")
+            return (qp or "").strip().lower() in truthy
+        except Exception:
+            return False
+
     def _iso_utc_now() -> str:
         return (
             datetime.now(timezone.utc)
@@ -519,7 +587,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
 
         return out
 
-    def _grounding_bundle(
+    async def _grounding_bundle(
         *,
         prompt: str,
         knowledge_snapshot: Dict[str, Any],
@@ -532,7 +600,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 GroundingPackService,
             )
 
-            gp = GroundingPackService.build(
+            gp = await GroundingPackService.abuild(
                 prompt=prompt,
                 knowledge_snapshot=knowledge_snapshot,
                 memory_public_snapshot=memory_snapshot,
@@ -1662,10 +1730,9 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 content = audit_fn(content)
             except Exception:
                 pass
-        return JSONResponse(content=content)
+        return ContractJSONResponse(content=content)
 
-    @router.post("/chat", response_model=AgentOutput, response_model_by_alias=False)
-    async def chat(payload: AgentInput, request: Request):
+    async def _chat_turn(payload: AgentInput, request: Request):
         audit_request_id = uuid.uuid4().hex
         audit_started_at = (
             datetime.now(timezone.utc)
@@ -1675,6 +1742,20 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
         )
         debug_req_on = _debug_enabled_request(request)
 
+        # Block 2 response contract: hand the sanitizer the turn inputs we
+        # already parsed (no-op unless the gateway middleware opened a turn).
+        _sid_hdr = (request.headers.get("X-Session-Id") or "").strip()
+        _sid_body = getattr(payload, "session_id", None)
+        note_chat_contract_request(
+            prompt=str(
+                getattr(payload, "message", None)
+                or getattr(payload, "input_text", None)
+                or ""
+            ),
+            session_id=_sid_body if isinstance(_sid_body, str) else _sid_hdr,
+            conversation_id=getattr(payload, "conversation_id", None),
+        )
+
         def _truthy(v: Any) -> bool:
             if v is True:
                 return True
@@ -1764,6 +1845,17 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 tr_content["turn_gate"] = tg
                 content["trace"] = tr_content
 
+            # Conversation-state store round-trips for this turn (one load per
+            # conversation + one coalesced flush; see conversation_state_turn).
+            # Always in the audit line; in the response trace only for debug,
+            # so the minimal trace contract stays unchanged.
+            conv_state = conversation_state_turn_stats()
+            if conv_state is not None and debug_on:
+                tr_content = content.get("trace")
+                tr_content = tr_content if isinstance(tr_content, dict) else {}
+                tr_content["conversation_state"] = conv_state
+                content["trace"] = tr_content
+
             # Build audit (no raw Notion data; counts + reasons only).
             snap_counts = _snapshot_counts(snapshot)
             trace0 = trace if isinstance(trace, dict) else {}
@@ -1870,6 +1962,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     "not_used": gp_trace.get("not_used"),
                 },
                 "targeted_reads": targeted_reads or {},
+                "conversation_state": conv_state or {},
             }
             if mismatch:
                 audit["mismatch"] = mismatch
@@ -2170,7 +2263,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     dept_payload, ctx={"conversation_id": conversation_id}
                 )
             except Exception as exc:
-                return JSONResponse(
+                return ContractJSONResponse(
                     status_code=500,
                     content=_attach_session_id(
                         _attach_and_log_audit(
@@ -2240,7 +2333,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 debug_on=bool(debug_on),
                 exit_path="dept_finance.strict.ok",
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         if is_explicit_dept_ops:
             from services.department_agents import dept_ops_agent  # noqa: PLC0415
@@ -2300,7 +2393,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 )
             except Exception as exc:
                 # No fallback: strict dept_ops failure is a hard 500.
-                return JSONResponse(
+                return ContractJSONResponse(
                     status_code=500,
                     content=_attach_session_id(
                         _attach_and_log_audit(
@@ -2379,7 +2472,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 debug_on=bool(debug_on),
                 exit_path="dept_ops.strict.ok",
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         memory_provider = "readonly_memory_service"
         memory_error: Optional[str] = None
@@ -2428,7 +2521,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
             and _require_conversation_id()
             and not (isinstance(conversation_id, str) and conversation_id.strip())
         ):
-            return JSONResponse(
+            return ContractJSONResponse(
                 status_code=400,
                 content=_attach_session_id(
                     _attach_and_log_audit(
@@ -2656,7 +2749,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 debug_on=bool(debug_on),
                 exit_path="ceo_chat.block3.grounding.fail_closed",
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         # Gate is authoritative for pending proposal replay/dismiss.
         if gate_decision.intent_category == "PENDING_PROPOSAL_CONFIRM" and pending:
@@ -2699,7 +2792,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 debug_on=bool(debug_on),
                 exit_path="ceo_chat.pending_proposal.replay",
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         if gate_decision.intent_category == "PENDING_PROPOSAL_DISMISS" and pending:
             pending_declined = True
@@ -2743,7 +2836,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 debug_on=bool(debug_on),
                 exit_path="ceo_chat.turn_gate.ambiguous",
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         conv_summary = None
         if isinstance(conversation_id, str) and conversation_id.strip():
@@ -2967,10 +3060,30 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                         if notion is not None:
                             targeted_reads_info["source"] = "live"
                             max_items = {"tasks": 50, "projects": 30, "goals": 30}
-                            snap = await notion.build_knowledge_snapshot(
-                                db_keys=list(pol.notion_db_keys),
-                                max_items_by_db=max_items,
-                            )
+
+                            async def _build_targeted_snapshot() -> Any:
+                                return await notion.build_knowledge_snapshot(
+                                    db_keys=list(pol.notion_db_keys),
+                                    max_items_by_db=max_items,
+                                )
+
+                            coalesced = False
+                            if isinstance(session_id, str) and session_id.strip():
+                                # Single-flight: concurrent turns in this session
+                                # share one Notion snapshot build (and it is cached).
+                                (
+                                    snap,
+                                    coalesced,
+                                ) = await SESSION_SNAPSHOT_CACHE.get_or_build(
+                                    session_id=session_id.strip(),
+                                    db_keys_csv=db_keys_csv,
+                                    build=_build_targeted_snapshot,
+                                    ttl_seconds=ttl_s,
+                                    min_last_sync=min_last_sync,
+                                )
+                            else:
+                                snap = await _build_targeted_snapshot()
+                            targeted_reads_info["coalesced"] = bool(coalesced)
                             if isinstance(snap, dict) and snap:
                                 payload.snapshot = snap
                                 kb = {
@@ -2984,19 +3097,16 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                                         if isinstance(snap.get("meta"), dict)
                                         else {}
                                     )
-                                    if isinstance(m.get("notion_calls"), int):
+                                    # A coalesced turn made no Notion calls itself.
+                                    if not coalesced and isinstance(
+                                        m.get("notion_calls"), int
+                                    ):
                                         notion_calls_for_trace = int(
                                             m.get("notion_calls")
                                         )
                                 except Exception:
                                     notion_calls_for_trace = None
-                                if isinstance(session_id, str) and session_id.strip():
-                                    SESSION_SNAPSHOT_CACHE.set(
-                                        session_id=session_id.strip(),
-                                        db_keys_csv=db_keys_csv,
-                                        value=snap,
-                                        ttl_seconds=ttl_s,
-                                    )
+                    targeted_reads_info["cache_stats"] = SESSION_SNAPSHOT_CACHE.stats()
             except Exception:
                 # Fail-soft: never block chat on Notion targeted reads.
                 pass
@@ -3119,7 +3229,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 "phase6_notion_ops_gate": {"event": "armed", "session_id": session_id}
             }
             tr["turn_gate"] = turn_gate_trace
-            grounding = _grounding_bundle(
+            grounding = await _grounding_bundle(
                 prompt=prompt,
                 knowledge_snapshot=ks_for_gp,
                 memory_snapshot=mem_snapshot,
@@ -3154,7 +3264,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 exit_path="ceo_chat.notion_ops.armed",
                 targeted_reads=targeted_reads_info,
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         if session_id and _is_deactivate(prompt):
             st = await _set_armed(session_id, False, prompt=prompt)
@@ -3165,7 +3275,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 }
             }
             tr["turn_gate"] = turn_gate_trace
-            grounding = _grounding_bundle(
+            grounding = await _grounding_bundle(
                 prompt=prompt,
                 knowledge_snapshot=ks_for_gp,
                 memory_snapshot=mem_snapshot,
@@ -3200,7 +3310,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 exit_path="ceo_chat.notion_ops.disarmed",
                 targeted_reads=targeted_reads_info,
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         # Determine armed state (default false if no session_id)
         st = (
@@ -3335,7 +3445,9 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     exit_path="ceo_chat.create_task_active_goal.cancel",
                     targeted_reads=targeted_reads_info,
                 )
-                return JSONResponse(content=_attach_session_id(content, session_id))
+                return ContractJSONResponse(
+                    content=_attach_session_id(content, session_id)
+                )
 
             title = (prompt or "").strip().strip(" \t\r\n\"'.,;:!?")
             if title:
@@ -3426,7 +3538,9 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     exit_path="ceo_chat.create_task_active_goal.missing_goal_context",
                     targeted_reads=targeted_reads_info,
                 )
-                return JSONResponse(content=_attach_session_id(content, session_id))
+                return ContractJSONResponse(
+                    content=_attach_session_id(content, session_id)
+                )
 
             inline_title = _extract_inline_task_title(prompt or "")
             if not inline_title:
@@ -3480,7 +3594,9 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     exit_path="ceo_chat.create_task_active_goal.ask_title",
                     targeted_reads=targeted_reads_info,
                 )
-                return JSONResponse(content=_attach_session_id(content, session_id))
+                return ContractJSONResponse(
+                    content=_attach_session_id(content, session_id)
+                )
 
             # Inline title provided; normalize prompt and thread goal_id into metadata.
             try:
@@ -3559,7 +3675,9 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     exit_path="ceo_chat.write_intent.transform_plan_missing_source",
                     targeted_reads=targeted_reads_info,
                 )
-                return JSONResponse(content=_attach_session_id(content, session_id))
+                return ContractJSONResponse(
+                    content=_attach_session_id(content, session_id)
+                )
 
             resolved_prompt = transform_plan_resolution.get("prompt")
             if isinstance(resolved_prompt, str) and resolved_prompt.strip():
@@ -3654,7 +3772,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     },
                 }
 
-                grounding_nops = _grounding_bundle(
+                grounding_nops = await _grounding_bundle(
                     prompt=prompt,
                     knowledge_snapshot=ks_for_gp,
                     memory_snapshot=mem_snapshot,
@@ -3695,7 +3813,9 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     targeted_reads=targeted_reads_info,
                 )
 
-                return JSONResponse(content=_attach_session_id(content, session_id))
+                return ContractJSONResponse(
+                    content=_attach_session_id(content, session_id)
+                )
             except Exception:
                 # Fail-soft: fall back to existing advisor routing.
                 pass
@@ -3772,7 +3892,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             "intent": "show_goals_tasks",
                             "exit_path": "deterministic_ssot",
                         }
-                        _det_grounding = _grounding_bundle(
+                        _det_grounding = await _grounding_bundle(
                             prompt=prompt,
                             knowledge_snapshot=ks_for_gp,
                             memory_snapshot=mem_snapshot,
@@ -3905,7 +4025,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                         except Exception:
                             pass
 
-                        return JSONResponse(
+                        return ContractJSONResponse(
                             content=_attach_session_id(_det_content, session_id)
                         )
             except Exception:
@@ -4181,7 +4301,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             "goal_ids": list(goal_id_set)[:3],
                             "linked_tasks_count": int(len(linked_titles)),
                         }
-                        _det_grounding_mi = _grounding_bundle(
+                        _det_grounding_mi = await _grounding_bundle(
                             prompt=prompt,
                             knowledge_snapshot=ks_for_gp,
                             memory_snapshot=mem_snapshot,
@@ -4217,7 +4337,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             exit_path="ceo_chat.deterministic_ssot.multi_intent_goal_summary",
                             targeted_reads=targeted_reads_info,
                         )
-                        return JSONResponse(
+                        return ContractJSONResponse(
                             content=_attach_session_id(_det_content_mi, session_id)
                         )
         except Exception:
@@ -4305,7 +4425,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             else None
                         ),
                     }
-                    _det_grounding_top = _grounding_bundle(
+                    _det_grounding_top = await _grounding_bundle(
                         prompt=prompt,
                         knowledge_snapshot=ks_for_gp,
                         memory_snapshot=mem_snapshot,
@@ -4341,7 +4461,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                         exit_path="ceo_chat.deterministic_ssot.top_goal",
                         targeted_reads=targeted_reads_info,
                     )
-                    return JSONResponse(
+                    return ContractJSONResponse(
                         content=_attach_session_id(_det_content_top, session_id)
                     )
             except Exception:
@@ -4642,7 +4762,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             "signals_count": int(len(signals)),
                             "mode": "deterministic" if has_enough_signals else "hybrid",
                         }
-                        _det_grounding_why = _grounding_bundle(
+                        _det_grounding_why = await _grounding_bundle(
                             prompt=prompt,
                             knowledge_snapshot=ks_for_gp,
                             memory_snapshot=mem_snapshot,
@@ -4678,7 +4798,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             exit_path="ceo_chat.deterministic_ssot.why_main_goal_hybrid",
                             targeted_reads=targeted_reads_info,
                         )
-                        return JSONResponse(
+                        return ContractJSONResponse(
                             content=_attach_session_id(_det_content_why, session_id)
                         )
         except Exception:
@@ -5005,7 +5125,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                                 "total_count": int(total_count),
                                 "active_count": int(active_count),
                             }
-                            _det_grounding_goal_tasks = _grounding_bundle(
+                            _det_grounding_goal_tasks = await _grounding_bundle(
                                 prompt=prompt,
                                 knowledge_snapshot=ks_for_gp,
                                 memory_snapshot=mem_snapshot,
@@ -5043,7 +5163,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                                 exit_path="ceo_chat.deterministic_ssot.goal_scoped_tasks",
                                 targeted_reads=targeted_reads_info,
                             )
-                            return JSONResponse(
+                            return ContractJSONResponse(
                                 content=_attach_session_id(
                                     _det_content_goal_tasks, session_id
                                 )
@@ -5083,7 +5203,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             "active_count": stats.get("active_count"),
                         },
                     }
-                    _det_grounding_pa = _grounding_bundle(
+                    _det_grounding_pa = await _grounding_bundle(
                         prompt=prompt,
                         knowledge_snapshot=ks_for_gp,
                         memory_snapshot=mem_snapshot,
@@ -5119,7 +5239,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                         exit_path="ceo_chat.deterministic_ssot.task_phase_a",
                         targeted_reads=targeted_reads_info,
                     )
-                    return JSONResponse(
+                    return ContractJSONResponse(
                         content=_attach_session_id(_det_content_pa, session_id)
                     )
 
@@ -5222,7 +5342,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                         "exit_path": "deterministic_ssot_task_query",
                         "stats": res.stats,
                     }
-                    _det_grounding2 = _grounding_bundle(
+                    _det_grounding2 = await _grounding_bundle(
                         prompt=prompt,
                         knowledge_snapshot=ks_for_gp,
                         memory_snapshot=mem_snapshot,
@@ -5258,7 +5378,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                         exit_path="ceo_chat.deterministic_ssot.task_query",
                         targeted_reads=targeted_reads_info,
                     )
-                    return JSONResponse(
+                    return ContractJSONResponse(
                         content=_attach_session_id(_det_content2, session_id)
                     )
         except Exception:
@@ -5913,7 +6033,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             "exit_path": "deterministic_snapshot_goal_ownership",
                             "goal_ref": goal_ref,
                         }
-                        _det_grounding3 = _grounding_bundle(
+                        _det_grounding3 = await _grounding_bundle(
                             prompt=prompt,
                             knowledge_snapshot=ks_for_gp,
                             memory_snapshot=mem_snapshot,
@@ -5949,7 +6069,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             exit_path="ceo_chat.deterministic_ssot.goal_ownership",
                             targeted_reads=targeted_reads_info,
                         )
-                        return JSONResponse(
+                        return ContractJSONResponse(
                             content=_attach_session_id(_det_content3, session_id)
                         )
                     else:
@@ -5981,7 +6101,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             "exit_path": "deterministic_snapshot_goal_ownership",
                             "goal_ref": None,
                         }
-                        _det_grounding3b = _grounding_bundle(
+                        _det_grounding3b = await _grounding_bundle(
                             prompt=prompt,
                             knowledge_snapshot=ks_for_gp,
                             memory_snapshot=mem_snapshot,
@@ -6016,14 +6136,14 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                             exit_path="ceo_chat.deterministic_ssot.goal_ownership",
                             targeted_reads=targeted_reads_info,
                         )
-                        return JSONResponse(
+                        return ContractJSONResponse(
                             content=_attach_session_id(_det_content3b, session_id)
                         )
         except Exception:
             pass
 
         # Build a first grounding pack early so the agent can cite KB ids deterministically.
-        pre_grounding = _grounding_bundle(
+        pre_grounding = await _grounding_bundle(
             prompt=prompt,
             knowledge_snapshot=ks_for_gp,
             memory_snapshot=mem_snapshot,
@@ -6208,7 +6328,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
             except Exception:
                 pass
         except LLMNotConfiguredError as e:
-            return JSONResponse(
+            return ContractJSONResponse(
                 status_code=500,
                 content=_attach_session_id(
                     _attach_and_log_audit(
@@ -6257,7 +6377,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
         legacy_trace = out.trace or {}
         if isinstance(legacy_trace, dict) and isinstance(notion_calls_for_trace, int):
             legacy_trace["notion_calls"] = int(notion_calls_for_trace)
-        grounding = _grounding_bundle(
+        grounding = await _grounding_bundle(
             prompt=prompt,
             knowledge_snapshot=ks_for_gp,
             memory_snapshot=mem_snapshot,
@@ -6381,7 +6501,9 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     exit_path="ceo_chat.disarmed.non_notion_actionable",
                     targeted_reads=targeted_reads_info,
                 )
-                return JSONResponse(content=_attach_session_id(content, session_id))
+                return ContractJSONResponse(
+                    content=_attach_session_id(content, session_id)
+                )
 
             # If the advisor returned non-actionable proposal wrappers (e.g. approval-gated
             # memory/knowledge write proposals), keep them even when Notion Ops is DISARMED.
@@ -6442,7 +6564,9 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     exit_path="ceo_chat.disarmed.wrapper_proposals",
                     targeted_reads=targeted_reads_info,
                 )
-                return JSONResponse(content=_attach_session_id(content, session_id))
+                return ContractJSONResponse(
+                    content=_attach_session_id(content, session_id)
+                )
 
             content: Dict[str, Any] = {
                 "text": _apply_post_answer_snapshot_consistency_guard(
@@ -6486,7 +6610,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 exit_path="ceo_chat.disarmed.no_actionable",
                 targeted_reads=targeted_reads_info,
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         # ARMED: allow actionable, otherwise allow approval-wrapper fallback
         if actionable:
@@ -6558,7 +6682,7 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 exit_path="ceo_chat.armed.actionable",
                 targeted_reads=targeted_reads_info,
             )
-            return JSONResponse(content=_attach_session_id(content, session_id))
+            return ContractJSONResponse(content=_attach_session_id(content, session_id))
 
         # No actionable → fallback:
         if _looks_like_write_intent(prompt):
@@ -6634,7 +6758,21 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
             exit_path="ceo_chat.armed.fallback",
             targeted_reads=targeted_reads_info,
         )
-        return JSONResponse(content=_attach_session_id(content, session_id))
+        return ContractJSONResponse(content=_attach_session_id(content, session_id))
+
+    @router.post("/chat", response_model=AgentOutput, response_model_by_alias=False)
+    async def chat(payload: AgentInput, request: Request):
+        # Conversation meta/turns are loaded once per turn and written back in
+        # one coalesced flush when the turn ends (also on errors). The load and
+        # the flush are awaited, so Postgres round-trips do not block the loop.
+        async with aconversation_state_turn() as conv_turn:
+            _sid = getattr(payload, "session_id", None)
+            await conv_turn.aprefetch(
+                _extract_conversation_id(payload)
+                or (_sid if isinstance(_sid, str) else "")
+                or (request.headers.get("X-Session-Id") or "")
+            )
+            return await _chat_turn(payload, request)
 
     @router.post("/chat/stream")
     async def chat_stream(payload: AgentInput, request: Request):
@@ -6642,6 +6780,15 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
 
         - Feature-flagged via CHAT_STREAMING_ENABLED (default OFF).
         - Does NOT modify /chat behavior; it delegates final response generation to /chat.
+        - By default assistant.delta events are chunks of the final text,
+          sent once /chat has finished (no assistant.reset, ever).
+        - Clients that handle assistant.reset opt in to live deltas with
+          X-Live-Deltas: 1 (or ?live_deltas=1): deltas are then emitted while
+          the advisory executor streams tokens (via the openai_streaming token
+          sink), filtered by the incremental leak sanitizer. assistant.final
+          still carries the fully sanitized /chat contract; if it diverges
+          from what was streamed, an assistant.reset event precedes the
+          corrected deltas.
         """
 
         if not _chat_streaming_enabled():
@@ -6690,6 +6837,8 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                 out.pop("metadata", None)
             return out
 
+        live_deltas = _live_deltas_requested(request)
+
         async def _iter_ndjson():
             seq = 0
 
@@ -6714,12 +6863,44 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     "source_endpoint": "/api/chat/stream",
                     "model": None,
                     "agent_id": None,
-                    "capabilities": {"text_streaming": True, "final_response": True},
+                    "capabilities": {
+                        "text_streaming": True,
+                        "token_streaming": live_deltas,
+                        "delta_reset": live_deltas,
+                        "final_response": True,
+                    },
                 },
             )
 
+            prompt_text = str(getattr(payload, "message", "") or "")
+            live = _LiveAnswerSink(prompt=prompt_text)
+            if live_deltas:
+                sink_token = set_token_sink(live)
+                try:
+                    # The task copies the current context, so executors see the sink.
+                    chat_task = asyncio.create_task(chat(payload, request))
+                finally:
+                    reset_token_sink(sink_token)
+            else:
+                # No sink: nothing is released early, so the final text is
+                # streamed as plain deltas and no reset can be needed.
+                chat_task = asyncio.create_task(chat(payload, request))
+
             try:
-                final_resp = await chat(payload, request)
+                while not chat_task.done():
+                    getter = asyncio.ensure_future(live.queue.get())
+                    done, _ = await asyncio.wait(
+                        {chat_task, getter}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if getter in done:
+                        yield _emit("assistant.delta", {"delta_text": getter.result()})
+                    else:
+                        getter.cancel()
+                while not live.queue.empty():
+                    piece = live.queue.get_nowait()
+                    yield _emit("assistant.delta", {"delta_text": piece})
+
+                final_resp = await chat_task
 
                 body_bytes = getattr(final_resp, "body", b"")
                 if not isinstance(body_bytes, (bytes, bytearray, memoryview)):
@@ -6737,25 +6918,40 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
 
                 # IMPORTANT: StreamingResponse bypasses the JSON-response middleware
                 # that enforces the "no internal template leak" contract.
-                # Apply the same Block 2 response contract integrity layer here
-                # to guarantee parity between stream and non-stream.
-                try:
-                    from gateway.gateway_server import (  # type: ignore
-                        enforce_response_contract_integrity,
-                    )
+                # Normally chat() already applied it via ContractJSONResponse;
+                # otherwise apply the same Block 2 layer here for parity
+                # between stream and non-stream.
+                if not bool(getattr(final_resp, "contract_enforced", False)):
+                    try:
+                        from gateway.gateway_server import (  # type: ignore
+                            enforce_response_contract_integrity,
+                        )
 
-                    body_obj = enforce_response_contract_integrity(
-                        body_obj=body_obj,
-                        prompt=str(getattr(payload, "message", "") or ""),
-                        session_id=session_id or "",
-                        conversation_id=conversation_id or "",
-                    )
-                except Exception:
-                    # Fail-safe: if sanitizer import or logic fails, do not block streaming.
-                    pass
+                        body_obj = enforce_response_contract_integrity(
+                            body_obj=body_obj,
+                            prompt=str(getattr(payload, "message", "") or ""),
+                            session_id=session_id or "",
+                            conversation_id=conversation_id or "",
+                        )
+                    except Exception:
+                        # Fail-safe: if sanitizer import or logic fails, do not block streaming.
+                        pass
 
                 text_out = str(body_obj.get("text") or "")
-                for part in _chunk_text(text_out):
+                streamed = live.released
+                remainder = text_out
+                if streamed and text_out.startswith(streamed):
+                    remainder = text_out[len(streamed) :]
+                elif streamed:
+                    # Post-processing/sanitizing changed already-streamed text.
+                    yield _emit(
+                        "assistant.reset",
+                        {
+                            "reason": "final_text_diverged",
+                            "discard_chars": len(streamed),
+                        },
+                    )
+                for part in _chunk_text(remainder):
                     if part:
                         yield _emit("assistant.delta", {"delta_text": part})
 
@@ -6779,6 +6975,10 @@ def build_chat_router(agent_router: Optional[Any] = None) -> APIRouter:
                     },
                 )
                 yield _emit("done", {"ok": False, "reason": "error"})
+            finally:
+                if not chat_task.done():
+                    # Client went away mid-stream: same as the old inline await.
+                    chat_task.cancel()
 
         return StreamingResponse(
             _iter_ndjson(),
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import os
+import asyncio
 import json
 import logging
+import weakref
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 from typing import Any, Dict, List, Optional
@@ -13,6 +15,7 @@ from fastapi import APIRouter, Body, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from services.approval_flow import require_approval_or_block
+from services.notion_query_cache import get_notion_query_cache
 from services.auth.dependencies import require_principal, require_role
 from services.auth.principal import Principal
 
@@ -213,11 +216,35 @@ def _discover_all_db_keys_from_env() -> Dict[str, str]:
     return out
 
 
+# One pooled client per event loop (httpx clients are loop-bound); keyed
+# weakly so clients of closed test loops are dropped with the loop.
+_NOTION_HTTP_CLIENTS: "weakref.WeakKeyDictionary[Any, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _notion_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _NOTION_HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=30.0)
+        _NOTION_HTTP_CLIENTS[loop] = client
+    return client
+
+
 async def _notion_db_query(database_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    # Shared read-through cache with NotionService (same DB id + query body).
+    return await get_notion_query_cache().read_through(
+        database_id, body, lambda: _notion_db_query_uncached(database_id, body)
+    )
+
+
+async def _notion_db_query_uncached(
+    database_id: str, body: Dict[str, Any]
+) -> Dict[str, Any]:
     url = f"{NOTION_API_URL}/databases/{database_id}/query"
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            r = await client.post(url, headers=_notion_headers(), json=body)
+        r = await _notion_http_client().post(url, headers=_notion_headers(), json=body)
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(
             status_code=502,
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 import os
-from typing import Literal, Union
+import threading
+from typing import Any, Dict, Literal, Tuple, Union
 
 from services.agent_router.openai_assistant_executor import OpenAIAssistantExecutor
 from services.agent_router.openai_assistants_executor import OpenAIAssistantsExecutor
+from services.agent_router.openai_client_pool import (
+    ensure_openai_client_config,
+    openai_pool_stats,
+    reset_openai_client_pool,
+)
 from services.agent_router.openai_responses_executor import OpenAIResponsesExecutor
+from services.agent_router.openai_streaming import stream_metrics_stats
 
 OpenAIAPIMode = Literal["assistants", "responses"]
 ExecutorPurpose = Literal["agent_router", "ops_planner", "ceo_advisor"]
 
+# Long-lived executors keyed by (purpose, mode, model, client generation).
+# Executors are stateless per call and resolve the shared AsyncOpenAI client
+# (and its keep-alive pool) per call. A key rotation bumps the client
+# generation, so stale executors are simply not hit again.
+_EXECUTORS: Dict[Tuple[str, str, str, int], Any] = {}
+_EXECUTORS_LOCK = threading.Lock()
+_EXECUTOR_STATS: Dict[str, int] = {"hits": 0, "builds": 0}
+
 
 def _read_api_mode() -> OpenAIAPIMode:
     raw = (os.getenv("OPENAI_API_MODE") or "assistants").strip().lower()
@@ -44,15 +59,53 @@ def get_executor(
 
         return _DummyCeoAdvisorExecutor()
 
-    # CEO advisor should respect OPENAI_API_MODE too.
-    # - If responses: use Responses executor
-    # - Else: keep legacy assistant executor for CEO advisor
-    if purpose == "ceo_advisor":
+    generation = ensure_openai_client_config()
+    model = (
+        (os.getenv("OPENAI_RESPONSES_MODEL") or "").strip()
+        if mode == "responses"
+        else ""
+    )
+    key = (str(purpose), mode, model, generation)
+
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(key)
+        if executor is not None:
+            _EXECUTOR_STATS["hits"] += 1
+            return executor
+
+        # CEO advisor should respect OPENAI_API_MODE too.
+        # - If responses: use Responses executor
+        # - Else: keep legacy assistant executor for CEO advisor
         if mode == "responses":
-            return OpenAIResponsesExecutor()
-        return OpenAIAssistantExecutor()
+            executor = OpenAIResponsesExecutor()
+        elif purpose == "ceo_advisor":
+            executor = OpenAIAssistantExecutor()
+        else:
+            executor = OpenAIAssistantsExecutor()
+
+        # Drop executors bound to a retired client generation.
+        for k in [k for k in _EXECUTORS if k[3] != key[3]]:
+            _EXECUTORS.pop(k, None)
+        _EXECUTORS[key] = executor
+        _EXECUTOR_STATS["builds"] += 1
+        return executor
+
+
+def executor_pool_stats() -> Dict[str, Any]:
+    """Registry and shared connection-pool statistics (for diagnostics)."""
+    with _EXECUTORS_LOCK:
+        out: Dict[str, Any] = {
+            "executors": sorted(f"{k[0]}:{k[1]}:{k[2] or '-'}" for k in _EXECUTORS),
+            "hits": int(_EXECUTOR_STATS["hits"]),
+            "builds": int(_EXECUTOR_STATS["builds"]),
+        }
+    out["client_pool"] = openai_pool_stats()
+    out["stream"] = stream_metrics_stats()
+    return out
 
-    if mode == "responses":
-        return OpenAIResponsesExecutor()
 
-    return OpenAIAssistantsExecutor()
+def reset_executor_pool() -> None:
+    with _EXECUTORS_LOCK:
+        _EXECUTORS.clear()
+        _EXECUTOR_STATS.update(hits=0, builds=0)
+    reset_openai_client_pool()
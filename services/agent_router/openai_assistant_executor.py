@@ -12,13 +12,24 @@ from decimal import Decimal
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from openai import OpenAI
-
 from services.ceo_alignment_engine import CEOAlignmentEngine  # <-- already present
-from services.identity_loader import load_ceo_identity_pack
+from services.identity_loader import load_ceo_identity_pack_frozen
 from services.knowledge_service import KnowledgeService
 from services.world_state_engine import WorldStateEngine  # <-- already present
-from services.agent_router.openai_key_diag import get_openai_key_diag
+from services.agent_router.openai_client_pool import (
+    ensure_openai_client_config,
+    get_shared_async_openai_client,
+)
+from services.agent_router.openai_streaming import (
+    RunStreamResult,
+    StreamMetrics,
+    acall,
+    collect_response_stream,
+    consume_run_stream,
+    open_token_stream,
+    record_stream_metrics,
+    streaming_enabled,
+)
 
 # OPTION C (Behaviour router) - best-effort import (FAIL-SOFT, enterprise)
 try:
@@ -770,32 +781,31 @@ class OpenAIAssistantExecutor:
         advisory_assistant_id_env: str = "CEO_ADVISOR_ASSISTANT_ID",
         poll_interval_s: float = 0.5,
         max_wait_s: float = 60.0,
+        client: Optional[Any] = None,
     ) -> None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise RuntimeError("OPENAI_API_KEY is missing")
-
         self._execution_assistant_id_env = execution_assistant_id_env
         self._advisory_assistant_id_env = advisory_assistant_id_env
         self._poll_interval_s = float(poll_interval_s)
         self._max_wait_s = float(max_wait_s)
 
-        self.client = OpenAI(api_key=api_key)
-
-        d = get_openai_key_diag()
-        logger.info(
-            "[OPENAI_KEY_DIAG] present=%s len=%s prefix=%s fp=%s source=%s mode=%s base_url=%s",
-            d.get("present"),
-            d.get("len"),
-            d.get("prefix"),
-            d.get("fingerprint"),
-            d.get("source"),
-            d.get("mode"),
-            d.get("base_url"),
-        )
+        self._client = client
+        if client is None:
+            # Fail fast on a missing key; the client itself is resolved per call.
+            ensure_openai_client_config()
+
+    @property
+    def client(self) -> Any:
+        """Injected client, else the shared AsyncOpenAI client for this loop."""
+        if self._client is not None:
+            return self._client
+        return get_shared_async_openai_client()
+
+    @client.setter
+    def client(self, value: Any) -> None:
+        self._client = value
 
-    async def _to_thread(self, fn, *args, **kwargs):
-        return await asyncio.to_thread(fn, *args, **kwargs)
+    async def _call(self, fn, *args, **kwargs):
+        return await acall(fn, *args, **kwargs)
 
     def _get_execution_assistant_id_or_raise(self) -> str:
         assistant_id = os.getenv(self._execution_assistant_id_env)
@@ -811,7 +821,7 @@ class OpenAIAssistantExecutor:
 
     async def _cancel_run_best_effort(self, *, thread_id: str, run_id: str) -> None:
         try:
-            await self._to_thread(
+            await self._call(
                 self.client.beta.threads.runs.cancel, thread_id=thread_id, run_id=run_id
             )
         except Exception:
@@ -837,50 +847,105 @@ class OpenAIAssistantExecutor:
                 await self._cancel_run_best_effort(thread_id=thread_id, run_id=run_id)
                 raise RuntimeError("Assistant run timed out")
 
-            run_status = await self._to_thread(
+            run_status = await self._call(
                 self.client.beta.threads.runs.retrieve,
                 thread_id=thread_id,
                 run_id=run_id,
             )
 
-            status = getattr(run_status, "status", None)
+            if await self._check_run_status(
+                run_status, thread_id=thread_id, run_id=run_id
+            ):
+                return
 
-            if status == "requires_action":
-                required_action = getattr(run_status, "required_action", None)
-                submit = (
-                    getattr(required_action, "submit_tool_outputs", None)
-                    if required_action
-                    else None
-                )
-                tool_calls = getattr(submit, "tool_calls", None) if submit else None
+            await asyncio.sleep(self._poll_interval_s)
 
-                await self._cancel_run_best_effort(thread_id=thread_id, run_id=run_id)
+    async def _check_run_status(
+        self, run_status: Any, *, thread_id: str, run_id: str
+    ) -> bool:
+        """True when completed; cancels + raises on tool calls, raises on failure."""
+        status = getattr(run_status, "status", None)
+
+        if status == "requires_action":
+            required_action = getattr(run_status, "required_action", None)
+            submit = (
+                getattr(required_action, "submit_tool_outputs", None)
+                if required_action
+                else None
+            )
+            tool_calls = getattr(submit, "tool_calls", None) if submit else None
 
-                names: list[str] = []
-                if tool_calls:
-                    for call in tool_calls:
-                        fn = getattr(call, "function", None)
-                        fn_name = getattr(fn, "name", None) if fn else None
-                        if fn_name:
-                            names.append(str(fn_name))
+            await self._cancel_run_best_effort(thread_id=thread_id, run_id=run_id)
 
-                raise ReadOnlyToolCallAttempt(
-                    f"Run attempted tool calls (hard-blocked): {names or ['(unknown)']}"
-                )
+            names: list[str] = []
+            if tool_calls:
+                for call in tool_calls:
+                    fn = getattr(call, "function", None)
+                    fn_name = getattr(fn, "name", None) if fn else None
+                    if fn_name:
+                        names.append(str(fn_name))
 
-            if status == "completed":
-                return
+            raise ReadOnlyToolCallAttempt(
+                f"Run attempted tool calls (hard-blocked): {names or ['(unknown)']}"
+            )
+
+        if status == "completed":
+            return True
+
+        if status in {"failed", "cancelled", "expired", "incomplete"}:
+            details = _run_last_error_details(run_status)
+            raise RuntimeError(
+                f"Assistant run failed with status: {status}; details={json.dumps(details, ensure_ascii=False)}"
+            )
+
+        return False
+
+    async def _stream_run_to_completion(
+        self,
+        *,
+        thread_id: str,
+        assistant_id: str,
+        instructions: Optional[str],
+        metrics: StreamMetrics,
+        on_token: Optional[Any] = None,
+    ) -> RunStreamResult:
+        """Create the run as an event stream and wait for its terminal event.
 
-            if status in {"failed", "cancelled", "expired"}:
-                details = _run_last_error_details(run_status)
-                raise RuntimeError(
-                    f"Assistant run failed with status: {status}; details={json.dumps(details, ensure_ascii=False)}"
+        Same read-only guard as _wait_for_run_completion, without polling.
+        """
+        out = RunStreamResult()
+        stream = await self._create_run_best_effort(
+            thread_id=thread_id,
+            assistant_id=assistant_id,
+            instructions=instructions,
+            tool_choice=None,
+            stream=True,
+        )
+        try:
+            await asyncio.wait_for(
+                consume_run_stream(stream, metrics=metrics, out=out, on_token=on_token),
+                timeout=self._max_wait_s,
+            )
+        except asyncio.TimeoutError as e:
+            if out.run_id:
+                await self._cancel_run_best_effort(
+                    thread_id=thread_id, run_id=out.run_id
                 )
+            raise RuntimeError("Assistant run timed out") from e
 
-            await asyncio.sleep(self._poll_interval_s)
+        if out.run_id is None:
+            raise RuntimeError("Assistant run stream produced no run")
+        if not await self._check_run_status(
+            out.run, thread_id=thread_id, run_id=out.run_id
+        ):
+            # Stream closed early without a terminal event: fall back to polling.
+            await self._wait_for_run_completion(
+                thread_id=thread_id, run_id=out.run_id, allow_tools=False
+            )
+        return out
 
     async def _get_final_assistant_message_text(self, *, thread_id: str) -> str:
-        messages = await self._to_thread(
+        messages = await self._call(
             self.client.beta.threads.messages.list, thread_id=thread_id
         )
         data = getattr(messages, "data", None) or []
@@ -942,6 +1007,7 @@ class OpenAIAssistantExecutor:
         assistant_id: str,
         instructions: Optional[str] = None,
         tool_choice: Optional[Any] = None,
+        stream: bool = False,
     ):
         """
         Compatibility layer for SDK / API shape changes.
@@ -964,6 +1030,8 @@ class OpenAIAssistantExecutor:
             kw0["instructions"] = instructions
         if tc is not None:
             kw0["tool_choice"] = tc
+        if stream:
+            kw0["stream"] = True
         attempts.append(kw0)
 
         # Drop tool_choice
@@ -979,9 +1047,7 @@ class OpenAIAssistantExecutor:
         last_exc: Optional[Exception] = None
         for i, kwargs in enumerate(attempts, start=1):
             try:
-                return await self._to_thread(
-                    self.client.beta.threads.runs.create, **kwargs
-                )
+                return await self._call(self.client.beta.threads.runs.create, **kwargs)
             except TypeError as e:
                 last_exc = e
                 logger.warning(
@@ -1059,7 +1125,7 @@ class OpenAIAssistantExecutor:
 
         thread = None
         if api_mode != "responses":
-            thread = await self._to_thread(self.client.beta.threads.create)
+            thread = await self._call(self.client.beta.threads.create)
 
         safe_context = dict(context)
         canon = dict(safe_context.get("canon") or {})
@@ -1078,7 +1144,8 @@ class OpenAIAssistantExecutor:
         identity_pack_errors_count = 0
 
         try:
-            identity_pack = load_ceo_identity_pack()
+            # Shared read-only pack: _compact_identity_pack builds new dicts.
+            identity_pack = load_ceo_identity_pack_frozen().value
         except Exception as e:  # noqa: BLE001
             logger.warning("load_ceo_identity_pack() failed: %s", e)
             identity_pack = None
@@ -1217,7 +1284,7 @@ class OpenAIAssistantExecutor:
         content, shrink_trace = _safe_dumps_for_openai(advisory_contract)
 
         if thread is not None:
-            await self._to_thread(
+            await self._call(
                 self.client.beta.threads.messages.create,
                 thread_id=thread.id,
                 role="user",
@@ -1226,18 +1293,27 @@ class OpenAIAssistantExecutor:
 
         t0 = time.monotonic()
         run = None
+        stream_metrics: Optional[StreamMetrics] = None
         try:
             if api_mode == "responses":
-                resp = await self._to_thread(
-                    self.client.responses.create,
-                    model=responses_model,
-                    input=content,
-                    instructions=run_instructions,
-                    temperature=0,
-                    text={"format": {"type": "json_object"}},
-                    tool_choice="none",
-                    tools=[],
-                )
+                resp_kwargs: Dict[str, Any] = {
+                    "model": responses_model,
+                    "input": content,
+                    "instructions": run_instructions,
+                    "temperature": 0,
+                    "text": {"format": {"type": "json_object"}},
+                    "tool_choice": "none",
+                    "tools": [],
+                }
+                create = self.client.responses.create
+                if streaming_enabled(create):
+                    stream_metrics = StreamMetrics(kind="ceo_advisor_responses")
+                    stream = await create(**resp_kwargs, stream=True)
+                    resp = await collect_response_stream(
+                        stream, metrics=stream_metrics, on_token=open_token_stream()
+                    )
+                else:
+                    resp = await self._call(create, **resp_kwargs)
 
                 output = getattr(resp, "output", None) or []
                 for item in output:
@@ -1263,19 +1339,32 @@ class OpenAIAssistantExecutor:
                 if thread is None:
                     raise RuntimeError("internal_error: missing_thread")
 
-                run = await self._create_run_best_effort(
-                    thread_id=thread.id,
-                    assistant_id=assistant_id,
-                    instructions=run_instructions,
-                    tool_choice=None,
-                )
+                streamed_text: Optional[str] = None
+                if streaming_enabled(self.client.beta.threads.runs.create):
+                    stream_metrics = StreamMetrics(kind="ceo_advisor_run")
+                    streamed = await self._stream_run_to_completion(
+                        thread_id=thread.id,
+                        assistant_id=assistant_id,
+                        instructions=run_instructions,
+                        metrics=stream_metrics,
+                        on_token=open_token_stream(),
+                    )
+                    run = streamed.run
+                    streamed_text = streamed.text
+                else:
+                    run = await self._create_run_best_effort(
+                        thread_id=thread.id,
+                        assistant_id=assistant_id,
+                        instructions=run_instructions,
+                        tool_choice=None,
+                    )
 
-                await self._wait_for_run_completion(
-                    thread_id=thread.id, run_id=run.id, allow_tools=False
-                )
+                    await self._wait_for_run_completion(
+                        thread_id=thread.id, run_id=run.id, allow_tools=False
+                    )
 
-                final_text = await self._get_final_assistant_message_text(
-                    thread_id=thread.id
+                final_text = streamed_text or (
+                    await self._get_final_assistant_message_text(thread_id=thread.id)
                 )
 
             parsed = self._safe_json_parse(final_text)
@@ -1292,6 +1381,8 @@ class OpenAIAssistantExecutor:
 
         except Exception as exc:  # noqa: BLE001
             elapsed_ms = int((time.monotonic() - t0) * 1000)
+            if stream_metrics is not None:
+                record_stream_metrics(stream_metrics)
             err_id = str(uuid.uuid4())
             logger.exception("CEO_ADVISORY_FAILED err_id=%s", err_id)
 
@@ -1363,6 +1454,9 @@ class OpenAIAssistantExecutor:
                     "error_message": err_msg,
                     "error_repr": err_repr,
                     "elapsed_ms": elapsed_ms,
+                    "llm_stream": stream_metrics.as_trace()
+                    if stream_metrics is not None
+                    else None,
                     "shrink_trace": shrink_trace,
                     "dashboard_contract_enforced": bool(enforce_dashboard_text),
                     "identity_pack_available": bool(identity_pack_available),
@@ -1389,6 +1483,9 @@ class OpenAIAssistantExecutor:
         trace["read_only_guard"] = True
         trace["no_tools_guard"] = True
         trace["elapsed_ms"] = elapsed_ms
+        if stream_metrics is not None:
+            record_stream_metrics(stream_metrics)
+            trace["llm_stream"] = stream_metrics.as_trace()
         trace["shrink_trace"] = shrink_trace
         trace["dashboard_contract_enforced"] = bool(enforce_dashboard_text)
 
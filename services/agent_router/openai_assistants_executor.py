@@ -2,19 +2,27 @@ from __future__ import annotations
 
 import asyncio
 import json
-import os
 import re
 import time
 from typing import Any, Dict, Optional
 
-from openai import OpenAI
-
 from services.agent_router.executor_errors import (
     ExecutorOutputError,
     ExecutorTimeout,
     ExecutorToolCallAttempt,
 )
-from services.agent_router.openai_key_diag import get_openai_key_diag
+from services.agent_router.openai_client_pool import (
+    ensure_openai_client_config,
+    get_shared_async_openai_client,
+)
+from services.agent_router.openai_streaming import (
+    RunStreamResult,
+    StreamMetrics,
+    acall,
+    consume_run_stream,
+    record_stream_metrics,
+    streaming_enabled,
+)
 
 
 _CODE_FENCE_RE = re.compile(
@@ -45,30 +53,68 @@ class OpenAIAssistantsExecutor:
         self._poll_interval_s = float(poll_interval_s)
         self._max_wait_s = float(max_wait_s)
 
-        if client is not None:
-            self.client = client
-            return
-
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise RuntimeError("OPENAI_API_KEY is missing")
-        self.client = OpenAI(api_key=api_key)
-
-        d = get_openai_key_diag()
-        logger = __import__("logging").getLogger(__name__)
-        logger.info(
-            "[OPENAI_KEY_DIAG] present=%s len=%s prefix=%s fp=%s source=%s mode=%s base_url=%s",
-            d.get("present"),
-            d.get("len"),
-            d.get("prefix"),
-            d.get("fingerprint"),
-            d.get("source"),
-            d.get("mode"),
-            d.get("base_url"),
-        )
+        self._client = client
+        if client is None:
+            # Fail fast on a missing key; the client itself is resolved per call.
+            ensure_openai_client_config()
+
+    @property
+    def client(self) -> Any:
+        """Injected client, else the shared AsyncOpenAI client for this loop."""
+        if self._client is not None:
+            return self._client
+        return get_shared_async_openai_client()
+
+    @client.setter
+    def client(self, value: Any) -> None:
+        self._client = value
+
+    async def _call(self, fn, *args, **kwargs):
+        return await acall(fn, *args, **kwargs)
+
+    def _raise_for_status(self, status: Optional[str]) -> bool:
+        """True when completed; raises on tool calls and terminal failures."""
+        if status == "requires_action":
+            raise ExecutorToolCallAttempt("run attempted tool calls (requires_action)")
+        if status == "completed":
+            return True
+        if status in {"failed", "cancelled", "expired", "incomplete"}:
+            raise ExecutorOutputError(f"run failed: status={status}")
+        return False
+
+    async def _stream_run(self, run_kwargs: Dict[str, Any]) -> RunStreamResult:
+        metrics = StreamMetrics(kind="assistants_run")
+        out = RunStreamResult()
+        stream = await self.client.beta.threads.runs.create(**run_kwargs, stream=True)
+        try:
+            await asyncio.wait_for(
+                consume_run_stream(stream, metrics=metrics, out=out),
+                timeout=self._max_wait_s,
+            )
+        except asyncio.TimeoutError as e:
+            raise ExecutorTimeout("run timed out") from e
+        finally:
+            record_stream_metrics(metrics)
 
-    async def _to_thread(self, fn, *args, **kwargs):
-        return await asyncio.to_thread(fn, *args, **kwargs)
+        try:
+            completed = self._raise_for_status(out.status)
+        except ExecutorToolCallAttempt:
+            if out.run_id:
+                try:
+                    await self._call(
+                        self.client.beta.threads.runs.cancel,
+                        thread_id=run_kwargs["thread_id"],
+                        run_id=out.run_id,
+                    )
+                except Exception:
+                    pass
+            raise
+        if not completed and out.run_id:
+            # Stream closed early without a terminal event: fall back to polling.
+            await self._wait_for_completion(
+                thread_id=run_kwargs["thread_id"], run_id=out.run_id
+            )
+        return out
 
     async def _wait_for_completion(self, *, thread_id: str, run_id: str) -> None:
         start = time.monotonic()
@@ -76,24 +122,14 @@ class OpenAIAssistantsExecutor:
             if time.monotonic() - start > self._max_wait_s:
                 raise ExecutorTimeout("run timed out")
 
-            run_status = await self._to_thread(
+            run_status = await self._call(
                 self.client.beta.threads.runs.retrieve,
                 thread_id=thread_id,
                 run_id=run_id,
             )
-            status = getattr(run_status, "status", None)
-
-            if status == "requires_action":
-                raise ExecutorToolCallAttempt(
-                    "run attempted tool calls (requires_action)"
-                )
-
-            if status == "completed":
+            if self._raise_for_status(getattr(run_status, "status", None)):
                 return
 
-            if status in {"failed", "cancelled", "expired"}:
-                raise ExecutorOutputError(f"run failed: status={status}")
-
             await asyncio.sleep(self._poll_interval_s)
 
     def _parse_json(self, text: str) -> Dict[str, Any]:
@@ -109,7 +145,7 @@ class OpenAIAssistantsExecutor:
     async def _get_latest_assistant_text_json(
         self, *, thread_id: str, limit: int = 10
     ) -> Dict[str, Any]:
-        messages = await self._to_thread(
+        messages = await self._call(
             self.client.beta.threads.messages.list, thread_id=thread_id, limit=limit
         )
         data = getattr(messages, "data", None) or []
@@ -141,7 +177,7 @@ class OpenAIAssistantsExecutor:
     async def _get_first_output_json(
         self, *, thread_id: str, limit: int = 1
     ) -> Dict[str, Any]:
-        messages = await self._to_thread(
+        messages = await self._call(
             self.client.beta.threads.messages.list, thread_id=thread_id, limit=limit
         )
         data = getattr(messages, "data", None) or []
@@ -195,9 +231,9 @@ class OpenAIAssistantsExecutor:
         if content is None:
             raise ValueError("content is required")
 
-        thread = await self._to_thread(self.client.beta.threads.create)
+        thread = await self._call(self.client.beta.threads.create)
 
-        await self._to_thread(
+        await self._call(
             self.client.beta.threads.messages.create,
             thread_id=thread.id,
             role="user",
@@ -215,23 +251,34 @@ class OpenAIAssistantsExecutor:
         if task.get("response_format") is not None:
             run_kwargs["response_format"] = task.get("response_format")
 
-        try:
-            run = await self._to_thread(
-                self.client.beta.threads.runs.create, **run_kwargs
-            )
-        except TypeError:
-            # Compatibility fallback
-            run = await self._to_thread(
-                self.client.beta.threads.runs.create,
-                thread_id=thread.id,
-                assistant_id=assistant_id,
-            )
-
-        await self._wait_for_completion(thread_id=thread.id, run_id=run.id)
-
         parse_mode = task.get("parse_mode") or "text_json"
         limit = int(task.get("limit") or 10)
 
+        if streaming_enabled(self.client.beta.threads.runs.create):
+            try:
+                streamed = await self._stream_run(run_kwargs)
+            except TypeError:
+                # Compatibility fallback
+                streamed = await self._stream_run(
+                    {"thread_id": thread.id, "assistant_id": assistant_id}
+                )
+            if parse_mode != "output_json" and streamed.text:
+                return self._parse_json(streamed.text)
+        else:
+            try:
+                run = await self._call(
+                    self.client.beta.threads.runs.create, **run_kwargs
+                )
+            except TypeError:
+                # Compatibility fallback
+                run = await self._call(
+                    self.client.beta.threads.runs.create,
+                    thread_id=thread.id,
+                    assistant_id=assistant_id,
+                )
+
+            await self._wait_for_completion(thread_id=thread.id, run_id=run.id)
+
         if parse_mode == "output_json":
             return await self._get_first_output_json(thread_id=thread.id, limit=limit)
 
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+from services.agent_router.openai_key_diag import get_openai_key_diag
+
+
+logger = logging.getLogger(__name__)
+
+
+# Process-wide OpenAI clients sharing long-lived keep-alive connection pools.
+#
+# Executors used to build `OpenAI(api_key=...)` (new httpx pool, new TLS
+# handshakes) and re-read .env for key diagnostics on every chat turn. Clients
+# here are keyed by a fingerprint of (api key, base url); a rotated key drops
+# them and bumps `generation` so callers caching executors rebuild too.
+#
+# AsyncOpenAI clients are kept per event loop: httpx.AsyncClient connections
+# are bound to the loop that opened them.
+#
+# Env:
+#   OPENAI_HTTP2=auto|1|0                (auto: on when the `h2` package exists)
+#   OPENAI_POOL_MAX_CONNECTIONS          (default 100)
+#   OPENAI_POOL_MAX_KEEPALIVE            (default 20)
+#   OPENAI_POOL_KEEPALIVE_EXPIRY_S       (default 30)
+#   OPENAI_POOL_TIMEOUT_S                (default 600, the SDK's default)
+
+_LOCK = threading.Lock()
+_STATE: Dict[str, Any] = {
+    "fingerprint": None,
+    "client": None,
+    "http_client": None,
+    "generation": 0,
+    "builds": 0,
+    "hits": 0,
+    "http2": False,
+    "limits": {},
+    "key_diag": None,
+}
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[Any, tuple[Any, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_NO_LOOP_ASYNC: Dict[str, Any] = {}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float((os.getenv(name) or "").strip() or default)
+    except Exception:
+        return float(default)
+
+
+def _base_url() -> Optional[str]:
+    return (
+        (os.getenv("OPENAI_BASE_URL") or "").strip()
+        or (os.getenv("OPENAI_API_BASE") or "").strip()
+        or (os.getenv("OPENAI_API_BASE_URL") or "").strip()
+        or None
+    )
+
+
+def _http2_enabled() -> bool:
+    raw = (os.getenv("OPENAI_HTTP2") or "auto").strip().lower()
+    if raw in {"0", "false", "no", "off"}:
+        return False
+    try:
+        import h2  # noqa: F401
+    except Exception:
+        if raw in {"1", "true", "yes", "on"}:
+            logger.warning("[OPENAI_POOL] OPENAI_HTTP2 set but h2 is not installed")
+        return False
+    return True
+
+
+def _pool_limits() -> Dict[str, Any]:
+    return {
+        "max_connections": int(_env_float("OPENAI_POOL_MAX_CONNECTIONS", 100)),
+        "max_keepalive_connections": int(_env_float("OPENAI_POOL_MAX_KEEPALIVE", 20)),
+        "keepalive_expiry": _env_float("OPENAI_POOL_KEEPALIVE_EXPIRY_S", 30.0),
+    }
+
+
+def _build_client(
+    *,
+    api_key: str,
+    base_url: Optional[str],
+    limits: Dict[str, Any],
+    http2: bool,
+    is_async: bool = False,
+) -> tuple[Any, Any]:
+    import httpx
+    from openai import AsyncOpenAI, OpenAI
+
+    http_cls = httpx.AsyncClient if is_async else httpx.Client
+    http_client = http_cls(
+        http2=http2,
+        limits=httpx.Limits(**limits),
+        timeout=httpx.Timeout(_env_float("OPENAI_POOL_TIMEOUT_S", 600.0)),
+    )
+    kwargs: Dict[str, Any] = {"api_key": api_key, "http_client": http_client}
+    if base_url:
+        kwargs["base_url"] = base_url
+    client_cls = AsyncOpenAI if is_async else OpenAI
+    return client_cls(**kwargs), http_client
+
+
+def _sync_key_locked() -> tuple[str, Optional[str]]:
+    """Validate the key and drop clients bound to a rotated one. Holds _LOCK."""
+
+    api_key = (os.getenv("OPENAI_API_KEY") or "").strip()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is missing")
+    base_url = _base_url()
+    fp = hashlib.sha256(f"{api_key}|{base_url or ''}".encode("utf-8")).hexdigest()
+    if _STATE["fingerprint"] == fp:
+        return api_key, base_url
+
+    # Retired pools may still serve in-flight calls; they are released once
+    # those finish and the old clients are garbage collected.
+    _ASYNC_CLIENTS.clear()
+    _NO_LOOP_ASYNC.clear()
+    _STATE.update(
+        fingerprint=fp,
+        client=None,
+        http_client=None,
+        generation=int(_STATE["generation"]) + 1,
+        http2=_http2_enabled(),
+        limits=_pool_limits(),
+    )
+
+    # Key diagnostics read .env; do it once per key, not once per turn.
+    d = get_openai_key_diag()
+    _STATE["key_diag"] = d
+    logger.info(
+        "[OPENAI_KEY_DIAG] present=%s len=%s prefix=%s fp=%s source=%s mode=%s base_url=%s",
+        d.get("present"),
+        d.get("len"),
+        d.get("prefix"),
+        d.get("fingerprint"),
+        d.get("source"),
+        d.get("mode"),
+        d.get("base_url"),
+    )
+    return api_key, base_url
+
+
+def ensure_openai_client_config() -> int:
+    """Raise if no key is configured; return the current client generation."""
+
+    with _LOCK:
+        _sync_key_locked()
+        return int(_STATE["generation"])
+
+
+def get_shared_openai_client() -> Any:
+    """Return the process-wide sync OpenAI client."""
+
+    with _LOCK:
+        api_key, base_url = _sync_key_locked()
+        if _STATE["client"] is not None:
+            _STATE["hits"] += 1
+            return _STATE["client"]
+
+        client, http_client = _build_client(
+            api_key=api_key,
+            base_url=base_url,
+            limits=_STATE["limits"],
+            http2=bool(_STATE["http2"]),
+        )
+        _STATE.update(
+            client=client,
+            http_client=http_client,
+            builds=int(_STATE["builds"]) + 1,
+        )
+        return client
+
+
+def get_shared_async_openai_client() -> Any:
+    """Return the AsyncOpenAI client for the running event loop."""
+
+    try:
+        loop: Any = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    with _LOCK:
+        api_key, base_url = _sync_key_locked()
+        if loop is None:
+            hit = _NO_LOOP_ASYNC.get("client")
+        else:
+            hit = _ASYNC_CLIENTS.get(loop)
+        if hit is not None:
+            _STATE["hits"] += 1
+            return hit[0]
+
+        built = _build_client(
+            api_key=api_key,
+            base_url=base_url,
+            limits=_STATE["limits"],
+            http2=bool(_STATE["http2"]),
+            is_async=True,
+        )
+        if loop is None:
+            _NO_LOOP_ASYNC["client"] = built
+        else:
+            _ASYNC_CLIENTS[loop] = built
+        _STATE["builds"] = int(_STATE["builds"]) + 1
+        return built[0]
+
+
+def openai_client_generation() -> int:
+    with _LOCK:
+        return int(_STATE["generation"])
+
+
+def _open_connections(http_client: Any) -> Optional[int]:
+    # Best-effort introspection of httpx -> httpcore pool internals.
+    try:
+        return int(len(http_client._transport._pool.connections))
+    except Exception:
+        return None
+
+
+def openai_pool_stats() -> Dict[str, Any]:
+    with _LOCK:
+        d = _STATE["key_diag"] if isinstance(_STATE["key_diag"], dict) else {}
+        async_http = [v[1] for v in _ASYNC_CLIENTS.values()]
+        async_http += [v[1] for v in _NO_LOOP_ASYNC.values()]
+        conns = [_open_connections(_STATE["http_client"])]
+        conns += [_open_connections(h) for h in async_http]
+        known = [c for c in conns if isinstance(c, int)]
+        return {
+            "generation": int(_STATE["generation"]),
+            "builds": int(_STATE["builds"]),
+            "hits": int(_STATE["hits"]),
+            "async_clients": len(async_http),
+            "http2": bool(_STATE["http2"]),
+            "limits": dict(_STATE["limits"]),
+            "open_connections": sum(known) if known else None,
+            "key_fingerprint": d.get("fingerprint"),
+        }
+
+
+def reset_openai_client_pool() -> None:
+    with _LOCK:
+        http_client = _STATE["http_client"]
+        _ASYNC_CLIENTS.clear()
+        _NO_LOOP_ASYNC.clear()
+        _STATE.update(
+            fingerprint=None,
+            client=None,
+            http_client=None,
+            builds=0,
+            hits=0,
+            key_diag=None,
+        )
+    if http_client is not None:
+        try:
+            http_client.close()
+        except Exception:
+            pass
@@ -6,13 +6,22 @@ import os
 import re
 from typing import Any, Dict, Optional
 
-from openai import OpenAI
-
 from services.agent_router.executor_errors import (
     ExecutorOutputError,
     ExecutorToolCallAttempt,
 )
-from services.agent_router.openai_key_diag import get_openai_key_diag
+from services.agent_router.openai_client_pool import (
+    ensure_openai_client_config,
+    get_shared_async_openai_client,
+)
+from services.agent_router.openai_streaming import (
+    StreamMetrics,
+    acall,
+    collect_response_stream,
+    open_token_stream,
+    record_stream_metrics,
+    streaming_enabled,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -58,26 +67,21 @@ class OpenAIResponsesExecutor:
         self._model_env = model_env
         self._default_model = default_model
 
-        if client is not None:
-            self.client = client
-            return
-
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise RuntimeError("OPENAI_API_KEY is missing")
-        self.client = OpenAI(api_key=api_key)
-
-        d = get_openai_key_diag()
-        logger.info(
-            "[OPENAI_KEY_DIAG] present=%s len=%s prefix=%s fp=%s source=%s mode=%s base_url=%s",
-            d.get("present"),
-            d.get("len"),
-            d.get("prefix"),
-            d.get("fingerprint"),
-            d.get("source"),
-            d.get("mode"),
-            d.get("base_url"),
-        )
+        self._client = client
+        if client is None:
+            # Fail fast on a missing key; the client itself is resolved per call.
+            ensure_openai_client_config()
+
+    @property
+    def client(self) -> Any:
+        """Injected client, else the shared AsyncOpenAI client for this loop."""
+        if self._client is not None:
+            return self._client
+        return get_shared_async_openai_client()
+
+    @client.setter
+    def client(self, value: Any) -> None:
+        self._client = value
 
     def _model(self) -> str:
         m = (os.getenv(self._model_env) or "").strip()
@@ -217,11 +221,13 @@ class OpenAIResponsesExecutor:
         if allow_tools:
             raise ExecutorToolCallAttempt("Tools are not allowed in this executor")
 
+        client = self.client
+
         # Prefer Responses API when available; fall back to Chat Completions for
         # older SDKs/environments (pre-responses).
         has_responses = bool(
-            getattr(self.client, "responses", None)
-            and hasattr(getattr(self.client, "responses", None), "create")
+            getattr(client, "responses", None)
+            and hasattr(getattr(client, "responses", None), "create")
         )
 
         if has_responses:
@@ -248,9 +254,22 @@ class OpenAIResponsesExecutor:
             kwargs["tool_choice"] = "none"
             kwargs["tools"] = []
 
-            resp = await __import__("asyncio").to_thread(
-                self.client.responses.create, **kwargs
-            )
+            create = client.responses.create
+            if streaming_enabled(create):
+                metrics = StreamMetrics(kind="responses")
+                # Only the CEO contract answer is user-visible; feed it live.
+                on_token = (
+                    open_token_stream()
+                    if bool(task.get("ceo_contract") is True)
+                    else None
+                )
+                stream = await create(**kwargs, stream=True)
+                resp = await collect_response_stream(
+                    stream, metrics=metrics, on_token=on_token
+                )
+                record_stream_metrics(metrics)
+            else:
+                resp = await acall(create, **kwargs)
 
             # Reject any tool/function call output items.
             output = getattr(resp, "output", None) or []
@@ -272,7 +291,7 @@ class OpenAIResponsesExecutor:
             len(instructions or ""),
             len(user_input or ""),
         )
-        chat = getattr(self.client, "chat", None)
+        chat = getattr(client, "chat", None)
         completions = getattr(chat, "completions", None) if chat is not None else None
         create = (
             getattr(completions, "create", None) if completions is not None else None
@@ -305,7 +324,7 @@ class OpenAIResponsesExecutor:
         if task.get("temperature") is not None:
             ck["temperature"] = task.get("temperature")
 
-        resp = await __import__("asyncio").to_thread(create, **ck)
+        resp = await acall(create, **ck)
         text = self._extract_chat_text(resp)
         return self._parse_json(
             text, force_text_contract=bool(task.get("ceo_contract") is True)
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# Async call + event-stream helpers shared by the OpenAI executors.
+#
+# With AsyncOpenAI, runs and responses are consumed as server-sent event
+# streams: completion is observed the moment the terminal event arrives (no
+# 0.5s polling) and no default-executor thread is held. Injected sync clients
+# (tests, legacy callers) still go through asyncio.to_thread.
+
+_RUN_TERMINAL_EVENTS = {
+    "thread.run.requires_action",
+    "thread.run.completed",
+    "thread.run.failed",
+    "thread.run.cancelled",
+    "thread.run.expired",
+    "thread.run.incomplete",
+}
+
+
+def is_async_callable(fn: Any) -> bool:
+    return bool(
+        inspect.iscoroutinefunction(fn)
+        or inspect.iscoroutinefunction(getattr(fn, "__call__", None))
+    )
+
+
+async def acall(fn: Any, /, *args: Any, **kwargs: Any) -> Any:
+    if is_async_callable(fn):
+        return await fn(*args, **kwargs)
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+def streaming_enabled(fn: Any) -> bool:
+    """Stream only over async SDK methods; OPENAI_STREAM_EVENTS=0 opts out."""
+
+    raw = (os.getenv("OPENAI_STREAM_EVENTS") or "1").strip().lower()
+    if raw in {"0", "false", "no", "off"}:
+        return False
+    return is_async_callable(fn)
+
+
+@dataclass
+class StreamMetrics:
+    kind: str
+    started: float = field(default_factory=time.monotonic)
+    first_token_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    events: int = 0
+
+    def mark_token(self) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.monotonic()
+
+    def mark_done(self) -> None:
+        if self.completed_at is None:
+            self.completed_at = time.monotonic()
+
+    def as_trace(self) -> Dict[str, Any]:
+        def _ms(t: Optional[float]) -> Optional[int]:
+            return None if t is None else int((t - self.started) * 1000)
+
+        return {
+            "kind": self.kind,
+            "streamed": True,
+            "ttft_ms": _ms(self.first_token_at),
+            "completion_ms": _ms(self.completed_at),
+            "events": int(self.events),
+        }
+
+
+# ------------------------------------------------------------
+# Live token sink (user-visible answer streaming)
+# ------------------------------------------------------------
+#
+# A streaming endpoint installs a sink in its context before awaiting the
+# canonical pipeline; executors producing the user-facing answer ask it for a
+# per-stream callback (`open_token_stream`) and feed it raw model deltas.
+# Without a sink installed this is a no-op.
+
+TokenCallback = Callable[[str], None]
+_TOKEN_SINK: ContextVar[Optional[Any]] = ContextVar("openai_token_sink", default=None)
+
+
+def set_token_sink(sink: Any) -> Token:
+    """`sink.open()` must return a TokenCallback (or None to decline)."""
+    return _TOKEN_SINK.set(sink)
+
+
+def reset_token_sink(token: Token) -> None:
+    _TOKEN_SINK.reset(token)
+
+
+def open_token_stream() -> Optional[TokenCallback]:
+    sink = _TOKEN_SINK.get()
+    if sink is None:
+        return None
+    try:
+        return sink.open()
+    except Exception:
+        return None
+
+
+def _emit_token(on_token: Optional[TokenCallback], text: Any) -> None:
+    if on_token is None or not isinstance(text, str) or not text:
+        return
+    try:
+        on_token(text)
+    except Exception:
+        # Live streaming is best-effort; the final answer is authoritative.
+        pass
+
+
+class JsonTextFieldDecoder:
+    """Incrementally decode one top-level string field of a streamed JSON object.
+
+    The advisory executors request JSON output ({"text": "...", ...}); this
+    yields the decoded characters of `field` as they arrive and ignores the
+    rest of the document (including any leading code fence).
+    """
+
+    _ESCAPES = {
+        '"': '"',
+        "\\": "\\",
+        "/": "/",
+        "b": "\b",
+        "f": "\f",
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+    }
+
+    def __init__(self, field: str = "text") -> None:
+        self._field = field
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+        self._uni: Optional[str] = None
+        self._high: Optional[int] = None
+        self._buf: List[str] = []
+        self._last_key: Optional[str] = None
+        self._expect_value = False
+        self._capturing = False
+        self.done = False
+
+    def _decoded(self, ch: str, out: List[str]) -> None:
+        if self._capturing:
+            out.append(ch)
+        else:
+            self._buf.append(ch)
+
+    def feed(self, chunk: str) -> str:
+        out: List[str] = []
+        for ch in chunk:
+            if self.done:
+                break
+            if self._in_str:
+                if self._uni is not None:
+                    self._uni += ch
+                    if len(self._uni) == 4:
+                        try:
+                            cp = int(self._uni, 16)
+                        except ValueError:
+                            cp = 0xFFFD
+                        self._uni = None
+                        if 0xD800 <= cp < 0xDC00:
+                            self._high = cp
+                        elif 0xDC00 <= cp < 0xE000 and self._high is not None:
+                            cp = 0x10000 + ((self._high - 0xD800) << 10) + (cp - 0xDC00)
+                            self._high = None
+                            self._decoded(chr(cp), out)
+                        else:
+                            self._high = None
+                            self._decoded(chr(cp), out)
+                elif self._esc:
+                    self._esc = False
+                    if ch == "u":
+                        self._uni = ""
+                    else:
+                        self._decoded(self._ESCAPES.get(ch, ch), out)
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+                    if self._capturing:
+                        self._capturing = False
+                        self.done = True
+                    elif self._depth == 1 and not self._expect_value:
+                        self._last_key = "".join(self._buf)
+                    self._buf = []
+                    self._expect_value = False
+                else:
+                    self._decoded(ch, out)
+                continue
+
+            if ch == '"':
+                self._in_str = True
+                self._buf = []
+                self._capturing = bool(
+                    self._depth == 1
+                    and self._expect_value
+                    and self._last_key == self._field
+                )
+            elif ch in "{[":
+                self._depth += 1
+                self._expect_value = False
+            elif ch in "}]":
+                self._depth = max(0, self._depth - 1)
+            elif ch == ":" and self._depth == 1:
+                self._expect_value = True
+            elif ch == "," and self._depth == 1:
+                self._expect_value = False
+                self._last_key = None
+        return "".join(out)
+
+
+_STATS_LOCK = threading.Lock()
+_STATS: Dict[str, Dict[str, Any]] = {}
+
+
+def record_stream_metrics(metrics: StreamMetrics) -> None:
+    t = metrics.as_trace()
+    logger.info(
+        "[OPENAI_STREAM] kind=%s ttft_ms=%s completion_ms=%s events=%s",
+        t["kind"],
+        t["ttft_ms"],
+        t["completion_ms"],
+        t["events"],
+    )
+    with _STATS_LOCK:
+        st = _STATS.setdefault(
+            metrics.kind,
+            {"count": 0, "ttft_ms_sum": 0, "ttft_n": 0, "completion_ms_sum": 0},
+        )
+        st["count"] += 1
+        if isinstance(t["ttft_ms"], int):
+            st["ttft_ms_sum"] += t["ttft_ms"]
+            st["ttft_n"] += 1
+        if isinstance(t["completion_ms"], int):
+            st["completion_ms_sum"] += t["completion_ms"]
+        st["last"] = t
+
+
+def stream_metrics_stats() -> Dict[str, Any]:
+    with _STATS_LOCK:
+        out: Dict[str, Any] = {}
+        for kind, st in _STATS.items():
+            n = int(st["count"])
+            out[kind] = {
+                "count": n,
+                "avg_ttft_ms": (
+                    int(st["ttft_ms_sum"] / st["ttft_n"]) if st["ttft_n"] else None
+                ),
+                "avg_completion_ms": int(st["completion_ms_sum"] / n) if n else None,
+                "last": dict(st.get("last") or {}),
+            }
+        return out
+
+
+async def _close_stream(stream: Any) -> None:
+    close = getattr(stream, "close", None)
+    if close is None:
+        return
+    try:
+        await acall(close)
+    except Exception:
+        pass
+
+
+@dataclass
+class RunStreamResult:
+    run: Any = None
+    run_id: Optional[str] = None
+    status: Optional[str] = None
+    text: Optional[str] = None
+
+
+def _message_text(message: Any) -> str:
+    chunks: List[str] = []
+    for part in getattr(message, "content", None) or []:
+        text_obj = getattr(part, "text", None)
+        value = getattr(text_obj, "value", None) if text_obj else None
+        if isinstance(value, str) and value.strip():
+            chunks.append(value)
+    return "\n".join(chunks).strip()
+
+
+def _run_delta_text(data: Any) -> str:
+    delta = getattr(data, "delta", None)
+    chunks: List[str] = []
+    for part in getattr(delta, "content", None) or []:
+        text_obj = getattr(part, "text", None)
+        value = getattr(text_obj, "value", None) if text_obj else None
+        if isinstance(value, str):
+            chunks.append(value)
+    return "".join(chunks)
+
+
+async def consume_run_stream(
+    stream: Any,
+    *,
+    metrics: StreamMetrics,
+    out: Optional[RunStreamResult] = None,
+    on_token: Optional[TokenCallback] = None,
+) -> RunStreamResult:
+    """Read Assistants run events until the run reaches a terminal state.
+
+    Stops at `thread.run.requires_action` too, so the caller can cancel the
+    run before any tool output is ever submitted. `out` is filled in place so
+    a caller that times out still knows the run id.
+    """
+
+    out = out if out is not None else RunStreamResult()
+    try:
+        async for event in stream:
+            metrics.events += 1
+            name = getattr(event, "event", None) or ""
+            data = getattr(event, "data", None)
+
+            # thread.run.step.* carry a RunStep (own id/status); only run
+            # events may update the run the caller cancels/checks.
+            if (
+                name.startswith("thread.run.")
+                and not name.startswith("thread.run.step.")
+                and data is not None
+            ):
+                out.run = data
+                out.run_id = getattr(data, "id", None) or out.run_id
+                out.status = getattr(data, "status", None) or out.status
+            elif name == "thread.message.delta":
+                metrics.mark_token()
+                _emit_token(on_token, _run_delta_text(data))
+            elif name == "thread.message.completed" and data is not None:
+                if getattr(data, "role", "assistant") == "assistant":
+                    text = _message_text(data)
+                    if text:
+                        metrics.mark_token()
+                        out.text = text
+            elif name == "error":
+                raise RuntimeError(f"Assistant run stream error: {data!r}"[:2000])
+
+            if name in _RUN_TERMINAL_EVENTS:
+                break
+    finally:
+        metrics.mark_done()
+        await _close_stream(stream)
+    return out
+
+
+async def collect_response_stream(
+    stream: Any,
+    *,
+    metrics: StreamMetrics,
+    on_token: Optional[TokenCallback] = None,
+) -> Any:
+    """Read Responses API events and return the final Response object."""
+
+    try:
+        async for event in stream:
+            metrics.events += 1
+            etype = getattr(event, "type", None) or ""
+            if etype == "response.output_text.delta":
+                metrics.mark_token()
+                _emit_token(on_token, getattr(event, "delta", None))
+            elif etype in {"response.completed", "response.incomplete"}:
+                return getattr(event, "response", None)
+            elif etype == "response.failed":
+                resp = getattr(event, "response", None)
+                err = getattr(resp, "error", None)
+                raise RuntimeError(f"Responses stream failed: {err!r}"[:2000])
+            elif etype == "error":
+                msg = getattr(event, "message", None) or repr(event)
+                raise RuntimeError(f"Responses stream error: {msg}"[:2000])
+    finally:
+        metrics.mark_done()
+        await _close_stream(stream)
+    raise RuntimeError("Responses stream ended without a completed response")
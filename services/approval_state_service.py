@@ -1,15 +1,25 @@
 # services/approval_state_service.py
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import os
-from datetime import datetime, timezone, timedelta
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
+from services.json_journal import (
+    JsonJournal,
+    append_jsonl,
+    encode_jsonl,
+    journal_path_for,
+    scan_jsonl,
+)
+
 logger = logging.getLogger(__name__)
 
 # ============================================================
@@ -81,6 +91,31 @@ def _resolve_pending_ttl_seconds() -> int:
 _PENDING_TTL_SECONDS = _resolve_pending_ttl_seconds()
 
 
+# Hot set vs archive:
+# - pending/approved approvals stay in memory, indexed by idempotency key,
+#   status and (for pending) TTL deadline;
+# - rejected/expired approvals are terminal, and approved ones are done once
+#   their execution finished (mark_executed); both are moved to an
+#   append-only archive file (only byte offsets, status and, for approved,
+#   the idempotency key stay in memory).
+# Mutations append to a journal next to the snapshot; the snapshot (hot set
+# only) is rewritten when the journal exceeds APPROVAL_JOURNAL_COMPACT_RECORDS.
+
+_TERMINAL_STATUSES = ("rejected", "expired")
+_IDEMPOTENT_STATUSES = ("pending", "approved")
+
+
+def _archive_path() -> Path:
+    return _APPROVAL_FILE.with_name(_APPROVAL_FILE.name + ".archive.jsonl")
+
+
+def _journal_compact_records() -> int:
+    try:
+        return int((os.getenv("APPROVAL_JOURNAL_COMPACT_RECORDS") or "").strip() or 500)
+    except Exception:
+        return 500
+
+
 def _atomic_write_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.parent / f".{path.name}.{os.getpid()}.tmp"
@@ -91,6 +126,144 @@ def _atomic_write_json(path: Path, data: Any) -> None:
     os.replace(tmp_path, path)
 
 
+IdemKey = Tuple[str, str, str]
+
+
+def _idem_key(approval: Dict[str, Any]) -> IdemKey:
+    return (
+        str(approval.get("execution_id") or ""),
+        str(approval.get("command") or ""),
+        str(approval.get("payload_key") or ""),
+    )
+
+
+class _ApprovalIndex:
+    """Secondary indexes over the hot set (caller holds the service lock)."""
+
+    def __init__(self) -> None:
+        self.by_idem: Dict[IdemKey, str] = {}
+        self.by_status: Dict[str, Dict[str, None]] = {}
+        self.expiry: List[Tuple[float, str]] = []
+
+    def clear(self) -> None:
+        self.by_idem.clear()
+        self.by_status.clear()
+        self.expiry.clear()
+
+    def add(self, approval: Dict[str, Any]) -> None:
+        aid = str(approval.get("approval_id") or "")
+        status = str(approval.get("status") or "")
+        self.by_status.setdefault(status, {})[aid] = None
+        if status in _IDEMPOTENT_STATUSES:
+            # First match wins, as with the old insertion-order scan.
+            self.by_idem.setdefault(_idem_key(approval), aid)
+        if status == "pending":
+            created_at = _parse_utc_iso(approval.get("created_at"))
+            if created_at is not None:
+                heapq.heappush(self.expiry, (created_at.timestamp(), aid))
+
+    def remove(self, approval: Dict[str, Any], *, status: str) -> None:
+        aid = str(approval.get("approval_id") or "")
+        bucket = self.by_status.get(status)
+        if bucket is not None:
+            bucket.pop(aid, None)
+        key = _idem_key(approval)
+        if self.by_idem.get(key) == aid:
+            self.by_idem.pop(key, None)
+        # Expiry heap entries are dropped lazily when popped.
+
+    def pop_expired(self, cutoff_ts: float) -> Iterator[str]:
+        while self.expiry and self.expiry[0][0] < cutoff_ts:
+            yield heapq.heappop(self.expiry)[1]
+
+
+def _is_archivable(approval: Dict[str, Any]) -> bool:
+    status = approval.get("status")
+    return status in _TERMINAL_STATUSES or (
+        status == "approved" and bool(approval.get("executed_at"))
+    )
+
+
+class _ApprovalArchive:
+    """Append-only JSONL of archived approvals, indexed by byte offset."""
+
+    def __init__(self) -> None:
+        self.offsets: Dict[str, int] = {}
+        self.status: Dict[str, str] = {}
+        self.by_status: Dict[str, Dict[str, None]] = {}
+        # Executed approvals still answer create() idempotently.
+        self.by_idem: Dict[IdemKey, str] = {}
+
+    def _note(self, off: int, approval: Dict[str, Any]) -> None:
+        aid = str(approval.get("approval_id") or "")
+        status = str(approval.get("status") or "")
+        prev = self.status.get(aid)
+        if prev is not None:
+            self.by_status.get(prev, {}).pop(aid, None)
+        self.offsets[aid] = off
+        self.status[aid] = status
+        self.by_status.setdefault(status, {})[aid] = None
+        if status in _IDEMPOTENT_STATUSES:
+            self.by_idem.setdefault(_idem_key(approval), aid)
+
+    def load(self, path: Path) -> None:
+        self.offsets.clear()
+        self.status.clear()
+        self.by_status.clear()
+        self.by_idem.clear()
+        for off, rec in scan_jsonl(path):
+            if isinstance(rec.get("approval_id"), str):
+                self._note(off, rec)
+
+    def append(self, path: Path, approval: Dict[str, Any]) -> None:
+        off = append_jsonl(path, encode_jsonl([approval]), fsync=True)
+        self._note(off, approval)
+
+    def get(self, path: Path, approval_id: str) -> Optional[Dict[str, Any]]:
+        off = self.offsets.get(approval_id)
+        if off is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return self._read_at(f, off)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _read_at(f: BinaryIO, off: int) -> Optional[Dict[str, Any]]:
+        f.seek(off)
+        line = f.readline()
+        try:
+            rec = json.loads(line) if line.endswith(b"\n") else None
+        except Exception:
+            return None
+        return rec if isinstance(rec, dict) else None
+
+    def iter_all(
+        self, path: Path, status: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        if status:
+            # Seek to the matching records only.
+            offs = sorted(self.offsets[aid] for aid in self.by_status.get(status, ()))
+            if not offs:
+                return
+            try:
+                with open(path, "rb") as f:
+                    for off in offs:
+                        rec = self._read_at(f, off)
+                        if rec is not None:
+                            yield rec
+            except FileNotFoundError:
+                return
+            return
+        if not self.offsets:
+            return
+        live = set(self.offsets.values())
+        for off, rec in scan_jsonl(path):
+            if off in live:
+                yield rec
+
+
 class ApprovalStateService:
     """
     CANONICAL APPROVAL STATE SERVICE (STRICT)
@@ -102,11 +275,16 @@ class ApprovalStateService:
     """
 
     _GLOBAL_APPROVALS: Dict[str, Dict[str, Any]] = {}
+    _GLOBAL_INDEX: _ApprovalIndex = _ApprovalIndex()
+    _GLOBAL_ARCHIVE: _ApprovalArchive = _ApprovalArchive()
+    _GLOBAL_JOURNAL: Optional[JsonJournal] = None
     _GLOBAL_LOCK: Lock = Lock()
     _LOADED_FROM_DISK: bool = False
 
     def __init__(self) -> None:
         self._approvals = ApprovalStateService._GLOBAL_APPROVALS
+        self._index = ApprovalStateService._GLOBAL_INDEX
+        self._archive = ApprovalStateService._GLOBAL_ARCHIVE
         self._lock = ApprovalStateService._GLOBAL_LOCK
 
         with self._lock:
@@ -143,14 +321,17 @@ class ApprovalStateService:
         with self._lock:
             self._expire_stale_pending_locked()
 
-            for approval in self._approvals.values():
-                if (
-                    approval.get("execution_id") == execution_id
-                    and approval.get("command") == cmd_norm
-                    and approval.get("payload_key") == payload_key
-                    and approval.get("status") in ("pending", "approved")
-                ):
-                    return dict(approval)
+            existing_id = self._index.by_idem.get((execution_id, cmd_norm, payload_key))
+            existing = self._approvals.get(existing_id) if existing_id else None
+            if existing is not None and existing.get("status") in _IDEMPOTENT_STATUSES:
+                return dict(existing)
+            archived_id = self._archive.by_idem.get(
+                (execution_id, cmd_norm, payload_key)
+            )
+            if archived_id:
+                archived = self._archive.get(_archive_path(), archived_id)
+                if archived is not None:
+                    return archived
 
             approval_id = str(uuid4())
             now = _utc_now_iso()
@@ -168,7 +349,8 @@ class ApprovalStateService:
             }
 
             self._approvals[approval_id] = approval
-            self._persist_to_disk_locked()
+            self._index.add(approval)
+            self._persist_to_disk_locked(approval)
             return dict(approval)
 
     # ============================================================
@@ -227,7 +409,8 @@ class ApprovalStateService:
 
             approval["approved_at"] = now
             approval["decided_at"] = now
-            self._persist_to_disk_locked()
+            self._status_changed_locked(approval, previous="pending")
+            self._persist_to_disk_locked(approval)
             return dict(approval)
 
     def reject(
@@ -252,7 +435,8 @@ class ApprovalStateService:
             if isinstance(note, str) and note.strip():
                 approval["note"] = note.strip()
             approval["decided_at"] = _utc_now_iso()
-            self._persist_to_disk_locked()
+            self._status_changed_locked(approval, previous="pending")
+            self._persist_to_disk_locked(approval)
             return dict(approval)
 
     # ============================================================
@@ -263,24 +447,71 @@ class ApprovalStateService:
         with self._lock:
             self._expire_stale_pending_locked()
             a = self._approvals.get(approval_id)
-            return bool(a and a.get("status") == "approved")
+            if a is None:
+                return self._archive.status.get(approval_id) == "approved"
+            return a.get("status") == "approved"
 
     def get(self, approval_id: str) -> Dict[str, Any]:
         with self._lock:
             self._expire_stale_pending_locked()
             return dict(self._require(approval_id))
 
-    def list_approvals(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_approvals(
+        self, status: Optional[str] = None, *, include_archived: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Hot-set approvals, plus archived ones when include_archived is set.
+
+        By default the archive is read only for a status filter, which seeks
+        to the matching records; an unfiltered call stays on the hot set.
+        """
+
         with self._lock:
             self._expire_stale_pending_locked()
-            vals = list(self._approvals.values())
             if status:
-                vals = [a for a in vals if a.get("status") == status]
-            return [dict(a) for a in vals]
+                ids = self._index.by_status.get(status) or {}
+                vals = [self._approvals[aid] for aid in ids if aid in self._approvals]
+                vals.sort(key=lambda a: str(a.get("created_at") or ""))
+            else:
+                vals = list(self._approvals.values())
+            out = [dict(a) for a in vals]
+
+            if include_archived if include_archived is not None else bool(status):
+                archived = list(self._archive.iter_all(_archive_path(), status))
+                if archived:
+                    out.extend(archived)
+                    # Creation order across hot set + archive, as before.
+                    out.sort(key=lambda a: str(a.get("created_at") or ""))
+            return out
 
     def list_pending(self) -> List[Dict[str, Any]]:
         return self.list_approvals(status="pending")
 
+    def count_by_status(self) -> Dict[str, int]:
+        """Approval counts per status across the hot set and the archive."""
+
+        with self._lock:
+            self._expire_stale_pending_locked()
+            counts = {st: len(ids) for st, ids in self._index.by_status.items() if ids}
+            for st, ids in self._archive.by_status.items():
+                if ids:
+                    counts[st] = counts.get(st, 0) + len(ids)
+            return counts
+
+    # ============================================================
+    # EXECUTION
+    # ============================================================
+
+    def mark_executed(self, approval_id: str, *, execution_state: str) -> None:
+        """Record that an approved execution finished and archive it."""
+
+        with self._lock:
+            a = self._approvals.get(approval_id)
+            if a is None or a.get("status") != "approved":
+                return
+            a["execution_state"] = str(execution_state or "")
+            a["executed_at"] = _utc_now_iso()
+            self._persist_to_disk_locked(a)
+
     # ============================================================
     # TTL / EXPIRATION
     # ============================================================
@@ -290,24 +521,21 @@ class ApprovalStateService:
         if ttl <= 0:
             return 0
 
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(seconds=ttl)
-
-        changed = 0
-        for a in self._approvals.values():
-            if a.get("status") != "pending":
+        expired: List[Dict[str, Any]] = []
+        for aid in self._index.pop_expired(time.time() - ttl):
+            a = self._approvals.get(aid)
+            if a is None or a.get("status") != "pending":
                 continue
-            created_at = _parse_utc_iso(a.get("created_at"))
-            if created_at and created_at < cutoff:
-                a["status"] = "expired"
-                a["expired_at"] = _utc_now_iso()
-                a.setdefault("decided_at", a["expired_at"])
-                a.setdefault("note", "expired_by_ttl")
-                changed += 1
-
-        if changed:
-            self._persist_to_disk_locked()
-        return changed
+            a["status"] = "expired"
+            a["expired_at"] = _utc_now_iso()
+            a.setdefault("decided_at", a["expired_at"])
+            a.setdefault("note", "expired_by_ttl")
+            self._status_changed_locked(a, previous="pending")
+            expired.append(a)
+
+        if expired:
+            self._persist_to_disk_locked(*expired)
+        return len(expired)
 
     # ============================================================
     # INTERNAL
@@ -315,37 +543,117 @@ class ApprovalStateService:
 
     def _require(self, approval_id: str) -> Dict[str, Any]:
         a = self._approvals.get(approval_id)
+        if a is None:
+            # Archived approvals are read-only here
+            # (every decision path returns early for a non-pending status).
+            a = self._archive.get(_archive_path(), approval_id)
         if not a:
             raise KeyError("Approval not found")
         return a
 
+    def _status_changed_locked(
+        self, approval: Dict[str, Any], *, previous: str
+    ) -> None:
+        self._index.remove(approval, status=previous)
+        self._index.add(approval)
+
+    def _journal_locked(self) -> JsonJournal:
+        j = ApprovalStateService._GLOBAL_JOURNAL
+        if j is None or j.path != journal_path_for(_APPROVAL_FILE):
+            if j is not None:
+                j.close()
+            j = JsonJournal(journal_path_for(_APPROVAL_FILE))
+            ApprovalStateService._GLOBAL_JOURNAL = j
+        return j
+
+    def _archive_terminal_locked(self, approval: Dict[str, Any]) -> bool:
+        aid = str(approval.get("approval_id") or "")
+        status = str(approval.get("status") or "")
+        if not _is_archivable(approval) or aid not in self._approvals:
+            return False
+        if self._archive.status.get(aid) != status:
+            # Already there if a crash hit before the journal marker.
+            self._archive.append(_archive_path(), approval)
+        self._approvals.pop(aid, None)
+        self._index.remove(approval, status=status)
+        return True
+
     def _load_from_disk_locked(self) -> None:
+        self._index.clear()
         try:
-            if not _APPROVAL_FILE.exists():
-                return
-            with open(_APPROVAL_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if not isinstance(data, dict):
-                return
-            for k, v in data.items():
-                if (
-                    isinstance(k, str)
-                    and isinstance(v, dict)
-                    and k not in self._approvals
-                ):
-                    v.setdefault("approval_id", k)
-                    v.setdefault("status", "pending")
-                    v.setdefault("created_at", _utc_now_iso())
-                    self._approvals[k] = v
+            if _APPROVAL_FILE.exists():
+                with open(_APPROVAL_FILE, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    for k, v in data.items():
+                        if (
+                            isinstance(k, str)
+                            and isinstance(v, dict)
+                            and k not in self._approvals
+                        ):
+                            v.setdefault("approval_id", k)
+                            v.setdefault("status", "pending")
+                            v.setdefault("created_at", _utc_now_iso())
+                            self._approvals[k] = v
         except Exception as e:
             logger.warning("ApprovalState load failed: %s", e)
 
-    def _persist_to_disk_locked(self) -> None:
+        replayed = 0
         try:
-            _atomic_write_json(_APPROVAL_FILE, self._approvals)
+            for rec in self._journal_locked().replay():
+                k = rec.get("k")
+                if not isinstance(k, str):
+                    continue
+                replayed += 1
+                if rec.get("archived") is True:
+                    self._approvals.pop(k, None)
+                elif isinstance(rec.get("v"), dict):
+                    self._approvals[k] = rec["v"]
+        except Exception as e:
+            logger.warning("ApprovalState journal replay failed: %s", e)
+
+        self._archive.load(_archive_path())
+
+        migrated = 0
+        for a in list(self._approvals.values()):
+            self._index.add(a)
+        for a in list(self._approvals.values()):
+            try:
+                if self._archive_terminal_locked(a):
+                    migrated += 1
+            except Exception as e:
+                logger.warning("ApprovalState archive failed: %s", e)
+                break
+
+        if replayed or migrated:
+            self._compact_locked()
+
+    def _persist_to_disk_locked(self, *changed: Dict[str, Any]) -> None:
+        try:
+            journal = self._journal_locked()
+            records: List[Dict[str, Any]] = []
+            for a in changed:
+                records.append({"k": a.get("approval_id"), "v": a})
+            journal.append(*records)
+
+            archived = [
+                {"k": a.get("approval_id"), "archived": True}
+                for a in changed
+                if self._archive_terminal_locked(a)
+            ]
+            n = journal.append(*archived)
+            if n >= _journal_compact_records():
+                self._compact_locked()
         except Exception as e:
             logger.warning("ApprovalState persist failed: %s", e)
 
+    def _compact_locked(self) -> None:
+        try:
+            _atomic_write_json(_APPROVAL_FILE, self._approvals)
+            self._journal_locked().truncate()
+        except Exception as e:
+            logger.warning("ApprovalState compaction failed: %s", e)
+
 
 _APPROVAL_STATE_SINGLETON = ApprovalStateService()
 
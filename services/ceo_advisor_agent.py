@@ -14,6 +14,7 @@ from models.agent_contract import AgentInput, AgentOutput, ProposedCommand
 from models.canon import PROPOSAL_WRAPPER_INTENT
 
 from services.intent_precedence import classify_intent
+from services.prompt_features import analyze_prompt, prompt_keywords, prompt_pattern
 
 # PHASE 6: Import shared Notion Ops state management
 from services.notion_ops_state import get_state as get_notion_ops_state
@@ -468,11 +469,8 @@ def _build_responses_no_grounding_instructions(
 # -----------------------------------
 # Detection (propose-only / notion ask)
 # -----------------------------------
-def _is_propose_only_request(user_text: str) -> bool:
-    t = (user_text or "").strip().lower()
-    if not t:
-        return False
-    signals = (
+_PF_PROPOSE_ONLY = prompt_keywords(
+    (
         "propose",
         "proposed_commands",
         "do not execute",
@@ -481,7 +479,21 @@ def _is_propose_only_request(user_text: str) -> bool:
         "samo predloži",
         "return proposed",
     )
-    return any(s in t for s in signals)
+)
+
+
+def _is_propose_only_request(user_text: str) -> bool:
+    pf = analyze_prompt(user_text)
+    if not pf.lower:
+        return False
+    return pf.has(_PF_PROPOSE_ONLY)
+
+
+_PF_ACTION_VERB = prompt_pattern(
+    r"(?i)\b(kreiraj|napravi|dodaj|upi\u0161i|upisi|unesi|postavi|set|create|add|write)\b"
+)
+_PF_GOAL_WORD = prompt_pattern(r"(?i)\b(cilj|goal)\b")
+_PF_TASK_WORD = prompt_pattern(r"(?i)\b(task|zad|zadatak)\b")
 
 
 def _has_explicit_action_for_goal_task(user_text: str) -> tuple[bool, str]:
@@ -494,20 +506,16 @@ def _has_explicit_action_for_goal_task(user_text: str) -> tuple[bool, str]:
     Otherwise returns (False, "").
     """
 
-    t = (user_text or "").strip().lower()
-    if not t:
+    pf = analyze_prompt(user_text)
+    if not pf.lower:
         return (False, "")
 
-    action_re = r"(?i)\b(kreiraj|napravi|dodaj|upi\u0161i|upisi|unesi|postavi|set|create|add|write)\b"
-    if not re.search(action_re, t):
+    if not pf.has(_PF_ACTION_VERB):
         return (False, "")
 
-    goal_re = r"(?i)\b(cilj|goal)\b"
-    task_re = r"(?i)\b(task|zad|zadatak)\b"
-
-    if re.search(goal_re, t):
+    if pf.has(_PF_GOAL_WORD):
         return (True, "goal")
-    if re.search(task_re, t):
+    if pf.has(_PF_TASK_WORD):
         return (True, "task")
     return (False, "")
 
@@ -520,6 +528,53 @@ def _wants_notion_task_or_goal(user_text: str) -> bool:
     return bool(ok and kind in {"goal", "task"})
 
 
+_PF_TALK_FIRST = prompt_keywords(
+    (
+        "prvo razgovaramo",
+        "prvo da razgovaramo",
+        "prvo razgovor",
+        "prvo da popricamo",
+        "prvo da popričamo",
+        "prvo da pricamo",
+        "da prvo razgovaramo",
+        "let's talk first",
+        "lets talk first",
+        "before we do that",
+    )
+)
+_PF_NOT_NOW = prompt_keywords(
+    (
+        "neću sad",
+        "necu sad",
+        "neću sada",
+        "necu sada",
+        "ne sada",
+        "ne sad",
+        "neću još",
+        "necu jos",
+        "neću jos",
+        "ne jos",
+    )
+)
+_PF_EXECUTION_VERB = prompt_keywords(
+    (
+        "postav",
+        "podes",
+        "upi",
+        "upis",
+        "unes",
+        "kreir",
+        "dodaj",
+        "napravi",
+        "set ",
+        "create ",
+        "write ",
+    )
+)
+_PF_PREP_WORD = prompt_keywords(("priprem", "priprema", "razrad", "razrada"))
+_PF_FIRST_WORD = prompt_keywords(("prvo", "before", "najprije", "najpre"))
+
+
 def _defers_notion_execution_or_wants_discussion_first(user_text: str) -> bool:
     """True when the user explicitly says: not now / let's talk first / prep/analysis.
 
@@ -527,66 +582,20 @@ def _defers_notion_execution_or_wants_discussion_first(user_text: str) -> bool:
     response for planning/discussion prompts.
     """
 
-    t = (user_text or "").strip().lower()
-    if not t:
+    pf = analyze_prompt(user_text)
+    if not pf.lower:
         return False
 
     # Direct "talk first" markers.
-    if any(
-        s in t
-        for s in (
-            "prvo razgovaramo",
-            "prvo da razgovaramo",
-            "prvo razgovor",
-            "prvo da popricamo",
-            "prvo da popričamo",
-            "prvo da pricamo",
-            "da prvo razgovaramo",
-            "let's talk first",
-            "lets talk first",
-            "before we do that",
-        )
-    ):
+    if pf.has(_PF_TALK_FIRST):
         return True
 
     # "Not now" markers, typically paired with execution verbs.
-    not_now = any(
-        s in t
-        for s in (
-            "neću sad",
-            "necu sad",
-            "neću sada",
-            "necu sada",
-            "ne sada",
-            "ne sad",
-            "neću još",
-            "necu jos",
-            "neću jos",
-            "ne jos",
-        )
-    )
-    if not_now and any(
-        v in t
-        for v in (
-            "postav",
-            "podes",
-            "upi",
-            "upis",
-            "unes",
-            "kreir",
-            "dodaj",
-            "napravi",
-            "set ",
-            "create ",
-            "write ",
-        )
-    ):
+    if pf.has(_PF_NOT_NOW) and pf.has(_PF_EXECUTION_VERB):
         return True
 
     # Prep/analysis wording that implies discussion before execution.
-    if any(s in t for s in ("priprem", "priprema", "razrad", "razrada")) and any(
-        s in t for s in ("prvo", "before", "najprije", "najpre")
-    ):
+    if pf.has(_PF_PREP_WORD) and pf.has(_PF_FIRST_WORD):
         return True
 
     return False
@@ -635,17 +644,17 @@ def _strict_llm_required(meta: Any) -> bool:
     return False
 
 
+_PF_EMPTY_STATE_KICKOFF = prompt_pattern(
+    r"(?i)\b(prazn\w*\s+stanj\w*|nema\s+(cilj\w*|goal\w*|task\w*|zadat\w*)|kako\s+da\s+pocn\w*|kako\s+da\s+po\u010dn\w*)\b"
+)
+
+
 def _is_empty_state_kickoff_prompt(user_text: str) -> bool:
-    t = (user_text or "").strip().lower()
-    if not t:
+    pf = analyze_prompt(user_text)
+    if not pf.lower:
         return False
     # User is explicitly asking how to start from an empty state.
-    return bool(
-        re.search(
-            r"(?i)\b(prazn\w*\s+stanj\w*|nema\s+(cilj\w*|goal\w*|task\w*|zadat\w*)|kako\s+da\s+pocn\w*|kako\s+da\s+po\u010dn\w*)\b",
-            t,
-        )
-    )
+    return pf.has(_PF_EMPTY_STATE_KICKOFF)
 
 
 def _default_kickoff_text() -> str:
@@ -670,8 +679,43 @@ def _default_kickoff_text() -> str:
     )
 
 
+# Invariant: memory capability Q&A should activate ONLY when the user is
+# clearly asking about the assistant/system memory (2nd person or identity).
+# This prevents false positives when talking about human memory.
+_PF_ASSISTANT_IDENTITY_MARKER = prompt_pattern(
+    r"(?i)\b(adnan(\.ai)?|assistant|ceo\s*advisor|sistem|system|agent)\b",
+    view="casefold",
+)
+_PF_SECOND_PERSON_MARKER = prompt_pattern(
+    r"(?i)\b("
+    r"tvoj\w*|"
+    r"mo\u017ee\u0161|mozes|"
+    r"koristi\u0161|koristis|"
+    r"pamti\u0161|pamtis|"
+    r"zapamti\u0161|zapamtis|"
+    r"your"
+    r")\b",
+    view="casefold",
+)
+_PF_MEMORY_KEYWORD = prompt_pattern(r"(?i)\b(memorij\w*|memory)\b", view="casefold")
+# Explicit second-person question forms about remembering (no need to also
+# mention 'memory'/'memorija'). Still guarded against human-memory phrasing.
+_PF_ASSISTANT_REMEMBER_QUESTION = prompt_pattern(
+    r"(?i)\b("
+    r"mo\u017ee\u0161\s+li\s+(za)?pamt\w*|"
+    r"mozes\s+li\s+(za)?pamt\w*|"
+    r"da\s+li\s+pamti\u0161\b|da\s+li\s+pamtis\b|"
+    r"pamti\u0161\s+li\b|pamtis\s+li\b|"
+    r"can\s+you\s+remember\b|do\s+you\s+remember\b|"
+    r"can\s+you\s+store\b|do\s+you\s+store\b"
+    r")",
+    view="casefold",
+)
+
+
 def _is_memory_capability_question(user_text: str) -> bool:
-    t = (user_text or "").strip()
+    pf = analyze_prompt(user_text)
+    t = pf.stripped
     if not t:
         return False
 
@@ -680,54 +724,12 @@ def _is_memory_capability_question(user_text: str) -> bool:
     if _parse_memory_write_allowlist_command(t) is not None:
         return False
 
-    t_cf = t.casefold()
-
-    # Invariant: memory capability Q&A should activate ONLY when the user is
-    # clearly asking about the assistant/system memory (2nd person or identity).
-    # This prevents false positives when talking about human memory.
-    has_identity_marker = bool(
-        re.search(
-            r"(?i)\b(adnan(\.ai)?|assistant|ceo\s*advisor|sistem|system|agent)\b",
-            t_cf,
-        )
-    )
-
-    has_second_person_marker = bool(
-        re.search(
-            r"(?i)\b("
-            r"tvoj\w*|"
-            r"mo\u017ee\u0161|mozes|"
-            r"koristi\u0161|koristis|"
-            r"pamti\u0161|pamtis|"
-            r"zapamti\u0161|zapamtis|"
-            r"your"
-            r")\b",
-            t_cf,
-        )
-    )
-
-    has_memory_keyword = bool(re.search(r"(?i)\b(memorij\w*|memory)\b", t_cf))
-
-    # Explicit second-person question forms about remembering (no need to also
-    # mention 'memory'/'memorija'). Still guarded against human-memory phrasing.
-    has_explicit_assistant_remember_question = bool(
-        re.search(
-            r"(?i)\b("
-            r"mo\u017ee\u0161\s+li\s+(za)?pamt\w*|"
-            r"mozes\s+li\s+(za)?pamt\w*|"
-            r"da\s+li\s+pamti\u0161\b|da\s+li\s+pamtis\b|"
-            r"pamti\u0161\s+li\b|pamtis\s+li\b|"
-            r"can\s+you\s+remember\b|do\s+you\s+remember\b|"
-            r"can\s+you\s+store\b|do\s+you\s+store\b"
-            r")",
-            t_cf,
-        )
-    )
-
-    if has_explicit_assistant_remember_question:
+    if pf.has(_PF_ASSISTANT_REMEMBER_QUESTION):
         return True
 
-    if has_memory_keyword and (has_identity_marker or has_second_person_marker):
+    if pf.has(_PF_MEMORY_KEYWORD) and (
+        pf.has(_PF_ASSISTANT_IDENTITY_MARKER) or pf.has(_PF_SECOND_PERSON_MARKER)
+    ):
         return True
 
     return False
@@ -856,30 +858,33 @@ def _is_expand_knowledge_request(user_text: str) -> bool:
     return bool(parsed and parsed.get("kind") == "expand_knowledge")
 
 
+_PF_TRACE_STATUS = prompt_pattern(
+    r"(?i)\b("
+    r"provenance|sources\s+used|status\s+izvora|"
+    r"izvor|izvori|izvori\s+znanja|"
+    r"odakle\s+ti(\s+info|\s+ovo)?|odakle\s+podaci|"
+    r"na\s+osnovu\s+\u010dega|na\s+osnovu\s+cega|"
+    r"sta\s+je\s+koristen\w*|\u0161ta\s+je\s+kori\u0161ten\w*|"
+    r"sta\s+je\s+preskocen\w*|\u0161ta\s+je\s+presko\u010den\w*|"
+    r"za\u0161to\s+presko\u010den\w*|zasto\s+preskocen\w*|"
+    r"trace"
+    r")\b"
+)
+
+
 def _is_trace_status_query(user_text: str) -> bool:
     """Detect user intent to ask for provenance / trace status.
 
     This must have higher priority than memory capability/governance classifiers.
     """
 
-    t = (user_text or "").strip().lower()
+    pf = analyze_prompt(user_text)
+    t = pf.lower
     if not t:
         return False
 
     # Strong triggers (BHS + EN)
-    if re.search(
-        r"(?i)\b("
-        r"provenance|sources\s+used|status\s+izvora|"
-        r"izvor|izvori|izvori\s+znanja|"
-        r"odakle\s+ti(\s+info|\s+ovo)?|odakle\s+podaci|"
-        r"na\s+osnovu\s+\u010dega|na\s+osnovu\s+cega|"
-        r"sta\s+je\s+koristen\w*|\u0161ta\s+je\s+kori\u0161ten\w*|"
-        r"sta\s+je\s+preskocen\w*|\u0161ta\s+je\s+presko\u010den\w*|"
-        r"za\u0161to\s+presko\u010den\w*|zasto\s+preskocen\w*|"
-        r"trace"
-        r")\b",
-        t,
-    ):
+    if pf.has(_PF_TRACE_STATUS):
         return True
 
     # Source-list phrasing like "KB/Identity/Memory/Notion"
@@ -1842,42 +1847,45 @@ def _is_revenue_growth_deliverable_request(user_text: str) -> bool:
     )
 
 
+_PF_DASHBOARD_TARGET = prompt_pattern(
+    r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*|kpi\w*)\b"
+)
+_PF_DASHBOARD_WORD = prompt_keywords(
+    (
+        "dashboard",
+        "snapshot",
+        "status",
+        "stanje",
+        "sažetak",
+        "sazetak",
+        "prioritet",
+        "priority",
+        "top 3",
+        "top3",
+        "top 5",
+        "top5",
+    )
+)
+
+
 def _is_dashboard_intent(user_text: str) -> bool:
     """True only for explicit dashboard/listing/status intent.
 
     Note: merely mentioning 'goal/task' is not enough.
     """
 
-    t = (user_text or "").strip().lower()
+    pf = analyze_prompt(user_text)
+    t = pf.lower
     if not t:
         return False
 
     if _is_show_request(t):
         return True
 
-    wants_targets = bool(
-        re.search(r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*|kpi\w*)\b", t)
-    )
-    if not wants_targets:
+    if not pf.has(_PF_DASHBOARD_TARGET):
         return False
 
-    return any(
-        k in t
-        for k in (
-            "dashboard",
-            "snapshot",
-            "status",
-            "stanje",
-            "sažetak",
-            "sazetak",
-            "prioritet",
-            "priority",
-            "top 3",
-            "top3",
-            "top 5",
-            "top5",
-        )
-    )
+    return pf.has(_PF_DASHBOARD_WORD)
 
 
 def _default_notion_ops_goal_subgoal_prompt(*, english_output: bool) -> str:
@@ -1935,18 +1943,8 @@ def _unwrap_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
     return snapshot
 
 
-def _is_fact_sensitive_query(user_text: str) -> bool:
-    """Detect prompts that would require grounded business facts.
-
-    We allow general coaching without snapshot, but we must not assert
-    business state (blocked/at-risk/KPI counts/status) without SSOT data.
-    """
-
-    t = (user_text or "").strip().lower()
-    if not t:
-        return False
-
-    risk_terms = (
+_PF_RISK_TERM = prompt_keywords(
+    (
         "blocked",
         "blokiran",
         "blokada",
@@ -1961,12 +1959,11 @@ def _is_fact_sensitive_query(user_text: str) -> bool:
         "incident",
         "p0",
     )
-    if any(s in t for s in risk_terms):
-        return True
-
-    # KPI/finance terms are assumed to be business-fact sensitive in CEO context.
-    # Without SSOT snapshot, we must not assert values or status.
-    kpi_terms = (
+)
+# KPI/finance terms are assumed to be business-fact sensitive in CEO context.
+# Without SSOT snapshot, we must not assert values or status.
+_PF_KPI_TERM = prompt_keywords(
+    (
         "revenue",
         "prihod",
         "mrr",
@@ -1986,23 +1983,34 @@ def _is_fact_sensitive_query(user_text: str) -> bool:
         "gmv",
         "arpu",
     )
-    if any(s in t for s in kpi_terms):
+)
+_PF_STATUS_WORD = prompt_pattern(r"(?i)\b(status|stanje|progress|napredak)\b")
+_PF_FACT_TARGET = prompt_pattern(
+    r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*|kpi\w*|project\w*|projekat\w*|revenue|prihod|profit|dobit|margin|marža|ebitda)\b"
+)
+_PF_COUNT_WORD = prompt_pattern(r"(?i)\b(koliko|broj|how\s+many)\b")
+
+
+def _is_fact_sensitive_query(user_text: str) -> bool:
+    """Detect prompts that would require grounded business facts.
+
+    We allow general coaching without snapshot, but we must not assert
+    business state (blocked/at-risk/KPI counts/status) without SSOT data.
+    """
+
+    pf = analyze_prompt(user_text)
+    if not pf.lower:
+        return False
+
+    if pf.has(_PF_RISK_TERM):
         return True
 
-    # "status/stanje" questions become fact-sensitive when tied to goals/tasks/KPIs.
-    wants_status = bool(re.search(r"(?i)\b(status|stanje|progress|napredak)\b", t))
-    wants_target = bool(
-        re.search(
-            r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*|kpi\w*|project\w*|projekat\w*|revenue|prihod|profit|dobit|margin|marža|ebitda)\b",
-            t,
-        )
-    )
-    if wants_status and wants_target:
+    if pf.has(_PF_KPI_TERM):
         return True
 
+    # "status/stanje" questions become fact-sensitive when tied to goals/tasks/KPIs.
     # Count/number queries about goals/tasks are fact-sensitive.
-    wants_count = bool(re.search(r"(?i)\b(koliko|broj|how\s+many)\b", t))
-    if wants_count and wants_target:
+    if (pf.has(_PF_STATUS_WORD) or pf.has(_PF_COUNT_WORD)) and pf.has(_PF_FACT_TARGET):
         return True
 
     return False
@@ -2108,38 +2116,42 @@ def _needs_structured_snapshot_answer(user_text: str) -> bool:
     return False
 
 
+# Explicit Bosnian list-tasks phrases (deterministic; bypass LLM).
+_PF_LIST_TASKS_PHRASE = prompt_keywords(
+    (
+        "koji su taskovi",
+        "navedi taskove",
+        "koje taskove imamo",
+        "lista taskova",
+    )
+)
+_PF_SHOW_VERB = prompt_pattern(
+    r"(?i)\b(pokazi|poka\u017ei|prika\u017ei|prikazi|izlistaj|navedi|lista|show|list|pogledaj)\b"
+)
+_PF_SHOW_TARGET = prompt_pattern(r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*)\b")
+_PF_QUESTION_OPENER = prompt_pattern(r"(?i)^\s*(koje|kakve|koji|kakav)\b")
+
+
 def _is_show_request(user_text: str) -> bool:
-    t = (user_text or "").strip().lower()
+    pf = analyze_prompt(user_text)
+    t = pf.lower
     if not t:
         return False
 
-    # Explicit Bosnian list-tasks phrases (deterministic; bypass LLM).
-    if any(
-        s in t
-        for s in (
-            "koji su taskovi",
-            "navedi taskove",
-            "koje taskove imamo",
-            "lista taskova",
-        )
-    ):
+    if pf.has(_PF_LIST_TASKS_PHRASE):
         return True
 
-    show = bool(
-        re.search(
-            r"(?i)\b(pokazi|poka\u017ei|prika\u017ei|prikazi|izlistaj|navedi|lista|show|list|pogledaj)\b",
-            t,
-        )
-    )
-    target = bool(re.search(r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*)\b", t))
+    if not pf.has(_PF_SHOW_TARGET):
+        return False
+
+    if pf.has(_PF_SHOW_VERB):
+        return True
 
     # Also treat common interrogative forms as "show" when they ask what tasks/goals exist.
     # Example: "Koje taskove imamo u sistemu?"
-    q_show = bool(re.search(r"(?i)^\s*(koje|kakve|koji|kakav)\b", t)) and (
+    return pf.has(_PF_QUESTION_OPENER) and (
         "?" in t or "imamo" in t or "navedi" in t or "lista" in t
     )
-    show = bool(show or q_show)
-    return show and target
 
 
 def _show_target(user_text: str) -> str:
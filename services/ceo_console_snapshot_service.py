@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import copy
 import datetime as dt
+import hashlib
 import logging
 import os
+import threading
+import time
+import weakref
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 import requests
 from pydantic import BaseModel, Field
 
 from services.knowledge_snapshot_service import KnowledgeSnapshotService
-from services.notion_service import discover_notion_db_registry_from_env
+from services.notion_rate_limiter import (
+    NOTION_TRANSIENT_STATUS_CODES,
+    NotionRetryPolicy,
+    get_rate_limiter_for_token,
+    parse_retry_after_s,
+)
+from services.notion_service import (
+    current_notion_budget,
+    discover_notion_db_registry_from_env,
+)
 
 NOTION_API_URL = "https://api.notion.com/v1"
 DEFAULT_NOTION_VERSION = "2022-06-28"
@@ -20,6 +37,9 @@ DEFAULT_PAGE_SIZE = 100
 DEFAULT_EXCERPT_LINES = 40
 DEFAULT_MAX_ROWS = 50
 
+# Assembled dashboard ({dashboard, knowledge}) cache; 0 disables.
+DEFAULT_DASHBOARD_CACHE_TTL_S = 15.0
+
 # Normalization bounds (read-only; fail-soft)
 DEFAULT_MAX_TEXT_VALUE_CHARS = 2000
 DEFAULT_MAX_LIST_ITEMS = 50
@@ -321,6 +341,231 @@ class _NotionClient:
         return results
 
 
+class _AsyncNotionClient:
+    """httpx twin of _NotionClient (same pagination / truncation semantics).
+
+    The underlying AsyncClient is pooled per (event loop, token, version), so
+    per-request service instances still reuse keep-alive connections. Every
+    request goes through the token's shared NotionRateLimiter (the same
+    budget NotionService draws from) and retries 429 / 5xx like
+    NotionService._safe_request.
+    """
+
+    def __init__(self, config: _NotionConfig) -> None:
+        self._config = config
+        self._retry_policy = NotionRetryPolicy.from_env()
+
+    @property
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self._config.token}",
+            "Notion-Version": self._config.version,
+            "Content-Type": "application/json",
+        }
+
+    def _client(self) -> httpx.AsyncClient:
+        return _pooled_async_client(self._config.token, self._config.version)
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        limiter = get_rate_limiter_for_token(self._config.token)
+        budget_state = current_notion_budget()
+        attempt = 0
+        while True:
+            await limiter.acquire(
+                remaining_s=(
+                    budget_state.remaining_s if budget_state is not None else None
+                )
+            )
+            try:
+                resp = await self._client().request(
+                    method,
+                    url,
+                    headers=self._headers,
+                    timeout=self._config.http_timeout_sec,
+                    **kwargs,
+                )
+            finally:
+                # Always return the in-flight slot (also on CancelledError).
+                limiter.release()
+
+            status = int(resp.status_code)
+            if status == 429:
+                retry_after_s = parse_retry_after_s(resp.headers.get("Retry-After"))
+                limiter.record_throttled(retry_after_s=retry_after_s)
+            elif status in NOTION_TRANSIENT_STATUS_CODES:
+                retry_after_s = None
+                limiter.record_transient_error()
+            else:
+                if status < 400:
+                    limiter.record_success()
+                return resp
+
+            # All snapshot requests are reads, so 5xx is safe to retry too.
+            delay = self._retry_policy.retry_delay_s(
+                attempt=attempt,
+                retry_after_s=retry_after_s,
+                allowed=True,
+                budget_state=budget_state,
+            )
+            if delay is None:
+                return resp
+            limiter.record_retry()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def query_database(
+        self,
+        database_id: str,
+        filter_: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, Any]]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_rows: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        url = f"{NOTION_API_URL}/databases/{database_id}/query"
+        payload: Dict[str, Any] = {"page_size": page_size}
+        if filter_:
+            payload["filter"] = filter_
+        if sorts:
+            payload["sorts"] = sorts
+
+        results: List[Dict[str, Any]] = []
+        next_cursor: Optional[str] = None
+
+        max_rows_eff = max_rows if isinstance(max_rows, int) and max_rows > 0 else None
+
+        while True:
+            if next_cursor:
+                payload["start_cursor"] = next_cursor
+
+            resp = await self._request("POST", url, json=payload)
+            if resp.status_code != 200:
+                raise RuntimeError(
+                    f"Notion query failed (status={resp.status_code}): {resp.text}"
+                )
+
+            data = resp.json()
+            batch = data.get("results", [])
+            if isinstance(batch, list):
+                results.extend(batch)
+
+            if max_rows_eff is not None and len(results) >= max_rows_eff:
+                return results[:max_rows_eff]
+
+            next_cursor = data.get("next_cursor")
+            if not next_cursor:
+                break
+
+        return results
+
+    async def retrieve_page(self, page_id: str) -> Dict[str, Any]:
+        url = f"{NOTION_API_URL}/pages/{page_id}"
+        resp = await self._request("GET", url)
+        if resp.status_code != 200:
+            raise RuntimeError(
+                f"Notion retrieve page failed (status={resp.status_code}): {resp.text}"
+            )
+        data = resp.json()
+        return data if isinstance(data, dict) else {}
+
+    async def list_block_children(
+        self, block_id: str, page_size: int = 50, max_blocks: int = 100
+    ) -> List[Dict[str, Any]]:
+        url = f"{NOTION_API_URL}/blocks/{block_id}/children?page_size={page_size}"
+        results: List[Dict[str, Any]] = []
+        next_cursor: Optional[str] = None
+
+        while True:
+            full_url = url
+            if next_cursor:
+                full_url = f"{url}&start_cursor={next_cursor}"
+
+            resp = await self._request("GET", full_url)
+            if resp.status_code != 200:
+                raise RuntimeError(
+                    f"Notion list block children failed (status={resp.status_code}): {resp.text}"
+                )
+
+            data = resp.json()
+            batch = data.get("results", [])
+            if isinstance(batch, list):
+                results.extend(batch)
+
+            if len(results) >= max_blocks:
+                return results[:max_blocks]
+
+            next_cursor = data.get("next_cursor")
+            if not next_cursor:
+                break
+
+        return results
+
+
+# (loop id, token, version) -> (weakref to loop, client). The weakref guards
+# against a new loop reusing the id of a closed one.
+_ASYNC_CLIENTS: Dict[Tuple[int, str, str], Tuple[Any, httpx.AsyncClient]] = {}
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+
+
+def _pooled_async_client(token: str, version: str) -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    key = (id(loop), token, version)
+    with _ASYNC_CLIENTS_LOCK:
+        hit = _ASYNC_CLIENTS.get(key)
+        if hit is not None and hit[0]() is loop and not hit[1].is_closed:
+            return hit[1]
+        for k in [k for k, (ref, _) in _ASYNC_CLIENTS.items() if ref() is None]:
+            _ASYNC_CLIENTS.pop(k, None)
+        client = httpx.AsyncClient()
+        _ASYNC_CLIENTS[key] = (weakref.ref(loop), client)
+        return client
+
+
+# ============================================================
+# DASHBOARD CACHE (short TTL, single-flight)
+# ============================================================
+#
+# The assembled {generated_at, dashboard, knowledge} payload is cached per
+# config fingerprint. Concurrent asnapshot() misses share one in-flight build
+# (same pattern as KBNotionStore). KnowledgeSnapshot state is never cached.
+
+_DASHBOARD_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_DASHBOARD_IN_FLIGHT: Dict[str, concurrent.futures.Future] = {}
+_DASHBOARD_LOCK = threading.Lock()
+
+
+def _dashboard_cache_ttl_s() -> float:
+    raw = (os.getenv("CEO_CONSOLE_SNAPSHOT_CACHE_TTL_S") or "").strip()
+    if not raw:
+        return DEFAULT_DASHBOARD_CACHE_TTL_S
+    try:
+        return max(0.0, float(raw))
+    except Exception:
+        return DEFAULT_DASHBOARD_CACHE_TTL_S
+
+
+def _dashboard_cache_get(key: str, ttl_s: float) -> Optional[Dict[str, Any]]:
+    if ttl_s <= 0:
+        return None
+    with _DASHBOARD_LOCK:
+        hit = _DASHBOARD_CACHE.get(key)
+    if hit is None or (time.monotonic() - hit[0]) >= ttl_s:
+        return None
+    return copy.deepcopy(hit[1])
+
+
+def _dashboard_cache_put(key: str, ttl_s: float, payload: Dict[str, Any]) -> None:
+    if ttl_s <= 0:
+        return
+    with _DASHBOARD_LOCK:
+        _DASHBOARD_CACHE[key] = (time.monotonic(), payload)
+
+
+def clear_dashboard_cache() -> None:
+    with _DASHBOARD_LOCK:
+        _DASHBOARD_CACHE.clear()
+
+
 class CeoConsoleSnapshotService:
     def __init__(
         self,
@@ -331,6 +576,7 @@ class CeoConsoleSnapshotService:
     ) -> None:
         self._notion: Optional[_NotionClient] = notion_client
         self._cfg: Optional[_NotionConfig] = config
+        self._anotion: Optional[_AsyncNotionClient] = None
         self._env_db_registry_meta: Dict[str, Dict[str, Any]] = (
             env_db_registry_meta if isinstance(env_db_registry_meta, dict) else {}
         )
@@ -461,6 +707,12 @@ class CeoConsoleSnapshotService:
             env_db_registry_warnings=warnings,
         )
 
+    def _async_notion(self) -> _AsyncNotionClient:
+        assert self._cfg is not None
+        if self._anotion is None:
+            self._anotion = _AsyncNotionClient(self._cfg)
+        return self._anotion
+
     def build_snapshot(self) -> CeoDashboardSnapshot:
         self._require_ready()
         assert self._notion is not None
@@ -470,8 +722,39 @@ class CeoConsoleSnapshotService:
 
         goals = self._load_goals()
         tasks = self._load_tasks()
-        weekly_priority = self._build_weekly_priority(goals, tasks)
         approvals = self._build_approvals_summary()
+        return self._dashboard(now, goals, tasks, approvals)
+
+    async def abuild_snapshot(self) -> CeoDashboardSnapshot:
+        """Async build_snapshot: goals, tasks and approvals are fetched concurrently."""
+        self._require_ready()
+        assert self._cfg is not None
+
+        now = dt.datetime.utcnow()
+
+        results = await asyncio.gather(
+            self._aload_goals(),
+            self._aload_tasks(),
+            self._abuild_approvals_summary(),
+            return_exceptions=True,
+        )
+        # Surface the first failure in the same order the sync path would hit it.
+        for r in results:
+            if isinstance(r, BaseException):
+                raise r
+        goals, tasks, approvals = results
+        return self._dashboard(now, goals, tasks, approvals)
+
+    def _dashboard(
+        self,
+        now: dt.datetime,
+        goals: List[CeoGoal],
+        tasks: List[CeoTask],
+        approvals: CeoApprovalSummary,
+    ) -> CeoDashboardSnapshot:
+        assert self._cfg is not None
+
+        weekly_priority = self._build_weekly_priority(goals, tasks)
 
         meta = self._base_metadata()
         meta["kind"] = "dashboard_snapshot"
@@ -488,7 +771,8 @@ class CeoConsoleSnapshotService:
             metadata=meta,
         )
 
-    def snapshot(self) -> Dict[str, Any]:
+    @staticmethod
+    def _knowledge_snapshot_state() -> Dict[str, Any]:
         # Always expose KnowledgeSnapshot TTL state (CEO console needs it)
         try:
             ks = KnowledgeSnapshotService.get_snapshot()
@@ -500,46 +784,129 @@ class CeoConsoleSnapshotService:
                 "error": str(e),
                 "source": "KnowledgeSnapshotService.get_snapshot",
             }
+        return ks
 
+    @staticmethod
+    def _envelope(ks: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
         trace = ks.get("trace") if isinstance(ks, dict) else {}
         if not isinstance(trace, dict):
             trace = {}
+        out: Dict[str, Any] = {
+            "available": body.get("available"),
+            "source": "ceo_console_snapshot_service",
+        }
+        out.update(body)
+        return {
+            **out,
+            "knowledge_snapshot": ks,
+            "ttl_seconds": trace.get("ttl_seconds"),
+            "age_seconds": trace.get("age_seconds"),
+            "is_expired": trace.get("is_expired"),
+        }
+
+    @staticmethod
+    def _dashboard_body(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "available": True,
+            "generated_at": payload.get("generated_at"),
+            "dashboard": payload.get("dashboard"),
+            "knowledge": payload.get("knowledge"),
+        }
+
+    def _dashboard_cache_key(self) -> str:
+        assert self._cfg is not None
+        # repr() of the dataclass includes the token; only its hash is kept.
+        return hashlib.sha256(repr(self._cfg).encode("utf-8")).hexdigest()
+
+    def snapshot(self) -> Dict[str, Any]:
+        ks = self._knowledge_snapshot_state()
 
         if not self._ready:
-            return {
-                "available": False,
-                "source": "ceo_console_snapshot_service",
-                "error": self._init_error or "snapshot service not configured",
-                "knowledge_snapshot": ks,
-                "ttl_seconds": trace.get("ttl_seconds"),
-                "age_seconds": trace.get("age_seconds"),
-                "is_expired": trace.get("is_expired"),
-            }
+            return self._envelope(
+                ks,
+                {
+                    "available": False,
+                    "error": self._init_error or "snapshot service not configured",
+                },
+            )
 
         try:
-            dash = self.build_snapshot()
-            extra = self._build_ceo_advisory_knowledge()
-            return {
-                "available": True,
-                "source": "ceo_console_snapshot_service",
+            ttl_s = _dashboard_cache_ttl_s()
+            key = self._dashboard_cache_key()
+            payload = _dashboard_cache_get(key, ttl_s)
+            if payload is None:
+                dash = self.build_snapshot()
+                extra = self._build_ceo_advisory_knowledge()
+                payload = {
+                    "generated_at": dash.generated_at.isoformat(),
+                    "dashboard": _safe_model_dump(dash),
+                    "knowledge": extra,
+                }
+                _dashboard_cache_put(key, ttl_s, copy.deepcopy(payload))
+            return self._envelope(ks, self._dashboard_body(payload))
+        except Exception as e:
+            return self._envelope(ks, {"available": False, "error": str(e)})
+
+    async def asnapshot(self) -> Dict[str, Any]:
+        """Async snapshot(): concurrent Notion fan-out + cached/single-flight dashboard."""
+        ks = self._knowledge_snapshot_state()
+
+        if not self._ready:
+            return self._envelope(
+                ks,
+                {
+                    "available": False,
+                    "error": self._init_error or "snapshot service not configured",
+                },
+            )
+
+        try:
+            payload = await self._acached_dashboard_payload()
+            return self._envelope(ks, self._dashboard_body(payload))
+        except Exception as e:
+            return self._envelope(ks, {"available": False, "error": str(e)})
+
+    async def _acached_dashboard_payload(self) -> Dict[str, Any]:
+        ttl_s = _dashboard_cache_ttl_s()
+        key = self._dashboard_cache_key()
+
+        payload = _dashboard_cache_get(key, ttl_s)
+        if payload is not None:
+            return payload
+
+        with _DASHBOARD_LOCK:
+            fut = _DASHBOARD_IN_FLIGHT.get(key)
+            leader = fut is None
+            if leader:
+                fut = concurrent.futures.Future()
+                _DASHBOARD_IN_FLIGHT[key] = fut
+        assert fut is not None
+
+        if not leader:
+            return copy.deepcopy(await asyncio.wrap_future(fut))
+
+        try:
+            dash, extra = await asyncio.gather(
+                self.abuild_snapshot(), self._abuild_ceo_advisory_knowledge()
+            )
+            payload = {
                 "generated_at": dash.generated_at.isoformat(),
                 "dashboard": _safe_model_dump(dash),
                 "knowledge": extra,
-                "knowledge_snapshot": ks,
-                "ttl_seconds": trace.get("ttl_seconds"),
-                "age_seconds": trace.get("age_seconds"),
-                "is_expired": trace.get("is_expired"),
-            }
-        except Exception as e:
-            return {
-                "available": False,
-                "source": "ceo_console_snapshot_service",
-                "error": str(e),
-                "knowledge_snapshot": ks,
-                "ttl_seconds": trace.get("ttl_seconds"),
-                "age_seconds": trace.get("age_seconds"),
-                "is_expired": trace.get("is_expired"),
             }
+            _dashboard_cache_put(key, ttl_s, payload)
+            fut.set_result(payload)
+            return copy.deepcopy(payload)
+        except Exception as exc:  # noqa: BLE001
+            fut.set_exception(exc)
+            raise
+        finally:
+            with _DASHBOARD_LOCK:
+                if _DASHBOARD_IN_FLIGHT.get(key) is fut:
+                    _DASHBOARD_IN_FLIGHT.pop(key, None)
+            if not fut.done():
+                # Leader was cancelled; release followers instead of hanging them.
+                fut.set_exception(RuntimeError("ceo dashboard build cancelled"))
 
     def get_snapshot(self) -> Dict[str, Any]:
         return self.snapshot()
@@ -663,6 +1030,30 @@ class CeoConsoleSnapshotService:
                 )
             raise
 
+    async def _asafe_query_with_optional_sort(
+        self,
+        database_id: str,
+        sorts: Optional[List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        assert self._cfg is not None
+        notion = self._async_notion()
+
+        if not sorts:
+            return await notion.query_database(
+                database_id, filter_=None, sorts=None, max_rows=self._cfg.max_rows
+            )
+
+        try:
+            return await notion.query_database(
+                database_id, filter_=None, sorts=sorts, max_rows=self._cfg.max_rows
+            )
+        except RuntimeError as e:
+            if self._is_missing_sort_property_error(e):
+                return await notion.query_database(
+                    database_id, filter_=None, sorts=None, max_rows=self._cfg.max_rows
+                )
+            raise
+
     def _build_ceo_advisory_knowledge(self) -> Dict[str, Any]:
         assert self._cfg is not None
         assert self._notion is not None
@@ -690,6 +1081,35 @@ class CeoConsoleSnapshotService:
 
         return knowledge
 
+    async def _abuild_ceo_advisory_knowledge(self) -> Dict[str, Any]:
+        assert self._cfg is not None
+
+        knowledge: Dict[str, Any] = {
+            "sop": {"available": False},
+            "plans": {"available": False},
+            "time_management": {"available": False},
+        }
+
+        # Each loader is fail-soft (returns {"available": False, "error": ...}).
+        loads: Dict[str, Any] = {}
+        if self._cfg.sop_db_id:
+            loads["sop"] = self._asummarize_simple_database(
+                self._cfg.sop_db_id, "Name", "sop"
+            )
+        if self._cfg.plans_db_id:
+            loads["plans"] = self._asummarize_simple_database(
+                self._cfg.plans_db_id, "Name", "plans"
+            )
+        if self._cfg.time_management_page_id:
+            loads["time_management"] = self._aread_page_excerpt(
+                self._cfg.time_management_page_id, "time_management"
+            )
+
+        if loads:
+            results = await asyncio.gather(*loads.values())
+            knowledge.update(zip(loads.keys(), results))
+        return knowledge
+
     def _summarize_simple_database(
         self, database_id: str, title_prop: str, label: str
     ) -> Dict[str, Any]:
@@ -701,21 +1121,41 @@ class CeoConsoleSnapshotService:
             rows = self._notion.query_database(
                 database_id, filter_=None, sorts=None, max_rows=self._cfg.max_rows
             )
-            items: List[Dict[str, Any]] = []
-            for row in rows:
-                props: Dict[str, Any] = (
-                    row.get("properties", {}) if isinstance(row, dict) else {}
-                )
-                title = self._extract_title(props.get(title_prop)) or "(untitled)"
-                items.append({"id": row.get("id", ""), "title": title})
-            out["available"] = True
-            out["count"] = len(items)
-            out["items"] = items
+            return self._simple_database_summary(out, rows, title_prop)
+        except Exception as e:
+            out["error"] = str(e)
             return out
+
+    async def _asummarize_simple_database(
+        self, database_id: str, title_prop: str, label: str
+    ) -> Dict[str, Any]:
+        assert self._cfg is not None
+
+        out: Dict[str, Any] = {"available": False, "label": label, "items": []}
+        try:
+            rows = await self._async_notion().query_database(
+                database_id, filter_=None, sorts=None, max_rows=self._cfg.max_rows
+            )
+            return self._simple_database_summary(out, rows, title_prop)
         except Exception as e:
             out["error"] = str(e)
             return out
 
+    def _simple_database_summary(
+        self, out: Dict[str, Any], rows: List[Dict[str, Any]], title_prop: str
+    ) -> Dict[str, Any]:
+        items: List[Dict[str, Any]] = []
+        for row in rows:
+            props: Dict[str, Any] = (
+                row.get("properties", {}) if isinstance(row, dict) else {}
+            )
+            title = self._extract_title(props.get(title_prop)) or "(untitled)"
+            items.append({"id": row.get("id", ""), "title": title})
+        out["available"] = True
+        out["count"] = len(items)
+        out["items"] = items
+        return out
+
     def _read_page_excerpt(self, page_id: str, label: str) -> Dict[str, Any]:
         assert self._cfg is not None
         assert self._notion is not None
@@ -729,22 +1169,50 @@ class CeoConsoleSnapshotService:
         }
         try:
             page = self._notion.retrieve_page(page_id)
-            props = page.get("properties", {}) if isinstance(page, dict) else {}
-            title = self._try_extract_page_title(props)
-
             blocks = self._notion.list_block_children(block_id=page_id, max_blocks=200)
-            lines = self._extract_block_plain_text_lines(blocks)
-            excerpt = lines[: self._cfg.excerpt_lines]
-
-            out["available"] = True
-            out["title"] = title
-            out["excerpt"] = excerpt
-            out["excerpt_lines"] = len(excerpt)
+            return self._page_excerpt(out, page, blocks)
+        except Exception as e:
+            out["error"] = str(e)
             return out
+
+    async def _aread_page_excerpt(self, page_id: str, label: str) -> Dict[str, Any]:
+        assert self._cfg is not None
+        notion = self._async_notion()
+
+        out: Dict[str, Any] = {
+            "available": False,
+            "label": label,
+            "page_id": page_id,
+            "title": None,
+            "excerpt": [],
+        }
+        try:
+            page, blocks = await asyncio.gather(
+                notion.retrieve_page(page_id),
+                notion.list_block_children(block_id=page_id, max_blocks=200),
+            )
+            return self._page_excerpt(out, page, blocks)
         except Exception as e:
             out["error"] = str(e)
             return out
 
+    def _page_excerpt(
+        self, out: Dict[str, Any], page: Dict[str, Any], blocks: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        assert self._cfg is not None
+
+        props = page.get("properties", {}) if isinstance(page, dict) else {}
+        title = self._try_extract_page_title(props)
+
+        lines = self._extract_block_plain_text_lines(blocks)
+        excerpt = lines[: self._cfg.excerpt_lines]
+
+        out["available"] = True
+        out["title"] = title
+        out["excerpt"] = excerpt
+        out["excerpt_lines"] = len(excerpt)
+        return out
+
     @staticmethod
     def _try_extract_page_title(props: Dict[str, Any]) -> Optional[str]:
         for _, val in props.items():
@@ -782,16 +1250,29 @@ class CeoConsoleSnapshotService:
                 parts.append(pt)
         return "".join(parts).strip()
 
+    def _goals_sorts(self) -> List[Dict[str, Any]]:
+        assert self._cfg is not None
+        return [{"property": self._cfg.goal_deadline_prop, "direction": "ascending"}]
+
     def _load_goals(self) -> List[CeoGoal]:
         assert self._cfg is not None
+        return self._goals_from_rows(
+            self._safe_query_with_optional_sort(
+                self._cfg.goals_db_id, sorts=self._goals_sorts()
+            )
+        )
 
-        rows = self._safe_query_with_optional_sort(
-            self._cfg.goals_db_id,
-            sorts=[
-                {"property": self._cfg.goal_deadline_prop, "direction": "ascending"}
-            ],
+    async def _aload_goals(self) -> List[CeoGoal]:
+        assert self._cfg is not None
+        return self._goals_from_rows(
+            await self._asafe_query_with_optional_sort(
+                self._cfg.goals_db_id, sorts=self._goals_sorts()
+            )
         )
 
+    def _goals_from_rows(self, rows: List[Dict[str, Any]]) -> List[CeoGoal]:
+        assert self._cfg is not None
+
         goals: List[CeoGoal] = []
         for row in rows:
             props: Dict[str, Any] = (
@@ -830,16 +1311,29 @@ class CeoConsoleSnapshotService:
             )
         return goals
 
+    def _tasks_sorts(self) -> List[Dict[str, Any]]:
+        assert self._cfg is not None
+        return [{"property": self._cfg.task_due_date_prop, "direction": "ascending"}]
+
     def _load_tasks(self) -> List[CeoTask]:
         assert self._cfg is not None
+        return self._tasks_from_rows(
+            self._safe_query_with_optional_sort(
+                self._cfg.tasks_db_id, sorts=self._tasks_sorts()
+            )
+        )
 
-        rows = self._safe_query_with_optional_sort(
-            self._cfg.tasks_db_id,
-            sorts=[
-                {"property": self._cfg.task_due_date_prop, "direction": "ascending"}
-            ],
+    async def _aload_tasks(self) -> List[CeoTask]:
+        assert self._cfg is not None
+        return self._tasks_from_rows(
+            await self._asafe_query_with_optional_sort(
+                self._cfg.tasks_db_id, sorts=self._tasks_sorts()
+            )
         )
 
+    def _tasks_from_rows(self, rows: List[Dict[str, Any]]) -> List[CeoTask]:
+        assert self._cfg is not None
+
         tasks: List[CeoTask] = []
         for row in rows:
             props: Dict[str, Any] = (
@@ -931,13 +1425,33 @@ class CeoConsoleSnapshotService:
         if not self._cfg.approvals_db_id:
             return CeoApprovalSummary()
 
-        rows = self._notion.query_database(
-            self._cfg.approvals_db_id,
-            filter_=None,
-            sorts=None,
-            max_rows=self._cfg.max_rows,
+        return self._approvals_from_rows(
+            self._notion.query_database(
+                self._cfg.approvals_db_id,
+                filter_=None,
+                sorts=None,
+                max_rows=self._cfg.max_rows,
+            )
         )
 
+    async def _abuild_approvals_summary(self) -> CeoApprovalSummary:
+        assert self._cfg is not None
+
+        if not self._cfg.approvals_db_id:
+            return CeoApprovalSummary()
+
+        return self._approvals_from_rows(
+            await self._async_notion().query_database(
+                self._cfg.approvals_db_id,
+                filter_=None,
+                sorts=None,
+                max_rows=self._cfg.max_rows,
+            )
+        )
+
+    def _approvals_from_rows(self, rows: List[Dict[str, Any]]) -> CeoApprovalSummary:
+        assert self._cfg is not None
+
         today = dt.date.today()
         pending = approved_today = completed = errors = 0
 
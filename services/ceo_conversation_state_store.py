@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import logging
 import os
 import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from services.json_journal import append_jsonl, scan_jsonl, write_jsonl_atomic
 
 
 _DEFAULT_MAX_TURNS = 10
@@ -15,6 +23,8 @@ _DEFAULT_MAX_TURN_CHARS = 600
 
 _LOCK = threading.Lock()
 
+logger = logging.getLogger(__name__)
+
 
 def _backend_kind() -> str:
     return (os.getenv("MEMORY_BACKEND") or "file").strip().lower()
@@ -52,6 +62,38 @@ def _pg_backend_required():
     return pg
 
 
+def _apg_backend_required():
+    """Async twin of _pg_backend_required() for the awaitable call paths.
+
+    Returns an object with the PostgresMemoryBackend method names as
+    coroutines: AsyncPostgresMemoryBackend, or the sync backend run on a
+    worker thread when the asyncio engine is unavailable.
+    """
+
+    pg = _pg_backend_required()
+    if pg is None:
+        return None
+    try:
+        from services.memory_postgres_async_backend import AsyncPostgresMemoryBackend
+
+        return AsyncPostgresMemoryBackend()
+    except Exception:
+        return _ThreadedBackend(pg)
+
+
+class _ThreadedBackend:
+    def __init__(self, pg: Any) -> None:
+        self._pg = pg
+
+    def __getattr__(self, name: str) -> Any:
+        fn = getattr(self._pg, name)
+
+        async def _call(**kwargs: Any) -> Any:
+            return await asyncio.to_thread(fn, **kwargs)
+
+        return _call
+
+
 def _now_unix() -> float:
     return time.time()
 
@@ -110,6 +152,557 @@ def _save_db(db: Dict[str, Any]) -> None:
             pass
 
 
+# ============================================================
+# SHARDED FILE LAYOUT (CEO_CONVERSATION_STATE_LAYOUT=sharded)
+# ============================================================
+#
+# One append-only JSONL segment per conversation (sha256(cid) file name) under
+# CEO_CONVERSATION_STATE_DIR (default: <state path>.d/). Records:
+#   {"op": "turn", "t", "user", "assistant", "max_turns"}
+#   {"op": "meta", "updates": {...}}
+#   {"op": "snapshot", "cid", "turns": [...], "meta": {...}}  (compaction)
+# Replay applies records in order with the legacy trim/merge rules, so a
+# segment always yields exactly what the single-file store would hold.
+#
+# Recently used conversations stay decoded in an LRU, revalidated by the
+# segment's (size, mtime_ns) so appends from other processes are picked up.
+# Locks are striped by conversation hash: a turn only contends with its own
+# conversation. Conversations missing a segment are seeded once from the
+# legacy single-file store.
+
+_SHARD_LOCKS = [threading.Lock() for _ in range(64)]
+_LRU_LOCK = threading.Lock()
+_LRU: "OrderedDict[str, _SegmentState]" = OrderedDict()
+_LEGACY_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+@dataclass
+class _SegmentState:
+    turns: List[Dict[str, Any]] = field(default_factory=list)
+    meta: Dict[str, Any] = field(default_factory=dict)
+    records: int = 0
+    sig: Optional[Tuple[int, int]] = None
+
+
+def _layout() -> str:
+    return (os.getenv("CEO_CONVERSATION_STATE_LAYOUT") or "json").strip().lower()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int((os.getenv(name) or "").strip() or default)
+    except Exception:
+        return int(default)
+
+
+def _segment_path(cid: str) -> str:
+    root = (os.getenv("CEO_CONVERSATION_STATE_DIR") or "").strip()
+    if not root:
+        root = _state_path() + ".d"
+    h = hashlib.sha256(cid.encode("utf-8")).hexdigest()
+    return os.path.join(root, h[:2], h[2:34] + ".jsonl")
+
+
+def _shard_lock(path: str) -> threading.Lock:
+    return _SHARD_LOCKS[hash(path) % len(_SHARD_LOCKS)]
+
+
+def _stat_sig(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+        return (int(st.st_size), int(st.st_mtime_ns))
+    except OSError:
+        return None
+
+
+def _apply_record(state: _SegmentState, rec: Dict[str, Any]) -> None:
+    op = rec.get("op")
+    if op == "snapshot":
+        turns = rec.get("turns")
+        meta = rec.get("meta")
+        state.turns = (
+            [t for t in turns if isinstance(t, dict)] if isinstance(turns, list) else []
+        )
+        state.meta = dict(meta) if isinstance(meta, dict) else {}
+    elif op == "turn":
+        state.turns.append(
+            {
+                "t": rec.get("t"),
+                "user": rec.get("user"),
+                "assistant": rec.get("assistant"),
+            }
+        )
+        max_turns = rec.get("max_turns")
+        if isinstance(max_turns, int) and max_turns > 0:
+            state.turns = state.turns[-max_turns:]
+        else:
+            state.turns = []
+    elif op == "meta":
+        updates = rec.get("updates")
+        if isinstance(updates, dict):
+            for k, v in updates.items():
+                if isinstance(k, str) and k.strip():
+                    state.meta[k.strip()] = v
+    state.records += 1
+
+
+def _legacy_conversation(cid: str) -> Optional[Dict[str, Any]]:
+    path = _state_path()
+    sig = _stat_sig(path)
+    if sig is None:
+        return None
+    with _LRU_LOCK:
+        hit = _LEGACY_CACHE.get(path)
+    if hit is None or hit[0] != sig:
+        hit = (sig, _load_db())
+        with _LRU_LOCK:
+            _LEGACY_CACHE.clear()
+            _LEGACY_CACHE[path] = hit
+    st = hit[1].get(cid)
+    return st if isinstance(st, dict) else None
+
+
+def _write_segment(path: str, recs: List[Dict[str, Any]], *, mode: str) -> None:
+    data = "".join(
+        json.dumps(r, ensure_ascii=False, sort_keys=True) + "\n" for r in recs
+    ).encode("utf-8")
+    if mode == "a":
+        # Drops a torn tail first, so this batch is not glued onto it.
+        append_jsonl(Path(path), data)
+    else:
+        write_jsonl_atomic(Path(path), data, fsync=False)
+
+
+def _read_segment(cid: str, path: str) -> _SegmentState:
+    """Caller holds the shard lock."""
+    sig = _stat_sig(path)
+    with _LRU_LOCK:
+        cached = _LRU.get(path)
+        if cached is not None:
+            _LRU.move_to_end(path)
+    if cached is not None and cached.sig == sig:
+        return cached
+
+    state = _SegmentState()
+    if sig is None:
+        legacy = _legacy_conversation(cid)
+        if legacy is not None:
+            snap = {
+                "op": "snapshot",
+                "cid": cid,
+                "turns": legacy.get("turns")
+                if isinstance(legacy.get("turns"), list)
+                else [],
+                "meta": legacy.get("meta")
+                if isinstance(legacy.get("meta"), dict)
+                else {},
+            }
+            try:
+                _write_segment(path, [snap], mode="w")
+            except Exception:
+                pass
+            _apply_record(state, snap)
+            sig = _stat_sig(path)
+    else:
+        try:
+            # An unterminated last line is a torn write and is not applied;
+            # the next append truncates it away.
+            for _, rec in scan_jsonl(Path(path)):
+                _apply_record(state, rec)
+        except Exception:
+            state = _SegmentState()
+    state.sig = sig
+    _lru_put(path, state)
+    return state
+
+
+def _lru_put(path: str, state: _SegmentState) -> None:
+    cap = max(1, _env_int("CEO_CONVERSATION_STATE_LRU_SIZE", 256))
+    with _LRU_LOCK:
+        _LRU[path] = state
+        _LRU.move_to_end(path)
+        while len(_LRU) > cap:
+            _LRU.popitem(last=False)
+
+
+def _append_records(cid: str, recs: List[Dict[str, Any]]) -> None:
+    """Append several records to one segment with a single write."""
+    if not recs:
+        return
+    path = _segment_path(cid)
+    with _shard_lock(path):
+        state = _read_segment(cid, path)
+        for rec in recs:
+            _apply_record(state, rec)
+        compact_at = max(2, _env_int("CEO_CONVERSATION_STATE_COMPACT_RECORDS", 64))
+        try:
+            if state.records >= compact_at:
+                snap = {
+                    "op": "snapshot",
+                    "cid": cid,
+                    "turns": state.turns,
+                    "meta": state.meta,
+                }
+                _write_segment(path, [snap], mode="w")
+                state.records = 1
+            else:
+                _write_segment(path, recs, mode="a")
+        except Exception:
+            with _LRU_LOCK:
+                _LRU.pop(path, None)
+            return
+        state.sig = _stat_sig(path)
+        _lru_put(path, state)
+
+
+def _append_record(cid: str, rec: Dict[str, Any]) -> None:
+    _append_records(cid, [rec])
+
+
+def _sharded_state(cid: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    path = _segment_path(cid)
+    with _shard_lock(path):
+        state = _read_segment(cid, path)
+        return list(state.turns), dict(state.meta)
+
+
+def clear_conversation_state_cache() -> None:
+    with _LRU_LOCK:
+        _LRU.clear()
+        _LEGACY_CACHE.clear()
+
+
+# ============================================================
+# PER-TURN UNIT OF WORK (/api/chat)
+# ============================================================
+#
+# One chat turn reads meta/turns/summary from many branches (advisor, intent
+# gates, continuity grounding) and writes turns + meta at several exits. Inside
+# conversation_state_turn() the store loads each conversation once, serves all
+# later reads from memory (including this turn's own writes) and buffers
+# writes as segment-style records. On scope exit the buffer is flushed with
+# one write per conversation:
+#   json      -> one _load_db/_save_db under _LOCK, replayed on fresh state
+#   sharded   -> one segment append (_append_records)
+#   postgres  -> one transaction (apply_conversation_records)
+# aconversation_state_turn() is the same scope for async handlers: the
+# Postgres load (aprefetch/aview) and the flush run on the async backend.
+# Outside a scope every call hits the backend directly, as before.
+#
+# ENV:
+#   CEO_CONVERSATION_STATE_TURN_LOAD_MAX  (default 50) turns preloaded in
+#                                         postgres mode; larger reads reload.
+
+
+@dataclass
+class _TurnEntry:
+    state: Optional[_SegmentState] = None  # loaded base + pending applied
+    loaded_max: int = 0
+    complete: bool = True
+    pending: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class _ConversationTurn:
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.entries: Dict[str, _TurnEntry] = {}
+        self.closed = False
+        self.counters: Dict[str, int] = {
+            "loads": 0,
+            "reads": 0,
+            "writes": 0,
+            "flushes": 0,
+            "flush_errors": 0,
+        }
+
+    def _needs_load(self, entry: _TurnEntry, need: int) -> bool:
+        return entry.state is None or (not entry.complete and need > entry.loaded_max)
+
+    def _install_locked(
+        self,
+        entry: _TurnEntry,
+        turns: List[Dict[str, Any]],
+        meta: Dict[str, Any],
+        *,
+        cap: int = 0,
+    ) -> None:
+        turns = [t for t in turns if isinstance(t, dict)]
+        entry.loaded_max = cap
+        entry.complete = cap <= 0 or len(turns) < cap
+        self.counters["loads"] += 1
+        state = _SegmentState(turns=turns, meta=dict(meta or {}))
+        for rec in entry.pending:
+            _apply_record(state, rec)
+        entry.state = state
+
+    def _load_locked(self, cid: str, entry: _TurnEntry, need: int) -> None:
+        pg = _pg_backend_required()
+        if pg is not None:
+            cap = max(_env_int("CEO_CONVERSATION_STATE_TURN_LOAD_MAX", 50), int(need))
+            turns, meta = pg.get_conversation_state(conversation_id=cid, max_turns=cap)
+            self._install_locked(entry, turns, meta, cap=cap)
+            return
+        if _layout() == "sharded":
+            turns, meta = _sharded_state(cid)
+        else:
+            with _LOCK:
+                st = _load_db().get(cid)
+            st = st if isinstance(st, dict) else {}
+            turns = st.get("turns")
+            turns = (
+                [t for t in turns if isinstance(t, dict)]
+                if isinstance(turns, list)
+                else []
+            )
+            meta = st.get("meta")
+            meta = dict(meta) if isinstance(meta, dict) else {}
+        self._install_locked(entry, list(turns), meta)
+
+    def view(self, cid: str, *, need: int = 0) -> _SegmentState:
+        with self.lock:
+            entry = self.entries.setdefault(cid, _TurnEntry())
+            if self._needs_load(entry, need):
+                self._load_locked(cid, entry, need)
+            self.counters["reads"] += 1
+            return entry.state  # type: ignore[return-value]
+
+    async def aview(self, cid: str, *, need: int = 0) -> _SegmentState:
+        """view() with the Postgres load awaited instead of blocking the loop."""
+
+        apg = _apg_backend_required()
+        if apg is None:
+            return self.view(cid, need=need)
+        with self.lock:
+            entry = self.entries.setdefault(cid, _TurnEntry())
+            cap = max(_env_int("CEO_CONVERSATION_STATE_TURN_LOAD_MAX", 50), int(need))
+            if not self._needs_load(entry, need):
+                self.counters["reads"] += 1
+                return entry.state  # type: ignore[return-value]
+        turns, meta = await apg.get_conversation_state(
+            conversation_id=cid, max_turns=cap
+        )
+        with self.lock:
+            if self._needs_load(entry, need):
+                self._install_locked(entry, turns, meta, cap=cap)
+            self.counters["reads"] += 1
+            return entry.state  # type: ignore[return-value]
+
+    async def aprefetch(self, cid: str) -> None:
+        """Await the Postgres load up front so later sync reads are memory hits.
+
+        File layouts keep loading lazily on the first read.
+        """
+
+        cid = (cid or "").strip()
+        if not cid:
+            return
+        try:
+            if _apg_backend_required() is None:
+                return
+            await self.aview(cid)
+        except Exception:
+            # Fail-soft: the first sync read retries (and raises) as before.
+            with self.lock:
+                entry = self.entries.get(cid)
+                if entry is not None and entry.state is None and not entry.pending:
+                    self.entries.pop(cid, None)
+            return
+        with self.lock:
+            self.counters["reads"] -= 1  # a prefetch is not a read
+
+    def buffer(self, cid: str, rec: Dict[str, Any]) -> None:
+        with self.lock:
+            entry = self.entries.setdefault(cid, _TurnEntry())
+            entry.pending.append(rec)
+            if entry.state is not None:
+                _apply_record(entry.state, rec)
+            self.counters["writes"] += 1
+
+    def _close_locked(self) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        self.closed = True
+        dirty = [(cid, e.pending) for cid, e in self.entries.items() if e.pending]
+        for e in self.entries.values():
+            e.pending = []
+        return dirty
+
+    def _flush_failed(self, cid: str, recs: List[Dict[str, Any]]) -> None:
+        self.counters["flush_errors"] += 1
+        logger.warning(
+            "conversation state flush failed cid_hash=%s records=%s",
+            _sha256_prefix(cid),
+            len(recs),
+            exc_info=True,
+        )
+
+    def flush(self) -> None:
+        with self.lock:
+            dirty = self._close_locked()
+        for cid, recs in dirty:
+            try:
+                _flush_records(cid, recs)
+                self.counters["flushes"] += 1
+            except Exception:
+                self._flush_failed(cid, recs)
+
+    async def aflush(self) -> None:
+        try:
+            apg = _apg_backend_required()
+        except Exception:
+            apg = None  # flush() records the failure per conversation
+        if apg is None:
+            self.flush()
+            return
+        with self.lock:
+            dirty = self._close_locked()
+        for cid, recs in dirty:
+            try:
+                await apg.apply_conversation_records(conversation_id=cid, records=recs)
+                self.counters["flushes"] += 1
+            except Exception:
+                self._flush_failed(cid, recs)
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            out = dict(self.counters)
+            pending = sum(1 for e in self.entries.values() if e.pending)
+        out["pending_flushes"] = pending
+        # Backend round-trips this turn costs: loads + one write per dirty
+        # conversation (already flushed or about to be).
+        out["round_trips"] = (
+            out["loads"] + out["flushes"] + out["flush_errors"] + pending
+        )
+        return out
+
+
+_CONVERSATION_TURN: ContextVar[Optional[_ConversationTurn]] = ContextVar(
+    "ceo_conversation_state_turn", default=None
+)
+
+
+def _active_turn() -> Optional[_ConversationTurn]:
+    turn = _CONVERSATION_TURN.get()
+    if turn is None or turn.closed:
+        return None
+    return turn
+
+
+def _flush_records(cid: str, recs: List[Dict[str, Any]]) -> None:
+    pg = _pg_backend_required()
+    if pg is not None:
+        pg.apply_conversation_records(conversation_id=cid, records=recs)
+        return
+
+    if _layout() == "sharded":
+        _append_records(cid, recs)
+        return
+
+    with _LOCK:
+        db = _load_db()
+        st = db.get(cid)
+        st = st if isinstance(st, dict) else {}
+        turns = st.get("turns")
+        meta = st.get("meta")
+        # Replay on the fresh on-disk state so concurrent writers are kept.
+        state = _SegmentState(
+            turns=turns if isinstance(turns, list) else [],
+            meta=meta if isinstance(meta, dict) else {},
+        )
+        for rec in recs:
+            _apply_record(state, rec)
+        if any(r.get("op") == "turn" for r in recs):
+            st["turns"] = state.turns
+        if any(r.get("op") == "meta" for r in recs):
+            st["meta"] = state.meta
+        st["updated_at"] = _now_unix()
+        db[cid] = st
+        _save_db(db)
+
+
+@contextmanager
+def conversation_state_turn() -> Iterator[_ConversationTurn]:
+    """Scope one chat turn: load once, serve reads from memory, flush at exit.
+
+    Nested scopes join the outer one (only the outermost flushes).
+    """
+
+    outer = _active_turn()
+    if outer is not None:
+        yield outer
+        return
+    turn = _ConversationTurn()
+    token = _CONVERSATION_TURN.set(turn)
+    try:
+        yield turn
+    finally:
+        try:
+            turn.flush()
+        finally:
+            _CONVERSATION_TURN.reset(token)
+
+
+@asynccontextmanager
+async def aconversation_state_turn() -> AsyncIterator[_ConversationTurn]:
+    """Async conversation_state_turn(): the Postgres flush is awaited."""
+
+    outer = _active_turn()
+    if outer is not None:
+        yield outer
+        return
+    turn = _ConversationTurn()
+    token = _CONVERSATION_TURN.set(turn)
+    try:
+        yield turn
+    finally:
+        try:
+            await turn.aflush()
+        finally:
+            _CONVERSATION_TURN.reset(token)
+
+
+def conversation_state_turn_stats() -> Optional[Dict[str, int]]:
+    """Round-trip counters of the current turn scope (None outside a scope)."""
+
+    turn = _CONVERSATION_TURN.get()
+    return turn.stats() if turn is not None else None
+
+
+async def _aread_pairs(cid: str, max_turns: int) -> List[Dict[str, Any]]:
+    turn = _active_turn()
+    if turn is not None:
+        return list((await turn.aview(cid, need=int(max_turns))).turns)
+    apg = _apg_backend_required()
+    if apg is None:
+        return _read_pairs(cid, max_turns)
+    pairs = await apg.get_conversation_turns(
+        conversation_id=cid, max_turns=int(max_turns)
+    )
+    return [t for t in pairs if isinstance(t, dict)]
+
+
+def _read_pairs(cid: str, max_turns: int) -> List[Dict[str, Any]]:
+    turn = _active_turn()
+    if turn is not None:
+        return list(turn.view(cid, need=int(max_turns)).turns)
+
+    pg = _pg_backend_required()
+    if pg is not None:
+        pairs = pg.get_conversation_turns(
+            conversation_id=cid,
+            max_turns=int(max_turns),
+        )
+        return [t for t in pairs if isinstance(t, dict)]
+    if _layout() == "sharded":
+        pairs, _ = _sharded_state(cid)
+        return pairs
+    with _LOCK:
+        db = _load_db()
+        st = db.get(cid)
+        st = st if isinstance(st, dict) else {}
+        turns = st.get("turns")
+        turns = turns if isinstance(turns, list) else []
+    return [t for t in turns if isinstance(t, dict)]
+
+
 @dataclass(frozen=True)
 class ConversationStateSummary:
     conversation_id: str
@@ -119,6 +712,76 @@ class ConversationStateSummary:
     conversation_id_hash: str
 
 
+def _summary_from_pairs(
+    cid: str,
+    pairs: List[Dict[str, Any]],
+    *,
+    max_turns: int,
+    max_summary_chars: int,
+) -> ConversationStateSummary:
+    # keep last N pairs (user+assistant) => store uses list of dicts
+    # We interpret one "turn" as a pair (user, assistant) in storage.
+    if max_turns <= 0:
+        pairs = []
+    else:
+        pairs = pairs[-int(max_turns) :]
+
+    lines: List[str] = []
+    for i, it in enumerate(pairs, 1):
+        u = it.get("user")
+        a = it.get("assistant")
+        u = u if isinstance(u, str) else ""
+        a = a if isinstance(a, str) else ""
+        if not (u.strip() or a.strip()):
+            continue
+        lines.append(f"{i}) USER: {_truncate(u.strip(), max_chars=400)}")
+        lines.append(f"   ASSISTANT: {_truncate(a.strip(), max_chars=600)}")
+
+    txt = "\n".join(lines).strip()
+    txt = _truncate(txt, max_chars=int(max_summary_chars))
+
+    return ConversationStateSummary(
+        conversation_id=cid,
+        turns_used=len(pairs),
+        summary_text=txt,
+        summary_len=len(txt),
+        conversation_id_hash=_sha256_prefix(cid),
+    )
+
+
+def _recent_from_pairs(
+    pairs: List[Dict[str, Any]], max_turns: int
+) -> List[Dict[str, Any]]:
+    if max_turns <= 0:
+        pairs = []
+    else:
+        pairs = pairs[-int(max_turns) :]
+
+    out: List[Dict[str, Any]] = []
+    for it in pairs:
+        user_text = it.get("user")
+        assistant_text = it.get("assistant")
+        turn: Dict[str, Any] = {
+            "user": user_text if isinstance(user_text, str) else "",
+            "assistant": assistant_text if isinstance(assistant_text, str) else "",
+        }
+        t_unix = it.get("t")
+        if isinstance(t_unix, (int, float)):
+            turn["t"] = float(t_unix)
+        out.append(turn)
+    return out
+
+
+def _turn_record(u: str, a: str, max_turns: Any) -> Dict[str, Any]:
+    return {
+        "op": "turn",
+        "t": _now_unix(),
+        "user": u,
+        "assistant": a,
+        "max_turns": max_turns if isinstance(max_turns, int) else 0,
+    }
+
+
 class ConversationStateStore:
     """Minimal persisted multi-turn store (bounded).
 
@@ -143,50 +806,11 @@ class ConversationStateStore:
                 conversation_id_hash=_sha256_prefix(""),
             )
 
-        pg = _pg_backend_required()
-        if pg is not None:
-            pairs = pg.get_conversation_turns(
-                conversation_id=cid,
-                max_turns=int(max_turns),
-            )
-            pairs = [t for t in pairs if isinstance(t, dict)]
-        else:
-            with _LOCK:
-                db = _load_db()
-                st = db.get(cid)
-                st = st if isinstance(st, dict) else {}
-                turns = st.get("turns")
-                turns = turns if isinstance(turns, list) else []
-
-            pairs = [t for t in turns if isinstance(t, dict)]
-
-        # keep last N pairs (user+assistant) => store uses list of dicts
-        # We interpret one "turn" as a pair (user, assistant) in storage.
-        if max_turns <= 0:
-            pairs = []
-        else:
-            pairs = pairs[-int(max_turns) :]
-
-        lines: List[str] = []
-        for i, it in enumerate(pairs, 1):
-            u = it.get("user")
-            a = it.get("assistant")
-            u = u if isinstance(u, str) else ""
-            a = a if isinstance(a, str) else ""
-            if not (u.strip() or a.strip()):
-                continue
-            lines.append(f"{i}) USER: {_truncate(u.strip(), max_chars=400)}")
-            lines.append(f"   ASSISTANT: {_truncate(a.strip(), max_chars=600)}")
-
-        txt = "\n".join(lines).strip()
-        txt = _truncate(txt, max_chars=int(max_summary_chars))
-
-        return ConversationStateSummary(
-            conversation_id=cid,
-            turns_used=len(pairs),
-            summary_text=txt,
-            summary_len=len(txt),
-            conversation_id_hash=_sha256_prefix(cid),
+        return _summary_from_pairs(
+            cid,
+            _read_pairs(cid, int(max_turns)),
+            max_turns=max_turns,
+            max_summary_chars=max_summary_chars,
         )
 
     @staticmethod
@@ -199,41 +823,7 @@ class ConversationStateStore:
         if not cid:
             return []
 
-        pg = _pg_backend_required()
-        if pg is not None:
-            pairs = pg.get_conversation_turns(
-                conversation_id=cid,
-                max_turns=int(max_turns),
-            )
-            pairs = [t for t in pairs if isinstance(t, dict)]
-        else:
-            with _LOCK:
-                db = _load_db()
-                st = db.get(cid)
-                st = st if isinstance(st, dict) else {}
-                turns = st.get("turns")
-                turns = turns if isinstance(turns, list) else []
-
-            pairs = [t for t in turns if isinstance(t, dict)]
-
-        if max_turns <= 0:
-            pairs = []
-        else:
-            pairs = pairs[-int(max_turns) :]
-
-        out: List[Dict[str, Any]] = []
-        for it in pairs:
-            user_text = it.get("user")
-            assistant_text = it.get("assistant")
-            turn: Dict[str, Any] = {
-                "user": user_text if isinstance(user_text, str) else "",
-                "assistant": assistant_text if isinstance(assistant_text, str) else "",
-            }
-            t_unix = it.get("t")
-            if isinstance(t_unix, (int, float)):
-                turn["t"] = float(t_unix)
-            out.append(turn)
-        return out
+        return _recent_from_pairs(_read_pairs(cid, int(max_turns)), max_turns)
 
     @staticmethod
     def append_turn(
@@ -251,6 +841,11 @@ class ConversationStateStore:
         u = _truncate((user_text or "").strip(), max_chars=int(max_turn_chars))
         a = _truncate((assistant_text or "").strip(), max_chars=int(max_turn_chars))
 
+        turn = _active_turn()
+        if turn is not None:
+            turn.buffer(cid, _turn_record(u, a, max_turns))
+            return
+
         pg = _pg_backend_required()
         if pg is not None:
             pg.append_conversation_turn(
@@ -261,6 +856,10 @@ class ConversationStateStore:
             )
             return
 
+        if _layout() == "sharded":
+            _append_record(cid, _turn_record(u, a, max_turns))
+            return
+
         with _LOCK:
             db = _load_db()
             st = db.get(cid)
@@ -292,11 +891,19 @@ class ConversationStateStore:
         if not cid:
             return {}
 
+        turn = _active_turn()
+        if turn is not None:
+            return dict(turn.view(cid).meta)
+
         pg = _pg_backend_required()
         if pg is not None:
             meta = pg.get_conversation_meta(conversation_id=cid)
             return dict(meta) if isinstance(meta, dict) else {}
 
+        if _layout() == "sharded":
+            _, meta = _sharded_state(cid)
+            return meta
+
         with _LOCK:
             db = _load_db()
             st = db.get(cid)
@@ -313,11 +920,20 @@ class ConversationStateStore:
         if not isinstance(updates, dict) or not updates:
             return
 
+        turn = _active_turn()
+        if turn is not None:
+            turn.buffer(cid, {"op": "meta", "updates": dict(updates)})
+            return
+
         pg = _pg_backend_required()
         if pg is not None:
             pg.upsert_conversation_meta(conversation_id=cid, updates=updates)
             return
 
+        if _layout() == "sharded":
+            _append_record(cid, {"op": "meta", "updates": dict(updates)})
+            return
+
         with _LOCK:
             db = _load_db()
             st = db.get(cid)
@@ -334,3 +950,91 @@ class ConversationStateStore:
             st["updated_at"] = _now_unix()
             db[cid] = st
             _save_db(db)
+
+    # ------------------------------------------------------------
+    # Awaitable call paths (Postgres round-trips off the event loop;
+    # file layouts are local I/O and run inline, as the sync methods do)
+    # ------------------------------------------------------------
+    @staticmethod
+    async def aget_summary(
+        *,
+        conversation_id: str,
+        max_turns: int = _DEFAULT_MAX_TURNS,
+        max_summary_chars: int = _DEFAULT_MAX_SUMMARY_CHARS,
+    ) -> ConversationStateSummary:
+        cid = (conversation_id or "").strip()
+        if not cid:
+            return ConversationStateStore.get_summary(conversation_id="")
+        return _summary_from_pairs(
+            cid,
+            await _aread_pairs(cid, int(max_turns)),
+            max_turns=max_turns,
+            max_summary_chars=max_summary_chars,
+        )
+
+    @staticmethod
+    async def aget_recent_turns(
+        *,
+        conversation_id: str,
+        max_turns: int = _DEFAULT_MAX_TURNS,
+    ) -> List[Dict[str, Any]]:
+        cid = (conversation_id or "").strip()
+        if not cid:
+            return []
+        return _recent_from_pairs(await _aread_pairs(cid, int(max_turns)), max_turns)
+
+    @staticmethod
+    async def aget_meta(*, conversation_id: str) -> Dict[str, Any]:
+        cid = (conversation_id or "").strip()
+        if not cid:
+            return {}
+        turn = _active_turn()
+        if turn is not None:
+            return dict((await turn.aview(cid)).meta)
+        apg = _apg_backend_required()
+        if apg is None:
+            return ConversationStateStore.get_meta(conversation_id=cid)
+        meta = await apg.get_conversation_meta(conversation_id=cid)
+        return dict(meta) if isinstance(meta, dict) else {}
+
+    @staticmethod
+    async def aappend_turn(
+        *,
+        conversation_id: str,
+        user_text: str,
+        assistant_text: str,
+        max_turns: int = _DEFAULT_MAX_TURNS,
+        max_turn_chars: int = _DEFAULT_MAX_TURN_CHARS,
+    ) -> None:
+        cid = (conversation_id or "").strip()
+        apg = _apg_backend_required() if cid and _active_turn() is None else None
+        if apg is None:
+            ConversationStateStore.append_turn(
+                conversation_id=cid,
+                user_text=user_text,
+                assistant_text=assistant_text,
+                max_turns=max_turns,
+                max_turn_chars=max_turn_chars,
+            )
+            return
+        await apg.append_conversation_turn(
+            conversation_id=cid,
+            user_text=_truncate(
+                (user_text or "").strip(), max_chars=int(max_turn_chars)
+            ),
+            assistant_text=_truncate(
+                (assistant_text or "").strip(), max_chars=int(max_turn_chars)
+            ),
+            max_turns=int(max_turns),
+        )
+
+    @staticmethod
+    async def aupdate_meta(*, conversation_id: str, updates: Dict[str, Any]) -> None:
+        cid = (conversation_id or "").strip()
+        if not cid or not isinstance(updates, dict) or not updates:
+            return
+        apg = _apg_backend_required() if _active_turn() is None else None
+        if apg is None:
+            ConversationStateStore.update_meta(conversation_id=cid, updates=updates)
+            return
+        await apg.upsert_conversation_meta(conversation_id=cid, updates=updates)
@@ -0,0 +1,160 @@
+# duplicate_index.py
+
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+# ---------------------------------------------
+# Indeks za fuzzy detekciju duplikata naslova
+# ---------------------------------------------
+#
+# DynamicMemoryEngine.check_duplicates je poredio novi naslov sa svakim
+# zapamćenim taskom punom Levenshtein matricom i ponovnom normalizacijom oba
+# stringa. Ovdje se naslovi normalizuju jednom (pri dodavanju), a upit
+# računa distancu samo za kandidate koji mogu preći prag:
+#   1) dužina: distanca >= |la - lb|
+#   2) trigrami: svaka edit operacija uništi najviše 3 trigrama, pa je
+#      |T(a) & T(b)| >= max(|T(a)|, |T(b)|) - 3 * k
+#   3) Levenshtein u traci širine k (Ukkonen) sa ranim izlazom čim cijeli
+#      red pređe k.
+# k je najveća distanca za koju 1 - d / max_len >= prag, izračunata istom
+# float aritmetikom kao levenshtein_ratio, pa su rezultati identični.
+
+DEFAULT_THRESHOLD = 0.75
+_Q = 3
+
+
+def max_distance(max_len: int, threshold: float = DEFAULT_THRESHOLD) -> int:
+    """Najveća distanca d za koju je 1 - (d / max_len) >= threshold."""
+    if max_len <= 0:
+        return -1
+    k = int(max_len * (1 - threshold)) + 1
+    while k >= 0 and 1 - (k / max_len) < threshold:
+        k -= 1
+    return k
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    return frozenset(text[i : i + _Q] for i in range(len(text) - _Q + 1))
+
+
+def bounded_distance(a: str, b: str, k: int) -> Optional[int]:
+    """Levenshtein distanca ako je <= k, inače None."""
+    if k < 0:
+        return None
+    la, lb = len(a), len(b)
+    if abs(la - lb) > k:
+        return None
+    if la > lb:
+        a, b, la, lb = b, a, lb, la
+    if la == 0:
+        return lb
+
+    big = k + 1
+    prev = [j if j <= k else big for j in range(lb + 1)]
+    for i in range(1, la + 1):
+        lo = max(1, i - k)
+        hi = min(lb, i + k)
+        cur = [big] * (lb + 1)
+        cur[0] = i if i <= k else big
+        row_min = cur[0]
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            v = prev[j - 1] + (0 if ca == b[j - 1] else 1)
+            x = prev[j] + 1
+            if x < v:
+                v = x
+            x = cur[j - 1] + 1
+            if x < v:
+                v = x
+            if v > big:
+                v = big
+            cur[j] = v
+            if v < row_min:
+                row_min = v
+        if row_min > k:
+            return None
+        prev = cur
+
+    d = prev[lb]
+    return d if d <= k else None
+
+
+class DuplicateTitleIndex:
+    """Inkrementalni indeks naslova (pozicija u listi -> normalizovan ključ)."""
+
+    def __init__(
+        self,
+        normalize: Callable[[str], str],
+        threshold: float = DEFAULT_THRESHOLD,
+    ):
+        self._normalize = normalize
+        self.threshold = threshold
+        self.titles: List[str] = []
+        self._keys: List[str] = []
+        self._grams: List[FrozenSet[str]] = []
+        self._by_len: Dict[int, List[int]] = {}
+        self._title_set: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __contains__(self, title: object) -> bool:
+        try:
+            return title in self._title_set
+        except TypeError:  # nehashabilan naslov
+            return title in self.titles
+
+    def key(self, title: str) -> str:
+        # check_duplicates normalizuje naslov, a levenshtein_ratio ga normalizuje
+        # ponovo; normalize nije idempotentna (npr. "a ́" -> "a " -> "a"),
+        # pa ključ prolazi kroz obje normalizacije.
+        if not isinstance(title, str):
+            return ""
+        once = self._normalize(title)
+        if not once:
+            return ""
+        return self._normalize(once)
+
+    def add(self, title: str) -> None:
+        pos = len(self.titles)
+        k = self.key(title)
+        self.titles.append(title)
+        self._keys.append(k)
+        self._grams.append(trigrams(k))
+        if isinstance(title, str):
+            self._title_set.add(title)
+        if k:
+            self._by_len.setdefault(len(k), []).append(pos)
+
+    def find(self, title: str) -> List[Tuple[int, str, float]]:
+        """(pozicija, naslov, sličnost) za sve naslove iznad praga, redom dodavanja."""
+        q = self.key(title)
+        lq = len(q)
+        if not lq:
+            return []
+        q_grams = trigrams(q)
+        th = self.threshold
+
+        lo = max(1, int(lq * th) - 1)
+        hi = int(lq / th) + 1 if th > 0 else max(self._by_len or [lq])
+        out: List[Tuple[int, str, float]] = []
+        for length in range(lo, hi + 1):
+            bucket = self._by_len.get(length)
+            if not bucket:
+                continue
+            max_len = lq if lq > length else length
+            k = max_distance(max_len, th)
+            if abs(lq - length) > k:
+                continue
+            for pos in bucket:
+                grams = self._grams[pos]
+                need = max(len(q_grams), len(grams)) - _Q * k
+                if need > 0 and len(q_grams & grams) < need:
+                    continue
+                d = bounded_distance(q, self._keys[pos], k)
+                if d is None:
+                    continue
+                ratio = 1 - (d / max_len)
+                if ratio >= th:
+                    out.append((pos, self.titles[pos], ratio))
+        out.sort(key=lambda r: r[0])
+        return out
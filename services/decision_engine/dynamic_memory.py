@@ -2,6 +2,11 @@
 
 import unicodedata
 
+from services.decision_engine.duplicate_index import (
+    DEFAULT_THRESHOLD,
+    DuplicateTitleIndex,
+)
+
 
 class DynamicMemoryEngine:
     def __init__(self, session_memory: dict):
@@ -11,6 +16,8 @@ class DynamicMemoryEngine:
         """
         self.memory = session_memory.get("dynamic_memory", {})
         self.memory.setdefault("tasks", [])
+        self._dup_index = None
+        self._dup_index_src = None
 
     # ---------------------------------------------
     # Normalizacija teksta
@@ -61,16 +68,40 @@ class DynamicMemoryEngine:
     # Fuzzy duplicate check
     # ---------------------------------------------
     def check_duplicates(self, title: str):
-        normalized_new = self.normalize(title)
-
         duplicates = []
-        for t in self.memory["tasks"]:
-            ratio = self.levenshtein_ratio(normalized_new, self.normalize(t))
-            if ratio >= 0.75:  # fuzzy match threshold
-                duplicates.append({"task": t, "similarity": ratio})
+        for _, t, ratio in self._duplicate_index().find(title):
+            duplicates.append({"task": t, "similarity": ratio})
 
         return duplicates
 
+    def _duplicate_index(self) -> DuplicateTitleIndex:
+        """
+        Indeks prati self.memory["tasks"]: novi naslovi dodani na kraj liste
+        (add_task ili izvana) se indeksiraju inkrementalno; svaka druga
+        promjena (zamjena liste, brisanje, tasks[i] = ... na bilo kojoj
+        poziciji) znači rebuild.
+
+        Provjera poredi indeksirani prefiks sa listom element po element;
+        za nepromijenjene elemente to je samo poređenje pokazivača, što je
+        zanemarivo naspram fuzzy pretrage.
+        """
+        tasks = self.memory["tasks"]
+        idx = self._dup_index
+        n = len(idx) if idx is not None else 0
+        if (
+            idx is None
+            or self._dup_index_src is not tasks
+            or n > len(tasks)
+            or idx.titles != (tasks if n == len(tasks) else tasks[:n])
+        ):
+            idx = DuplicateTitleIndex(self.normalize, DEFAULT_THRESHOLD)
+            self._dup_index = idx
+            self._dup_index_src = tasks
+            n = 0
+        for t in tasks[n:]:
+            idx.add(t)
+        return idx
+
     # ---------------------------------------------
     # Evaluate D1
     # ---------------------------------------------
@@ -85,5 +116,7 @@ class DynamicMemoryEngine:
     # Dodavanje novog taska u memoriju (persistencija)
     # ---------------------------------------------
     def add_task(self, title: str):
-        if title and title not in self.memory["tasks"]:
+        idx = self._duplicate_index()
+        if title and title not in idx:
             self.memory["tasks"].append(title)
+            idx.add(title)
@@ -0,0 +1,98 @@
+# keyword_matcher.py
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+# ---------------------------------------------
+# Aho-Corasick automat za keyword pravila
+# ---------------------------------------------
+#
+# StaticMemoryEngine je za svaki (pravilo, keyword) par radio `kw in text`,
+# pa `token in text` za svaki token keyworda. Ovdje se svi keywordi i njihovi
+# tokeni kompajliraju jednom u automat, a jedan prolaz kroz tekst vraća skup
+# svih pojmova koji se pojavljuju kao podstring.
+
+
+class KeywordAutomaton:
+    """Multi-pattern podstring matcher (Aho-Corasick)."""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.patterns: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._built = True
+        for p in patterns:
+            self.add(p)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def add(self, pattern: str) -> int:
+        """Dodaje pattern (ako već ne postoji) i vraća njegov id."""
+        pid = self._ids.get(pattern)
+        if pid is not None:
+            return pid
+        pid = len(self.patterns)
+        self.patterns.append(pattern)
+        self._ids[pattern] = pid
+        if not pattern:
+            # Prazan string je podstring svakog teksta; find ga uvijek vraća.
+            return pid
+
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(pid)
+        self._built = False
+        return pid
+
+    def id_of(self, pattern: str) -> int:
+        return self._ids[pattern]
+
+    def _build(self) -> None:
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque()
+        for nxt in goto[0].values():
+            fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # izlazi fail-čvora su također pogođeni u ovom čvoru
+                merged = out[fail[nxt]]
+                if merged:
+                    out[nxt] = out[nxt] + [p for p in merged if p not in out[nxt]]
+        self._built = True
+
+    def find(self, text: str) -> Set[int]:
+        """Id-evi svih patterna koji se pojavljuju u tekstu."""
+        if not self._built:
+            self._build()
+        found: Set[int] = set()
+        empty = self._ids.get("")
+        if empty is not None:
+            found.add(empty)
+
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
@@ -1,10 +1,17 @@
 import difflib
 
+from services.decision_engine.keyword_matcher import KeywordAutomaton
+
+_FUZZY_THRESHOLD = 0.75
+
 
 class StaticMemoryEngine:
     def __init__(self, memory: dict):
         self.memory = memory
         self.rules = memory.get("rules", [])
+        self._compiled = None
+        self._compiled_src = None
+        self.compile_rules()
 
     def apply(self, text: str) -> dict:
         return self.evaluate(text)
@@ -36,25 +43,98 @@ class StaticMemoryEngine:
 
         return False
 
+    # ---------------------------------------------
+    # Kompajliranje pravila
+    # ---------------------------------------------
+    def compile_rules(self):
+        """
+        Svi keywordi (lowercase) i njihovi tokeni idu u jedan Aho-Corasick
+        automat, pa evaluate radi jedan prolaz kroz tekst umjesto podstring
+        provjere po paru (pravilo, keyword).
+
+        Pravila se kompajliraju pri učitavanju; evaluate ponovo kompajlira
+        ako se self.rules zamijeni drugom listom ili joj se promijeni dužina.
+        Pravilo koje nije dict ili ima keyword koji nije string ide starim
+        putem (_fuzzy_match), sa istim ponašanjem kao prije.
+        """
+        automaton = KeywordAutomaton()
+        compiled = []
+        for rule in self.rules:
+            entries = None
+            keywords = rule.get("keywords", []) if isinstance(rule, dict) else None
+            if isinstance(keywords, (list, tuple)) and all(
+                isinstance(kw, str) for kw in keywords
+            ):
+                entries = []
+                for kw in keywords:
+                    kw_lower = kw.lower()
+                    entries.append(
+                        (
+                            kw_lower,
+                            automaton.add(kw_lower),
+                            tuple(automaton.add(tok) for tok in kw_lower.split()),
+                        )
+                    )
+            compiled.append((rule, entries))
+
+        self._automaton = automaton
+        self._compiled = compiled
+        self._compiled_src = (self.rules, len(self.rules))
+
+    def _compiled_rules(self):
+        rules = self.rules
+        src = self._compiled_src
+        if self._compiled is None or src[0] is not rules or src[1] != len(rules):
+            self.compile_rules()
+        return self._compiled
+
+    def _rule_hit(self, entries, t: str, found, matcher) -> bool:
+        for kw, kw_id, token_ids in entries:
+            # 1. + 2. podstring / svi tokeni (automat)
+            if kw_id in found or all(tid in found for tid in token_ids):
+                return True
+
+            # 3. difflib ratio; 2*M / (len(kw) + len(t)) nikad ne prelazi
+            # real_quick_ratio ni quick_ratio, pa ratio računamo samo kad
+            # gornje granice dozvoljavaju (dug prompt ga preskače odmah).
+            lk, lt = len(kw), len(t)
+            if 2.0 * min(lk, lt) / (lk + lt) < _FUZZY_THRESHOLD:
+                continue
+            if matcher[0] is None:
+                matcher[0] = difflib.SequenceMatcher(None, "", t)
+            sm = matcher[0]
+            sm.set_seq1(kw)
+            if sm.quick_ratio() >= _FUZZY_THRESHOLD and sm.ratio() >= _FUZZY_THRESHOLD:
+                return True
+        return False
+
     def evaluate(self, text: str) -> dict:
         text_lower = text.lower()
+        compiled = self._compiled_rules()
+        # _fuzzy_match je tekst lowercase-ovao još jednom
+        t = text_lower.lower()
+        found = self._automaton.find(t)
+        matcher = [None]
 
         triggered = []
         total_impact = {"alignment_bonus": 0, "trust_bonus": 0, "priority_bonus": 0}
 
-        for rule in self.rules:
+        for rule, entries in compiled:
             rule_id = rule.get("id")
-            keywords = rule.get("keywords", [])
-            impact = rule.get("impact", {})
+            if entries is None:
+                # nekompajlirano pravilo: originalna petlja
+                keywords = rule.get("keywords", [])
+                hit = any(self._fuzzy_match(text_lower, kw) for kw in keywords)
+            else:
+                hit = self._rule_hit(entries, t, found, matcher)
+            if not hit:
+                continue
 
-            for kw in keywords:
-                if self._fuzzy_match(text_lower, kw):
-                    triggered.append(rule_id)
-
-                    total_impact["alignment_bonus"] += impact.get("alignment_bonus", 0)
-                    total_impact["trust_bonus"] += impact.get("trust_bonus", 0)
-                    total_impact["priority_bonus"] += impact.get("priority_bonus", 0)
+            impact = rule.get("impact", {})
+            triggered.append(rule_id)
 
-                    break  # one rule triggered once
+            total_impact["alignment_bonus"] += impact.get("alignment_bonus", 0)
+            total_impact["trust_bonus"] += impact.get("trust_bonus", 0)
+            total_impact["priority_bonus"] += impact.get("priority_bonus", 0)
 
         return {"rules_triggered": triggered, "impact": total_impact}
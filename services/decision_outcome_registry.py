@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -11,24 +12,25 @@ from uuid import uuid4
 
 from services.decision_history_writer import insert_decision_history
 from services.identity_resolver import resolve_identity_id
+from services.json_journal import journal_path_for
+from services.journaled_store import JournaledStore
 
 logger = logging.getLogger(__name__)
 
 # Keep consistent with other persistence patterns (ExecutionRegistry uses a base path).
 _BASE_PATH = Path(".data")
-_REGISTRY_FILE = _BASE_PATH / "decision_outcomes.json"
+_REGISTRY_FILE = _BASE_PATH / "decision_outcomes.json"  # legacy full snapshot
 
 
-def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _hot_max() -> int:
+    try:
+        return max(1, int(os.getenv("DECISION_OUTCOME_HOT_MAX") or "2000"))
+    except Exception:
+        return 2000
 
 
-def _atomic_write_json(path: Path, data: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-    tmp.replace(path)
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 
 def _ensure_dict(x: Any) -> Dict[str, Any]:
@@ -79,14 +81,25 @@ class DecisionOutcomeRecord:
 class DecisionOutcomeRegistry:
     """
     Central log of AI recommendations vs actual outcomes.
-    Persistent JSON on disk, thread-safe, idempotent on (approval_id).
+    Persistent append-only journal on disk, thread-safe, idempotent on (approval_id).
+
+    Records live in a JournaledStore (bounded hot set, lazy disk reads,
+    batched background appends); only the small id indexes and timestamps
+    are kept in memory for every decision.
     """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._store: Dict[str, Dict[str, Any]] = {}  # decision_id -> record dict
+        # decision_id -> record dict
+        self._store = JournaledStore(
+            journal_path_for(_REGISTRY_FILE),
+            name="decision_outcomes",
+            hot_max=_hot_max(),
+            legacy_loader=_load_legacy_store,
+        )
         self._by_approval_id: Dict[str, str] = {}  # approval_id -> decision_id
         self._by_execution_id: Dict[str, str] = {}  # execution_id -> decision_id
+        self._ts_by_id: Dict[str, str] = {}  # decision_id -> timestamp (list_recent)
         self._load_from_disk_locked()
 
     # ----------------------------
@@ -197,11 +210,7 @@ class DecisionOutcomeRegistry:
             rec_dict = rec.__dict__.copy()
             rec_dict["principal_sub"] = principal_sub or None
 
-            self._store[decision_id] = rec_dict
-            self._by_approval_id[approval_id] = decision_id
-            self._by_execution_id[execution_id] = decision_id
-
-            self._persist_to_disk_locked()
+            self._persist_to_disk_locked(decision_id, rec_dict)
             return dict(rec_dict)
 
     # ----------------------------
@@ -255,8 +264,7 @@ class DecisionOutcomeRegistry:
                 rr = out.get("result")
                 rec["result_keys"] = sorted(list(rr.keys()))
 
-            self._store[did] = rec
-            self._persist_to_disk_locked()
+            self._persist_to_disk_locked(did, rec)
             return dict(rec)
 
     # ----------------------------
@@ -290,8 +298,7 @@ class DecisionOutcomeRegistry:
             if isinstance(feedback, str) and feedback.strip():
                 rec["feedback"] = feedback.strip()
 
-            self._store[did] = rec
-            self._persist_to_disk_locked()
+            self._persist_to_disk_locked(did, rec)
             return dict(rec)
 
     def update_memory_periodically(self) -> Dict[str, Any]:
@@ -320,57 +327,55 @@ class DecisionOutcomeRegistry:
         if nn <= 0:
             nn = 50
         with self._lock:
-            items = list(self._store.values())
-            items.sort(
-                key=lambda x: str(_ensure_dict(x).get("timestamp")), reverse=True
-            )
-            return [dict(_ensure_dict(x)) for x in items[:nn]]
+            ids = sorted(self._ts_by_id, key=lambda d: self._ts_by_id[d], reverse=True)[
+                :nn
+            ]
+            return [dict(_ensure_dict(self._store.get(did))) for did in ids]
 
     # ----------------------------
     # DISK
     # ----------------------------
+    def _index_locked(self, decision_id: str, rec: Dict[str, Any]) -> None:
+        approval_id = _ensure_str(rec.get("approval_id"))
+        execution_id = _ensure_str(rec.get("execution_id"))
+        if approval_id:
+            self._by_approval_id[approval_id] = decision_id
+        if execution_id:
+            self._by_execution_id[execution_id] = decision_id
+        self._ts_by_id[decision_id] = str(rec.get("timestamp"))
+
     def _load_from_disk_locked(self) -> None:
         with self._lock:
             try:
-                if not _REGISTRY_FILE.exists():
-                    return
-                with open(_REGISTRY_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if not isinstance(data, dict):
-                    return
-
-                store = data.get("store")
-                by_approval = data.get("by_approval_id")
-                by_exec = data.get("by_execution_id")
-
-                if isinstance(store, dict):
-                    self._store.update(
-                        {str(k): _ensure_dict(v) for k, v in store.items()}
-                    )
-                if isinstance(by_approval, dict):
-                    self._by_approval_id.update(
-                        {str(k): str(v) for k, v in by_approval.items()}
-                    )
-                if isinstance(by_exec, dict):
-                    self._by_execution_id.update(
-                        {str(k): str(v) for k, v in by_exec.items()}
-                    )
-
+                self._store.load(on_record=self._index_locked)
             except Exception as e:
                 logger.warning("DecisionOutcomeRegistry load failed: %s", str(e))
 
-    def _persist_to_disk_locked(self) -> None:
+    def _persist_to_disk_locked(self, decision_id: str, rec: Dict[str, Any]) -> None:
+        # Indexes + hot set update synchronously; the journal append is batched
+        # on the store's writer thread, off the request path.
+        self._index_locked(decision_id, rec)
         try:
-            payload = {
-                "store": self._store,
-                "by_approval_id": self._by_approval_id,
-                "by_execution_id": self._by_execution_id,
-                "updated_at": _utc_now_iso(),
-            }
-            _atomic_write_json(_REGISTRY_FILE, payload)
+            self._store.put(decision_id, rec)
         except Exception as e:
             logger.warning("DecisionOutcomeRegistry persist failed: %s", str(e))
 
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Wait until every recorded outcome is on disk (tests/shutdown)."""
+        return self._store.flush(timeout=timeout)
+
+
+def _load_legacy_store() -> Dict[str, Dict[str, Any]]:
+    """Records from the pre-journal `{"store": ...}` snapshot, for migration."""
+    if not _REGISTRY_FILE.exists():
+        return {}
+    with open(_REGISTRY_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    store = data.get("store") if isinstance(data, dict) else None
+    if not isinstance(store, dict):
+        return {}
+    return {str(k): _ensure_dict(v) for k, v in store.items()}
+
 
 _DECISION_OUTCOME_REGISTRY_SINGLETON: Optional[DecisionOutcomeRegistry] = None
 _DECISION_OUTCOME_REGISTRY_LOCK = threading.Lock()
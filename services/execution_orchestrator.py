@@ -368,7 +368,7 @@ class ExecutionOrchestrator:
         if isinstance(blocked, dict):
             return blocked
 
-        return await self._execute_after_approval(cmd)
+        return self._release_approval(cmd, await self._execute_after_approval(cmd))
 
     async def resume(self, execution_id: str) -> Dict[str, Any]:
         cmd = self.registry.get(execution_id)
@@ -416,11 +416,23 @@ class ExecutionOrchestrator:
         except Exception:
             pass
 
-        return await self._execute_after_approval(cmd)
+        return self._release_approval(cmd, await self._execute_after_approval(cmd))
 
     # --------------------------------------------------
     # POST-APPROVAL EXECUTION
     # --------------------------------------------------
+    def _release_approval(
+        self, cmd: AICommand, result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # A finished execution moves its approval out of the hot set.
+        state = result.get("execution_state") if isinstance(result, dict) else None
+        if state in ("COMPLETED", "FAILED") and cmd.approval_id:
+            try:
+                self.approvals.mark_executed(cmd.approval_id, execution_state=state)
+            except Exception:
+                pass
+        return result
+
     async def _execute_after_approval(self, cmd: AICommand) -> Dict[str, Any]:
         cmd.execution_state = "EXECUTING"
         self.registry.register(cmd)
@@ -622,7 +634,7 @@ class ExecutionOrchestrator:
 
                         mem_ro = get_memory_read_only_service()
                         mem_snapshot = mem_ro.export_public_snapshot() if mem_ro else {}
-                        gp = GroundingPackService.build(
+                        gp = await GroundingPackService.abuild(
                             prompt="refresh_snapshot",
                             knowledge_snapshot=ks if isinstance(ks, dict) else {},
                             memory_public_snapshot=mem_snapshot,
@@ -10,7 +10,9 @@ Problem koji rješava:
 
 Rješenje:
 - Class-level GLOBAL store + lock (kao ApprovalStateService).
-- Best-effort persist na disk (da preživi reload/restart).
+- Best-effort persist na disk (da preživi reload/restart): append-only
+  journal (services/journaled_store.py) umjesto rewrite-a cijelog JSON-a po
+  tranziciji; stari execution_ids se lijeno čitaju s diska (bounded hot set).
 - Registry čuva AICommand (kanonski objekat), i state (BLOCKED/COMPLETED/FAILED...).
 
 API koje koristi Orchestrator:
@@ -25,12 +27,15 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, Optional, Union, List
 
 from models.ai_command import AICommand
+from services.json_journal import journal_path_for
+from services.journaled_store import JournaledStore
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -39,7 +44,22 @@ logger.setLevel(logging.INFO)
 # STORAGE (SURVIVES RELOAD/RESTART) — best-effort
 # ============================================================
 _BASE_PATH = Path(__file__).resolve().parent.parent / "adnan_ai" / "memory"
-_REGISTRY_FILE = _BASE_PATH / "execution_registry.json"
+_REGISTRY_FILE = _BASE_PATH / "execution_registry.json"  # legacy full snapshot
+
+
+def _hot_max() -> int:
+    try:
+        return max(1, int(os.getenv("EXECUTION_REGISTRY_HOT_MAX") or "2000"))
+    except Exception:
+        return 2000
+
+
+def _load_legacy_snapshot() -> Dict[str, Dict[str, Any]]:
+    if not _REGISTRY_FILE.exists():
+        return {}
+    with open(_REGISTRY_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data if isinstance(data, dict) else {}
 
 
 def _utc_ts() -> str:
@@ -125,22 +145,36 @@ class ExecutionRegistry:
       }
 
     U runtime-u vraćamo AICommand object.
+
+    Store je JournaledStore: svaka tranzicija je jedan appendovani record,
+    zapis radi background writer (batch + fsync), a u memoriji je samo
+    ograničen hot set (EXECUTION_REGISTRY_HOT_MAX).
     """
 
-    _GLOBAL: Dict[str, Dict[str, Any]] = {}
+    _GLOBAL: Optional[JournaledStore] = None
     _LOCK: Lock = Lock()
     _LOADED_FROM_DISK: bool = False
 
     def __init__(self):
-        self._store = ExecutionRegistry._GLOBAL
         self._lock = ExecutionRegistry._LOCK
 
         # Load once per process
         with self._lock:
             if not ExecutionRegistry._LOADED_FROM_DISK:
+                ExecutionRegistry._GLOBAL = JournaledStore(
+                    journal_path_for(_REGISTRY_FILE),
+                    name="execution_registry",
+                    hot_max=_hot_max(),
+                    legacy_loader=_load_legacy_snapshot,
+                )
                 self._load_from_disk_locked()
                 ExecutionRegistry._LOADED_FROM_DISK = True
 
+    @property
+    def _store(self) -> JournaledStore:
+        assert ExecutionRegistry._GLOBAL is not None
+        return ExecutionRegistry._GLOBAL
+
     # ------------------------------------------------------------
     # CORE API
     # ------------------------------------------------------------
@@ -192,11 +226,9 @@ class ExecutionRegistry:
                     ):
                         cmd.approval_id = existing_cmd.approval_id
 
-            self._store[execution_id] = {
-                "command": _to_dict(cmd),
-                "updated_at": now,
-            }
-            self._persist_to_disk_locked()
+            self._persist_to_disk_locked(
+                execution_id, {"command": _to_dict(cmd), "updated_at": now}
+            )
 
     def get(self, execution_id: str) -> Optional[Union[AICommand, Dict[str, Any]]]:
         """
@@ -248,8 +280,9 @@ class ExecutionRegistry:
                     md["approval_id"] = aid.strip()
                     cmd.metadata = md
 
-            self._store[eid] = {"command": _to_dict(cmd), "updated_at": _utc_ts()}
-            self._persist_to_disk_locked()
+            self._persist_to_disk_locked(
+                eid, {"command": _to_dict(cmd), "updated_at": _utc_ts()}
+            )
 
     def complete(self, execution_id: str, result: Dict[str, Any]) -> None:
         eid = (execution_id or "").strip()
@@ -271,8 +304,9 @@ class ExecutionRegistry:
             if isinstance(result, dict):
                 cmd.result = result
 
-            self._store[eid] = {"command": _to_dict(cmd), "updated_at": _utc_ts()}
-            self._persist_to_disk_locked()
+            self._persist_to_disk_locked(
+                eid, {"command": _to_dict(cmd), "updated_at": _utc_ts()}
+            )
 
     def fail(self, execution_id: str, failure: Dict[str, Any]) -> None:
         """
@@ -298,19 +332,21 @@ class ExecutionRegistry:
             if isinstance(failure, dict):
                 cmd.result = failure
 
-            self._store[eid] = {"command": _to_dict(cmd), "updated_at": _utc_ts()}
-            self._persist_to_disk_locked()
+            self._persist_to_disk_locked(
+                eid, {"command": _to_dict(cmd), "updated_at": _utc_ts()}
+            )
 
     # ------------------------------------------------------------
     # OPTIONAL HELPERS (debug)
     # ------------------------------------------------------------
     def list_execution_ids(self) -> List[str]:
         with self._lock:
-            return sorted(list(self._store.keys()))
+            return sorted(self._store.keys())
 
     def snapshot(self) -> Dict[str, Any]:
         """
         READ-ONLY registry snapshot (bez velikih payload-a).
+        Skenira cijeli journal (i evictane zapise) — samo za debug.
         """
         with self._lock:
             out: Dict[str, Any] = {}
@@ -337,32 +373,22 @@ class ExecutionRegistry:
     def _load_from_disk_locked(self) -> None:
         try:
             _BASE_PATH.mkdir(parents=True, exist_ok=True)
-            if not _REGISTRY_FILE.exists():
-                return
-
-            with open(_REGISTRY_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not isinstance(data, dict):
-                return
-
-            for eid, rec in data.items():
-                if not isinstance(eid, str) or not isinstance(rec, dict):
-                    continue
-                if eid not in self._store:
-                    self._store[eid] = rec
-
+            self._store.load()
         except Exception as e:
             logger.warning("ExecutionRegistry load_from_disk failed: %s", str(e))
 
-    def _persist_to_disk_locked(self) -> None:
+    def _persist_to_disk_locked(self, execution_id: str, rec: Dict[str, Any]) -> None:
+        # put() updates the in-memory view synchronously; the append itself is
+        # batched on the store's writer thread, off the request path.
         try:
-            _BASE_PATH.mkdir(parents=True, exist_ok=True)
-            with open(_REGISTRY_FILE, "w", encoding="utf-8") as f:
-                json.dump(self._store, f, indent=2, ensure_ascii=False, default=str)
+            self._store.put(execution_id, rec)
         except Exception as e:
             logger.warning("ExecutionRegistry persist_to_disk failed: %s", str(e))
 
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Wait until every recorded transition is on disk (tests/shutdown)."""
+        return self._store.flush(timeout=timeout)
+
 
 _EXECUTION_REGISTRY_SINGLETON = ExecutionRegistry()
 
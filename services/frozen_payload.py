@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+
+# ============================================================
+# FROZEN PAYLOADS (CONTENT-ADDRESSED HASH MEMOIZATION)
+# ============================================================
+#
+# Loaders that hand out rarely-changing, read-only payloads (identity pack,
+# KB file/Notion snapshot) serialize + hash them once per generation and
+# publish the result here. Consumers (GroundingPackService) then look the
+# hash up by object identity instead of re-serializing the payload per turn.
+#
+# The registry holds a strong reference to every published value, so an id()
+# can never be reused while its entry is alive, and lookups also check `is`.
+# Published values must be treated as immutable by everyone. Hot paths that
+# only read (grounding pack payloads, prompt compaction) take the shared value
+# as is; load_ceo_identity_pack() and other general-purpose loaders hand out
+# a thaw() deep copy instead of the shared value or a shallow copy of it.
+
+
+def stable_json_dumps(obj: Any) -> str:
+    try:
+        return json.dumps(
+            obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        )
+    except Exception:
+        return json.dumps(str(obj), ensure_ascii=False)
+
+
+@dataclass(frozen=True, eq=False)
+class FrozenPayload:
+    """Read-only payload with its canonical JSON form, sha256 and byte size."""
+
+    value: Any
+    serialized: str
+    sha256: str
+    size_bytes: int
+    generation: Hashable = None
+
+    @classmethod
+    def of(cls, value: Any, *, generation: Hashable = None) -> "FrozenPayload":
+        serialized = stable_json_dumps(value)
+        data = serialized.encode("utf-8")
+        return cls(
+            value=value,
+            serialized=serialized,
+            sha256=hashlib.sha256(data).hexdigest(),
+            size_bytes=len(data),
+            generation=generation,
+        )
+
+    def thaw(self) -> Any:
+        """Private deep copy of `value`, safe to mutate."""
+        return copy.deepcopy(self.value)
+
+
+_PUBLISHED: "OrderedDict[int, FrozenPayload]" = OrderedDict()
+_PUBLISHED_LOCK = threading.Lock()
+_PUBLISHED_MAX = 32
+
+
+def publish(frozen: FrozenPayload) -> FrozenPayload:
+    """Register `frozen.value` so `sha256_hex(value)` is a lookup (small LRU)."""
+    key = id(frozen.value)
+    with _PUBLISHED_LOCK:
+        _PUBLISHED[key] = frozen
+        _PUBLISHED.move_to_end(key)
+        while len(_PUBLISHED) > _PUBLISHED_MAX:
+            _PUBLISHED.popitem(last=False)
+    return frozen
+
+
+def published(obj: Any) -> Optional[FrozenPayload]:
+    with _PUBLISHED_LOCK:
+        hit = _PUBLISHED.get(id(obj))
+    if hit is not None and hit.value is obj:
+        return hit
+    return None
+
+
+def freeze(obj: Any) -> FrozenPayload:
+    """Published FrozenPayload for `obj`, or a one-off (unpublished) one."""
+    hit = published(obj)
+    if hit is not None:
+        return hit
+    return FrozenPayload.of(obj)
+
+
+def sha256_hex(obj: Any) -> str:
+    """sha256 of the stable JSON form; free for published payloads."""
+    return freeze(obj).sha256
+
+
+def clear_published_payloads() -> None:
+    with _PUBLISHED_LOCK:
+        _PUBLISHED.clear()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import re
@@ -11,6 +10,7 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+from services.frozen_payload import freeze
 from services.grounding_policy import classify_prompt
 
 
@@ -29,6 +29,19 @@ def _run_coro_in_worker(coro: Any) -> Any:
     return _KB_EXECUTOR.submit(_runner).result()
 
 
+def _run_sync(coro: Any) -> Any:
+    """Run `coro` to completion from sync code.
+
+    Without a running loop the coroutine runs on a private loop in this thread;
+    only sync callers nested inside a running loop pay for the worker hop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return _run_coro_in_worker(coro)
+
+
 def _env_true(name: str, default: str = "true") -> bool:
     return (os.getenv(name, default) or "").strip().lower() == "true"
 
@@ -42,11 +55,6 @@ def _stable_json_dumps(obj: Any) -> str:
         return json.dumps(str(obj), ensure_ascii=False)
 
 
-def _sha256_hex(obj: Any) -> str:
-    data = _stable_json_dumps(obj).encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
-
-
 def _now_iso() -> str:
     # ISO-ish without importing datetime (keep tiny + deterministic)
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
@@ -198,9 +206,12 @@ class GroundingPackService:
     @classmethod
     def _load_identity_pack(cls) -> Dict[str, Any]:
         try:
-            from services.identity_loader import load_ceo_identity_pack  # noqa: PLC0415
+            from services.identity_loader import (  # noqa: PLC0415
+                load_ceo_identity_pack_frozen,
+            )
 
-            pack = load_ceo_identity_pack()
+            # Shared + published: identity_hash below is a lookup, not a re-hash.
+            pack = load_ceo_identity_pack_frozen().value
             return pack if isinstance(pack, dict) else {}
         except Exception as exc:  # noqa: BLE001
             return {
@@ -218,6 +229,13 @@ class GroundingPackService:
     @classmethod
     def _load_kb_file(
         cls, *, ctx: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Any]:
+        """Sync wrapper around `_aload_kb_file` (see `build`)."""
+        return _run_sync(cls._aload_kb_file(ctx=ctx))
+
+    @classmethod
+    async def _aload_kb_file(
+        cls, *, ctx: Optional[Dict[str, Any]] = None
     ) -> Tuple[Dict[str, Any], Dict[str, Any], Any]:
         """Load KB payload.
 
@@ -244,12 +262,13 @@ class GroundingPackService:
             }
 
             if isinstance(store, FileKBStore):
-                payload, entries = store.load_payload_and_entries()
-                kb_file = payload if isinstance(payload, dict) else kb_file
-                kb_file["entries"] = entries
+                kb_file = store.load_kb_file().value
+                meta = store.get_meta()
+            elif hasattr(store, "load_kb_file"):
+                kb_file = (await store.load_kb_file(ctx)).value
                 meta = store.get_meta()
             else:
-                entries = _run_coro_in_worker(store.get_entries(ctx))
+                entries = await store.get_entries(ctx)
                 kb_file = {
                     "version": "notion",
                     "description": "notion_kb",
@@ -277,139 +296,31 @@ class GroundingPackService:
 
     @classmethod
     def _retrieve_kb(
-        cls, *, prompt: str, kb: Dict[str, Any], intent: Optional[str] = None
+        cls,
+        *,
+        prompt: str,
+        kb: Dict[str, Any],
+        intent: Optional[str] = None,
+        index: Optional[Any] = None,
+        kb_hash: Optional[str] = None,
     ) -> KBRetrievalResult:
-        from services.text_normalization import (  # noqa: PLC0415
-            kb_entry_searchable_text,
-            normalize_text,
-            tokenize_normalized,
-        )
-
-        entries = kb.get("entries")
-        items = entries if isinstance(entries, list) else []
-
-        toks_all = tokenize_normalized(prompt)
-
-        # Prevent low-signal matches that cause false positives (e.g., "plan" matching agent roles).
-        low_signal = {"plan", "plans", "planning"}
-
-        # Very small stopword list for prompts like "Objasni X kao da sam...".
-        # Keep minimal to avoid surprising recall regressions.
-        stop = {
-            "kao",
-            "da",
-            "sam",
-            "si",
-            "smo",
-            "ste",
-            "su",
-            "ali",
-            "samo",
-            "objasni",
-            "objasnite",
-            "koristi",
-        }
-
-        toks_sig = [
-            t
-            for t in toks_all
-            if isinstance(t, str)
-            and len(t) >= 3
-            and t not in low_signal
-            and t not in stop
-        ]
-        toks_sig_set = set(toks_sig)
-        q_has_wysiati = "wysiati" in set(toks_all)
-
-        intent_norm = (intent or "").strip().lower()
-        gate_enabled = intent_norm in {"advisory", "state_query", "identity"}
-
-        def _entry_applies_to(entry: Dict[str, Any]) -> List[str]:
-            raw = entry.get("applies_to")
-            if isinstance(raw, list):
-                out = [
-                    str(x).strip().lower()
-                    for x in raw
-                    if isinstance(x, str) and str(x).strip()
-                ]
-                return out or ["all"]
-            return ["all"]
-
-        scored: List[Tuple[float, Dict[str, Any]]] = []
-        for e in items:
-            if not isinstance(e, dict):
-                continue
-
-            if gate_enabled:
-                applies_to = _entry_applies_to(e)
-                if (intent_norm not in applies_to) and ("all" not in applies_to):
-                    continue
-
-            entry_id = str(e.get("id") or "")
-            title_raw = str(e.get("title") or "")
-
-            id_norm = normalize_text(entry_id)
-            title_norm = normalize_text(title_raw)
+        """Deterministic token-overlap retrieval.
 
-            search_norm = normalize_text(kb_entry_searchable_text(e))
-            content_tokens = set(tokenize_normalized(search_norm))
-            id_title_tokens = set(tokenize_normalized(f"{id_norm} {title_norm}"))
-
-            # Must-include rule: if query mentions WYSIATI, force include matching entry.
-            must_include = False
-            if q_has_wysiati and (
-                "wysiati" in id_title_tokens or "wysiati" in content_tokens
-            ):
-                must_include = True
+        `index` is a prebuilt KBSearchIndex over `kb["entries"]` (FileKBStore
+        caches one per file version); without it the shared index cache is
+        keyed by the KB content hash (`kb_hash`, computed when not given).
+        """
+        from services.kb_search_index import get_kb_search_index  # noqa: PLC0415
 
-            id_title_hits = (
-                sum(1 for t in toks_sig_set if t in id_title_tokens)
-                if toks_sig_set
-                else 0
-            )
-            content_hits = (
-                sum(1 for t in toks_sig_set if t in content_tokens)
-                if toks_sig_set
-                else 0
+        if index is None:
+            entries = kb.get("entries")
+            digest = kb_hash or freeze(kb).sha256
+            index = get_kb_search_index(
+                ("kb_file", digest), entries if isinstance(entries, list) else []
             )
 
-            # Phrase match is still useful for exact-quote lookups.
-            phrase_hit = False
-            prompt_norm = normalize_text(prompt)
-            if prompt_norm:
-                phrase_hit = (
-                    prompt_norm in search_norm
-                    or prompt_norm in title_norm
-                    or prompt_norm in id_norm
-                )
+        selected = index.retrieve(prompt, limit=cls._kb_max_entries(), intent=intent)
 
-            if not (
-                must_include or phrase_hit or id_title_hits > 0 or content_hits > 0
-            ):
-                continue
-
-            pr = e.get("priority")
-            try:
-                prf = float(pr)
-            except Exception:
-                prf = 0.0
-
-            # Ranking bias: prefer direct id/title token matches heavily.
-            score = 0.0
-            if must_include:
-                score += 1_000_000.0
-            if phrase_hit:
-                score += 50_000.0
-            score += float(id_title_hits) * 10_000.0
-            score += float(content_hits) * 100.0
-            score += prf
-
-            scored.append((score, e))
-
-        # Deterministic sorting
-        scored.sort(key=lambda pair: (-pair[0], str(pair[1].get("id") or "")))
-
-        selected = [e for _, e in scored[: cls._kb_max_entries()]]
         used_ids: List[str] = []
         for e in selected:
             _id = e.get("id")
@@ -427,6 +338,36 @@ class GroundingPackService:
         memory_public_snapshot: Dict[str, Any],
         legacy_trace: Optional[Dict[str, Any]] = None,
         agent_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Sync wrapper around `abuild` for callers without an event loop.
+
+        Async callers must `await GroundingPackService.abuild(...)` instead, so
+        KB store I/O runs on their loop (and its loop-bound Notion clients).
+        """
+        if not cls.enabled():
+            return {
+                "enabled": False,
+                "feature_flags": {"CEO_GROUNDING_PACK_ENABLED": False},
+            }
+        return _run_sync(
+            cls.abuild(
+                prompt=prompt,
+                knowledge_snapshot=knowledge_snapshot,
+                memory_public_snapshot=memory_public_snapshot,
+                legacy_trace=legacy_trace,
+                agent_id=agent_id,
+            )
+        )
+
+    @classmethod
+    async def abuild(
+        cls,
+        *,
+        prompt: str,
+        knowledge_snapshot: Dict[str, Any],
+        memory_public_snapshot: Dict[str, Any],
+        legacy_trace: Optional[Dict[str, Any]] = None,
+        agent_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         if not cls.enabled():
             return {
@@ -437,7 +378,7 @@ class GroundingPackService:
         t_start = time.perf_counter()
 
         identity_pack = cls._load_identity_pack()
-        identity_hash = _sha256_hex(identity_pack)
+        identity_hash = freeze(identity_pack).sha256
 
         ctx: Dict[str, Any] = {}
         if isinstance(agent_id, str) and agent_id.strip():
@@ -448,9 +389,10 @@ class GroundingPackService:
                 ctx["request_id"] = rid.strip()
 
         t_kb_load0 = time.perf_counter()
-        kb_file, kb_meta, kb_store = cls._load_kb_file(ctx=ctx)
+        kb_file, kb_meta, kb_store = await cls._aload_kb_file(ctx=ctx)
         t_kb_load1 = time.perf_counter()
-        kb_hash = _sha256_hex(kb_file)
+        kb_frozen = freeze(kb_file)
+        kb_hash = kb_frozen.sha256
 
         t_kb0 = time.perf_counter()
         kb_search: Dict[str, Any] = {}
@@ -463,16 +405,14 @@ class GroundingPackService:
         try:
             if kb_store is not None and hasattr(kb_store, "search"):
                 try:
-                    kb_search = _run_coro_in_worker(
-                        kb_store.search(
-                            prompt,
-                            top_k=cls._kb_search_top_k(),
-                            intent=intent_for_kb,
-                        )
+                    kb_search = await kb_store.search(
+                        prompt,
+                        top_k=cls._kb_search_top_k(),
+                        intent=intent_for_kb,
                     )
                 except TypeError:
-                    kb_search = _run_coro_in_worker(
-                        kb_store.search(prompt, top_k=cls._kb_search_top_k())
+                    kb_search = await kb_store.search(
+                        prompt, top_k=cls._kb_search_top_k()
                     )
                 search_attempted = isinstance(kb_search, dict) and any(
                     k in kb_search for k in ("entries", "used_entry_ids", "meta")
@@ -508,7 +448,7 @@ class GroundingPackService:
         # a structured response, fall back to deterministic token-overlap retrieval.
         if not search_attempted:
             kb_retrieval = cls._retrieve_kb(
-                prompt=prompt, kb=kb_file, intent=intent_for_kb
+                prompt=prompt, kb=kb_file, intent=intent_for_kb, kb_hash=kb_hash
             )
             used_entry_ids = list(kb_retrieval.used_entry_ids)
             selected_entries = list(kb_retrieval.selected_entries)
@@ -625,7 +565,8 @@ class GroundingPackService:
 
         # Memory snapshot (read-only exported)
         mem = memory_public_snapshot if isinstance(memory_public_snapshot, dict) else {}
-        mem_hash = _sha256_hex(mem)
+        mem_frozen = freeze(mem)
+        mem_hash = mem_frozen.sha256
 
         counts = {
             "goals": _count_list(notion_payload, "goals"),
@@ -671,8 +612,8 @@ class GroundingPackService:
         # Payload bytes (used for budget enforcement)
         payload_bytes = {
             "notion_snapshot": len(_stable_json_dumps(notion_snapshot).encode("utf-8")),
-            "kb_snapshot": len(_stable_json_dumps(kb_file).encode("utf-8")),
-            "memory_snapshot": len(_stable_json_dumps(mem).encode("utf-8")),
+            "kb_snapshot": kb_frozen.size_bytes,
+            "memory_snapshot": mem_frozen.size_bytes,
         }
 
         # Enforce Notion budgets:
@@ -940,6 +881,13 @@ class GroundingPackService:
             diagnostics["missing_keys"] = mk
             diagnostics["recommended_action"] = "reduce_notion_payload"
 
+        # identity_pack / kb_file are shared published payloads and go into the
+        # pack by reference (read-only; their hashes identify them). Only the
+        # few selected KB entries, which callers reshape, are copied.
+        selected_entries = [
+            dict(e) if isinstance(e, dict) else e for e in selected_entries
+        ]
+
         pack = {
             "enabled": True,
             "schema_version": "v1",
@@ -7,7 +7,10 @@ import hashlib
 import time
 import logging
 import os
-from typing import Any, Callable, Dict
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from services.frozen_payload import FrozenPayload, publish
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -18,6 +21,19 @@ logger.setLevel(logging.INFO)
 
 _CACHE: Dict[str, Dict[str, Any]] = {}
 
+# CEO identity pack, frozen once per generation (identity file mtimes/sizes).
+_PACK_FROZEN: Optional[FrozenPayload] = None
+_PACK_LOCK = threading.Lock()
+
+_PACK_FILES: Tuple[Tuple[str, str], ...] = (
+    ("identity", "identity.json"),
+    ("kernel", "kernel.json"),
+    ("decision_engine", "decision_engine.json"),
+    ("static_memory", "static_memory.json"),
+    ("memory", "memory.json"),
+    ("agents", "agents.json"),
+)
+
 # ============================================================
 # CORE JSON LOADER (UTF-8 BOM SAFE)
 # ============================================================
@@ -248,7 +264,46 @@ def load_agents_identity() -> Dict[str, Any]:
 # ============================================================
 
 
+def _identity_pack_generation() -> Tuple[Any, ...]:
+    gen: list = [(os.getenv("IDENTITY_PATH") or "").strip()]
+    for _, filename in _PACK_FILES:
+        try:
+            st = os.stat(resolve_path(filename))
+            gen.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            gen.append(None)
+    return tuple(gen)
+
+
+def load_ceo_identity_pack_frozen() -> FrozenPayload:
+    """
+    CEO identity pack + its canonical JSON and sha256, built once per generation.
+
+    The value is shared and published (services.frozen_payload); treat it as
+    read-only. Use load_ceo_identity_pack() for a private deep copy.
+    """
+    global _PACK_FROZEN
+    gen = _identity_pack_generation()
+    frozen = _PACK_FROZEN
+    if frozen is not None and frozen.generation == gen:
+        return frozen
+    with _PACK_LOCK:
+        frozen = _PACK_FROZEN
+        if frozen is None or frozen.generation != gen:
+            frozen = publish(
+                FrozenPayload.of(_build_ceo_identity_pack(), generation=gen)
+            )
+            _PACK_FROZEN = frozen
+    return frozen
+
+
 def load_ceo_identity_pack() -> Dict[str, Any]:
+    # Deep copy: callers may mutate nested sections (identity/kernel/...),
+    # which a top-level dict() copy would leak into the shared pack.
+    return load_ceo_identity_pack_frozen().thaw()
+
+
+def _build_ceo_identity_pack() -> Dict[str, Any]:
     """
     Returns a best-effort "identity pack" for CEO Advisor context.
 
@@ -401,14 +456,7 @@ def load_ceo_identity_pack() -> Dict[str, Any]:
         }
 
     # meta (hash + file mtimes)
-    paths = {
-        "identity": resolve_path("identity.json"),
-        "kernel": resolve_path("kernel.json"),
-        "decision_engine": resolve_path("decision_engine.json"),
-        "static_memory": resolve_path("static_memory.json"),
-        "memory": resolve_path("memory.json"),
-        "agents": resolve_path("agents.json"),
-    }
+    paths = {k: resolve_path(filename) for k, filename in _PACK_FILES}
 
     mt: Dict[str, Any] = {}
     for k, p in paths.items():
@@ -1,5 +1,5 @@
-import re
 from services.intent_contract import Intent, IntentType
+from services.prompt_features import analyze_prompt, prompt_pattern
 
 
 class IntentClassifier:
@@ -78,103 +78,97 @@ class IntentClassifier:
     # ==================================================
 
     def classify(self, text: str, *, source: str) -> Intent:
-        lowered = (text or "").lower().strip()
+        # Each pattern group is one precompiled alternation on the shared,
+        # already lowercased prompt view.
+        pf = analyze_prompt(text)
 
         # --------------------------------------------------
         # CONFIRM
         # --------------------------------------------------
-        for pattern in self.CONFIRM_PATTERNS:
-            if re.fullmatch(pattern, lowered):
-                return Intent(
-                    type=IntentType.CONFIRM,
-                    confidence=0.99,
-                    payload={},
-                    source=source,
-                )
+        if pf.has(prompt_pattern(self.CONFIRM_PATTERNS, fullmatch=True)):
+            return Intent(
+                type=IntentType.CONFIRM,
+                confidence=0.99,
+                payload={},
+                source=source,
+            )
 
         # --------------------------------------------------
         # CANCEL
         # --------------------------------------------------
-        for pattern in self.CANCEL_PATTERNS:
-            if re.fullmatch(pattern, lowered):
-                return Intent(
-                    type=IntentType.CANCEL,
-                    confidence=0.99,
-                    payload={},
-                    source=source,
-                )
+        if pf.has(prompt_pattern(self.CANCEL_PATTERNS, fullmatch=True)):
+            return Intent(
+                type=IntentType.CANCEL,
+                confidence=0.99,
+                payload={},
+                source=source,
+            )
 
         # --------------------------------------------------
         # SYSTEM QUERY (READ-ONLY)
         # --------------------------------------------------
-        for pattern in self.SYSTEM_QUERY_PATTERNS:
-            if re.search(pattern, lowered):
-                return Intent(
-                    type=IntentType.SYSTEM_QUERY,
-                    confidence=0.95,
-                    payload={},
-                    source=source,
-                )
+        if pf.has(prompt_pattern(self.SYSTEM_QUERY_PATTERNS)):
+            return Intent(
+                type=IntentType.SYSTEM_QUERY,
+                confidence=0.95,
+                payload={},
+                source=source,
+            )
 
         # --------------------------------------------------
         # GOALS LIST (READ)
         # --------------------------------------------------
-        for pattern in self.GOALS_LIST_PATTERNS:
-            if re.search(pattern, lowered):
-                return Intent(
-                    type=IntentType.GOALS_LIST,
-                    confidence=0.92,
-                    payload={},
-                    source=source,
-                )
+        if pf.has(prompt_pattern(self.GOALS_LIST_PATTERNS)):
+            return Intent(
+                type=IntentType.GOALS_LIST,
+                confidence=0.92,
+                payload={},
+                source=source,
+            )
 
         # --------------------------------------------------
         # SOP LIST (READ)
         # --------------------------------------------------
-        for pattern in self.SOP_LIST_PATTERNS:
-            if re.search(pattern, lowered):
-                return Intent(
-                    type=IntentType.LIST_SOPS,
-                    confidence=0.92,
-                    payload={},
-                    source=source,
-                )
+        if pf.has(prompt_pattern(self.SOP_LIST_PATTERNS)):
+            return Intent(
+                type=IntentType.LIST_SOPS,
+                confidence=0.92,
+                payload={},
+                source=source,
+            )
 
         # --------------------------------------------------
         # SOP VIEW (READ)
         # --------------------------------------------------
-        for pattern in self.SOP_VIEW_PATTERNS:
-            if re.search(pattern, lowered):
-                return Intent(
-                    type=IntentType.VIEW_SOP,
-                    confidence=0.93,
-                    payload={},
-                    source=source,
-                )
+        if pf.has(prompt_pattern(self.SOP_VIEW_PATTERNS)):
+            return Intent(
+                type=IntentType.VIEW_SOP,
+                confidence=0.93,
+                payload={},
+                source=source,
+            )
 
         # --------------------------------------------------
         # GOAL CREATE (WRITE / APPROVAL REQUIRED)
         # --------------------------------------------------
-        for pattern in self.GOAL_CREATE_PATTERNS:
-            if re.search(pattern, lowered):
-                return Intent(
-                    type=IntentType.GOAL_CREATE,
-                    confidence=0.90,
-                    payload={},
-                    source=source,
-                )
+        if pf.has(prompt_pattern(self.GOAL_CREATE_PATTERNS)):
+            return Intent(
+                type=IntentType.GOAL_CREATE,
+                confidence=0.90,
+                payload={},
+                source=source,
+            )
 
         # --------------------------------------------------
         # IDENTITY / CHAT
         # --------------------------------------------------
-        for pattern in self.IDENTITY_PATTERNS:
-            if re.search(pattern, lowered):
-                return Intent(
-                    type=IntentType.CHAT,
-                    confidence=0.9,
-                    payload={},
-                    source=source,
-                )
+        if pf.has(prompt_pattern(self.IDENTITY_PATTERNS)):
+            return Intent(
+                type=IntentType.CHAT,
+                confidence=0.9,
+                payload={},
+                source=source,
+            )
 
         # --------------------------------------------------
         # FALLBACK
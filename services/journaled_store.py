@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from services.json_journal import (
+    append_jsonl,
+    scan_jsonl,
+    truncate_torn_tail,
+    write_jsonl_atomic,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Log-structured keyed record store shared by the registries.
+#
+# Every state transition appends one `{"k": key, "v": record}` line to an
+# append-only JSONL log instead of rewriting a whole JSON file. Only byte
+# offsets are kept for every key; full records live in a bounded LRU hot set
+# and older keys are read back lazily from the log. Appends are serialized at
+# put() time and written by a background thread in batches (one fsync per
+# batch), so request handlers never touch the disk. The same thread compacts
+# the log (rewrite latest version per key + atomic rename) once superseded
+# lines outnumber live ones. Torn-tail handling is services/json_journal.py's.
+#
+# Env:
+#   JOURNALED_STORE_COMPACT_MIN_GARBAGE   superseded lines before compaction (default 1000)
+#   JOURNALED_STORE_FSYNC=0               skip fsync (tests / ephemeral disks)
+
+Record = Dict[str, Any]
+
+_STORES: "weakref.WeakSet[JournaledStore]" = weakref.WeakSet()
+_STORES_LOCK = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int((os.getenv(name) or "").strip() or default)
+    except Exception:
+        return default
+
+
+def _fsync_enabled() -> bool:
+    return (os.getenv("JOURNALED_STORE_FSYNC") or "1").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
+def _key_value(rec: Any) -> Optional[Tuple[str, Record]]:
+    if not isinstance(rec, dict):
+        return None
+    k, v = rec.get("k"), rec.get("v")
+    if not isinstance(k, str) or not isinstance(v, dict):
+        return None
+    return k, v
+
+
+def _parse_line(raw: bytes) -> Optional[Tuple[str, Record]]:
+    try:
+        return _key_value(json.loads(raw.decode("utf-8")))
+    except Exception:
+        return None
+
+
+class JournaledStore:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        name: str,
+        hot_max: int = 2000,
+        legacy_loader: Optional[Callable[[], Dict[str, Record]]] = None,
+    ) -> None:
+        self.path = path
+        self.name = name
+        self.hot_max = max(1, int(hot_max))
+        self._legacy_loader = legacy_loader
+
+        self._lock = threading.Lock()
+        self._offsets: Dict[str, int] = {}
+        self._hot: "OrderedDict[str, Record]" = OrderedDict()
+        self._pending: Dict[str, Record] = {}
+        self._size = 0
+        self._lines = 0
+
+        self._cond = threading.Condition()
+        self._queue: Deque[Tuple[str, str, Record]] = deque()
+        self._inflight = 0
+        self._writer: Optional[threading.Thread] = None
+
+        self.stats: Dict[str, int] = {
+            "appends": 0,
+            "batches": 0,
+            "compactions": 0,
+            "disk_reads": 0,
+        }
+        with _STORES_LOCK:
+            _STORES.add(self)
+
+    # ------------------------------------------------------------
+    # LOAD
+    # ------------------------------------------------------------
+    def load(self, on_record: Optional[Callable[[str, Record], None]] = None) -> None:
+        """Index the log (or migrate the legacy snapshot into it).
+
+        `on_record(key, record)` sees every stored version in write order so
+        owners can rebuild small secondary indexes; the last call per key wins.
+        """
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists() and self._legacy_loader is not None:
+            self._migrate_legacy()
+
+        with self._lock:
+            self._offsets.clear()
+            self._hot.clear()
+            self._lines = 0
+            # Offsets are computed from _size, so a torn tail must go now.
+            self._size = truncate_torn_tail(self.path)
+            for off, rec in scan_jsonl(self.path):
+                parsed = _key_value(rec)
+                if parsed is None:
+                    continue
+                k, v = parsed
+                self._offsets[k] = off
+                self._lines += 1
+                if on_record is not None:
+                    on_record(k, v)
+
+    def _migrate_legacy(self) -> None:
+        try:
+            data = self._legacy_loader() if self._legacy_loader else None
+        except Exception as e:
+            logger.warning("%s legacy load failed: %s", self.name, e)
+            return
+        if not data:
+            return
+        lines = [
+            self._line(k, v)
+            for k, v in data.items()
+            if isinstance(k, str) and isinstance(v, dict)
+        ]
+        write_jsonl_atomic(
+            self.path, "".join(lines).encode("utf-8"), fsync=_fsync_enabled()
+        )
+        logger.info("%s migrated %s legacy records", self.name, len(data))
+
+    # ------------------------------------------------------------
+    # READ
+    # ------------------------------------------------------------
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._pending or key in self._offsets or key in self._hot
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(set(self._offsets) | set(self._pending))
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(dict.fromkeys([*self._offsets, *self._pending]))
+
+    def get(self, key: str) -> Optional[Record]:
+        """Return the live record (owners mutate it, then put() it back)."""
+
+        with self._lock:
+            rec = self._pending.get(key)
+            if rec is None:
+                rec = self._hot.get(key)
+            if rec is not None:
+                self._touch_locked(key, rec)
+                return rec
+            off = self._offsets.get(key)
+            if off is None:
+                return None
+            rec = self._read_at_locked(off, key)
+            if rec is not None:
+                self._touch_locked(key, rec)
+            return rec
+
+    def items(self) -> Iterator[Tuple[str, Record]]:
+        """Every key with its latest record (one sequential log scan)."""
+
+        with self._lock:
+            pending = dict(self._pending)
+            live = {off: k for k, off in self._offsets.items() if k not in pending}
+            try:
+                with open(self.path, "rb") as f:
+                    lines: List[Tuple[str, Record]] = []
+                    while True:
+                        off = f.tell()
+                        raw = f.readline()
+                        if not raw or off >= self._size:
+                            break
+                        if off not in live:
+                            continue
+                        parsed = _parse_line(raw)
+                        if parsed is not None:
+                            lines.append(parsed)
+            except FileNotFoundError:
+                lines = []
+        yield from lines
+        yield from pending.items()
+
+    def _touch_locked(self, key: str, rec: Record) -> None:
+        self._hot[key] = rec
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_max:
+            self._hot.popitem(last=False)
+
+    def _read_at_locked(self, off: int, key: str) -> Optional[Record]:
+        self.stats["disk_reads"] += 1
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(off)
+                parsed = _parse_line(f.readline())
+        except Exception as e:
+            logger.warning("%s read failed key=%s: %s", self.name, key, e)
+            return None
+        if parsed is None or parsed[0] != key:
+            return None
+        return parsed[1]
+
+    # ------------------------------------------------------------
+    # WRITE
+    # ------------------------------------------------------------
+    @staticmethod
+    def _line(key: str, rec: Record) -> str:
+        return json.dumps({"k": key, "v": rec}, ensure_ascii=False, default=str) + "\n"
+
+    def put(self, key: str, rec: Record) -> None:
+        """Record a new version; the append happens on the writer thread.
+
+        The line is serialized here, under the caller's lock, so later
+        in-place mutations of `rec` cannot race the writer.
+        """
+
+        line = self._line(key, rec)
+        with self._lock:
+            self._pending[key] = rec
+            self._touch_locked(key, rec)
+        with self._cond:
+            self._queue.append((key, line, rec))
+            self._ensure_writer_locked()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until every queued append is on disk."""
+
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and self._inflight == 0, timeout=timeout
+            )
+
+    def _ensure_writer_locked(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            return
+        ref = weakref.ref(self)
+
+        def _run() -> None:
+            while True:
+                store = ref()
+                if store is None:
+                    return
+                if not store._drain_once(wait_s=1.0):
+                    del store
+                    continue
+                del store
+
+        self._writer = threading.Thread(
+            target=_run, name=f"journaled-store-{self.name}", daemon=True
+        )
+        self._writer.start()
+
+    def _drain_once(self, *, wait_s: float) -> bool:
+        with self._cond:
+            if not self._queue:
+                self._cond.wait(timeout=wait_s)
+            if not self._queue:
+                return False
+            # Group commit: everything queued so far goes out in one write.
+            batch = list(self._queue)
+            self._queue.clear()
+            self._inflight = len(batch)
+        try:
+            self._append_batch(batch)
+            self._maybe_compact()
+        except Exception as e:
+            logger.warning("%s append failed: %s", self.name, e)
+        finally:
+            with self._cond:
+                self._inflight = 0
+                self._cond.notify_all()
+        return True
+
+    def _append_batch(self, batch: List[Tuple[str, str, Record]]) -> None:
+        chunks: List[bytes] = []
+        placed: List[Tuple[str, int, Record]] = []
+        pos = 0
+        for key, line, rec in batch:
+            data = line.encode("utf-8")
+            chunks.append(data)
+            placed.append((key, pos, rec))
+            pos += len(data)
+
+        # Offsets are relative to where the batch actually lands (after a torn
+        # tail from an earlier failed write has been cut).
+        start = append_jsonl(self.path, b"".join(chunks), fsync=_fsync_enabled())
+        pos += start
+
+        with self._lock:
+            for key, off, rec in placed:
+                self._offsets[key] = start + off
+                if self._pending.get(key) is rec:
+                    del self._pending[key]
+            self._size = pos
+            self._lines += len(placed)
+        self.stats["appends"] += len(placed)
+        self.stats["batches"] += 1
+
+    # ------------------------------------------------------------
+    # COMPACTION (writer thread only)
+    # ------------------------------------------------------------
+    def _maybe_compact(self) -> None:
+        with self._lock:
+            live = len(self._offsets)
+            garbage = self._lines - live
+        if garbage < max(_env_int("JOURNALED_STORE_COMPACT_MIN_GARBAGE", 1000), live):
+            return
+        self.compact()
+
+    def compact(self) -> None:
+        """Rewrite only the latest line per key, then swap atomically.
+
+        Only the writer thread appends, so the log cannot grow while this
+        runs; readers keep using the old file until the swap.
+        """
+
+        with self._lock:
+            by_off = sorted((off, k) for k, off in self._offsets.items())
+            size = self._size
+        tmp = self.path.with_name(self.path.name + ".compact")
+        new_offsets: Dict[str, int] = {}
+        pos = 0
+        with open(self.path, "rb") as src, open(tmp, "wb") as dst:
+            for off, k in by_off:
+                if off >= size:
+                    break
+                src.seek(off)
+                raw = src.readline()
+                new_offsets[k] = pos
+                dst.write(raw)
+                pos += len(raw)
+            dst.flush()
+            if _fsync_enabled():
+                os.fsync(dst.fileno())
+        with self._lock:
+            os.replace(tmp, self.path)
+            self._offsets = new_offsets
+            self._size = pos
+            self._lines = len(new_offsets)
+        self.stats["compactions"] += 1
+
+
+@atexit.register
+def _flush_all_stores() -> None:
+    with _STORES_LOCK:
+        stores = list(_STORES)
+    for store in stores:
+        try:
+            store.flush(timeout=5.0)
+        except Exception:
+            pass
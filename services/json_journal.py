@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+# Append-only JSONL change log kept next to a JSON snapshot file, plus the
+# low-level helpers every JSONL log in the repo is built on (approval
+# journal and archive, memory WAL, JournaledStore registries, conversation
+# segments).
+#
+# Owners append one record per mutation instead of rewriting the whole
+# snapshot, replay the journal over the snapshot on load, and compact (write
+# the snapshot, then truncate) once the journal grows past a threshold.
+# Records should be full-value upserts / deletes keyed by id so replay is
+# idempotent: a crash between snapshot write and truncate is harmless.
+#
+# Crash-safety rules (implemented and tested only here):
+#   - a record counts only once its line is newline-terminated; an
+#     unterminated last line is a torn write and is never replayed;
+#   - before appending, a torn tail is truncated back to the last newline,
+#     so the next record never gets glued onto the partial one;
+#   - complete lines that do not parse as a JSON object are skipped.
+#
+# Not thread-safe: owners call it under their own lock.
+
+
+def journal_path_for(snapshot_path: Path) -> Path:
+    return snapshot_path.with_name(snapshot_path.name + ".journal.jsonl")
+
+
+def encode_jsonl(
+    records: Iterable[Dict[str, Any]],
+    *,
+    default: Optional[Callable[[Any], Any]] = str,
+) -> bytes:
+    return "".join(
+        json.dumps(r, ensure_ascii=False, default=default) + "\n" for r in records
+    ).encode("utf-8")
+
+
+def scan_jsonl(path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(byte offset, record) for every complete line holding a JSON object."""
+
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        while True:
+            off = f.tell()
+            raw = f.readline()
+            if not raw.endswith(b"\n"):
+                return  # EOF, or torn tail write from a crash
+            try:
+                rec = json.loads(raw)
+            except Exception:
+                continue
+            if isinstance(rec, dict):
+                yield off, rec
+
+
+def _truncate_torn_tail(f: BinaryIO) -> int:
+    end = f.seek(0, os.SEEK_END)
+    if end == 0:
+        return 0
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return end
+    good = 0
+    pos = end
+    while pos > 0:
+        step = min(64 * 1024, pos)
+        f.seek(pos - step)
+        nl = f.read(step).rfind(b"\n")
+        if nl >= 0:
+            good = pos - step + nl + 1
+            break
+        pos -= step
+    f.truncate(good)
+    return good
+
+
+def truncate_torn_tail(path: Path) -> int:
+    """Drop an unterminated last line; returns the resulting file size."""
+
+    try:
+        with open(path, "r+b") as f:
+            return _truncate_torn_tail(f)
+    except FileNotFoundError:
+        return 0
+
+
+def open_for_append(path: Path) -> BinaryIO:
+    """Binary append handle positioned after the last complete line."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    f = open(path, "a+b")
+    try:
+        _truncate_torn_tail(f)
+    except Exception:
+        f.close()
+        raise
+    return f
+
+
+def append_jsonl(path: Path, data: bytes, *, fsync: bool = False) -> int:
+    """One-shot append of encoded lines; returns the offset they start at."""
+
+    with open_for_append(path) as f:
+        start = f.seek(0, os.SEEK_END)
+        f.write(data)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    return start
+
+
+def write_jsonl_atomic(path: Path, data: bytes, *, fsync: bool = True) -> None:
+    """Replace the whole log (compaction / migration) via tmp + rename."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class JsonJournal:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        fsync: bool = True,
+        default: Optional[Callable[[Any], Any]] = str,
+    ) -> None:
+        self.path = path
+        self.fsync = fsync
+        self.default = default
+        self.records = 0
+        self._fh: Optional[BinaryIO] = None
+        self._dirty = False
+
+    def replay(self) -> List[Dict[str, Any]]:
+        out = [rec for _, rec in scan_jsonl(self.path)]
+        self.records = len(out)
+        return out
+
+    def append(self, *records: Dict[str, Any], fsync: Optional[bool] = None) -> int:
+        """Append records; returns the journal length since last compaction.
+
+        `fsync=False` leaves the write for a later sync() (group commit).
+        """
+
+        if not records:
+            return self.records
+        data = encode_jsonl(records, default=self.default)
+        if self._fh is None:
+            self._fh = open_for_append(self.path)
+        self._fh.write(data)
+        self._fh.flush()
+        if self.fsync if fsync is None else fsync:
+            os.fsync(self._fh.fileno())
+            self._dirty = False
+        else:
+            self._dirty = True
+        self.records += len(records)
+        return self.records
+
+    def sync(self) -> None:
+        if self._fh is not None and self._dirty:
+            os.fsync(self._fh.fileno())
+        self._dirty = False
+
+    def truncate(self) -> None:
+        """Caller has already persisted a snapshot covering every record."""
+
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as f:
+            if self.fsync:
+                os.fsync(f.fileno())
+        self.records = 0
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
+        self._dirty = False
@@ -3,13 +3,24 @@ from __future__ import annotations
 import os
 import hashlib
 import json
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
+from services.frozen_payload import FrozenPayload, publish
 from services.identity_loader import load_json_file, resolve_path
+from services.kb_search_index import KBSearchIndex
 from services.kb_store import KBStore
 from services.kb_types import KBEntry
 
 
+# Parsed file + search index + frozen grounding payload, keyed by path and
+# stamped with the on-disk version (mtime_ns, size).
+_FILE_CACHE: Dict[
+    str, Tuple[Tuple[int, int], Dict[str, Any], KBSearchIndex, str, FrozenPayload]
+] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+
 class FileKBStore(KBStore):
     """Loads KB entries from the existing JSON file format.
 
@@ -32,10 +43,45 @@ class FileKBStore(KBStore):
             return os.path.abspath(kb_path)
         return resolve_path("knowledge.json")
 
+    def _load_cached(
+        self,
+    ) -> Tuple[Dict[str, Any], KBSearchIndex, str, FrozenPayload]:
+        """Load + index the KB file once per on-disk version (mtime/size)."""
+        path = self._resolve_kb_path()
+        try:
+            st = os.stat(path)
+            version: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            version = None
+
+        if version is not None:
+            with _FILE_CACHE_LOCK:
+                hit = _FILE_CACHE.get(path)
+            if hit is not None and hit[0] == version:
+                return hit[1], hit[2], hit[3], hit[4]
+
+        payload = load_json_file(path)
+        payload = payload if isinstance(payload, dict) else {}
+        raw_entries = payload.get("entries")
+        index = KBSearchIndex(raw_entries if isinstance(raw_entries, list) else [])
+        digest = self._sha256_hex(raw_entries if isinstance(raw_entries, list) else [])
+        kb_file = dict(payload)
+        kb_file["entries"] = self._parse_entries(payload)
+        frozen = FrozenPayload.of(kb_file, generation=(path, version))
+        if version is not None:
+            publish(frozen)
+            with _FILE_CACHE_LOCK:
+                _FILE_CACHE[path] = (version, payload, index, digest, frozen)
+        return payload, index, digest, frozen
+
     def load_payload(self) -> Dict[str, Any]:
         try:
-            payload = load_json_file(self._resolve_kb_path())
-            return payload if isinstance(payload, dict) else {}
+            payload, _, _, _ = self._load_cached()
+            # Shallow copy: callers replace "entries" on the returned dict.
+            out = dict(payload)
+            if isinstance(out.get("entries"), list):
+                out["entries"] = list(out["entries"])
+            return out
         except Exception as exc:  # noqa: BLE001
             return {
                 "version": "unknown",
@@ -48,6 +94,19 @@ class FileKBStore(KBStore):
         payload = self.load_payload()
         return payload, self._parse_entries(payload)
 
+    def load_kb_file(self) -> FrozenPayload:
+        """File fields + parsed entries (grounding pack `kb_file` shape).
+
+        Frozen and published once per file version; the value is shared and
+        must not be mutated.
+        """
+        try:
+            return self._load_cached()[3]
+        except Exception:  # noqa: BLE001
+            payload, entries = self.load_payload_and_entries()
+            payload["entries"] = entries
+            return FrozenPayload.of(payload)
+
     @staticmethod
     def _coerce_str_list(v: Any) -> List[str]:
         if not isinstance(v, list):
@@ -167,14 +226,17 @@ class FileKBStore(KBStore):
         force: bool = False,
         intent: Optional[str] = None,
     ) -> Dict[str, Any]:
-        payload = self.load_payload()
+        try:
+            payload, index, digest, _ = self._load_cached()
+        except Exception:
+            payload, index, digest = {}, KBSearchIndex([]), self._sha256_hex([])
         # Use the exact same scoring/selection logic as the legacy grounding pack.
         # This preserves determinism and keeps existing tests stable.
         try:
             from services.grounding_pack_service import GroundingPackService  # noqa: PLC0415
 
             baseline = GroundingPackService._retrieve_kb(
-                prompt=query, kb=payload, intent=intent
+                prompt=query, kb=payload, intent=intent, index=index
             )
             selected = list(baseline.selected_entries)
             used_ids = list(baseline.used_entry_ids)
@@ -198,10 +260,14 @@ class FileKBStore(KBStore):
             "total_entries": len(payload.get("entries") or [])
             if isinstance(payload, dict)
             else 0,
-            "hash": self._sha256_hex(
-                payload.get("entries") if isinstance(payload, dict) else []
-            ),
+            "hash": digest,
             "hit_count": len(selected),
         }
         self._last_meta = {"source": "file", "cache_hit": False, "last_sync": None}
         return {"entries": selected, "used_entry_ids": used_ids, "meta": meta}
+
+
+def clear_kb_file_cache() -> None:
+    """Drop the parsed KB file cache (no IO)."""
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.clear()
@@ -8,11 +8,19 @@ import random
 import time
 import threading
 import concurrent.futures
+from functools import partial
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+from services.frozen_payload import FrozenPayload, publish
+from services.kb_search_index import (
+    KBSearchIndex,
+    clear_kb_search_index_cache,
+    get_kb_search_index,
+)
 from services.kb_store import KBStore
+from services.notion_query_cache import get_notion_query_cache
 from services.kb_types import KBEntry
 
 
@@ -413,6 +421,14 @@ class KBNotionStore(KBStore):
             data = r.json()
             return data if isinstance(data, dict) else {}
 
+    async def _post_query(
+        self, client: httpx.AsyncClient, body: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        r = await client.post(f"/v1/databases/{self._db_id}/query", json=body)
+        r.raise_for_status()
+        data = r.json()
+        return data if isinstance(data, dict) else {}
+
     async def _query_pages(self) -> List[Dict[str, Any]]:
         if not self._db_id:
             raise KBNotionReadFail("Missing NOTION_KB_DB_ID")
@@ -431,9 +447,9 @@ class KBNotionStore(KBStore):
                 if next_cursor:
                     body["start_cursor"] = next_cursor
 
-                r = await client.post(f"/v1/databases/{self._db_id}/query", json=body)
-                r.raise_for_status()
-                data = r.json()
+                data = await get_notion_query_cache().read_through(
+                    self._db_id, body, partial(self._post_query, client, body)
+                )
                 results = data.get("results")
                 if isinstance(results, list):
                     for x in results:
@@ -571,6 +587,10 @@ class KBNotionStore(KBStore):
         try:
             entries, digest, last_fetch_iso = await self._fetch_entries_with_retry()
             fetched_at = time.time()
+            index = get_kb_search_index(("notion", db_key, digest), entries)
+            kb_file = publish(
+                FrozenPayload.of(_notion_kb_file(entries), generation=(db_key, digest))
+            )
             with _CACHE_LOCK:
                 _CACHE_BY_DB[db_key] = {
                     "entries_all": list(entries),
@@ -578,6 +598,8 @@ class KBNotionStore(KBStore):
                     "ttl_s": int(ttl_s),
                     "hash": digest,
                     "last_fetch_iso": last_fetch_iso,
+                    "index": index,
+                    "kb_file": kb_file,
                 }
                 fut2 = _IN_FLIGHT_BY_DB.get(db_key)
                 _IN_FLIGHT_BY_DB.pop(db_key, None)
@@ -614,148 +636,15 @@ class KBNotionStore(KBStore):
         force: bool = False,
         intent: Optional[str] = None,
     ) -> Dict[str, Any]:
-        from services.text_normalization import (  # noqa: PLC0415
-            kb_entry_searchable_text,
-            normalize_text,
-            tokenize_normalized,
-        )
-
         loaded = await self.load_all(force=force)
         entries_all = loaded.get("entries") if isinstance(loaded, dict) else []
         meta0 = loaded.get("meta") if isinstance(loaded, dict) else {}
 
-        q = (query or "").strip()
-        q_norm = normalize_text(q)
-        q_toks = tokenize_normalized(q)
-
-        # Prevent low-signal matches.
-        low_signal = {"plan", "plans", "planning"}
-        # Very small stopword list for common "explain" prompts; keep minimal.
-        stop = {
-            "kao",
-            "da",
-            "sam",
-            "si",
-            "smo",
-            "ste",
-            "su",
-            "ali",
-            "samo",
-            "objasni",
-            "objasnite",
-            "koristi",
-        }
-        q_toks_sig = [
-            t
-            for t in q_toks
-            if isinstance(t, str)
-            and len(t) >= 3
-            and t not in low_signal
-            and t not in stop
-        ]
-        q_toks_sig_set = set(q_toks_sig)
-        q_has_wysiati = "wysiati" in set(q_toks)
-
-        intent_norm = (intent or "").strip().lower()
-        gate_enabled = intent_norm in {"advisory", "state_query", "identity"}
-
-        def _entry_applies_to(entry: KBEntry) -> List[str]:
-            raw = entry.get("applies_to")
-            if isinstance(raw, list):
-                out = [
-                    str(x).strip().lower()
-                    for x in raw
-                    if isinstance(x, str) and str(x).strip()
-                ]
-                return out or ["all"]
-            return ["all"]
-
-        hits: List[Tuple[int, int, int, int, str, KBEntry]] = []
-        if q_norm and isinstance(entries_all, list):
-            for e in entries_all:
-                if not isinstance(e, dict):
-                    continue
-
-                if gate_enabled:
-                    applies_to = _entry_applies_to(e)
-                    if (intent_norm not in applies_to) and ("all" not in applies_to):
-                        continue
-
-                entry_id = str(e.get("id") or "")
-                title_raw = str(e.get("title") or "")
-                title_norm = normalize_text(title_raw)
-
-                search_raw = kb_entry_searchable_text(e)
-                search_norm = normalize_text(search_raw)
-
-                id_norm = normalize_text(entry_id)
-                id_title_tokens = set(tokenize_normalized(f"{id_norm} {title_norm}"))
-
-                # Primary: full-phrase match on normalized text.
-                title_hit = 1 if q_norm in title_norm else 0
-                phrase_hit = q_norm in search_norm
-
-                # Secondary: token overlap on normalized tokens.
-                token_hit = False
-                content_tokens: set[str] = set()
-                if not phrase_hit and (q_toks_sig or q_has_wysiati):
-                    content_tokens = set(tokenize_normalized(search_norm))
-
-                    # Must-include rule: if query mentions WYSIATI, include matching entry.
-                    must_include = False
-                    if q_has_wysiati and (
-                        "wysiati" in id_title_tokens or "wysiati" in content_tokens
-                    ):
-                        must_include = True
-                        token_hit = True
-
-                    if not token_hit and q_toks_sig:
-                        overlap_total = sum(
-                            1 for t in q_toks_sig_set if t in content_tokens
-                        )
-                        overlap_id_title = sum(
-                            1 for t in q_toks_sig_set if t in id_title_tokens
-                        )
-
-                        if len(q_toks_sig) >= 2:
-                            token_hit = overlap_total >= 2 or (
-                                overlap_total >= 1 and overlap_id_title >= 1
-                            )
-                        else:
-                            token_hit = overlap_total >= 1
-                else:
-                    must_include = False
-
-                if not (phrase_hit or token_hit):
-                    continue
-
-                occurrences = search_norm.count(q_norm) if q_norm else 0
-                _id = entry_id
-
-                # Ranking bias: prefer direct id/title token matches.
-                id_title_hits = (
-                    sum(1 for t in q_toks_sig_set if t in id_title_tokens)
-                    if q_toks_sig_set
-                    else 0
-                )
-
-                hits.append(
-                    (
-                        1 if must_include else 0,
-                        id_title_hits,
-                        title_hit,
-                        occurrences,
-                        _id,
-                        e,
-                    )
-                )
-
-        # Sort: must-include first, then id/title token matches, then title phrase hits,
-        # then occurrences desc, then stable by id.
-        hits.sort(key=lambda t: (-t[0], -t[1], -t[2], -t[3], t[4]))
-
-        top_k_i = int(top_k) if int(top_k) > 0 else 8
-        selected = [e for _, _, _, _, _, e in hits[:top_k_i]]
+        index = self._search_index(
+            entries_all if isinstance(entries_all, list) else [],
+            meta0.get("hash") if isinstance(meta0, dict) else None,
+        )
+        selected = index.search(query, top_k=top_k, intent=intent)
 
         used_ids: List[str] = []
         for e in selected:
@@ -780,6 +669,34 @@ class KBNotionStore(KBStore):
         self._last_meta = dict(meta)
         return {"entries": selected, "used_entry_ids": used_ids, "meta": meta}
 
+    def _search_index(
+        self, entries: List[KBEntry], digest: Optional[str]
+    ) -> KBSearchIndex:
+        """Index built on refresh (cache entry); rebuilt only if missing."""
+        with _CACHE_LOCK:
+            cache = _CACHE_BY_DB.get(self._db_id) or {}
+            idx = cache.get("index")
+            if isinstance(idx, KBSearchIndex) and cache.get("hash") == digest:
+                return idx
+        if not digest:
+            return KBSearchIndex(entries)
+        return get_kb_search_index(("notion", self._db_id, digest), entries)
+
+    async def load_kb_file(self, ctx: Optional[Dict[str, Any]] = None) -> FrozenPayload:
+        """Grounding pack `kb_file` payload, frozen + published once per refresh."""
+        out = await self.load_all(force=False)
+        entries = out.get("entries") if isinstance(out, dict) else []
+        meta = out.get("meta") if isinstance(out, dict) else {}
+        digest = meta.get("hash") if isinstance(meta, dict) else None
+        with _CACHE_LOCK:
+            cache = _CACHE_BY_DB.get(self._db_id) or {}
+            kb_file = cache.get("kb_file")
+            if isinstance(kb_file, FrozenPayload) and cache.get("hash") == digest:
+                return kb_file
+        return FrozenPayload.of(
+            _notion_kb_file(entries if isinstance(entries, list) else [])
+        )
+
     async def get_entries(self, ctx: Optional[Dict[str, Any]] = None) -> List[KBEntry]:
         # Back-compat for existing loaders.
         out = await self.load_all(force=False)
@@ -799,11 +716,16 @@ class KBNotionStore(KBStore):
         }
 
 
+def _notion_kb_file(entries: List[KBEntry]) -> Dict[str, Any]:
+    return {"version": "notion", "description": "notion_kb", "entries": list(entries)}
+
+
 def _reset_cache_for_tests() -> None:
     """Test hook. Not part of runtime contract."""
     with _CACHE_LOCK:
         _CACHE_BY_DB.clear()
         _IN_FLIGHT_BY_DB.clear()
+    clear_kb_search_index_cache()
 
 
 def clear_kb_notion_process_cache() -> None:
@@ -815,6 +737,7 @@ def clear_kb_notion_process_cache() -> None:
     with _CACHE_LOCK:
         _CACHE_BY_DB.clear()
         _IN_FLIGHT_BY_DB.clear()
+    clear_kb_search_index_cache()
 
 
 # Back-compat alias
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Hashable, List, Optional, Sequence, Set, Tuple
+
+from services.text_normalization import (
+    kb_entry_searchable_text,
+    normalize_text,
+    tokenize_normalized,
+)
+
+
+# ============================================================
+# KB SEARCH INDEX
+# ============================================================
+#
+# Precomputed, immutable index over a KB entry list. Built once per KB refresh
+# (KBNotionStore.load_all / FileKBStore file change) so a chat turn only
+# evaluates candidate entries instead of re-normalizing the whole KB.
+#
+# Candidates are a superset of every entry that can match:
+# - token hits via posting lists (content + id/title tokens)
+# - phrase hits via str.find over one concatenated normalized blob
+# and each candidate is then scored with exactly the legacy per-entry rules,
+# in original entry order, so rankings are identical to the full scan.
+
+# Prevent low-signal matches (e.g. "plan" matching agent roles).
+_LOW_SIGNAL = frozenset({"plan", "plans", "planning"})
+
+# Very small stopword list for prompts like "Objasni X kao da sam...".
+_STOP = frozenset(
+    {
+        "kao",
+        "da",
+        "sam",
+        "si",
+        "smo",
+        "ste",
+        "su",
+        "ali",
+        "samo",
+        "objasni",
+        "objasnite",
+        "koristi",
+    }
+)
+
+_GATED_INTENTS = frozenset({"advisory", "state_query", "identity"})
+
+# Separator between entries in the phrase blob; never produced by normalize_text
+# for KB text, and queries containing it fall back to a full scan.
+_SEP = "\x00"
+
+
+def _entry_applies_to(entry: Dict[str, Any]) -> Tuple[str, ...]:
+    raw = entry.get("applies_to")
+    if isinstance(raw, list):
+        out = tuple(
+            str(x).strip().lower() for x in raw if isinstance(x, str) and str(x).strip()
+        )
+        return out or ("all",)
+    return ("all",)
+
+
+def _significant_tokens(tokens: Sequence[str]) -> List[str]:
+    return [
+        t
+        for t in tokens
+        if isinstance(t, str)
+        and len(t) >= 3
+        and t not in _LOW_SIGNAL
+        and t not in _STOP
+    ]
+
+
+@dataclass(frozen=True)
+class _IndexedEntry:
+    pos: int
+    entry: Dict[str, Any]
+    entry_id: str
+    id_norm: str
+    title_norm: str
+    search_norm: str
+    content_tokens: FrozenSet[str]
+    id_title_tokens: FrozenSet[str]
+    applies_to: Tuple[str, ...]
+    priority: float
+
+
+class _PhraseBlob:
+    """Concatenated normalized strings with offset -> entry position mapping."""
+
+    def __init__(self, parts: Sequence[Tuple[int, str]]) -> None:
+        chunks: List[str] = []
+        starts: List[int] = []
+        owners: List[int] = []
+        offset = 0
+        for pos, text in parts:
+            starts.append(offset)
+            owners.append(pos)
+            chunks.append(text)
+            offset += len(text) + 1
+        self._blob = _SEP.join(chunks)
+        self._starts = starts
+        self._owners = owners
+
+    def find_owners(self, needle: str) -> Set[int]:
+        out: Set[int] = set()
+        if not needle or not self._starts:
+            return out
+        blob = self._blob
+        i = blob.find(needle)
+        while i != -1:
+            slot = bisect_right(self._starts, i) - 1
+            out.add(self._owners[slot])
+            # Skip to the next part: one entry is enough per owner.
+            nxt = slot + 1
+            if nxt >= len(self._starts):
+                break
+            i = blob.find(needle, self._starts[nxt])
+        return out
+
+
+class KBSearchIndex:
+    """Inverted index over KB entries (see module notes)."""
+
+    def __init__(self, entries: Sequence[Any]) -> None:
+        items: List[_IndexedEntry] = []
+        postings: Dict[str, Set[int]] = {}
+        by_applies_to: Dict[str, Set[int]] = {}
+
+        for pos, e in enumerate(entries):
+            if not isinstance(e, dict):
+                continue
+            entry_id = str(e.get("id") or "")
+            id_norm = normalize_text(entry_id)
+            title_norm = normalize_text(str(e.get("title") or ""))
+            search_norm = normalize_text(kb_entry_searchable_text(e))
+            content_tokens = frozenset(tokenize_normalized(search_norm))
+            id_title_tokens = frozenset(tokenize_normalized(f"{id_norm} {title_norm}"))
+            try:
+                priority = float(e.get("priority"))
+            except Exception:
+                priority = 0.0
+            applies_to = _entry_applies_to(e)
+
+            items.append(
+                _IndexedEntry(
+                    pos=pos,
+                    entry=e,
+                    entry_id=entry_id,
+                    id_norm=id_norm,
+                    title_norm=title_norm,
+                    search_norm=search_norm,
+                    content_tokens=content_tokens,
+                    id_title_tokens=id_title_tokens,
+                    applies_to=applies_to,
+                    priority=priority,
+                )
+            )
+            for t in content_tokens | id_title_tokens:
+                postings.setdefault(t, set()).add(pos)
+            for a in applies_to:
+                by_applies_to.setdefault(a, set()).add(pos)
+
+        self._items: Dict[int, _IndexedEntry] = {it.pos: it for it in items}
+        self._postings = postings
+        self._by_applies_to = by_applies_to
+        self._search_blob = _PhraseBlob([(it.pos, it.search_norm) for it in items])
+        self._id_title_blob = _PhraseBlob(
+            [(it.pos, it.title_norm) for it in items]
+            + [(it.pos, it.id_norm) for it in items]
+        )
+        self.size = len(items)
+
+    # ----------------------------
+    # candidate selection
+    # ----------------------------
+    def _allowed_positions(self, intent: Optional[str]) -> Optional[Set[int]]:
+        intent_norm = (intent or "").strip().lower()
+        if intent_norm not in _GATED_INTENTS:
+            return None
+        return self._by_applies_to.get(intent_norm, set()) | self._by_applies_to.get(
+            "all", set()
+        )
+
+    def _candidates(
+        self,
+        *,
+        tokens: Set[str],
+        phrase: str,
+        include_id_title_phrase: bool,
+        intent: Optional[str],
+    ) -> List[_IndexedEntry]:
+        if _SEP in phrase:
+            positions: Set[int] = set(self._items.keys())
+        else:
+            positions = set()
+            for t in tokens:
+                positions |= self._postings.get(t, set())
+            if phrase:
+                positions |= self._search_blob.find_owners(phrase)
+                if include_id_title_phrase:
+                    positions |= self._id_title_blob.find_owners(phrase)
+
+        allowed = self._allowed_positions(intent)
+        if allowed is not None:
+            positions &= allowed
+        return [self._items[p] for p in sorted(positions)]
+
+    # ----------------------------
+    # KBNotionStore.search ranking
+    # ----------------------------
+    def search(
+        self, query: str, *, top_k: int, intent: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        q = (query or "").strip()
+        q_norm = normalize_text(q)
+        if not q_norm:
+            return []
+        q_toks = tokenize_normalized(q)
+        q_toks_sig = _significant_tokens(q_toks)
+        q_toks_sig_set = set(q_toks_sig)
+        q_has_wysiati = "wysiati" in set(q_toks)
+
+        lookup = set(q_toks_sig_set)
+        if q_has_wysiati:
+            lookup.add("wysiati")
+
+        hits: List[Tuple[int, int, int, int, str, Dict[str, Any]]] = []
+        for it in self._candidates(
+            tokens=lookup, phrase=q_norm, include_id_title_phrase=False, intent=intent
+        ):
+            title_hit = 1 if q_norm in it.title_norm else 0
+            phrase_hit = q_norm in it.search_norm
+
+            token_hit = False
+            must_include = False
+            if not phrase_hit and (q_toks_sig or q_has_wysiati):
+                content_tokens = it.content_tokens
+                id_title_tokens = it.id_title_tokens
+
+                # Must-include rule: if query mentions WYSIATI, include matching entry.
+                if q_has_wysiati and (
+                    "wysiati" in id_title_tokens or "wysiati" in content_tokens
+                ):
+                    must_include = True
+                    token_hit = True
+
+                if not token_hit and q_toks_sig:
+                    overlap_total = sum(
+                        1 for t in q_toks_sig_set if t in content_tokens
+                    )
+                    overlap_id_title = sum(
+                        1 for t in q_toks_sig_set if t in id_title_tokens
+                    )
+                    if len(q_toks_sig) >= 2:
+                        token_hit = overlap_total >= 2 or (
+                            overlap_total >= 1 and overlap_id_title >= 1
+                        )
+                    else:
+                        token_hit = overlap_total >= 1
+
+            if not (phrase_hit or token_hit):
+                continue
+
+            occurrences = it.search_norm.count(q_norm)
+            id_title_hits = (
+                sum(1 for t in q_toks_sig_set if t in it.id_title_tokens)
+                if q_toks_sig_set
+                else 0
+            )
+            hits.append(
+                (
+                    1 if must_include else 0,
+                    id_title_hits,
+                    title_hit,
+                    occurrences,
+                    it.entry_id,
+                    it.entry,
+                )
+            )
+
+        # Must-include first, then id/title token matches, then title phrase hits,
+        # then occurrences desc, then stable by id.
+        hits.sort(key=lambda t: (-t[0], -t[1], -t[2], -t[3], t[4]))
+        top_k_i = int(top_k) if int(top_k) > 0 else 8
+        return [e for _, _, _, _, _, e in hits[:top_k_i]]
+
+    # ----------------------------
+    # GroundingPackService._retrieve_kb ranking
+    # ----------------------------
+    def retrieve(
+        self, prompt: str, *, limit: int, intent: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        toks_all = tokenize_normalized(prompt)
+        toks_sig_set = set(_significant_tokens(toks_all))
+        q_has_wysiati = "wysiati" in set(toks_all)
+        prompt_norm = normalize_text(prompt)
+
+        lookup = set(toks_sig_set)
+        if q_has_wysiati:
+            lookup.add("wysiati")
+
+        scored: List[Tuple[float, Dict[str, Any]]] = []
+        for it in self._candidates(
+            tokens=lookup,
+            phrase=prompt_norm,
+            include_id_title_phrase=True,
+            intent=intent,
+        ):
+            must_include = q_has_wysiati and (
+                "wysiati" in it.id_title_tokens or "wysiati" in it.content_tokens
+            )
+            id_title_hits = (
+                sum(1 for t in toks_sig_set if t in it.id_title_tokens)
+                if toks_sig_set
+                else 0
+            )
+            content_hits = (
+                sum(1 for t in toks_sig_set if t in it.content_tokens)
+                if toks_sig_set
+                else 0
+            )
+            phrase_hit = False
+            if prompt_norm:
+                phrase_hit = (
+                    prompt_norm in it.search_norm
+                    or prompt_norm in it.title_norm
+                    or prompt_norm in it.id_norm
+                )
+
+            if not (
+                must_include or phrase_hit or id_title_hits > 0 or content_hits > 0
+            ):
+                continue
+
+            # Ranking bias: prefer direct id/title token matches heavily.
+            score = 0.0
+            if must_include:
+                score += 1_000_000.0
+            if phrase_hit:
+                score += 50_000.0
+            score += float(id_title_hits) * 10_000.0
+            score += float(content_hits) * 100.0
+            score += it.priority
+
+            scored.append((score, it.entry))
+
+        scored.sort(key=lambda pair: (-pair[0], str(pair[1].get("id") or "")))
+        return [e for _, e in scored[:limit]]
+
+
+_INDEX_CACHE: "OrderedDict[Hashable, KBSearchIndex]" = OrderedDict()
+_INDEX_CACHE_LOCK = threading.Lock()
+_INDEX_CACHE_MAX = 8
+
+
+def get_kb_search_index(key: Hashable, entries: Sequence[Any]) -> KBSearchIndex:
+    """Return the index for `key` (e.g. KB content hash), building it on miss.
+
+    Small process-local LRU; callers must pass a key that changes whenever the
+    entries change.
+    """
+    with _INDEX_CACHE_LOCK:
+        idx = _INDEX_CACHE.get(key)
+        if idx is not None:
+            _INDEX_CACHE.move_to_end(key)
+            return idx
+
+    idx = KBSearchIndex(entries)
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[key] = idx
+        _INDEX_CACHE.move_to_end(key)
+        while len(_INDEX_CACHE) > _INDEX_CACHE_MAX:
+            _INDEX_CACHE.popitem(last=False)
+    return idx
+
+
+def clear_kb_search_index_cache() -> None:
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE.clear()
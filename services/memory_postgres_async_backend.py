@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.memory_postgres_backend import (
+    SQL_AUDIT_EVENT_INSERT,
+    SQL_MEMORY_ITEM_BY_KEY,
+    SQL_MEMORY_ITEM_INSERT,
+    SQL_MEMORY_ITEM_LAST_WRITE,
+    SQL_MEMORY_ITEMS_RECENT,
+    SQL_META_GET,
+    SQL_META_UPSERT_MANY,
+    SQL_SCOPE_CLEAR,
+    SQL_SCOPE_KV_DELETE,
+    SQL_SCOPE_KV_GET,
+    SQL_SCOPE_KV_UPSERT,
+    SQL_TURNS_RECENT,
+    MemoryWriteRecord,
+    PostgresBackendUnavailable,
+    _env_first,
+    _iso,
+    audit_event_params,
+    conversation_record_steps,
+    driver_connect_args,
+    memory_item_params,
+    memory_item_result,
+    memory_item_row,
+    meta_rows,
+    meta_updates_param,
+    pool_options,
+    scope_kv_params,
+    scope_kv_row,
+    turn_append_steps,
+    turn_params,
+    turn_rows,
+)
+
+
+# Async twin of PostgresMemoryBackend for request handlers: same tables, same
+# SQL and row mapping, but on SQLAlchemy's asyncio engine so a DB round-trip
+# never blocks the event loop.
+#
+# Driver: DATABASE_URL is mapped onto an async dialect. Plain postgresql:// and
+# postgresql+psycopg2:// become postgresql+psycopg:// (psycopg 3 is async
+# native); postgresql+asyncpg:// is used as-is when that driver is installed.
+# Pool sizing and prepared statements follow the MEMORY_PG_* knobs documented
+# in services/memory_postgres_backend.py.
+
+
+def async_database_url(url: str) -> str:
+    u = (url or "").strip()
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if u.startswith(prefix):
+            return "postgresql+psycopg://" + u[len(prefix) :]
+    return u
+
+
+# Async engines pool loop-bound connections: one engine per (event loop, URL),
+# keyed weakly so engines of closed test loops go away with the loop.
+_ASYNC_ENGINES: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _async_engine(url: str) -> Any:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    loop = asyncio.get_running_loop()
+    per_loop = _ASYNC_ENGINES.get(loop)
+    if per_loop is None:
+        per_loop = {}
+        _ASYNC_ENGINES[loop] = per_loop
+    eng = per_loop.get(url)
+    if eng is None:
+        eng = create_async_engine(
+            url,
+            connect_args=driver_connect_args(url),
+            **pool_options(),
+        )
+        per_loop[url] = eng
+    return eng
+
+
+class AsyncPostgresMemoryBackend:
+    """Awaitable memory-plane backend (memory items, scoped KV, conversations)."""
+
+    def __init__(self, *, database_url: Optional[str] = None) -> None:
+        self._database_url = async_database_url(
+            database_url or _env_first("DATABASE_URL")
+        )
+
+    def is_configured(self) -> bool:
+        return bool(self._database_url)
+
+    def _get_engine(self) -> Any:
+        if not self._database_url:
+            raise PostgresBackendUnavailable("DATABASE_URL is not set")
+        return _async_engine(self._database_url)
+
+    async def _run_steps(self, steps: List[Tuple[Any, Dict[str, Any]]]) -> None:
+        if not steps:
+            return
+        async with self._get_engine().begin() as conn:
+            for sql, params in steps:
+                await conn.execute(sql, params)
+
+    # ------------------------------------------------------------
+    # memory_item (memory_write.v1)
+    # ------------------------------------------------------------
+    async def upsert_memory_item(self, rec: MemoryWriteRecord) -> Dict[str, Any]:
+        async with self._get_engine().begin() as conn:
+            row = (
+                (await conn.execute(SQL_MEMORY_ITEM_INSERT, memory_item_params(rec)))
+                .mappings()
+                .first()
+            )
+            if row is None:
+                row = (
+                    (
+                        await conn.execute(
+                            SQL_MEMORY_ITEM_BY_KEY,
+                            {"idempotency_key": rec.idempotency_key},
+                        )
+                    )
+                    .mappings()
+                    .first()
+                )
+        return memory_item_result(row)
+
+    async def get_recent_memory_items(self, *, limit: int) -> List[Dict[str, Any]]:
+        if not isinstance(limit, int) or limit <= 0:
+            return []
+        async with self._get_engine().connect() as conn:
+            rows = (
+                (await conn.execute(SQL_MEMORY_ITEMS_RECENT, {"limit": int(limit)}))
+                .mappings()
+                .all()
+            )
+        return [memory_item_row(r) for r in reversed(list(rows))]
+
+    async def get_last_memory_write(self) -> Optional[str]:
+        async with self._get_engine().connect() as conn:
+            row = (await conn.execute(SQL_MEMORY_ITEM_LAST_WRITE)).mappings().first()
+        if not row:
+            return None
+        return _iso(row.get("mx"))
+
+    async def insert_audit_event(self, event: Dict[str, Any]) -> None:
+        if not isinstance(event, dict):
+            return
+        await self._run_steps([(SQL_AUDIT_EVENT_INSERT, audit_event_params(event))])
+
+    # ------------------------------------------------------------
+    # memory_scope_kv (scoped KV)
+    # ------------------------------------------------------------
+    async def get_scope_kv(
+        self, *, scope_type: str, scope_id: str, key: str
+    ) -> Optional[Dict[str, Any]]:
+        params = {"scope_type": scope_type, "scope_id": scope_id, "key": key}
+        async with self._get_engine().connect() as conn:
+            row = (await conn.execute(SQL_SCOPE_KV_GET, params)).mappings().first()
+
+        out = scope_kv_row(row)
+        if row and out is None:
+            # Best-effort cleanup of the expired key
+            try:
+                await self.delete_scope_kv(
+                    scope_type=scope_type, scope_id=scope_id, key=key
+                )
+            except Exception:
+                pass
+        return out
+
+    async def upsert_scope_kv(
+        self,
+        *,
+        scope_type: str,
+        scope_id: str,
+        key: str,
+        value: Any,
+        exp_unix: Optional[float],
+        meta: Dict[str, Any],
+    ) -> None:
+        params = scope_kv_params(
+            scope_type=scope_type,
+            scope_id=scope_id,
+            key=key,
+            value=value,
+            exp_unix=exp_unix,
+            meta=meta,
+        )
+        await self._run_steps([(SQL_SCOPE_KV_UPSERT, params)])
+
+    async def delete_scope_kv(self, *, scope_type: str, scope_id: str, key: str) -> int:
+        async with self._get_engine().begin() as conn:
+            res = await conn.execute(
+                SQL_SCOPE_KV_DELETE,
+                {"scope_type": scope_type, "scope_id": scope_id, "key": key},
+            )
+        return int(getattr(res, "rowcount", 0) or 0)
+
+    async def clear_scope(self, *, scope_type: str, scope_id: str) -> int:
+        async with self._get_engine().begin() as conn:
+            res = await conn.execute(
+                SQL_SCOPE_CLEAR, {"scope_type": scope_type, "scope_id": scope_id}
+            )
+        return int(getattr(res, "rowcount", 0) or 0)
+
+    # ------------------------------------------------------------
+    # conversation_turn / conversation_meta_kv
+    # ------------------------------------------------------------
+    async def append_conversation_turn(
+        self,
+        *,
+        conversation_id: str,
+        user_text: str,
+        assistant_text: str,
+        max_turns: int,
+    ) -> None:
+        await self._run_steps(
+            turn_append_steps(
+                turn_params(conversation_id, user_text, assistant_text),
+                max_turns=max_turns,
+            )
+        )
+
+    async def apply_conversation_records(
+        self, *, conversation_id: str, records: List[Dict[str, Any]]
+    ) -> None:
+        """Apply buffered turn/meta records in one transaction."""
+
+        await self._run_steps(conversation_record_steps(conversation_id, records or []))
+
+    async def get_conversation_turns(
+        self, *, conversation_id: str, max_turns: int
+    ) -> List[Dict[str, Any]]:
+        if not isinstance(max_turns, int) or max_turns <= 0:
+            return []
+        async with self._get_engine().connect() as conn:
+            rows = (
+                (
+                    await conn.execute(
+                        SQL_TURNS_RECENT,
+                        {
+                            "conversation_id": conversation_id,
+                            "max_turns": int(max_turns),
+                        },
+                    )
+                )
+                .mappings()
+                .all()
+            )
+        return turn_rows(rows)
+
+    async def get_conversation_state(
+        self, *, conversation_id: str, max_turns: int
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Last `max_turns` turns plus meta over a single connection."""
+
+        async with self._get_engine().connect() as conn:
+            turns: List[Dict[str, Any]] = []
+            if isinstance(max_turns, int) and max_turns > 0:
+                turns = turn_rows(
+                    (
+                        await conn.execute(
+                            SQL_TURNS_RECENT,
+                            {
+                                "conversation_id": conversation_id,
+                                "max_turns": int(max_turns),
+                            },
+                        )
+                    )
+                    .mappings()
+                    .all()
+                )
+            meta = meta_rows(
+                (await conn.execute(SQL_META_GET, {"conversation_id": conversation_id}))
+                .mappings()
+                .all()
+            )
+        return turns, meta
+
+    async def get_conversation_meta(self, *, conversation_id: str) -> Dict[str, Any]:
+        async with self._get_engine().connect() as conn:
+            rows = (
+                (await conn.execute(SQL_META_GET, {"conversation_id": conversation_id}))
+                .mappings()
+                .all()
+            )
+        return meta_rows(rows)
+
+    async def upsert_conversation_meta(
+        self, *, conversation_id: str, updates: Dict[str, Any]
+    ) -> None:
+        payload = meta_updates_param(updates)
+        if payload is None:
+            return
+        await self._run_steps(
+            [
+                (
+                    SQL_META_UPSERT_MANY,
+                    {"conversation_id": conversation_id, "updates": payload},
+                )
+            ]
+        )
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import os
 import json
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import sqlalchemy as sa
 
@@ -18,10 +19,489 @@ def _env_first(name: str) -> str:
     return (os.getenv(name) or "").strip()
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int((os.getenv(name) or "").strip() or default)
+    except Exception:
+        return int(default)
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# ============================================================
+# POOL / DRIVER TUNING (shared by the sync and async backends)
+# ============================================================
+#
+# ENV:
+#   MEMORY_PG_POOL_SIZE           (default 5)
+#   MEMORY_PG_MAX_OVERFLOW        (default 10)
+#   MEMORY_PG_POOL_TIMEOUT        (seconds, default 30)
+#   MEMORY_PG_POOL_RECYCLE        (seconds, default 1800)
+#   MEMORY_PG_POOL_PRE_PING       (default on; costs one round-trip per checkout)
+#   MEMORY_PG_PREPARE_THRESHOLD   (psycopg: server-side prepare after N runs,
+#                                  default 2, 0 disables; asyncpg: 0 disables
+#                                  its statement cache)
+#   MEMORY_PG_TURN_TRIM_EVERY     (default 8; trim conversation_turn every N
+#                                  appends per conversation, 1 = every append)
+
+
+def _pre_ping_enabled() -> bool:
+    raw = _env_first("MEMORY_PG_POOL_PRE_PING").lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def pool_options() -> Dict[str, Any]:
+    return {
+        "pool_size": max(1, _env_int("MEMORY_PG_POOL_SIZE", 5)),
+        "max_overflow": max(0, _env_int("MEMORY_PG_MAX_OVERFLOW", 10)),
+        "pool_timeout": max(1, _env_int("MEMORY_PG_POOL_TIMEOUT", 30)),
+        "pool_recycle": _env_int("MEMORY_PG_POOL_RECYCLE", 1800),
+        "pool_pre_ping": _pre_ping_enabled(),
+    }
+
+
+def driver_connect_args(url: str) -> Dict[str, Any]:
+    threshold = _env_int("MEMORY_PG_PREPARE_THRESHOLD", 2)
+    if url.startswith(("postgresql+psycopg:", "postgresql+psycopg_async:")):
+        return {"prepare_threshold": threshold if threshold > 0 else None}
+    if url.startswith("postgresql+asyncpg:"):
+        return {"prepared_statement_cache_size": 256 if threshold > 0 else 0}
+    return {}
+
+
+_ENGINES: Dict[str, sa.Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _shared_engine(url: str) -> sa.Engine:
+    """One pooled engine per DATABASE_URL for the whole process.
+
+    Callers construct PostgresMemoryBackend() per operation (conversation
+    state store, weekly memory); without sharing, every call paid for a new
+    pool and connection handshake.
+    """
+
+    with _ENGINES_LOCK:
+        eng = _ENGINES.get(url)
+        if eng is None:
+            eng = sa.create_engine(
+                url,
+                future=True,
+                connect_args=driver_connect_args(url),
+                **pool_options(),
+            )
+            _ENGINES[url] = eng
+        return eng
+
+
+# ============================================================
+# AMORTIZED TURN TRIMMING
+# ============================================================
+#
+# Readers always ask for the last N turns (ORDER BY ... LIMIT), so a few rows
+# beyond max_turns are invisible to them. The trimming DELETE therefore runs
+# every MEMORY_PG_TURN_TRIM_EVERY appends per conversation instead of on each
+# insert. max_turns <= 0 ("forget the conversation") still deletes at once.
+
+_TRIM_COUNTS: Dict[str, int] = {}
+_TRIM_LOCK = threading.Lock()
+_TRIM_COUNTS_MAX = 4096
+
+
+def should_trim_turns(conversation_id: str) -> bool:
+    every = max(1, _env_int("MEMORY_PG_TURN_TRIM_EVERY", 8))
+    if every == 1:
+        return True
+    with _TRIM_LOCK:
+        if (
+            conversation_id not in _TRIM_COUNTS
+            and len(_TRIM_COUNTS) >= _TRIM_COUNTS_MAX
+        ):
+            _TRIM_COUNTS.clear()
+        n = _TRIM_COUNTS.get(conversation_id, 0) + 1
+        _TRIM_COUNTS[conversation_id] = n
+    # The first append seen by this process trims too, so rows left behind by
+    # an earlier process never pile up.
+    return n == 1 or n % every == 0
+
+
+# ============================================================
+# SQL (compiled once; shared by the sync and async backends)
+# ============================================================
+
+SQL_MEMORY_ITEM_INSERT = sa.text(
+    """
+    INSERT INTO memory_item (
+        stored_id,
+        idempotency_key,
+        schema_version,
+        item_type,
+        item_text,
+        item_tags,
+        item_source,
+        grounded_on,
+        approval_id,
+        execution_id,
+        identity_id
+    ) VALUES (
+        :stored_id,
+        :idempotency_key,
+        'memory_write.v1',
+        :item_type,
+        :item_text,
+        CAST(:item_tags AS jsonb),
+        :item_source,
+        CAST(:grounded_on AS jsonb),
+        :approval_id,
+        :execution_id,
+        :identity_id
+    )
+    ON CONFLICT (idempotency_key)
+    DO NOTHING
+    RETURNING stored_id, created_at
+    """
+)
+
+SQL_MEMORY_ITEM_BY_KEY = sa.text(
+    """
+    SELECT stored_id, created_at
+    FROM memory_item
+    WHERE idempotency_key = :idempotency_key
+    LIMIT 1
+    """
+)
+
+SQL_MEMORY_ITEMS_RECENT = sa.text(
+    """
+    SELECT
+        stored_id,
+        idempotency_key,
+        item_type,
+        item_text,
+        item_tags,
+        item_source,
+        grounded_on,
+        approval_id,
+        execution_id,
+        identity_id,
+        created_at
+    FROM memory_item
+    ORDER BY created_at DESC
+    LIMIT :limit
+    """
+)
+
+SQL_MEMORY_ITEM_LAST_WRITE = sa.text("SELECT max(created_at) AS mx FROM memory_item")
+
+SQL_AUDIT_EVENT_INSERT = sa.text(
+    """
+    INSERT INTO memory_write_audit_event (
+        op, approval_id, execution_id, identity_id, stored_id, ok, source, payload
+    ) VALUES (
+        :op, :approval_id, :execution_id, :identity_id, :stored_id, :ok, :source, CAST(:payload AS jsonb)
+    )
+    """
+)
+
+SQL_SCOPE_KV_GET = sa.text(
+    """
+    SELECT value, ts_unix, exp_unix, meta
+    FROM memory_scope_kv
+    WHERE scope_type = :scope_type AND scope_id = :scope_id AND key = :key
+    LIMIT 1
+    """
+)
+
+SQL_SCOPE_KV_UPSERT = sa.text(
+    """
+    INSERT INTO memory_scope_kv (
+        scope_type, scope_id, key, value, ts_unix, exp_unix, meta
+    ) VALUES (
+        :scope_type, :scope_id, :key, CAST(:value AS jsonb), :ts_unix, :exp_unix, CAST(:meta AS jsonb)
+    )
+    ON CONFLICT (scope_type, scope_id, key)
+    DO UPDATE SET
+        value = excluded.value,
+        ts_unix = excluded.ts_unix,
+        exp_unix = excluded.exp_unix,
+        meta = excluded.meta
+    """
+)
+
+SQL_SCOPE_KV_DELETE = sa.text(
+    """
+    DELETE FROM memory_scope_kv
+    WHERE scope_type = :scope_type AND scope_id = :scope_id AND key = :key
+    """
+)
+
+SQL_SCOPE_CLEAR = sa.text(
+    """
+    DELETE FROM memory_scope_kv
+    WHERE scope_type = :scope_type AND scope_id = :scope_id
+    """
+)
+
+SQL_TURN_INSERT = sa.text(
+    """
+    INSERT INTO conversation_turn (conversation_id, t_unix, user_text, assistant_text)
+    VALUES (:conversation_id, :t_unix, :user_text, :assistant_text)
+    """
+)
+
+# Keep last N turns for the conversation.
+SQL_TURN_TRIM = sa.text(
+    """
+    DELETE FROM conversation_turn
+    WHERE id IN (
+        SELECT id FROM conversation_turn
+        WHERE conversation_id = :conversation_id
+        ORDER BY t_unix DESC
+        OFFSET :max_turns
+    )
+    """
+)
+
+SQL_TURN_DELETE_ALL = sa.text(
+    "DELETE FROM conversation_turn WHERE conversation_id = :conversation_id"
+)
+
+SQL_TURNS_RECENT = sa.text(
+    """
+    SELECT t_unix, user_text, assistant_text
+    FROM conversation_turn
+    WHERE conversation_id = :conversation_id
+    ORDER BY t_unix DESC
+    LIMIT :max_turns
+    """
+)
+
+SQL_META_GET = sa.text(
+    """
+    SELECT key, value
+    FROM conversation_meta_kv
+    WHERE conversation_id = :conversation_id
+    """
+)
+
+# Every key of one update in a single statement (one round-trip).
+SQL_META_UPSERT_MANY = sa.text(
+    """
+    INSERT INTO conversation_meta_kv (conversation_id, key, value, updated_at)
+    SELECT :conversation_id, e.key, e.value, now()
+    FROM jsonb_each(CAST(:updates AS jsonb)) AS e(key, value)
+    ON CONFLICT (conversation_id, key)
+    DO UPDATE SET value = excluded.value, updated_at = now()
+    """
+)
+
+
+# ============================================================
+# params / row mapping (shared by the sync and async backends)
+# ============================================================
+
+
+def _iso(ts: Any) -> Optional[str]:
+    if isinstance(ts, datetime):
+        return ts.astimezone(timezone.utc).isoformat()
+    return None
+
+
+def memory_item_params(rec: "MemoryWriteRecord") -> Dict[str, Any]:
+    return {
+        "stored_id": rec.stored_id,
+        "idempotency_key": rec.idempotency_key,
+        "item_type": rec.item_type,
+        "item_text": rec.item_text,
+        "item_tags": json.dumps(rec.item_tags),
+        "item_source": rec.item_source,
+        "grounded_on": json.dumps(rec.grounded_on),
+        "approval_id": rec.approval_id,
+        "execution_id": rec.execution_id,
+        "identity_id": rec.identity_id,
+    }
+
+
+def memory_item_row(r: Any) -> Dict[str, Any]:
+    return {
+        "stored_id": r.get("stored_id"),
+        "schema_version": "memory_write.v1",
+        "idempotency_key": r.get("idempotency_key"),
+        "item": {
+            "type": r.get("item_type"),
+            "text": r.get("item_text"),
+            "tags": list(r.get("item_tags") or []),
+            "source": r.get("item_source"),
+        },
+        "grounded_on": list(r.get("grounded_on") or []),
+        "approval_id": r.get("approval_id"),
+        "execution_id": r.get("execution_id"),
+        "identity_id": r.get("identity_id"),
+        "created_at": _iso(r.get("created_at")),
+    }
+
+
+def memory_item_result(row: Any) -> Dict[str, Any]:
+    if not row:
+        raise PostgresBackendUnavailable("memory_item upsert returned no row")
+    return {
+        "stored_id": row.get("stored_id"),
+        "created_at": _iso(row.get("created_at")) or _utc_now_iso(),
+    }
+
+
+def audit_event_params(event: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "op": (event.get("op") or "").strip() or "write",
+        "approval_id": event.get("approval_id"),
+        "execution_id": event.get("execution_id"),
+        "identity_id": event.get("identity_id"),
+        "stored_id": event.get("stored_id"),
+        "ok": bool(event.get("ok") is True),
+        "source": event.get("source"),
+        "payload": json.dumps(event.get("payload")) if "payload" in event else None,
+    }
+
+
+def scope_kv_params(
+    *,
+    scope_type: str,
+    scope_id: str,
+    key: str,
+    value: Any,
+    exp_unix: Optional[float],
+    meta: Dict[str, Any],
+) -> Dict[str, Any]:
+    return {
+        "scope_type": scope_type,
+        "scope_id": scope_id,
+        "key": key,
+        "value": json.dumps(value),
+        "ts_unix": float(time.time()),
+        "exp_unix": exp_unix,
+        "meta": json.dumps(meta or {}),
+    }
+
+
+def scope_kv_row(row: Any) -> Optional[Dict[str, Any]]:
+    """None for a missing or expired row."""
+
+    if not row:
+        return None
+    exp = row.get("exp_unix")
+    if isinstance(exp, (int, float)) and exp <= time.time():
+        return None
+    return {
+        "value": row.get("value"),
+        "ts": row.get("ts_unix"),
+        "exp": row.get("exp_unix"),
+        "meta": row.get("meta") or {},
+    }
+
+
+def turn_rows(rows: Any) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for r in reversed(list(rows)):
+        out.append(
+            {
+                "t": r.get("t_unix"),
+                "user": r.get("user_text"),
+                "assistant": r.get("assistant_text"),
+            }
+        )
+    return out
+
+
+def meta_rows(rows: Any) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for r in rows:
+        k = r.get("key")
+        if isinstance(k, str) and k.strip():
+            out[k] = r.get("value")
+    return out
+
+
+def meta_updates_param(updates: Any) -> Optional[str]:
+    """JSON object of the non-empty (stripped) keys, or None if nothing to write."""
+
+    if not isinstance(updates, dict):
+        return None
+    clean = {
+        k.strip(): v for k, v in updates.items() if isinstance(k, str) and k.strip()
+    }
+    if not clean:
+        return None
+    return json.dumps(clean)
+
+
+def turn_params(
+    conversation_id: str, user_text: str, assistant_text: str, t_unix: Any = None
+) -> Dict[str, Any]:
+    return {
+        "conversation_id": conversation_id,
+        "t_unix": float(t_unix)
+        if isinstance(t_unix, (int, float))
+        else float(time.time()),
+        "user_text": user_text,
+        "assistant_text": assistant_text,
+    }
+
+
+def conversation_record_steps(
+    conversation_id: str, records: List[Dict[str, Any]]
+) -> List[Tuple[Any, Dict[str, Any]]]:
+    """Expand buffered store records into (statement, params) steps.
+
+    Records use the ceo_conversation_state_store shape:
+    {"op": "turn", "t", "user", "assistant", "max_turns"} and
+    {"op": "meta", "updates": {...}}.
+    """
+
+    steps: List[Tuple[Any, Dict[str, Any]]] = []
+    for rec in records:
+        if not isinstance(rec, dict):
+            continue
+        if rec.get("op") == "turn":
+            steps.extend(
+                turn_append_steps(
+                    turn_params(
+                        conversation_id,
+                        str(rec.get("user") or ""),
+                        str(rec.get("assistant") or ""),
+                        rec.get("t"),
+                    ),
+                    max_turns=rec.get("max_turns"),
+                )
+            )
+        elif rec.get("op") == "meta":
+            payload = meta_updates_param(rec.get("updates"))
+            if payload is not None:
+                steps.append(
+                    (
+                        SQL_META_UPSERT_MANY,
+                        {"conversation_id": conversation_id, "updates": payload},
+                    )
+                )
+    return steps
+
+
+def turn_append_steps(
+    params: Dict[str, Any], *, max_turns: Any
+) -> List[Tuple[Any, Dict[str, Any]]]:
+    cid = params["conversation_id"]
+    steps: List[Tuple[Any, Dict[str, Any]]] = [(SQL_TURN_INSERT, params)]
+    if isinstance(max_turns, int) and max_turns > 0:
+        if should_trim_turns(cid):
+            steps.append(
+                (SQL_TURN_TRIM, {"conversation_id": cid, "max_turns": int(max_turns)})
+            )
+    else:
+        steps.append((SQL_TURN_DELETE_ALL, {"conversation_id": cid}))
+    return steps
+
+
 @dataclass(frozen=True)
 class MemoryWriteRecord:
     stored_id: str
@@ -45,6 +525,8 @@ class PostgresMemoryBackend:
     - CEO conversation turns + meta
 
     It is designed to be called from existing services via a feature flag.
+    Async request paths use AsyncPostgresMemoryBackend
+    (services/memory_postgres_async_backend.py) over the same SQL.
     """
 
     def __init__(self, *, database_url: Optional[str] = None) -> None:
@@ -58,11 +540,7 @@ class PostgresMemoryBackend:
         if not self._database_url:
             raise PostgresBackendUnavailable("DATABASE_URL is not set")
         if self._engine is None:
-            self._engine = sa.create_engine(
-                self._database_url,
-                pool_pre_ping=True,
-                future=True,
-            )
+            self._engine = _shared_engine(self._database_url)
         return self._engine
 
     # ------------------------------------------------------------
@@ -72,154 +550,43 @@ class PostgresMemoryBackend:
         """Idempotent insert by idempotency_key, returns stored_id + created_at."""
 
         eng = self._get_engine()
-
-        insert_sql = sa.text(
-            """
-            INSERT INTO memory_item (
-                stored_id,
-                idempotency_key,
-                schema_version,
-                item_type,
-                item_text,
-                item_tags,
-                item_source,
-                grounded_on,
-                approval_id,
-                execution_id,
-                identity_id
-            ) VALUES (
-                :stored_id,
-                :idempotency_key,
-                'memory_write.v1',
-                :item_type,
-                :item_text,
-                CAST(:item_tags AS jsonb),
-                :item_source,
-                CAST(:grounded_on AS jsonb),
-                :approval_id,
-                :execution_id,
-                :identity_id
-            )
-            ON CONFLICT (idempotency_key)
-            DO NOTHING
-            RETURNING stored_id, created_at
-            """
-        )
-
-        select_sql = sa.text(
-            """
-            SELECT stored_id, created_at
-            FROM memory_item
-            WHERE idempotency_key = :idempotency_key
-            LIMIT 1
-            """
-        )
-
-        params = {
-            "stored_id": rec.stored_id,
-            "idempotency_key": rec.idempotency_key,
-            "item_type": rec.item_type,
-            "item_text": rec.item_text,
-            "item_tags": json.dumps(rec.item_tags),
-            "item_source": rec.item_source,
-            "grounded_on": json.dumps(rec.grounded_on),
-            "approval_id": rec.approval_id,
-            "execution_id": rec.execution_id,
-            "identity_id": rec.identity_id,
-        }
-
         with eng.begin() as conn:
-            row = conn.execute(insert_sql, params).mappings().first()
+            row = (
+                conn.execute(SQL_MEMORY_ITEM_INSERT, memory_item_params(rec))
+                .mappings()
+                .first()
+            )
             if row is None:
                 row = (
-                    conn.execute(select_sql, {"idempotency_key": rec.idempotency_key})
+                    conn.execute(
+                        SQL_MEMORY_ITEM_BY_KEY,
+                        {"idempotency_key": rec.idempotency_key},
+                    )
                     .mappings()
                     .first()
                 )
-
-        if not row:
-            raise PostgresBackendUnavailable("memory_item upsert returned no row")
-
-        created_at = row.get("created_at")
-        if isinstance(created_at, datetime):
-            created_at_iso = created_at.astimezone(timezone.utc).isoformat()
-        else:
-            created_at_iso = _utc_now_iso()
-
-        return {
-            "stored_id": row.get("stored_id"),
-            "created_at": created_at_iso,
-        }
+        return memory_item_result(row)
 
     def get_recent_memory_items(self, *, limit: int) -> List[Dict[str, Any]]:
         if not isinstance(limit, int) or limit <= 0:
             return []
 
         eng = self._get_engine()
-        sql = sa.text(
-            """
-            SELECT
-                stored_id,
-                idempotency_key,
-                item_type,
-                item_text,
-                item_tags,
-                item_source,
-                grounded_on,
-                approval_id,
-                execution_id,
-                identity_id,
-                created_at
-            FROM memory_item
-            ORDER BY created_at DESC
-            LIMIT :limit
-            """
-        )
-
-        out: List[Dict[str, Any]] = []
         with eng.connect() as conn:
-            rows = conn.execute(sql, {"limit": int(limit)}).mappings().all()
-
-        for r in reversed(list(rows)):
-            created_at = r.get("created_at")
-            created_at_iso = (
-                created_at.astimezone(timezone.utc).isoformat()
-                if isinstance(created_at, datetime)
-                else None
-            )
-
-            out.append(
-                {
-                    "stored_id": r.get("stored_id"),
-                    "schema_version": "memory_write.v1",
-                    "idempotency_key": r.get("idempotency_key"),
-                    "item": {
-                        "type": r.get("item_type"),
-                        "text": r.get("item_text"),
-                        "tags": list(r.get("item_tags") or []),
-                        "source": r.get("item_source"),
-                    },
-                    "grounded_on": list(r.get("grounded_on") or []),
-                    "approval_id": r.get("approval_id"),
-                    "execution_id": r.get("execution_id"),
-                    "identity_id": r.get("identity_id"),
-                    "created_at": created_at_iso,
-                }
+            rows = (
+                conn.execute(SQL_MEMORY_ITEMS_RECENT, {"limit": int(limit)})
+                .mappings()
+                .all()
             )
-
-        return out
+        return [memory_item_row(r) for r in reversed(list(rows))]
 
     def get_last_memory_write(self) -> Optional[str]:
         eng = self._get_engine()
-        sql = sa.text("SELECT max(created_at) AS mx FROM memory_item")
         with eng.connect() as conn:
-            row = conn.execute(sql).mappings().first()
+            row = conn.execute(SQL_MEMORY_ITEM_LAST_WRITE).mappings().first()
         if not row:
             return None
-        mx = row.get("mx")
-        if isinstance(mx, datetime):
-            return mx.astimezone(timezone.utc).isoformat()
-        return None
+        return _iso(row.get("mx"))
 
     # ------------------------------------------------------------
     # memory_write_audit_event
@@ -229,29 +596,8 @@ class PostgresMemoryBackend:
             return
 
         eng = self._get_engine()
-        sql = sa.text(
-            """
-            INSERT INTO memory_write_audit_event (
-                op, approval_id, execution_id, identity_id, stored_id, ok, source, payload
-            ) VALUES (
-                :op, :approval_id, :execution_id, :identity_id, :stored_id, :ok, :source, CAST(:payload AS jsonb)
-            )
-            """
-        )
-
-        params = {
-            "op": (event.get("op") or "").strip() or "write",
-            "approval_id": event.get("approval_id"),
-            "execution_id": event.get("execution_id"),
-            "identity_id": event.get("identity_id"),
-            "stored_id": event.get("stored_id"),
-            "ok": bool(event.get("ok") is True),
-            "source": event.get("source"),
-            "payload": json.dumps(event.get("payload")) if "payload" in event else None,
-        }
-
         with eng.begin() as conn:
-            conn.execute(sql, params)
+            conn.execute(SQL_AUDIT_EVENT_INSERT, audit_event_params(event))
 
     # ------------------------------------------------------------
     # memory_scope_kv (scoped KV)
@@ -260,44 +606,24 @@ class PostgresMemoryBackend:
         self, *, scope_type: str, scope_id: str, key: str
     ) -> Optional[Dict[str, Any]]:
         eng = self._get_engine()
-
-        sql = sa.text(
-            """
-            SELECT value, ts_unix, exp_unix, meta
-            FROM memory_scope_kv
-            WHERE scope_type = :scope_type AND scope_id = :scope_id AND key = :key
-            LIMIT 1
-            """
-        )
-
         with eng.connect() as conn:
             row = (
                 conn.execute(
-                    sql,
+                    SQL_SCOPE_KV_GET,
                     {"scope_type": scope_type, "scope_id": scope_id, "key": key},
                 )
                 .mappings()
                 .first()
             )
 
-        if not row:
-            return None
-
-        exp = row.get("exp_unix")
-        if isinstance(exp, (int, float)) and exp <= time.time():
-            # Best-effort cleanup
+        out = scope_kv_row(row)
+        if row and out is None:
+            # Best-effort cleanup of the expired key
             try:
                 self.delete_scope_kv(scope_type=scope_type, scope_id=scope_id, key=key)
             except Exception:
                 pass
-            return None
-
-        return {
-            "value": row.get("value"),
-            "ts": row.get("ts_unix"),
-            "exp": row.get("exp_unix"),
-            "meta": row.get("meta") or {},
-        }
+        return out
 
     def upsert_scope_kv(
         self,
@@ -309,62 +635,33 @@ class PostgresMemoryBackend:
         exp_unix: Optional[float],
         meta: Dict[str, Any],
     ) -> None:
-        eng = self._get_engine()
-
-        sql = sa.text(
-            """
-            INSERT INTO memory_scope_kv (
-                scope_type, scope_id, key, value, ts_unix, exp_unix, meta
-            ) VALUES (
-                :scope_type, :scope_id, :key, CAST(:value AS jsonb), :ts_unix, :exp_unix, CAST(:meta AS jsonb)
-            )
-            ON CONFLICT (scope_type, scope_id, key)
-            DO UPDATE SET
-                value = excluded.value,
-                ts_unix = excluded.ts_unix,
-                exp_unix = excluded.exp_unix,
-                meta = excluded.meta
-            """
+        params = scope_kv_params(
+            scope_type=scope_type,
+            scope_id=scope_id,
+            key=key,
+            value=value,
+            exp_unix=exp_unix,
+            meta=meta,
         )
-
-        params = {
-            "scope_type": scope_type,
-            "scope_id": scope_id,
-            "key": key,
-            "value": json.dumps(value),
-            "ts_unix": float(time.time()),
-            "exp_unix": exp_unix,
-            "meta": json.dumps(meta or {}),
-        }
-
+        eng = self._get_engine()
         with eng.begin() as conn:
-            conn.execute(sql, params)
+            conn.execute(SQL_SCOPE_KV_UPSERT, params)
 
     def delete_scope_kv(self, *, scope_type: str, scope_id: str, key: str) -> int:
         eng = self._get_engine()
-        sql = sa.text(
-            """
-            DELETE FROM memory_scope_kv
-            WHERE scope_type = :scope_type AND scope_id = :scope_id AND key = :key
-            """
-        )
         with eng.begin() as conn:
             res = conn.execute(
-                sql,
+                SQL_SCOPE_KV_DELETE,
                 {"scope_type": scope_type, "scope_id": scope_id, "key": key},
             )
         return int(getattr(res, "rowcount", 0) or 0)
 
     def clear_scope(self, *, scope_type: str, scope_id: str) -> int:
         eng = self._get_engine()
-        sql = sa.text(
-            """
-            DELETE FROM memory_scope_kv
-            WHERE scope_type = :scope_type AND scope_id = :scope_id
-            """
-        )
         with eng.begin() as conn:
-            res = conn.execute(sql, {"scope_type": scope_type, "scope_id": scope_id})
+            res = conn.execute(
+                SQL_SCOPE_CLEAR, {"scope_type": scope_type, "scope_id": scope_id}
+            )
         return int(getattr(res, "rowcount", 0) or 0)
 
     # ------------------------------------------------------------
@@ -378,48 +675,27 @@ class PostgresMemoryBackend:
         assistant_text: str,
         max_turns: int,
     ) -> None:
-        eng = self._get_engine()
-        sql = sa.text(
-            """
-            INSERT INTO conversation_turn (conversation_id, t_unix, user_text, assistant_text)
-            VALUES (:conversation_id, :t_unix, :user_text, :assistant_text)
-            """
+        steps = turn_append_steps(
+            turn_params(conversation_id, user_text, assistant_text),
+            max_turns=max_turns,
         )
+        eng = self._get_engine()
         with eng.begin() as conn:
-            conn.execute(
-                sql,
-                {
-                    "conversation_id": conversation_id,
-                    "t_unix": float(time.time()),
-                    "user_text": user_text,
-                    "assistant_text": assistant_text,
-                },
-            )
+            for sql, params in steps:
+                conn.execute(sql, params)
 
-            if isinstance(max_turns, int) and max_turns > 0:
-                # Keep last N turns for the conversation.
-                cleanup = sa.text(
-                    """
-                    DELETE FROM conversation_turn
-                    WHERE id IN (
-                        SELECT id FROM conversation_turn
-                        WHERE conversation_id = :conversation_id
-                        ORDER BY t_unix DESC
-                        OFFSET :max_turns
-                    )
-                    """
-                )
-                conn.execute(
-                    cleanup,
-                    {"conversation_id": conversation_id, "max_turns": int(max_turns)},
-                )
-            else:
-                conn.execute(
-                    sa.text(
-                        "DELETE FROM conversation_turn WHERE conversation_id = :conversation_id"
-                    ),
-                    {"conversation_id": conversation_id},
-                )
+    def apply_conversation_records(
+        self, *, conversation_id: str, records: List[Dict[str, Any]]
+    ) -> None:
+        """Apply buffered turn/meta records in one transaction."""
+
+        steps = conversation_record_steps(conversation_id, records or [])
+        if not steps:
+            return
+        eng = self._get_engine()
+        with eng.begin() as conn:
+            for sql, params in steps:
+                conn.execute(sql, params)
 
     def get_conversation_turns(
         self, *, conversation_id: str, max_turns: int
@@ -428,87 +704,67 @@ class PostgresMemoryBackend:
             return []
 
         eng = self._get_engine()
-        sql = sa.text(
-            """
-            SELECT t_unix, user_text, assistant_text
-            FROM conversation_turn
-            WHERE conversation_id = :conversation_id
-            ORDER BY t_unix DESC
-            LIMIT :max_turns
-            """
-        )
-
         with eng.connect() as conn:
             rows = (
                 conn.execute(
-                    sql,
+                    SQL_TURNS_RECENT,
                     {"conversation_id": conversation_id, "max_turns": int(max_turns)},
                 )
                 .mappings()
                 .all()
             )
+        return turn_rows(rows)
+
+    def get_conversation_state(
+        self, *, conversation_id: str, max_turns: int
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Last `max_turns` turns plus meta over a single connection."""
 
-        out: List[Dict[str, Any]] = []
-        for r in reversed(list(rows)):
-            out.append(
-                {
-                    "t": r.get("t_unix"),
-                    "user": r.get("user_text"),
-                    "assistant": r.get("assistant_text"),
-                }
+        eng = self._get_engine()
+        with eng.connect() as conn:
+            turns: List[Dict[str, Any]] = []
+            if isinstance(max_turns, int) and max_turns > 0:
+                turns = turn_rows(
+                    conn.execute(
+                        SQL_TURNS_RECENT,
+                        {
+                            "conversation_id": conversation_id,
+                            "max_turns": int(max_turns),
+                        },
+                    )
+                    .mappings()
+                    .all()
+                )
+            meta = meta_rows(
+                conn.execute(SQL_META_GET, {"conversation_id": conversation_id})
+                .mappings()
+                .all()
             )
-        return out
+        return turns, meta
 
     # ------------------------------------------------------------
     # conversation_meta_kv
     # ------------------------------------------------------------
     def get_conversation_meta(self, *, conversation_id: str) -> Dict[str, Any]:
         eng = self._get_engine()
-        sql = sa.text(
-            """
-            SELECT key, value
-            FROM conversation_meta_kv
-            WHERE conversation_id = :conversation_id
-            """
-        )
-
         with eng.connect() as conn:
             rows = (
-                conn.execute(sql, {"conversation_id": conversation_id}).mappings().all()
+                conn.execute(SQL_META_GET, {"conversation_id": conversation_id})
+                .mappings()
+                .all()
             )
-
-        out: Dict[str, Any] = {}
-        for r in rows:
-            k = r.get("key")
-            if isinstance(k, str) and k.strip():
-                out[k] = r.get("value")
-        return out
+        return meta_rows(rows)
 
     def upsert_conversation_meta(
         self, *, conversation_id: str, updates: Dict[str, Any]
     ) -> None:
-        if not isinstance(updates, dict) or not updates:
+        payload = meta_updates_param(updates)
+        if payload is None:
             return
 
         eng = self._get_engine()
-        sql = sa.text(
-            """
-            INSERT INTO conversation_meta_kv (conversation_id, key, value, updated_at)
-            VALUES (:conversation_id, :key, CAST(:value AS jsonb), now())
-            ON CONFLICT (conversation_id, key)
-            DO UPDATE SET value = excluded.value, updated_at = now()
-            """
-        )
-
         with eng.begin() as conn:
-            for k, v in updates.items():
-                if not (isinstance(k, str) and k.strip()):
-                    continue
-                conn.execute(
-                    sql,
-                    {
-                        "conversation_id": conversation_id,
-                        "key": k.strip(),
-                        "value": json.dumps(v),
-                    },
-                )
+            conn.execute(
+                SQL_META_UPSERT_MANY,
+                {"conversation_id": conversation_id, "updates": payload},
+            )
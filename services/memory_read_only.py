@@ -40,6 +40,21 @@ class ReadOnlyMemoryService:
             default=default,
         )
 
+    async def aget(
+        self,
+        *,
+        scope_type: str,
+        scope_id: str,
+        key: str,
+        default: Any = None,
+    ) -> Any:
+        return await self._mem.aget(
+            scope_type=scope_type,
+            scope_id=scope_id,
+            key=key,
+            default=default,
+        )
+
     # ----------------------------
     # Minimal read-only export (for LLM context)
     # ----------------------------
@@ -58,22 +73,9 @@ class ReadOnlyMemoryService:
             try:
                 last_write = pg.get_last_memory_write()
                 recent = pg.get_recent_memory_items(limit=1000)
-                recent = recent if isinstance(recent, list) else []
-                items_count = len([x for x in recent if isinstance(x, dict)])
             except Exception:
                 return {}
-
-            return {
-                "schema_version": getattr(self._mem, "SCHEMA_VERSION", None),
-                # Legacy fields are intentionally empty in postgres mode unless/until
-                # they are migrated to the memory plane.
-                "decision_outcomes": [],
-                "execution_stats": {},
-                "write_audit_events": [],
-                "active_decision": None,
-                "memory_items_count": int(items_count),
-                "last_memory_write": last_write,
-            }
+            return self._pg_public_snapshot(last_write, recent)
 
         # File backend (legacy) mode: preserve existing behavior.
         try:
@@ -104,6 +106,41 @@ class ReadOnlyMemoryService:
             "last_memory_write": raw.get("last_memory_write"),
         }
 
+    async def aexport_public_snapshot(self) -> Dict[str, Any]:
+        """Awaitable export_public_snapshot (DB reads off the event loop)."""
+
+        if not self._pg_enabled():
+            return self.export_public_snapshot()
+        try:
+            last_write = await self._mem._pg_call("get_last_memory_write")
+            recent = await self._mem._pg_call("get_recent_memory_items", limit=1000)
+        except Exception:
+            return {}
+        return self._pg_public_snapshot(last_write, recent)
+
+    def _pg_enabled(self) -> bool:
+        try:
+            return bool(getattr(self._mem, "_pg_enabled", lambda: False)()) and (
+                getattr(self._mem, "_pg", None) is not None
+            )
+        except Exception:
+            return False
+
+    def _pg_public_snapshot(self, last_write: Any, recent: Any) -> Dict[str, Any]:
+        recent = recent if isinstance(recent, list) else []
+        items_count = len([x for x in recent if isinstance(x, dict)])
+        return {
+            "schema_version": getattr(self._mem, "SCHEMA_VERSION", None),
+            # Legacy fields are intentionally empty in postgres mode unless/until
+            # they are migrated to the memory plane.
+            "decision_outcomes": [],
+            "execution_stats": {},
+            "write_audit_events": [],
+            "active_decision": None,
+            "memory_items_count": int(items_count),
+            "last_memory_write": last_write,
+        }
+
     # ----------------------------
     # Canonical memory_write.v1 read helper (safe subset)
     # ----------------------------
@@ -137,6 +174,25 @@ class ReadOnlyMemoryService:
                 return []
             items0 = raw.get("memory_items")
 
+        return self._format_recent_items(items0, limit)
+
+    async def aget_recent_memory_items(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Awaitable get_recent_memory_items (DB read off the event loop)."""
+
+        if not isinstance(limit, int) or limit <= 0:
+            return []
+        if not self._pg_enabled():
+            return self.get_recent_memory_items(limit=limit)
+        try:
+            items0 = await self._mem._pg_call(
+                "get_recent_memory_items", limit=int(limit)
+            )
+        except Exception:
+            return []
+        return self._format_recent_items(items0, limit)
+
+    @staticmethod
+    def _format_recent_items(items0: Any, limit: int) -> List[Dict[str, Any]]:
         if not isinstance(items0, list) or not items0:
             return []
 
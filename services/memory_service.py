@@ -2,20 +2,169 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import os
 import threading
 import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Literal
 
+from services.json_journal import JsonJournal
+
 
 _DEFAULT_BASE_PATH = Path(__file__).resolve().parent.parent / "adnan_ai" / "memory"
 
 ScopeType = Literal["user", "session", "task", "execution"]
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int((os.getenv(name) or "").strip() or default)
+    except Exception:
+        return int(default)
+
+
+# ============================================================
+# WRITE-AHEAD LOG (MEMORY_FILE_MODE=wal)
+# ============================================================
+#
+# memory.json stays the snapshot; memory.json.wal holds one JSON line per
+# mutation: {"seq", "op": "set"|"del"|"append", "path": [...], "value", "cap"}.
+# Lines are flushed to the OS immediately and fsync'd by a group-commit
+# thread every MEMORY_WAL_FSYNC_MS (0 = fsync per write). After
+# MEMORY_WAL_COMPACT_RECORDS records the snapshot is rewritten with the last
+# folded seq ("_wal_seq") and the log truncated; on startup records with a
+# higher seq are replayed, so a crash between the two steps is harmless.
+#
+# One log per path is shared process-wide so seq stays monotonic across the
+# many MemoryService instances the app constructs.
+
+_WAL_SEQ_KEY = "_wal_seq"
+_WAL_LOGS: Dict[str, "_WalLog"] = {}
+_WAL_LOGS_LOCK = threading.Lock()
+
+
+def _apply_wal_op(memory: Dict[str, Any], rec: Dict[str, Any]) -> None:
+    path = rec.get("path")
+    if not isinstance(path, list) or not path:
+        return
+    node: Any = memory
+    for k in path[:-1]:
+        nxt = node.get(k) if isinstance(node, dict) else None
+        if not isinstance(nxt, dict):
+            nxt = {}
+            node[k] = nxt
+        node = nxt
+    last = path[-1]
+    op = rec.get("op")
+    if op == "set":
+        node[last] = rec.get("value")
+    elif op == "del":
+        node.pop(last, None)
+    elif op == "append":
+        lst = node.get(last)
+        if not isinstance(lst, list):
+            lst = []
+        lst.append(rec.get("value"))
+        cap = rec.get("cap")
+        if isinstance(cap, int) and cap > 0 and len(lst) > cap:
+            lst = lst[-cap:]
+        node[last] = lst
+
+
+class _WalLog:
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.seq = 0
+        # Snapshot writes do not stringify unknown types either; keep them
+        # failing loudly instead of replaying a str in their place.
+        self._journal = JsonJournal(path, default=None)
+        self._flusher: Optional[threading.Thread] = None
+
+    @property
+    def records(self) -> int:
+        return self._journal.records
+
+    @classmethod
+    def for_path(cls, path: Path) -> "_WalLog":
+        key = str(path)
+        with _WAL_LOGS_LOCK:
+            log = _WAL_LOGS.get(key)
+            if log is None:
+                log = cls(path)
+                _WAL_LOGS[key] = log
+            return log
+
+    def replay(self, memory: Dict[str, Any], *, after_seq: int) -> int:
+        applied = 0
+        with self.lock:
+            last = after_seq
+            for rec in self._journal.replay():
+                seq = rec.get("seq")
+                if not isinstance(seq, int) or seq <= after_seq:
+                    continue
+                _apply_wal_op(memory, rec)
+                applied += 1
+                last = max(last, seq)
+            self.seq = max(self.seq, last)
+        return applied
+
+    def append(self, ops: List[Dict[str, Any]]) -> int:
+        interval_ms = _env_int("MEMORY_WAL_FSYNC_MS", 50)
+        with self.lock:
+            recs = []
+            for op in ops:
+                self.seq += 1
+                recs.append({**op, "seq": self.seq})
+            records = self._journal.append(*recs, fsync=interval_ms <= 0)
+            if interval_ms > 0:
+                self._ensure_flusher(interval_ms)
+            return records
+
+    def sync(self) -> None:
+        with self.lock:
+            try:
+                self._journal.sync()
+            except Exception:
+                pass
+
+    def truncate(self) -> None:
+        """Caller holds self.lock and has already persisted a snapshot."""
+        self._journal.truncate()
+
+    def _ensure_flusher(self, interval_ms: int) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        ref = weakref.ref(self)
+
+        def _run() -> None:
+            while True:
+                time.sleep(interval_ms / 1000.0)
+                log = ref()
+                if log is None:
+                    return
+                log.sync()
+                del log
+
+        self._flusher = threading.Thread(
+            target=_run, name="memory-wal-fsync", daemon=True
+        )
+        self._flusher.start()
+
+
+@atexit.register
+def _sync_all_wal_logs() -> None:
+    with _WAL_LOGS_LOCK:
+        logs = list(_WAL_LOGS.values())
+    for log in logs:
+        log.sync()
+
+
 class MemoryService:
     """
     CANON (Phase 6): State/Memory SSOT API (scope-based) + backward compatible legacy API.
@@ -35,7 +184,7 @@ class MemoryService:
 
     def __init__(self):
         # NOTE (Windows deadlock root-cause): several codepaths call _save() while already
-        # holding the lock (e.g., upsert_memory_write_v1 -> _save, _purge_expired_locked -> _save).
+        # holding the lock (e.g., upsert_memory_write_v1 -> _persist -> _compact -> _save).
         # A non-reentrant Lock would deadlock; use RLock.
         self._lock = threading.RLock()
 
@@ -43,6 +192,7 @@ class MemoryService:
         # Default remains file-backed for repo compatibility.
         self._backend_kind = (os.getenv("MEMORY_BACKEND") or "file").strip().lower()
         self._pg = None
+        self._apg: Any = None  # async twin, created on first awaitable call
         if self._backend_kind == "postgres":
             try:
                 from services.memory_postgres_backend import PostgresMemoryBackend
@@ -62,6 +212,11 @@ class MemoryService:
         self.memory_file = base / "memory.json"
         self.tmp_file = base / "memory.json.tmp"
 
+        # File persistence mode: "snapshot" rewrites memory.json per mutation
+        # (legacy); "wal" appends per-mutation records and compacts in batches.
+        self._file_mode = (os.getenv("MEMORY_FILE_MODE") or "snapshot").strip().lower()
+        self._wal: Optional[_WalLog] = None
+
         self.memory = self._load()
 
         # ---- root keys ----
@@ -95,7 +250,14 @@ class MemoryService:
             if not isinstance(scopes[st], dict):
                 scopes[st] = {}
 
-        self._save()
+        if self._file_mode == "wal" and not self._pg_enabled():
+            self._wal = _WalLog.for_path(Path(str(self.memory_file) + ".wal"))
+            replayed = self._wal.replay(self.memory, after_seq=self._snapshot_seq)
+            # Crash recovery: fold replayed records into a fresh snapshot.
+            if replayed or not self.memory_file.exists():
+                self._compact()
+        else:
+            self._save()
 
         # Best-effort: if Postgres backend is enabled, seed the public snapshot fields.
         # This keeps existing ReadOnlyMemoryService snapshot surfaces working.
@@ -360,7 +522,10 @@ class MemoryService:
             }
             items.append(rec)
             self.memory["last_memory_write"] = now_iso
-            self._save()
+            self._persist(
+                {"op": "append", "path": ["memory_items"], "value": rec},
+                {"op": "set", "path": ["last_memory_write"], "value": now_iso},
+            )
 
             return {
                 "ok": True,
@@ -376,10 +541,43 @@ class MemoryService:
     def _pg_enabled(self) -> bool:
         return bool(self._backend_kind == "postgres" and self._pg is not None)
 
+    def _apg_backend(self) -> Any:
+        """Async twin of self._pg (same DATABASE_URL), or None if unavailable."""
+
+        if not self._pg_enabled():
+            return None
+        apg = self._apg
+        if apg is None:
+            try:
+                from services.memory_postgres_async_backend import (
+                    AsyncPostgresMemoryBackend,
+                )
+
+                apg = AsyncPostgresMemoryBackend(
+                    database_url=getattr(self._pg, "_database_url", None)
+                )
+            except Exception:
+                apg = False
+            self._apg = apg
+        return apg or None
+
+    async def _pg_call(self, method: str, **kwargs: Any) -> Any:
+        """Run a Postgres op without blocking the event loop.
+
+        Uses the async backend; falls back to the sync backend on a worker
+        thread when the asyncio engine is not available.
+        """
+
+        apg = self._apg_backend()
+        if apg is not None:
+            return await getattr(apg, method)(**kwargs)
+        return await asyncio.to_thread(getattr(self._pg, method), **kwargs)
+
     # ============================================================
     # INTERNALS
     # ============================================================
     def _load(self) -> Dict[str, Any]:
+        self._snapshot_seq = 0
         if not self.memory_file.exists():
             return {}
 
@@ -388,21 +586,58 @@ class MemoryService:
                 data = json.load(f)
                 if not isinstance(data, dict):
                     return {}
+                seq = data.pop(_WAL_SEQ_KEY, 0)
+                self._snapshot_seq = seq if isinstance(seq, int) else 0
                 if "schema_version" not in data:
                     data["schema_version"] = self.SCHEMA_VERSION
                 return data
         except Exception:
             return {}
 
-    def _save(self):
+    def _save(self, *, wal_seq: Optional[int] = None):
         with self._lock:
-            data = json.dumps(self.memory, indent=2, ensure_ascii=False)
+            doc = self.memory
+            if wal_seq is not None:
+                doc = {**self.memory, _WAL_SEQ_KEY: int(wal_seq)}
+            data = json.dumps(doc, indent=2, ensure_ascii=False)
             with open(self.tmp_file, "w", encoding="utf-8") as f:
                 f.write(data)
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(self.tmp_file, self.memory_file)
 
+    def _persist(self, *ops: Dict[str, Any]) -> None:
+        """Persist a mutation already applied to self.memory.
+
+        Snapshot mode rewrites memory.json; WAL mode appends `ops` (replayable
+        via _apply_wal_op) and compacts once the log grows past the threshold.
+        """
+        if self._wal is None:
+            with self._lock:
+                self._purge_all_expired_locked()
+                self._save()
+            return
+        with self._lock:
+            records = self._wal.append(list(ops))
+            if records >= max(1, _env_int("MEMORY_WAL_COMPACT_RECORDS", 1000)):
+                self._compact()
+
+    def _compact(self) -> None:
+        wal = self._wal
+        if wal is None:
+            return
+        with self._lock:
+            self._purge_all_expired_locked()
+            with wal.lock:
+                self._save(wal_seq=wal.seq)
+                self._snapshot_seq = wal.seq
+                wal.truncate()
+
+    def flush(self) -> None:
+        """Force-fsync pending WAL records (no-op in snapshot mode)."""
+        if self._wal is not None:
+            self._wal.sync()
+
     def _now(self) -> float:
         return time.time()
 
@@ -420,27 +655,23 @@ class MemoryService:
             return None
         return scope_type, scope_id.strip()
 
-    def _purge_expired_locked(self, scope_type: ScopeType, scope_id: str) -> None:
-        scopes = self.memory.get("scopes", {})
-        bucket = scopes.get(scope_type, {})
-        state = bucket.get(scope_id)
-        if not isinstance(state, dict):
-            return
-
+    def _purge_all_expired_locked(self) -> None:
+        """Drop expired scope keys in RAM (folded into the next snapshot)."""
         now = self._now()
-        expired_keys: List[str] = []
-        for k, v in state.items():
-            if not isinstance(v, dict):
+        for bucket in (self.memory.get("scopes") or {}).values():
+            if not isinstance(bucket, dict):
                 continue
-            exp = v.get("exp")
-            if isinstance(exp, (int, float)) and exp <= now:
-                expired_keys.append(k)
-
-        for k in expired_keys:
-            state.pop(k, None)
-
-        if expired_keys:
-            self._save()
+            for state in bucket.values():
+                if not isinstance(state, dict):
+                    continue
+                for k in [
+                    k
+                    for k, v in state.items()
+                    if isinstance(v, dict)
+                    and isinstance(v.get("exp"), (int, float))
+                    and v["exp"] <= now
+                ]:
+                    state.pop(k, None)
 
     # ============================================================
     # CANONICAL SCOPE API (Phase 6)
@@ -475,7 +706,6 @@ class MemoryService:
                 return default
 
         with self._lock:
-            self._purge_expired_locked(st, sid)
             scopes = self.memory["scopes"]
             bucket = scopes[st]
             state = bucket.get(sid)
@@ -484,6 +714,10 @@ class MemoryService:
             rec = state.get(key)
             if not isinstance(rec, dict):
                 return default
+            # Lazy TTL: expired keys read as missing; reads never write to disk.
+            exp = rec.get("exp")
+            if isinstance(exp, (int, float)) and exp <= self._now():
+                return default
             return rec.get("value", default)
 
     def set(
@@ -537,7 +771,7 @@ class MemoryService:
                 state = {}
                 bucket[sid] = state
             state[key] = rec
-            self._save()
+            self._persist({"op": "set", "path": ["scopes", st, sid, key], "value": rec})
         return True
 
     def delete(self, *, scope_type: str, scope_id: str, key: str) -> bool:
@@ -565,7 +799,7 @@ class MemoryService:
             existed = key in state
             state.pop(key, None)
             if existed:
-                self._save()
+                self._persist({"op": "del", "path": ["scopes", st, sid, key]})
             return existed
 
     def clear_scope(self, *, scope_type: str, scope_id: str) -> bool:
@@ -587,9 +821,109 @@ class MemoryService:
             existed = sid in bucket
             bucket.pop(sid, None)
             if existed:
-                self._save()
+                self._persist({"op": "del", "path": ["scopes", st, sid]})
             return existed
 
+    # ============================================================
+    # CANONICAL SCOPED API (awaitable)
+    # ============================================================
+    # Same semantics as get/set/delete/clear_scope. In Postgres mode the
+    # round-trip runs on the async backend; the file backend is in-process
+    # already, so it is served synchronously.
+    async def aget(
+        self,
+        *,
+        scope_type: str,
+        scope_id: str,
+        key: str,
+        default: Any = None,
+    ) -> Any:
+        if not self._pg_enabled():
+            return self.get(
+                scope_type=scope_type, scope_id=scope_id, key=key, default=default
+            )
+        norm = self._validate_scope(scope_type, scope_id)
+        if norm is None or not isinstance(key, str) or not key:
+            return default
+        st, sid = norm
+        try:
+            rec = await self._pg_call(
+                "get_scope_kv", scope_type=st, scope_id=sid, key=key
+            )
+        except Exception:
+            return default
+        if not isinstance(rec, dict):
+            return default
+        return rec.get("value", default)
+
+    async def aset(
+        self,
+        *,
+        scope_type: str,
+        scope_id: str,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        if not self._pg_enabled():
+            return self.set(
+                scope_type=scope_type,
+                scope_id=scope_id,
+                key=key,
+                value=value,
+                ttl_seconds=ttl_seconds,
+                metadata=metadata,
+            )
+        norm = self._validate_scope(scope_type, scope_id)
+        if norm is None or not isinstance(key, str) or not key:
+            return False
+        st, sid = norm
+        exp: Optional[float] = None
+        if isinstance(ttl_seconds, int) and ttl_seconds > 0:
+            exp = self._now() + float(ttl_seconds)
+        try:
+            await self._pg_call(
+                "upsert_scope_kv",
+                scope_type=st,
+                scope_id=sid,
+                key=key,
+                value=value,
+                exp_unix=exp,
+                meta=metadata or {},
+            )
+            return True
+        except Exception:
+            return False
+
+    async def adelete(self, *, scope_type: str, scope_id: str, key: str) -> bool:
+        if not self._pg_enabled():
+            return self.delete(scope_type=scope_type, scope_id=scope_id, key=key)
+        norm = self._validate_scope(scope_type, scope_id)
+        if norm is None or not isinstance(key, str) or not key:
+            return False
+        st, sid = norm
+        try:
+            n = await self._pg_call(
+                "delete_scope_kv", scope_type=st, scope_id=sid, key=key
+            )
+            return bool(n > 0)
+        except Exception:
+            return False
+
+    async def aclear_scope(self, *, scope_type: str, scope_id: str) -> bool:
+        if not self._pg_enabled():
+            return self.clear_scope(scope_type=scope_type, scope_id=scope_id)
+        norm = self._validate_scope(scope_type, scope_id)
+        if norm is None:
+            return False
+        st, sid = norm
+        try:
+            n = await self._pg_call("clear_scope", scope_type=st, scope_id=sid)
+            return bool(n >= 0)
+        except Exception:
+            return False
+
     # ============================================================
     # STM (legacy)
     # ============================================================
@@ -597,17 +931,23 @@ class MemoryService:
         if not isinstance(user_input, str) or not user_input.strip():
             return {"stored": False, "count": len(self.memory["entries"])}
 
-        self.memory["entries"].append(
-            {
-                "text": user_input,
-                "ts": self._now(),
-            }
-        )
+        entry = {
+            "text": user_input,
+            "ts": self._now(),
+        }
+        self.memory["entries"].append(entry)
 
         if len(self.memory["entries"]) > self.MAX_ENTRIES:
             self.memory["entries"] = self.memory["entries"][-self.MAX_ENTRIES :]
 
-        self._save()
+        self._persist(
+            {
+                "op": "append",
+                "path": ["entries"],
+                "value": entry,
+                "cap": self.MAX_ENTRIES,
+            }
+        )
         return {"stored": True, "count": len(self.memory["entries"])}
 
     def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -622,13 +962,12 @@ class MemoryService:
         if not isinstance(goal, dict):
             return
 
-        self.memory["goals"].append(
-            {
-                **goal,
-                "confirmed_at": self._now(),
-            }
-        )
-        self._save()
+        rec = {
+            **goal,
+            "confirmed_at": self._now(),
+        }
+        self.memory["goals"].append(rec)
+        self._persist({"op": "append", "path": ["goals"], "value": rec})
 
     # ============================================================
     # PLANS (legacy)
@@ -637,13 +976,12 @@ class MemoryService:
         if not isinstance(plan, dict):
             return
 
-        self.memory["plans"].append(
-            {
-                **plan,
-                "confirmed_at": self._now(),
-            }
-        )
-        self._save()
+        rec = {
+            **plan,
+            "confirmed_at": self._now(),
+        }
+        self.memory["plans"].append(rec)
+        self._persist({"op": "append", "path": ["plans"], "value": rec})
 
     # ============================================================
     # ACTIVE DECISION (legacy)
@@ -656,11 +994,17 @@ class MemoryService:
             "decision": decision,
             "ts": self._now(),
         }
-        self._save()
+        self._persist(
+            {
+                "op": "set",
+                "path": ["active_decision"],
+                "value": self.memory["active_decision"],
+            }
+        )
 
     def clear_active_decision(self):
         self.memory["active_decision"] = None
-        self._save()
+        self._persist({"op": "set", "path": ["active_decision"], "value": None})
 
     def get_active_decision(self) -> Optional[Dict[str, Any]]:
         return self.memory.get("active_decision")
@@ -692,6 +1036,15 @@ class MemoryService:
                 -self.MAX_DECISION_OUTCOMES :
             ]
 
+        ops: List[Dict[str, Any]] = [
+            {
+                "op": "append",
+                "path": ["decision_outcomes"],
+                "value": record,
+                "cap": self.MAX_DECISION_OUTCOMES,
+            }
+        ]
+
         if decision_type == "sop" and target:
             prev_sop = record["metadata"].get("previous_sop")
             current_sop = target
@@ -716,7 +1069,11 @@ class MemoryService:
                 if len(rel["history"]) > self.MAX_REL_HISTORY:
                     rel["history"] = rel["history"][-self.MAX_REL_HISTORY :]
 
-        self._save()
+                ops.append(
+                    {"op": "set", "path": ["cross_sop_relations", key], "value": rel}
+                )
+
+        self._persist(*ops)
 
     # ============================================================
     # WRITE AUDIT (Phase 5+)
@@ -733,7 +1090,8 @@ class MemoryService:
                 pass
 
         self.memory.setdefault("write_audit_events", [])
-        self.memory["write_audit_events"].append({**event, "ts": self._now()})
+        audit = {**event, "ts": self._now()}
+        self.memory["write_audit_events"].append(audit)
 
         if len(self.memory["write_audit_events"]) > self.MAX_WRITE_AUDIT_EVENTS:
             self.memory["write_audit_events"] = self.memory["write_audit_events"][
@@ -742,7 +1100,14 @@ class MemoryService:
 
         # In Postgres mode, do not persist audit events back to disk.
         if not self._pg_enabled():
-            self._save()
+            self._persist(
+                {
+                    "op": "append",
+                    "path": ["write_audit_events"],
+                    "value": audit,
+                    "cap": self.MAX_WRITE_AUDIT_EVENTS,
+                }
+            )
 
     # ============================================================
     # READ-ONLY ANALYTICS (legacy)
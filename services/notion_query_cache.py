@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+# ============================================================
+# NOTION QUERY CACHE (READ-THROUGH, PROCESS-WIDE)
+# ============================================================
+#
+# Shared in front of every `POST /v1/databases/{id}/query` issued by this
+# process (NotionService.query_database, notion_ops bulk query, gateway bulk
+# query SDK fallback, KBNotionStore). Key = (normalized database id,
+# canonical JSON of the query body: filter/sorts/start_cursor/page_size).
+#
+# Freshness:
+#   - our own writes bump a per-database generation (NotionService hooks
+#     every non-read request), so entries for that DB are never served again;
+#   - external edits are bounded by a short TTL.
+# Concurrent identical misses share one in-flight request (single-flight).
+#
+# ENV:
+#   NOTION_QUERY_CACHE_TTL_SECONDS   (default 20; <=0 disables the cache)
+#   NOTION_QUERY_CACHE_MAX_ENTRIES   (default 1000)
+#   NOTION_QUERY_CACHE_ENABLED       (default on; off under pytest/TESTING=1
+#                                     unless explicitly "true")
+
+_Key = Tuple[str, str]
+Fetch = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return int(raw)
+    except Exception:
+        return int(default)
+
+
+def normalize_database_id(database_id: Any) -> str:
+    """Notion accepts ids with or without dashes; cache on the bare hex form."""
+    return str(database_id or "").strip().replace("-", "").lower()
+
+
+def canonical_query_key(body: Any) -> str:
+    if not isinstance(body, dict):
+        body = {}
+    try:
+        return json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    except Exception:
+        return repr(sorted(body.items(), key=lambda kv: str(kv[0])))
+
+
+def _cache_enabled() -> bool:
+    raw = (os.getenv("NOTION_QUERY_CACHE_ENABLED") or "").strip().lower()
+    if raw in {"0", "false", "no", "off"}:
+        return False
+    if raw in {"1", "true", "yes", "on"}:
+        return True
+    # Tests swap Notion fakes/transports per case behind the same DB ids.
+    if (os.getenv("TESTING") or "").strip() == "1" or (
+        "PYTEST_CURRENT_TEST" in os.environ
+    ):
+        return False
+    return True
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    generation: int
+    value: Dict[str, Any]
+
+
+class NotionQueryCache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._global_generation = 0
+        self._inflight: Dict[Tuple[_Key, int], "asyncio.Future[Dict[str, Any]]"] = {}
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "stores": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "bypassed": 0,
+        }
+
+    # ----------------------------
+    # generations / invalidation
+    # ----------------------------
+    def _generation_locked(self, db: str) -> int:
+        return self._global_generation + self._generations.get(db, 0)
+
+    def invalidate_database(self, database_id: Any) -> None:
+        db = normalize_database_id(database_id)
+        if not db:
+            return
+        with self._lock:
+            self._generations[db] = self._generations.get(db, 0) + 1
+            for key in [k for k in self._entries if k[0] == db]:
+                del self._entries[key]
+            self._counters["invalidations"] += 1
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._global_generation += 1
+            self._entries.clear()
+            self._counters["invalidations"] += 1
+
+    # ----------------------------
+    # read-through
+    # ----------------------------
+    async def read_through(
+        self, database_id: Any, body: Any, fetch: Fetch
+    ) -> Dict[str, Any]:
+        """Serve a database query from cache, or run `fetch` once and cache it.
+
+        Callers always get their own deep copy, so mutating the result (e.g.
+        setdefault("database_id")) never leaks into the cache.
+        """
+
+        ttl = _env_int("NOTION_QUERY_CACHE_TTL_SECONDS", 20)
+        db = normalize_database_id(database_id)
+        if ttl <= 0 or not db or not _cache_enabled():
+            with self._lock:
+                self._counters["bypassed"] += 1
+            return await fetch()
+
+        key = (db, canonical_query_key(body))
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        with self._lock:
+            gen = self._generation_locked(db)
+            ent = self._entries.get(key)
+            if ent is not None and ent.expires_at > now and ent.generation == gen:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return copy.deepcopy(ent.value)
+            if ent is not None:
+                del self._entries[key]
+
+            shared = self._inflight.get((key, gen))
+            if shared is not None and shared.get_loop() is loop and not shared.done():
+                self._counters["coalesced"] += 1
+            else:
+                shared = None
+                fut: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+                self._inflight[(key, gen)] = fut
+                self._counters["misses"] += 1
+
+        if shared is not None:
+            try:
+                return copy.deepcopy(await asyncio.shield(shared))
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+            return await self.read_through(database_id, body, fetch)
+
+        try:
+            value = await fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop((key, gen), None)
+            if isinstance(e, Exception):
+                fut.set_exception(e)
+                fut.exception()  # mark retrieved when nobody else is waiting
+            else:
+                fut.cancel()
+            raise
+
+        with self._lock:
+            self._inflight.pop((key, gen), None)
+            # A write that landed while we were fetching bumped the generation:
+            # hand the result to this caller but do not cache it.
+            if isinstance(value, dict) and self._generation_locked(db) == gen:
+                self._entries[key] = _Entry(
+                    expires_at=time.monotonic() + float(ttl),
+                    generation=gen,
+                    value=copy.deepcopy(value),
+                )
+                self._entries.move_to_end(key)
+                self._counters["stores"] += 1
+                cap = max(1, _env_int("NOTION_QUERY_CACHE_MAX_ENTRIES", 1000))
+                while len(self._entries) > cap:
+                    self._entries.popitem(last=False)
+                    self._counters["evictions"] += 1
+        fut.set_result(value)
+        return value
+
+    # ----------------------------
+    # ops
+    # ----------------------------
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._counters)
+            out["calls_saved"] = out["hits"] + out["coalesced"]
+            out["entries"] = len(self._entries)
+            out["inflight"] = len(self._inflight)
+            return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._global_generation += 1
+            self._entries.clear()
+            self._inflight.clear()
+
+
+_NOTION_QUERY_CACHE = NotionQueryCache()
+
+
+def get_notion_query_cache() -> NotionQueryCache:
+    return _NOTION_QUERY_CACHE
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+
+# ============================================================
+# NOTION RATE LIMITER (TRANSPORT LAYER FOR NotionService._safe_request)
+# ============================================================
+#
+# Notion allows an average of ~3 requests/second per integration token and
+# answers bursts with HTTP 429 + Retry-After. The limiter below is shared by
+# every NotionService instance that uses the same token (process-wide), and is
+# loop-agnostic: state is guarded by a threading.Lock and waits use
+# asyncio.sleep on whichever loop is calling.
+#
+# NOTE: uses time.perf_counter (not time.monotonic) so tests that patch the
+# budget clock in services.notion_service are not affected by limiter reads.
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return float(raw)
+    except Exception:
+        return float(default)
+
+
+# 5xx answers worth retrying for idempotent reads.
+NOTION_TRANSIENT_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return int(raw)
+    except Exception:
+        return int(default)
+
+
+class NotionThrottleWaitExceeded(RuntimeError):
+    """Raised when the limiter wait would not fit the caller's latency window."""
+
+    def __init__(self, *, wait_ms: int, remaining_ms: int) -> None:
+        super().__init__("notion_throttle_wait_exceeded")
+        self.wait_ms = int(wait_ms)
+        self.remaining_ms = int(remaining_ms)
+
+
+@dataclass(frozen=True)
+class NotionRetryPolicy:
+    max_retries: int
+    backoff_base_s: float
+    backoff_max_s: float
+
+    @classmethod
+    def from_env(cls) -> "NotionRetryPolicy":
+        return cls(
+            max_retries=max(0, _env_int("NOTION_MAX_RETRIES", 3)),
+            backoff_base_s=max(0.0, _env_float("NOTION_RETRY_BACKOFF_BASE_MS", 500))
+            / 1000.0,
+            backoff_max_s=max(0.0, _env_float("NOTION_RETRY_BACKOFF_MAX_MS", 8000))
+            / 1000.0,
+        )
+
+    def backoff_s(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for attempt N (0-based)."""
+        cap = min(self.backoff_max_s, self.backoff_base_s * (2 ** max(0, attempt)))
+        return random.uniform(0.0, cap) if cap > 0 else 0.0
+
+    def retry_delay_s(
+        self,
+        *,
+        attempt: int,
+        retry_after_s: Optional[float],
+        allowed: bool,
+        budget_state: Any = None,
+    ) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to stop retrying.
+
+        Stops when retries are not allowed, exhausted, the active
+        notion_budget_context (`budget_state`) has no calls left, or the wait
+        would blow its latency window (the caller then surfaces the real HTTP
+        error).
+        """
+        if not allowed or attempt >= self.max_retries:
+            return None
+        if budget_state is not None and not budget_state.has_calls_left():
+            return None
+
+        if retry_after_s is not None:
+            delay = retry_after_s + random.uniform(0.0, 0.25)
+        else:
+            delay = self.backoff_s(attempt)
+
+        if budget_state is not None:
+            remaining_ms = budget_state.remaining_ms()
+            if remaining_ms is not None and delay * 1000.0 >= remaining_ms:
+                return None
+        return delay
+
+
+def parse_retry_after_s(value: Any) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if value is None:
+        return None
+    s = str(value).strip()
+    if not s:
+        return None
+    try:
+        return max(0.0, float(s))
+    except Exception:
+        pass
+    try:
+        dt = parsedate_to_datetime(s)
+    except Exception:
+        return None
+    if dt is None:
+        return None
+    return max(0.0, dt.timestamp() - time.time())
+
+
+class NotionRateLimiter:
+    """Token bucket + adaptive in-flight limit for one Notion token.
+
+    - Token bucket: `rate_per_s` refill, `burst` capacity. Callers reserve a
+      token up front and sleep for the reservation delay (fair, FIFO-ish).
+    - Cooldown: a 429 Retry-After pauses the whole bucket, so concurrent callers
+      sharing the token back off together instead of stampeding.
+    - Adaptive in-flight limit (AIMD): halved on 429, +1 after a streak of
+      successes, bounded by [1, max_in_flight].
+    """
+
+    _IN_FLIGHT_POLL_S = 0.02
+
+    def __init__(
+        self,
+        *,
+        rate_per_s: float,
+        burst: int,
+        max_in_flight: int,
+        increase_after: int = 20,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.rate_per_s = float(rate_per_s)
+        self.burst = max(1, int(burst))
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.increase_after = max(1, int(increase_after))
+        # Injectable for deterministic tests (bucket math only; waits still
+        # go through asyncio.sleep).
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last_refill = self._clock()
+        self._blocked_until = 0.0
+
+        self._in_flight = 0
+        self._in_flight_limit = self.max_in_flight
+        self._success_streak = 0
+
+        self._counters: Dict[str, float] = {
+            "requests": 0,
+            "retries": 0,
+            "throttled_429": 0,
+            "transient_errors": 0,
+            "retry_after_honored": 0,
+            "limit_decreases": 0,
+            "limit_increases": 0,
+            "throttle_wait_ms": 0.0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate_per_s > 0
+
+    # ----------------------------
+    # token bucket
+    # ----------------------------
+    def _refill_locked(self, now: float) -> None:
+        elapsed = max(0.0, now - self._last_refill)
+        self._last_refill = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate_per_s)
+
+    def reserve(self) -> float:
+        """Reserve one request slot; returns seconds the caller must wait."""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._refill_locked(now)
+            self._tokens -= 1.0
+            wait = 0.0
+            if self._tokens < 0:
+                wait = -self._tokens / self.rate_per_s
+            if self._blocked_until > now:
+                wait = max(wait, self._blocked_until - now)
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Block every caller sharing this token for `seconds` (Retry-After)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            until = self._clock() + float(seconds)
+            if until > self._blocked_until:
+                self._blocked_until = until
+
+    # ----------------------------
+    # in-flight limit
+    # ----------------------------
+    def _try_enter(self) -> bool:
+        with self._lock:
+            if self._in_flight < self._in_flight_limit:
+                self._in_flight += 1
+                self._counters["requests"] += 1
+                return True
+            return False
+
+    def _refund(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._tokens = min(float(self.burst), self._tokens + 1.0)
+
+    async def acquire(
+        self, *, remaining_s: Optional[Callable[[], Optional[float]]] = None
+    ) -> float:
+        """Wait for a bucket token and an in-flight slot; returns waited seconds.
+
+        `remaining_s` is consulted lazily (only when a wait is needed) and bounds
+        the total wait; when the wait cannot fit, the reserved token is refunded
+        and NotionThrottleWaitExceeded is raised before any time is spent.
+        """
+
+        def _check(wait_s: float) -> None:
+            if remaining_s is None:
+                return
+            left = remaining_s()
+            if left is not None and wait_s > left:
+                raise NotionThrottleWaitExceeded(
+                    wait_ms=int(wait_s * 1000), remaining_ms=int(left * 1000)
+                )
+
+        waited = 0.0
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                _check(delay)
+            except NotionThrottleWaitExceeded:
+                self._refund()
+                raise
+            await asyncio.sleep(delay)
+            waited += delay
+        while not self._try_enter():
+            _check(self._IN_FLIGHT_POLL_S)
+            await asyncio.sleep(self._IN_FLIGHT_POLL_S)
+            waited += self._IN_FLIGHT_POLL_S
+        if waited > 0:
+            with self._lock:
+                self._counters["throttle_wait_ms"] += waited * 1000.0
+        return waited
+
+    def release(self) -> None:
+        with self._lock:
+            if self._in_flight > 0:
+                self._in_flight -= 1
+
+    # ----------------------------
+    # feedback
+    # ----------------------------
+    def record_success(self) -> None:
+        with self._lock:
+            self._success_streak += 1
+            if (
+                self._success_streak >= self.increase_after
+                and self._in_flight_limit < self.max_in_flight
+            ):
+                self._in_flight_limit += 1
+                self._success_streak = 0
+                self._counters["limit_increases"] += 1
+
+    def record_throttled(self, *, retry_after_s: Optional[float]) -> None:
+        with self._lock:
+            self._counters["throttled_429"] += 1
+            self._success_streak = 0
+            new_limit = max(1, self._in_flight_limit // 2)
+            if new_limit < self._in_flight_limit:
+                self._in_flight_limit = new_limit
+                self._counters["limit_decreases"] += 1
+            if retry_after_s is not None:
+                self._counters["retry_after_honored"] += 1
+        if retry_after_s is not None:
+            self.pause(retry_after_s)
+
+    def record_transient_error(self) -> None:
+        with self._lock:
+            self._counters["transient_errors"] += 1
+            self._success_streak = 0
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._counters["retries"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            self._refill_locked(now)
+            out: Dict[str, Any] = {k: int(v) for k, v in self._counters.items()}
+            out.update(
+                {
+                    "rate_per_s": self.rate_per_s,
+                    "burst": self.burst,
+                    "tokens_available": round(max(0.0, self._tokens), 2),
+                    "in_flight": self._in_flight,
+                    "in_flight_limit": self._in_flight_limit,
+                    "max_in_flight": self.max_in_flight,
+                    "cooldown_ms": int(max(0.0, self._blocked_until - now) * 1000),
+                }
+            )
+            return out
+
+
+_LIMITERS: Dict[str, NotionRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+
+
+def get_rate_limiter_for_token(token: str) -> NotionRateLimiter:
+    """Process-wide limiter per Notion token (NotionService instances share it).
+
+    ENV:
+      NOTION_RATE_LIMIT_RPS      (default 3; <=0 disables the bucket)
+      NOTION_RATE_LIMIT_BURST    (default 3)
+      NOTION_MAX_IN_FLIGHT       (default 3)
+    """
+    key = _token_key(token)
+    with _LIMITERS_LOCK:
+        lim = _LIMITERS.get(key)
+        if lim is None:
+            lim = NotionRateLimiter(
+                rate_per_s=_env_float("NOTION_RATE_LIMIT_RPS", 3.0),
+                burst=_env_int("NOTION_RATE_LIMIT_BURST", 3),
+                max_in_flight=_env_int("NOTION_MAX_IN_FLIGHT", 3),
+            )
+            _LIMITERS[key] = lim
+        return lim
+
+
+def reset_rate_limiters_for_tests() -> None:
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlencode
 
 from services.notion_service import (
     NotionBudgetExceeded,
     NotionService,
+    current_notion_budget,
     env_int,
     get_notion_service,
     notion_budget_context,
@@ -16,6 +21,56 @@ PageObj = Dict[str, Any]
 BlockObj = Dict[str, Any]
 DatabaseObj = Dict[str, Any]
 
+# Block tree fetch knobs (render_page_to_markdown):
+#   NOTION_BLOCK_FETCH_CONCURRENCY   parallel children fetches per level (default 3)
+#   NOTION_PAGE_MAX_BLOCKS           total blocks per page render (default 1500)
+#   NOTION_PAGE_FETCH_BUDGET_MS      wall-clock budget for nested levels (default 3000)
+#   NOTION_PAGE_MARKDOWN_CACHE_MAX   rendered pages kept per process (default 256)
+#   NOTION_PAGE_MARKDOWN_CACHE_TTL_S max age of a cached render (default 300, 0 = off)
+_MAX_BLOCK_DEPTH = 5
+_CHILD_BLOCKS_MAX = 500
+
+# (page_id, last_edited_time) -> (stored_at, markdown). Only complete renders
+# are cached. The key alone can go stale: Notion reports last_edited_time at
+# minute granularity, and edits inside child pages/synced blocks do not bump
+# the parent page. Entries therefore also expire after the TTL, which bounds
+# how long such an edit can be hidden.
+_MARKDOWN_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+_MARKDOWN_CACHE_LOCK = threading.Lock()
+_cache_clock = time.monotonic
+
+
+def _markdown_cache_get(key: Tuple[str, str]) -> Optional[str]:
+    ttl_s = max(0, env_int("NOTION_PAGE_MARKDOWN_CACHE_TTL_S", 300))
+    with _MARKDOWN_CACHE_LOCK:
+        hit = _MARKDOWN_CACHE.get(key)
+        if hit is None:
+            return None
+        stored_at, md = hit
+        if ttl_s and _cache_clock() - stored_at >= ttl_s:
+            del _MARKDOWN_CACHE[key]
+            return None
+        _MARKDOWN_CACHE.move_to_end(key)
+        return md
+
+
+def _markdown_cache_put(key: Tuple[str, str], md: str) -> None:
+    cap = max(0, env_int("NOTION_PAGE_MARKDOWN_CACHE_MAX", 256))
+    if cap <= 0:
+        return
+    with _MARKDOWN_CACHE_LOCK:
+        # Older edits of the same page can never be served again.
+        for k in [k for k in _MARKDOWN_CACHE if k[0] == key[0]]:
+            del _MARKDOWN_CACHE[k]
+        _MARKDOWN_CACHE[key] = (_cache_clock(), md)
+        while len(_MARKDOWN_CACHE) > cap:
+            _MARKDOWN_CACHE.popitem(last=False)
+
+
+def clear_page_markdown_cache() -> None:
+    with _MARKDOWN_CACHE_LOCK:
+        _MARKDOWN_CACHE.clear()
+
 
 @dataclass(frozen=True)
 class ReadPageResult:
@@ -143,22 +198,32 @@ class NotionReadService:
           - paragraph
           - bulleted_list_item
         + mali broj praktičnih dodataka (divider, to_do, numbered) uz fallback.
+
+        Rezultat se kešira po (page_id, last_edited_time); isti SOP/KB page
+        se ne čita ponovo dok se ne izmijeni, najduže
+        NOTION_PAGE_MARKDOWN_CACHE_TTL_S sekundi.
         """
         page_id = page.get("id") if isinstance(page, dict) else None
         if not page_id or not isinstance(page_id, str):
             return ""
 
-        # Page content
-        blocks = await self._list_all_child_blocks(block_id=page_id, max_blocks=1500)
+        edited = page.get("last_edited_time")
+        cache_key = (page_id, edited) if isinstance(edited, str) and edited else None
+        if cache_key is not None:
+            cached = _markdown_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        blocks, children_by_id, complete = await self._fetch_block_tree(page_id)
 
         lines: List[str] = []
         for block in blocks:
-            rendered_lines = await self._render_block_recursive(block, depth=0)
-            if rendered_lines:
-                lines.extend(rendered_lines)
+            lines.extend(self._render_block_tree(block, children_by_id, depth=0))
 
-        md = "\n".join(lines).strip()
-        return self._normalize_markdown(md)
+        md = self._normalize_markdown("\n".join(lines).strip())
+        if cache_key is not None and complete:
+            _markdown_cache_put(cache_key, md)
+        return md
 
     async def read_page_as_markdown(self, query: str) -> Dict[str, str]:
         """
@@ -289,29 +354,106 @@ class NotionReadService:
 
         return out[:max_blocks_i]
 
-    async def _render_block_recursive(
-        self, block: BlockObj, *, depth: int
-    ) -> List[str]:
+    async def _fetch_block_tree(
+        self, page_id: str
+    ) -> Tuple[List[BlockObj], Dict[str, List[BlockObj]], bool]:
         """
-        Render block and optionally its children (for has_children).
-        Depth-limited to avoid runaway recursion.
+        Breadth-first, level-parallel block tree fetch.
+
+        Returns (top-level blocks, block_id -> children, complete). All
+        has_children blocks of one level are fetched concurrently (bounded by
+        NOTION_BLOCK_FETCH_CONCURRENCY) instead of one round-trip at a time.
+        Nested levels stop early - rendering what was fetched, complete=False -
+        when the total block cap, the local time budget or the enclosing
+        notion_budget_context (calls/latency) runs out.
         """
+        max_blocks = max(1, env_int("NOTION_PAGE_MAX_BLOCKS", 1500))
+        budget_ms = env_int("NOTION_PAGE_FETCH_BUDGET_MS", 3000)
+        deadline = time.monotonic() + budget_ms / 1000.0 if budget_ms > 0 else None
+        sem = asyncio.Semaphore(max(1, env_int("NOTION_BLOCK_FETCH_CONCURRENCY", 3)))
+
+        # The page's own children are required: budget errors propagate.
+        top = await self._list_all_child_blocks(block_id=page_id, max_blocks=max_blocks)
+        total = len(top)
+        children_by_id: Dict[str, List[BlockObj]] = {}
+        complete = True
+
+        level = top
+        for _ in range(_MAX_BLOCK_DEPTH):
+            parents = [
+                b["id"]
+                for b in level
+                if b.get("has_children") and isinstance(b.get("id"), str) and b["id"]
+            ]
+            if not parents:
+                break
+
+            budget = current_notion_budget()
+            room = max_blocks - total
+            out_of_time = deadline is not None and time.monotonic() >= deadline
+            if budget is not None:
+                remaining_ms = budget.remaining_ms()
+                out_of_time = out_of_time or (
+                    remaining_ms is not None and remaining_ms <= 0
+                )
+                if budget.max_calls is not None and budget.max_calls >= 0:
+                    parents_cap = max(0, int(budget.max_calls) - budget.calls)
+                    if parents_cap < len(parents):
+                        complete = False
+                        parents = parents[:parents_cap]
+            if room <= 0 or out_of_time or not parents:
+                complete = False
+                break
+
+            per_parent = min(_CHILD_BLOCKS_MAX, room)
+
+            async def _fetch(block_id: str) -> List[BlockObj]:
+                async with sem:
+                    return await self._list_all_child_blocks(
+                        block_id=block_id, max_blocks=per_parent
+                    )
+
+            fetched = await asyncio.gather(
+                *[_fetch(bid) for bid in parents], return_exceptions=True
+            )
+
+            next_level: List[BlockObj] = []
+            for bid, res in zip(parents, fetched):
+                if isinstance(res, BaseException):
+                    if not isinstance(res, Exception):
+                        raise res  # cancellation
+                    # NotionBudgetExceeded / transport error on a nested level:
+                    # a partial render beats no render.
+                    complete = False
+                    continue
+                res = res[: max(0, max_blocks - total)]
+                if not res:
+                    continue
+                total += len(res)
+                children_by_id[bid] = res
+                next_level.extend(res)
+            level = next_level
+
+        return top, children_by_id, complete
+
+    def _render_block_tree(
+        self,
+        block: BlockObj,
+        children_by_id: Dict[str, List[BlockObj]],
+        *,
+        depth: int,
+    ) -> List[str]:
+        """Render block and its already-fetched children (depth-first order)."""
         if not isinstance(block, dict):
             return []
 
         lines = self._render_block(block, depth=depth)
-
-        has_children = bool(block.get("has_children"))
         block_id = block.get("id")
-        if has_children and isinstance(block_id, str) and block_id and depth < 5:
-            children = await self._list_all_child_blocks(
-                block_id=block_id, max_blocks=500
-            )
-            for ch in children:
-                child_lines = await self._render_block_recursive(ch, depth=depth + 1)
-                if child_lines:
-                    lines.extend(child_lines)
-
+        if isinstance(block_id, str):
+            for ch in children_by_id.get(block_id) or []:
+                lines.extend(
+                    self._render_block_tree(ch, children_by_id, depth=depth + 1)
+                )
         return lines
 
     def _render_block(self, block: BlockObj, *, depth: int) -> List[str]:
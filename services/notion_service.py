@@ -16,6 +16,14 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from models.ai_command import AICommand
+from services.notion_query_cache import get_notion_query_cache
+from services.notion_rate_limiter import (
+    NOTION_TRANSIENT_STATUS_CODES,
+    NotionRetryPolicy,
+    NotionThrottleWaitExceeded,
+    get_rate_limiter_for_token,
+    parse_retry_after_s,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +149,34 @@ class _NotionBudgetState:
                 kind="max_latency_ms", detail=self.exceeded_detail
             )
 
+    def remaining_ms(self) -> Optional[float]:
+        """Milliseconds left in the latency window (None when unbounded)."""
+        if self.max_latency_ms is None or self.max_latency_ms < 0:
+            return None
+        elapsed_ms = (time.monotonic() - self.started_at) * 1000.0
+        return max(0.0, float(self.max_latency_ms) - elapsed_ms)
+
+    def remaining_s(self) -> Optional[float]:
+        ms = self.remaining_ms()
+        return None if ms is None else ms / 1000.0
+
+    def has_calls_left(self) -> bool:
+        if self.max_calls is None or self.max_calls < 0:
+            return True
+        return self.calls < int(self.max_calls)
+
+    def fail_throttle_wait(self, exc: NotionThrottleWaitExceeded) -> None:
+        self.exceeded = True
+        self.exceeded_kind = "max_latency_ms"
+        self.exceeded_detail = {
+            "throttle_wait_ms": exc.wait_ms,
+            "remaining_ms": exc.remaining_ms,
+            "limit_ms": int(self.max_latency_ms or 0),
+        }
+        raise NotionBudgetExceeded(
+            kind="max_latency_ms", detail=self.exceeded_detail
+        ) from exc
+
     def check_and_consume_call(self) -> None:
         # Latency check first (if we've already blown the window, do not spend a call).
         self._check_deadline_only()
@@ -169,6 +205,11 @@ _NOTION_BUDGET_STATE: contextvars.ContextVar[Optional[_NotionBudgetState]] = (
 )
 
 
+def current_notion_budget() -> Optional[_NotionBudgetState]:
+    """Budget of the enclosing notion_budget_context (None when unbounded)."""
+    return _NOTION_BUDGET_STATE.get()
+
+
 def env_int(name: str, default: int) -> int:
     raw = (os.getenv(name) or "").strip()
     try:
@@ -599,6 +640,10 @@ class NotionService:
             # Never break boot
             pass
 
+        # Transport: per-token rate limiter (shared process-wide) + retry policy.
+        self._rate_limiter = get_rate_limiter_for_token(api_key)
+        self._retry_policy = NotionRetryPolicy.from_env()
+
         # Schema cache (db_id -> schema)
         self._db_schema_cache: Dict[str, _DbSchemaCacheEntry] = {}
         self._db_schema_ttl_seconds = int(
@@ -627,6 +672,10 @@ class NotionService:
             self._users_cache_fetched_at = 0.0
         except Exception:
             pass
+        try:
+            get_notion_query_cache().clear()
+        except Exception:
+            pass
 
     @staticmethod
     def _discover_all_db_keys_from_env() -> Dict[str, str]:
@@ -729,6 +778,8 @@ class NotionService:
         return {
             "clients_by_loop": len(self._clients_by_loop),
             "current_loop_id": cur_loop_id,
+            "transport": self._rate_limiter.stats(),
+            "query_cache": get_notion_query_cache().stats(),
         }
 
     async def aclose_current_loop(self) -> None:
@@ -862,6 +913,79 @@ class NotionService:
     # ----------------------------
     # http wrapper
     # ----------------------------
+    _TRANSIENT_STATUS_CODES = NOTION_TRANSIENT_STATUS_CODES
+    _READ_POST_PATH_RE = re.compile(r"/v1/(search|databases/[^/]+/query)/?$")
+
+    @classmethod
+    def _is_idempotent_read(cls, method: str, url: str) -> bool:
+        """GETs plus Notion's read-only POST endpoints (db query, search)."""
+        m = (method or "").strip().upper()
+        if m == "GET":
+            return True
+        if m == "POST":
+            path = (url or "").split("?", 1)[0]
+            return bool(cls._READ_POST_PATH_RE.search(path))
+        return False
+
+    @staticmethod
+    def _response_header(resp: Any, name: str) -> Optional[str]:
+        headers = getattr(resp, "headers", None)
+        if headers is None:
+            return None
+        try:
+            v = headers.get(name)
+        except Exception:
+            return None
+        return v if isinstance(v, str) else None
+
+    def _retry_delay_s(
+        self,
+        *,
+        attempt: int,
+        retry_after_s: Optional[float],
+        allowed: bool,
+        budget_state: Optional[_NotionBudgetState],
+    ) -> Optional[float]:
+        return self._retry_policy.retry_delay_s(
+            attempt=attempt,
+            retry_after_s=retry_after_s,
+            allowed=allowed,
+            budget_state=budget_state,
+        )
+
+    async def _sleep_before_retry(self, delay_s: float) -> None:
+        self._rate_limiter.record_retry()
+        if delay_s > 0:
+            await asyncio.sleep(delay_s)
+
+    _DB_PATH_RE = re.compile(r"/v1/databases/([^/]+)/?$")
+
+    @classmethod
+    def _invalidate_query_cache_for_write(
+        cls, url: str, payload: Any, res: Any
+    ) -> None:
+        """Drop cached database queries a write may have changed.
+
+        Runs whether or not the write succeeded (a timed-out write may still
+        have landed). Block/comment writes do not change query results.
+        """
+        cache = get_notion_query_cache()
+        path = (url or "").split("?", 1)[0]
+        m = cls._DB_PATH_RE.search(path)
+        if m:
+            cache.invalidate_database(m.group(1))
+            return
+        if "/v1/pages" not in path:
+            return
+        for src in (payload, res):
+            parent = src.get("parent") if isinstance(src, dict) else None
+            db_id = parent.get("database_id") if isinstance(parent, dict) else None
+            if isinstance(db_id, str) and db_id.strip():
+                cache.invalidate_database(db_id)
+                return
+        # Page update/archive whose parent we could not see.
+        cache.invalidate_all()
+
     async def _safe_request(
         self,
         method: str,
@@ -869,6 +993,27 @@ class NotionService:
         *,
         payload: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if self._is_idempotent_read(method, url):
+            return await self._send_request(method, url, payload=payload, params=params)
+
+        res: Optional[Dict[str, Any]] = None
+        try:
+            res = await self._send_request(method, url, payload=payload, params=params)
+            return res
+        finally:
+            try:
+                self._invalidate_query_cache_for_write(url, payload, res)
+            except Exception:
+                pass
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        payload: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         # Optional safe wire-debug: proves the token source/shape (masked) before requests.
         # Enable temporarily by setting NOTION_DEBUG_AUTH=true.
@@ -951,20 +1096,96 @@ class NotionService:
         client = await self._get_client()
 
         budget_state = _NOTION_BUDGET_STATE.get()
-        if budget_state is not None:
-            budget_state.check_and_consume_call()
+        limiter = self._rate_limiter
+        retryable_read = self._is_idempotent_read(method, url)
 
-        try:
-            resp = await client.request(
-                method,
-                url,
-                params=params,
-                json=payload,
-            )
-        except Exception as exc:
-            raise RuntimeError(
-                f"Notion request failed: {type(exc).__name__}: {exc}"
-            ) from exc
+        attempt = 0
+        last_error: Optional[RuntimeError] = None
+        while True:
+            # Every attempt (including retries) spends one call from the budget.
+            if budget_state is not None:
+                budget_state.check_and_consume_call()
+
+            try:
+                await limiter.acquire(
+                    remaining_s=(
+                        budget_state.remaining_s if budget_state is not None else None
+                    )
+                )
+            except NotionThrottleWaitExceeded as exc:
+                # Retries surface the real HTTP error instead of a budget error.
+                if last_error is not None:
+                    raise last_error from exc
+                assert budget_state is not None
+                budget_state.fail_throttle_wait(exc)
+
+            try:
+                resp = await client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=payload,
+                )
+            except Exception as exc:
+                request_exc: Optional[Exception] = exc
+            else:
+                request_exc = None
+            finally:
+                # Always return the in-flight slot (also on CancelledError).
+                limiter.release()
+
+            if request_exc is not None:
+                transient = isinstance(request_exc, httpx.TransportError)
+                if transient:
+                    limiter.record_transient_error()
+                delay = self._retry_delay_s(
+                    attempt=attempt,
+                    retry_after_s=None,
+                    allowed=transient and retryable_read,
+                    budget_state=budget_state,
+                )
+                err = RuntimeError(
+                    f"Notion request failed: {type(request_exc).__name__}: {request_exc}"
+                )
+                if delay is None:
+                    raise err from request_exc
+                last_error = err
+                await self._sleep_before_retry(delay)
+                attempt += 1
+                continue
+
+            status = int(resp.status_code)
+            if status == 429:
+                # Notion does not apply throttled requests, so 429 is safe to
+                # retry for writes too (after Retry-After).
+                retry_after_s = parse_retry_after_s(
+                    self._response_header(resp, "Retry-After")
+                )
+                limiter.record_throttled(retry_after_s=retry_after_s)
+                delay = self._retry_delay_s(
+                    attempt=attempt,
+                    retry_after_s=retry_after_s,
+                    allowed=True,
+                    budget_state=budget_state,
+                )
+            elif status in self._TRANSIENT_STATUS_CODES:
+                limiter.record_transient_error()
+                delay = self._retry_delay_s(
+                    attempt=attempt,
+                    retry_after_s=None,
+                    allowed=retryable_read,
+                    budget_state=budget_state,
+                )
+            else:
+                if status < 400:
+                    limiter.record_success()
+                delay = None
+
+            if delay is None:
+                break
+            last_error = RuntimeError(f"Notion HTTP {status}: {resp.text or ''}")
+            await self._sleep_before_retry(delay)
+            attempt += 1
 
         # IMPORTANT: do not let budget deadline checks mask definitive HTTP errors
         # (e.g., 401/403). Budget checks still apply for successful responses.
@@ -980,6 +1201,7 @@ class NotionService:
             try:
                 setattr(exc, "notion_token_source", self._token_source_name())
                 setattr(exc, "notion_token_tail4", self._token_tail4())
+                setattr(exc, "notion_attempts", attempt + 1)
             except Exception:
                 pass
             raise exc
@@ -1795,6 +2017,7 @@ class NotionService:
         *,
         db_keys: Optional[List[str]] = None,
         max_items_by_db: Optional[Dict[str, int]] = None,
+        incremental: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """Build a lightweight, UI-safe knowledge snapshot from Notion.
 
@@ -1804,6 +2027,15 @@ class NotionService:
         - Returns wrapper compatible with KnowledgeSnapshotService.update_snapshot:
             {"payload": {"goals": [], "tasks": [], "projects": [], "last_sync": ...},
              "meta": {"ok": bool, "synced_at": ... , "errors": [...]}}
+
+        Incremental mode (incremental=True, or NOTION_SNAPSHOT_INCREMENTAL=true):
+        - each DB keeps the N most recently edited rows plus a last_edited_time
+          high-water mark in payload["databases"][db_key]
+        - later refreshes query only rows edited on/after that mark and merge
+          them into the current KnowledgeSnapshotService payload by page id
+        - a full sweep (detects deletions/archival) runs every
+          NOTION_SNAPSHOT_FULL_SWEEP_S seconds, on delta overflow, or when the
+          previous section is missing/failed/built with other limits
         """
 
         def _title_prop_for_db_cached(db_id: str) -> str:
@@ -2239,12 +2471,18 @@ class NotionService:
                 return {}, False
 
         async def _query_all_pages(
-            *, db_key: str, page_size: int = 50, max_items: int = 200
+            *,
+            db_key: str,
+            page_size: int = 50,
+            max_items: int = 200,
+            query_extra: Optional[Dict[str, Any]] = None,
         ) -> List[Dict[str, Any]]:
             out: List[Dict[str, Any]] = []
             cursor: Optional[str] = None
             while True:
                 q: Dict[str, Any] = {"page_size": int(page_size)}
+                if query_extra:
+                    q.update(query_extra)
                 if cursor:
                     q["start_cursor"] = cursor
 
@@ -2264,6 +2502,98 @@ class NotionService:
                     continue
                 return out
 
+        def _page_to_item(
+            db_key: str, p: Dict[str, Any], title_prop: str
+        ) -> Dict[str, Any]:
+            pid = _ensure_str(p.get("id"))
+            title = self._extract_page_title(p, title_prop)
+            # Robust fallback: if schema/title_prop mismatch or title empty,
+            # try any title-typed property present on the page.
+            if not title:
+                props = p.get("properties")
+                if isinstance(props, dict):
+                    for prop_name, prop in props.items():
+                        if (
+                            isinstance(prop_name, str)
+                            and isinstance(prop, dict)
+                            and prop.get("type") == "title"
+                        ):
+                            t2 = self._extract_page_title(p, prop_name)
+                            if t2:
+                                title = t2
+                                break
+            url = _ensure_str(p.get("url"))
+            last_edited_time = _ensure_str(p.get("last_edited_time"))
+            created_time = _ensure_str(p.get("created_time"))
+
+            try:
+                fields, truncated = _extract_allowlisted_fields(db_key, p)
+            except Exception:
+                fields, truncated = {}, False
+            return {
+                "id": pid.replace("-", "") if pid else pid,
+                "notion_id": pid,
+                "title": title,
+                "url": url,
+                "created_time": created_time,
+                "last_edited_time": last_edited_time,
+                "fields": fields,
+                "truncated": bool(truncated),
+            }
+
+        def _recent_first(
+            items0: List[Dict[str, Any]], cap: int
+        ) -> List[Dict[str, Any]]:
+            items0.sort(
+                key=lambda it: (
+                    _ensure_str(it.get("last_edited_time")),
+                    _ensure_str(it.get("id")),
+                ),
+                reverse=True,
+            )
+            return items0[:cap]
+
+        incremental_on = (
+            bool(incremental)
+            if incremental is not None
+            else (os.getenv("NOTION_SNAPSHOT_INCREMENTAL") or "").strip().lower()
+            == "true"
+        )
+        full_sweep_s = env_int("NOTION_SNAPSHOT_FULL_SWEEP_S", 900)
+        prev_databases: Dict[str, Any] = {}
+        if incremental_on:
+            try:
+                from services.knowledge_snapshot_service import (  # noqa: PLC0415
+                    KnowledgeSnapshotService,
+                )
+
+                prev_databases = _ensure_dict(
+                    KnowledgeSnapshotService.get_payload().get("databases")
+                )
+            except Exception:
+                prev_databases = {}
+
+        def _delta_base(
+            db_key: str, db_id: str, max_items: int
+        ) -> Optional[Dict[str, Any]]:
+            """Previous section usable as a delta base, else None (full sweep)."""
+            prev = prev_databases.get(db_key)
+            if not isinstance(prev, dict) or prev.get("last_error"):
+                return None
+            if prev.get("db_id") != db_id or prev.get("max_items") != max_items:
+                return None
+            if not _ensure_str(prev.get("high_water_mark")):
+                return None
+            if not isinstance(prev.get("items"), list):
+                return None
+            try:
+                swept = datetime.fromisoformat(_ensure_str(prev.get("full_sweep_at")))
+                if (datetime.utcnow() - swept).total_seconds() >= full_sweep_s:
+                    return None
+            except Exception:
+                return None
+            return prev
+
         synced_at = _utc_iso()
         payload: Dict[str, Any] = {
             "goals": [],
@@ -2432,49 +2762,69 @@ class NotionService:
                         max_items_i = int(MAX_ITEMS_PER_DB)
 
                     page_size = min(50, max_items_i)
-                    pages = await _query_all_pages(
-                        db_key=db_key, page_size=page_size, max_items=max_items_i
+                    sync_mode = "full"
+                    delta_count: Optional[int] = None
+                    base = (
+                        _delta_base(db_key, db_id, max_items_i)
+                        if incremental_on
+                        else None
                     )
-
                     items: List[Dict[str, Any]] = []
-                    for p in pages:
-                        pid = _ensure_str(p.get("id"))
-                        title = self._extract_page_title(p, title_prop)
-                        # Robust fallback: if schema/title_prop mismatch or title empty,
-                        # try any title-typed property present on the page.
-                        if not title:
-                            props = p.get("properties")
-                            if isinstance(props, dict):
-                                for prop_name, prop in props.items():
-                                    if (
-                                        isinstance(prop_name, str)
-                                        and isinstance(prop, dict)
-                                        and prop.get("type") == "title"
-                                    ):
-                                        t2 = self._extract_page_title(p, prop_name)
-                                        if t2:
-                                            title = t2
-                                            break
-                        url = _ensure_str(p.get("url"))
-                        last_edited_time = _ensure_str(p.get("last_edited_time"))
-                        created_time = _ensure_str(p.get("created_time"))
-
-                        try:
-                            fields, truncated = _extract_allowlisted_fields(db_key, p)
-                        except Exception:
-                            fields, truncated = {}, False
-                        items.append(
-                            {
-                                "id": pid.replace("-", "") if pid else pid,
-                                "notion_id": pid,
-                                "title": title,
-                                "url": url,
-                                "created_time": created_time,
-                                "last_edited_time": last_edited_time,
-                                "fields": fields,
-                                "truncated": bool(truncated),
-                            }
+                    if base is not None:
+                        # One extra row detects overflow (too many changes to
+                        # merge safely within the cap) -> fall back to full sweep.
+                        changed = await _query_all_pages(
+                            db_key=db_key,
+                            page_size=page_size,
+                            max_items=max_items_i + 1,
+                            query_extra={
+                                "filter": {
+                                    "timestamp": "last_edited_time",
+                                    "last_edited_time": {
+                                        "on_or_after": base["high_water_mark"]
+                                    },
+                                },
+                                "sorts": [
+                                    {
+                                        "timestamp": "last_edited_time",
+                                        "direction": "ascending",
+                                    }
+                                ],
+                            },
                         )
+                        if len(changed) <= max_items_i:
+                            by_id: Dict[str, Dict[str, Any]] = {}
+                            for it in base["items"]:
+                                if isinstance(it, dict) and it.get("id"):
+                                    by_id[str(it["id"])] = it
+                            for p in changed:
+                                it = _page_to_item(db_key, p, title_prop)
+                                by_id[str(it.get("id") or "")] = it
+                            items = _recent_first(list(by_id.values()), max_items_i)
+                            sync_mode = "delta"
+                            delta_count = len(changed)
+
+                    if sync_mode == "full":
+                        pages = await _query_all_pages(
+                            db_key=db_key,
+                            page_size=page_size,
+                            max_items=max_items_i,
+                            query_extra=(
+                                {
+                                    "sorts": [
+                                        {
+                                            "timestamp": "last_edited_time",
+                                            "direction": "descending",
+                                        }
+                                    ]
+                                }
+                                if incremental_on
+                                else None
+                            ),
+                        )
+                        items = [_page_to_item(db_key, p, title_prop) for p in pages]
+                        if incremental_on:
+                            items = _recent_first(items, max_items_i)
 
                     payload[db_key] = items
                     db_stats[db_key] = {
@@ -2497,6 +2847,29 @@ class NotionService:
                         "last_refreshed_at": synced_at,
                         "last_error": None,
                     }
+                    if incremental_on:
+                        db_stats[db_key]["sync_mode"] = sync_mode
+                        if delta_count is not None:
+                            db_stats[db_key]["delta_count"] = int(delta_count)
+                        databases[db_key].update(
+                            {
+                                "sync_mode": sync_mode,
+                                "max_items": int(max_items_i),
+                                "high_water_mark": max(
+                                    (
+                                        _ensure_str(it.get("last_edited_time"))
+                                        for it in items
+                                    ),
+                                    default="",
+                                )
+                                or None,
+                                "full_sweep_at": (
+                                    base.get("full_sweep_at")
+                                    if sync_mode == "delta" and base is not None
+                                    else synced_at
+                                ),
+                            }
+                        )
                 except NotionBudgetExceeded as exc:
                     meta["ok"] = False
                     meta["budget"]["exceeded"] = True
@@ -2602,7 +2975,12 @@ class NotionService:
         db_id = self._resolve_db_id(db_key)
         url = f"{self.NOTION_BASE_URL}/databases/{db_id}/query"
         payload = query if isinstance(query, dict) else {}
-        res = await self._safe_request("POST", url, payload=payload)
+        # Shared read-through cache (invalidated by our own writes, short TTL).
+        res = await get_notion_query_cache().read_through(
+            db_id,
+            payload,
+            lambda: self._safe_request("POST", url, payload=payload),
+        )
         res.setdefault("database_id", db_id)
         return res
 
@@ -2657,6 +3035,9 @@ class NotionService:
             }
 
         items = res.get("results") if isinstance(res, dict) else None
+        return self._pick_page_by_title(t, items)
+
+    def _pick_page_by_title(self, t: str, items: Any) -> Dict[str, Any]:
         if not isinstance(items, list) or not items:
             return {"ok": False, "page_id": None, "reason": "not_found"}
 
@@ -2689,6 +3070,82 @@ class NotionService:
             "reason": f"ambiguous:{names_preview}" if names_preview else "ambiguous",
         }
 
+    async def _resolve_page_ids_by_titles_best_effort(
+        self, *, db_key: str, titles: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Resolve many titles with one OR-filter query (per 100 titles).
+
+        Each title gets the same selection rules as
+        _resolve_page_id_by_title_best_effort (case-insensitive "contains",
+        exact match preferred, ambiguous otherwise). Titles still unresolved
+        when the combined result was truncated fall back to a single lookup.
+        """
+        uniq = sorted({(t or "").strip() for t in titles if (t or "").strip()})
+        if len(uniq) <= 1:
+            return {
+                t: await self._resolve_page_id_by_title_best_effort(
+                    db_key=db_key, title=t
+                )
+                for t in uniq
+            }
+
+        out: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(uniq), 100):
+            chunk = uniq[start : start + 100]
+            pages: List[Dict[str, Any]] = []
+            truncated = False
+            cursor: Optional[str] = None
+            try:
+                for _ in range(5):
+                    q: Dict[str, Any] = {
+                        "page_size": 100,
+                        "filter": {
+                            "or": [
+                                {"property": "Name", "title": {"contains": t}}
+                                for t in chunk
+                            ]
+                        },
+                    }
+                    if cursor:
+                        q["start_cursor"] = cursor
+                    res = await self.query_database(db_key=db_key, query=q)
+                    batch = res.get("results") if isinstance(res, dict) else None
+                    if isinstance(batch, list):
+                        pages.extend(p for p in batch if isinstance(p, dict))
+                    nxt = res.get("next_cursor") if isinstance(res, dict) else None
+                    truncated = bool(
+                        isinstance(res, dict)
+                        and res.get("has_more") is True
+                        and isinstance(nxt, str)
+                        and nxt.strip()
+                    )
+                    if not truncated:
+                        break
+                    cursor = _ensure_str(nxt)
+            except Exception as exc:  # noqa: BLE001
+                for t in chunk:
+                    out[t] = {
+                        "ok": False,
+                        "page_id": None,
+                        "reason": f"query_failed:{exc}",
+                    }
+                continue
+
+            for t in chunk:
+                needle = t.casefold()
+                matches = [
+                    p
+                    for p in pages
+                    if needle in self._extract_page_title(p, "Name").casefold()
+                ]
+                rr = self._pick_page_by_title(t, matches)
+                if rr.get("ok") is not True and truncated:
+                    rr = await self._resolve_page_id_by_title_best_effort(
+                        db_key=db_key, title=t
+                    )
+                out[t] = rr
+        return out
+
     async def execute(self, ai_command: Any) -> Dict[str, Any]:
         """
         Canonical executor entrypoint called by NotionOpsAgent / Orchestrator.
@@ -2837,10 +3294,11 @@ class NotionService:
                     goal_titles.add(gt)
 
             goal_title_to_id: Dict[str, str] = {}
+            resolved_titles = await self._resolve_page_ids_by_titles_best_effort(
+                db_key="goals", titles=sorted(goal_titles)
+            )
             for gt in sorted(goal_titles):
-                rr = await self._resolve_page_id_by_title_best_effort(
-                    db_key="goals", title=gt
-                )
+                rr = resolved_titles.get(gt) or {}
                 if rr.get("ok") is True and _ensure_str(rr.get("page_id")):
                     goal_title_to_id[gt] = _ensure_str(rr.get("page_id"))
                 else:
@@ -2874,7 +3332,6 @@ class NotionService:
         wrapper_patch = wrapper_patch if isinstance(wrapper_patch, dict) else None
 
         ref_map: Dict[str, str] = {}
-        results: List[Dict[str, Any]] = []
 
         def _parse_structured_error(exc: Exception) -> Dict[str, Any]:
             """Best-effort extraction of structured error fields.
@@ -2982,35 +3439,44 @@ class NotionService:
                 pass
             return out
 
-        def _resolve_refs(v: Any) -> Any:
+        _ref_re = re.compile(r"^\$(?P<id>[A-Za-z0-9_\-]+)(?P<rest>.*)$")
+
+        def _ref_keys(v: Any) -> List[str]:
+            if isinstance(v, str) and v.startswith("$") and len(v) > 1:
+                m = _ref_re.match(v)
+                return [m.group("id")] if m else []
+            if isinstance(v, list):
+                return [k for x in v for k in _ref_keys(x)]
+            if isinstance(v, dict):
+                return [k for x in v.values() for k in _ref_keys(x)]
+            return []
+
+        def _resolve_refs(v: Any, refs: Dict[str, str]) -> Any:
             if isinstance(v, str) and v.startswith("$") and len(v) > 1:
                 # Support "$op_id" as well as strings that start with "$op_id...".
-                m = re.match(r"^\$(?P<id>[A-Za-z0-9_\-]+)(?P<rest>.*)$", v)
+                m = _ref_re.match(v)
                 if not m:
                     return v
                 key = m.group("id")
                 rest = m.group("rest") or ""
-                resolved = ref_map.get(key)
+                resolved = refs.get(key)
                 if not resolved:
                     return v
                 return f"{resolved}{rest}"
             if isinstance(v, list):
-                return [_resolve_refs(x) for x in v]
+                return [_resolve_refs(x, refs) for x in v]
             if isinstance(v, dict):
-                return {k: _resolve_refs(x) for k, x in v.items()}
+                return {k: _resolve_refs(x, refs) for k, x in v.items()}
             return v
 
-        for idx, op in enumerate(operations):
+        async def _run_op(idx: int, op: Any) -> Dict[str, Any]:
             if not isinstance(op, dict):
-                results.append(
-                    {
-                        "index": idx,
-                        "ok": False,
-                        "reason": "invalid_operation_shape",
-                        "detail": "operation must be an object",
-                    }
-                )
-                continue
+                return {
+                    "index": idx,
+                    "ok": False,
+                    "reason": "invalid_operation_shape",
+                    "detail": "operation must be an object",
+                }
 
             op_id = _ensure_str(op.get("op_id"))
             op_intent = _ensure_str(op.get("intent"))
@@ -3020,7 +3486,12 @@ class NotionService:
             if not isinstance(op_params, dict):
                 op_params = op.get("params")
             op_params = _ensure_dict(op_params)
-            op_params = _resolve_refs(op_params)
+            op_refs = {
+                key: page_id_by_idx[dep_idx]
+                for key, dep_idx in deps_by_idx[idx].items()
+                if dep_idx in page_id_by_idx
+            }
+            op_params = _resolve_refs(op_params, op_refs)
 
             # Propagate wrapper_patch to sub-operations so create_* can apply schema-backed fills.
             if (
@@ -3031,15 +3502,12 @@ class NotionService:
                 op_params["wrapper_patch"] = wrapper_patch
 
             if not op_intent:
-                results.append(
-                    {
-                        "index": idx,
-                        "op_id": op_id or None,
-                        "ok": False,
-                        "reason": "missing_intent",
-                    }
-                )
-                continue
+                return {
+                    "index": idx,
+                    "op_id": op_id or None,
+                    "ok": False,
+                    "reason": "missing_intent",
+                }
 
             try:
                 sub_exec_id = f"{execution_id}:{idx}" if execution_id else ""
@@ -3057,7 +3525,8 @@ class NotionService:
                         "batch_op_id": op_id or None,
                     },
                 )
-                sub_res = await self.execute(sub)
+                async with sem:
+                    sub_res = await self.execute(sub)
 
                 # capture created ids for reference resolution
                 page_id = ""
@@ -3067,21 +3536,19 @@ class NotionService:
                     if isinstance(r, dict):
                         page_id = _ensure_str(r.get("page_id") or r.get("id") or "")
                         page_url = _ensure_str(r.get("url") or "")
-                if op_id and page_id:
-                    ref_map[op_id] = page_id
-
-                results.append(
-                    {
-                        "index": idx,
-                        "op_id": op_id or None,
-                        "client_ref": op_id or None,
-                        "intent": op_intent,
-                        "ok": True,
-                        "page_id": page_id or None,
-                        "url": page_url or None,
-                        "result": sub_res,
-                    }
-                )
+                if page_id:
+                    page_id_by_idx[idx] = page_id
+
+                return {
+                    "index": idx,
+                    "op_id": op_id or None,
+                    "client_ref": op_id or None,
+                    "intent": op_intent,
+                    "ok": True,
+                    "page_id": page_id or None,
+                    "url": page_url or None,
+                    "result": sub_res,
+                }
             except Exception as exc:  # noqa: BLE001
                 err = _parse_structured_error(exc)
 
@@ -3134,21 +3601,78 @@ class NotionService:
                 except Exception:
                     reason = str(exc)
 
-                results.append(
-                    {
-                        "index": idx,
-                        "op_id": op_id or None,
-                        "client_ref": op_id or None,
-                        "intent": op_intent,
-                        "ok": False,
-                        "reason": reason,
-                        "error_type": exc.__class__.__name__,
-                        "status_code": err.get("status_code")
-                        if isinstance(err, dict)
-                        else None,
-                        "error": err,
-                    }
-                )
+                return {
+                    "index": idx,
+                    "op_id": op_id or None,
+                    "client_ref": op_id or None,
+                    "intent": op_intent,
+                    "ok": False,
+                    "reason": reason,
+                    "error_type": exc.__class__.__name__,
+                    "status_code": err.get("status_code")
+                    if isinstance(err, dict)
+                    else None,
+                    "error": err,
+                }
+
+        # Dependency DAG: an op waits only for earlier ops whose "$<op_id>" it
+        # references (same resolution rule as sequential execution: the latest
+        # earlier op with that op_id). Ops that link by title at execution time
+        # may target a page created earlier in the batch, so they wait for all
+        # earlier ops. Independent ops run concurrently under
+        # NOTION_BATCH_CONCURRENCY; results keep the input order.
+        title_link_keys = {
+            "goal_title": "goal_id",
+            "parent_goal_title": "parent_goal_id",
+            "project_title": "project_id",
+            "primary_goal_title": "primary_goal_id",
+        }
+        deps_by_idx: Dict[int, Dict[str, int]] = {}
+        last_idx_by_op_id: Dict[str, int] = {}
+        for idx, op in enumerate(operations):
+            deps: Dict[str, int] = {}
+            if isinstance(op, dict):
+                op_params_d = op.get("payload")
+                if not isinstance(op_params_d, dict):
+                    op_params_d = op.get("params")
+                op_params_d = _ensure_dict(op_params_d)
+                for key in _ref_keys(op_params_d):
+                    if key in last_idx_by_op_id:
+                        deps[key] = last_idx_by_op_id[key]
+                if any(
+                    _ensure_str(op_params_d.get(tk))
+                    and not _ensure_str(op_params_d.get(ik))
+                    for tk, ik in title_link_keys.items()
+                ):
+                    # "#<n>" never matches a "$<op_id>" ref, so it only orders.
+                    deps.update({f"#{j}": j for j in range(idx)})
+                op_id_d = _ensure_str(op.get("op_id"))
+                if op_id_d:
+                    last_idx_by_op_id[op_id_d] = idx
+            deps_by_idx[idx] = deps
+
+        sem = asyncio.Semaphore(max(1, env_int("NOTION_BATCH_CONCURRENCY", 4)))
+        done = [asyncio.Event() for _ in operations]
+        page_id_by_idx: Dict[int, str] = {}
+
+        async def _run_when_ready(idx: int, op: Any) -> Dict[str, Any]:
+            try:
+                for dep_idx in deps_by_idx[idx].values():
+                    await done[dep_idx].wait()
+                return await _run_op(idx, op)
+            finally:
+                done[idx].set()
+
+        results: List[Dict[str, Any]] = list(
+            await asyncio.gather(
+                *[_run_when_ready(idx, op) for idx, op in enumerate(operations)]
+            )
+        )
+        for r in results:
+            op_id_r = _ensure_str(r.get("op_id"))
+            page_id_r = page_id_by_idx.get(int(r.get("index")))
+            if op_id_r and page_id_r:
+                ref_map[op_id_r] = page_id_r
 
         ok_all = all(
             (isinstance(r, dict) and r.get("ok") is True) for r in results
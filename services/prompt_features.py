@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+# Turn-level prompt analysis shared by the intent/meta-question predicates in
+# services/ceo_advisor_agent.py, routers/chat_router.py, gateway/gateway_server.py
+# and IntentClassifier.
+#
+# Every predicate used to re-strip, re-lowercase and re-run its own regex list
+# on the same prompt, and the chat path calls many of them (several more than
+# once) per turn. Here:
+#   - normalized views of the prompt (stripped / lower / casefold / BHS-ascii)
+#     are computed once;
+#   - patterns and keyword sets are registered and compiled at import time,
+#     deduplicated across modules (same view + spec -> same feature);
+#   - each feature is evaluated at most once per prompt and memoized.
+# analyze_prompt(text) returns the same PromptFeatures object for repeated
+# calls with the same text (small FIFO cache), so all predicates of a turn share it.
+#
+# Feature semantics are exactly those of the original checks:
+#   pattern  -> bool(re.search(pattern, view))  (or re.fullmatch)
+#   keywords -> any(needle in view for needle in needles)
+# A list of alternatives registered as one pattern is compiled into a single
+# alternation regex, which matches iff any alternative matches.
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int((os.getenv(name) or "").strip() or default)
+    except Exception:
+        return int(default)
+
+
+def _bhs_ascii(lowered: str) -> str:
+    return (
+        lowered.replace("č", "c")
+        .replace("ć", "c")
+        .replace("š", "s")
+        .replace("đ", "dj")
+        .replace("ž", "z")
+    )
+
+
+# view name -> builder(features) -> str
+_VIEWS: Dict[str, Callable[["PromptFeatures"], str]] = {
+    "stripped": lambda pf: (pf.raw or "").strip(),
+    "lower": lambda pf: pf.view("stripped").lower(),
+    "casefold": lambda pf: pf.view("stripped").casefold(),
+    "bhs": lambda pf: _bhs_ascii(pf.view("lower")),
+}
+
+
+class PromptFeature:
+    """A registered check on one view of the prompt."""
+
+    __slots__ = ("key", "view", "_test")
+
+    def __init__(self, key: Tuple[Any, ...], view: str, test: Callable[[str], bool]):
+        self.key = key
+        self.view = view
+        self._test = test
+
+    def __repr__(self) -> str:
+        return f"PromptFeature({self.key!r})"
+
+
+_REGISTRY: Dict[Tuple[Any, ...], PromptFeature] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _register(
+    key: Tuple[Any, ...], view: str, make: Callable[[], Callable[[str], bool]]
+) -> PromptFeature:
+    feat = _REGISTRY.get(key)
+    if feat is not None:
+        return feat
+    if view not in _VIEWS:
+        raise ValueError(f"unknown prompt view: {view}")
+    with _REGISTRY_LOCK:
+        feat = _REGISTRY.get(key)
+        if feat is None:
+            feat = PromptFeature(key, view, make())
+            _REGISTRY[key] = feat
+        return feat
+
+
+def prompt_pattern(
+    pattern: Any, *, view: str = "lower", fullmatch: bool = False
+) -> PromptFeature:
+    """Register a regex (or a list of alternatives) evaluated on `view`."""
+
+    if isinstance(pattern, (list, tuple)):
+        spec: Any = tuple(pattern)
+        source = (
+            "|".join(
+                f"(?i:{p[4:]})" if p.startswith("(?i)") else f"(?:{p})" for p in spec
+            )
+            or r"(?!)"
+        )
+    else:
+        spec = source = pattern
+    mode = "fullmatch" if fullmatch else "search"
+
+    def _make() -> Callable[[str], bool]:
+        rx = re.compile(source)
+        if fullmatch:
+            return lambda t: rx.fullmatch(t) is not None
+        return lambda t: rx.search(t) is not None
+
+    return _register(("re", mode, view, spec), view, _make)
+
+
+def prompt_keywords(needles: Iterable[str], *, view: str = "lower") -> PromptFeature:
+    """Register a substring set: true when any needle occurs in `view`."""
+
+    spec = tuple(needles)
+    return _register(
+        ("kw", view, spec), view, lambda: (lambda t: any(s in t for s in spec))
+    )
+
+
+class PromptFeatures:
+    """Memoized views and feature flags for one prompt."""
+
+    __slots__ = ("raw", "_views", "_flags")
+
+    def __init__(self, raw: Any) -> None:
+        self.raw = raw
+        self._views: Dict[str, str] = {}
+        self._flags: Dict[PromptFeature, bool] = {}
+
+    def view(self, name: str) -> str:
+        v = self._views.get(name)
+        if v is None:
+            v = _VIEWS[name](self)
+            self._views[name] = v
+        return v
+
+    @property
+    def stripped(self) -> str:
+        return self.view("stripped")
+
+    @property
+    def lower(self) -> str:
+        return self.view("lower")
+
+    @property
+    def casefold(self) -> str:
+        return self.view("casefold")
+
+    @property
+    def bhs(self) -> str:
+        return self.view("bhs")
+
+    def has(self, feature: PromptFeature) -> bool:
+        hit = self._flags.get(feature)
+        if hit is None:
+            hit = bool(feature._test(self.view(feature.view)))
+            self._flags[feature] = hit
+        return hit
+
+    def stats(self) -> Dict[str, int]:
+        return {"views": len(self._views), "features_evaluated": len(self._flags)}
+
+
+_CACHE_SIZE = max(0, _env_int("PROMPT_FEATURES_CACHE_SIZE", 64))
+# Insertion-ordered (FIFO) cache; a turn touches its prompt right after
+# creating it, so recency tracking would only add lock traffic on hits.
+_CACHE: "OrderedDict[str, PromptFeatures]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def analyze_prompt(text: Optional[str]) -> PromptFeatures:
+    """Shared PromptFeatures for `text` (same object for repeated calls)."""
+
+    if not isinstance(text, str) or _CACHE_SIZE <= 0:
+        return PromptFeatures(text)
+    pf = _CACHE.get(text)
+    if pf is not None:
+        return pf
+    with _CACHE_LOCK:
+        pf = _CACHE.get(text)
+        if pf is not None:
+            return pf
+        pf = PromptFeatures(text)
+        _CACHE[text] = pf
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+        return pf
+
+
+def reset_prompt_features_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+
+# Route-level hook for the Block 2 chat response contract.
+#
+# The gateway's ResponseContractMiddleware (pure ASGI) opens a turn for each
+# chat POST and hands it the sanitizer. The chat route records the inputs it
+# has already parsed (prompt, session/conversation ids) and returns
+# ContractJSONResponse, which sanitizes the response dict right before its
+# first (and only) JSON encoding. No request body re-read, no response
+# drain/re-parse/re-encode.
+#
+# Without an open turn (router mounted outside the gateway, unit tests) the
+# hook is a no-op, exactly like the app without the middleware.
+
+Enforcer = Callable[..., Dict[str, Any]]
+
+_CHAT_CONTRACT_TURN: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "chat_contract_turn", default=None
+)
+
+
+def begin_chat_contract_turn(*, enforce: Enforcer, session_id: str = "") -> Token:
+    turn: Dict[str, Any] = {
+        "enforce": enforce,
+        "prompt": "",
+        "session_id": (session_id or "").strip(),
+        "conversation_id": "",
+        "enforced": False,
+    }
+    return _CHAT_CONTRACT_TURN.set(turn)
+
+
+def end_chat_contract_turn(token: Token) -> None:
+    _CHAT_CONTRACT_TURN.reset(token)
+
+
+def current_chat_contract_turn() -> Optional[Dict[str, Any]]:
+    return _CHAT_CONTRACT_TURN.get()
+
+
+def note_chat_contract_request(
+    *,
+    prompt: Any = None,
+    session_id: Any = None,
+    conversation_id: Any = None,
+) -> None:
+    """Record the already-parsed turn inputs for the response sanitizer."""
+
+    turn = _CHAT_CONTRACT_TURN.get()
+    if turn is None:
+        return
+    if isinstance(prompt, str) and prompt:
+        turn["prompt"] = prompt
+    if isinstance(session_id, str) and session_id.strip():
+        turn["session_id"] = session_id.strip()
+    if isinstance(conversation_id, str) and conversation_id.strip():
+        turn["conversation_id"] = conversation_id.strip()
+
+
+def enforce_with_turn(turn: Dict[str, Any], body_obj: Dict[str, Any]) -> Dict[str, Any]:
+    text = body_obj.get("text")
+    if not isinstance(text, str) or not text.strip():
+        return body_obj
+    session_id = str(turn.get("session_id") or "")
+    return turn["enforce"](
+        body_obj=body_obj,
+        prompt=str(turn.get("prompt") or ""),
+        session_id=session_id,
+        conversation_id=str(turn.get("conversation_id") or "") or session_id,
+    )
+
+
+def apply_chat_response_contract(body_obj: Any) -> Tuple[Any, bool]:
+    """Sanitize a chat response dict before encoding; returns (body, applied)."""
+
+    turn = _CHAT_CONTRACT_TURN.get()
+    if turn is None or not isinstance(body_obj, dict):
+        return body_obj, False
+    out = enforce_with_turn(turn, body_obj)
+    turn["enforced"] = True
+    return out, True
+
+
+class ContractJSONResponse(JSONResponse):
+    """JSONResponse that applies the chat response contract on first render."""
+
+    contract_enforced = False
+
+    def render(self, content: Any) -> bytes:
+        try:
+            content, self.contract_enforced = apply_chat_response_contract(content)
+        except Exception:
+            # Fail-open like the old middleware; the ASGI layer retries on the
+            # encoded body since the turn is not marked enforced.
+            pass
+        return super().render(content)
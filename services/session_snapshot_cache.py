@@ -1,15 +1,38 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+_Key = Tuple[str, str]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int((os.getenv(name) or "").strip() or default)
+    except Exception:
+        return int(default)
+
+
+def _approx_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str))
+    except Exception:
+        return 0
 
 
 @dataclass
 class _CacheEntry:
     expires_at: float
     value: Dict[str, Any]
+    size: int = 0
 
 
 class SessionSnapshotCache:
@@ -20,10 +43,54 @@ class SessionSnapshotCache:
 
     NOTE: In-memory per-process cache (works well on a single instance; in multi-replica
     deployments you can swap this for Redis later without changing the call sites).
+
+    Bounded LRU: at most CEO_CHAT_SNAPSHOT_CACHE_MAX_ENTRIES entries and
+    CEO_CHAT_SNAPSHOT_CACHE_MAX_BYTES of (JSON-estimated) payload; expired
+    entries are also swept by a daemon thread every
+    CEO_CHAT_SNAPSHOT_CACHE_SWEEP_SECONDS so idle sessions do not leak.
+    get_or_build() coalesces concurrent misses for one key onto a single
+    in-flight build.
     """
 
-    def __init__(self) -> None:
-        self._store: Dict[Tuple[str, str], _CacheEntry] = {}
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_seconds: Optional[int] = None,
+    ) -> None:
+        self._store: "OrderedDict[_Key, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._generation = 0  # bumped by clear(); stale builds are not cached
+        self._inflight: Dict[_Key, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+        self.max_entries = max(
+            1,
+            max_entries
+            if max_entries is not None
+            else _env_int("CEO_CHAT_SNAPSHOT_CACHE_MAX_ENTRIES", 512),
+        )
+        self.max_bytes = max(
+            0,
+            max_bytes
+            if max_bytes is not None
+            else _env_int("CEO_CHAT_SNAPSHOT_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+        )
+        self._sweep_seconds = (
+            sweep_seconds
+            if sweep_seconds is not None
+            else _env_int("CEO_CHAT_SNAPSHOT_CACHE_SWEEP_SECONDS", 30)
+        )
+        self._sweeper: Optional[threading.Thread] = None
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "expired": 0,
+            "evicted": 0,
+            "builds": 0,
+            "coalesced": 0,
+        }
 
     def _iso_to_epoch(self, s: Any) -> Optional[float]:
         if not isinstance(s, str) or not s.strip():
@@ -57,13 +124,21 @@ class SessionSnapshotCache:
         db_keys_csv: str,
         min_last_sync: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        key = (session_id, db_keys_csv)
+        with self._lock:
+            value = self._lookup_locked((session_id, db_keys_csv), min_last_sync)
+            self._counters["hits" if value is not None else "misses"] += 1
+            return value
+
+    def _lookup_locked(
+        self, key: _Key, min_last_sync: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
         ent = self._store.get(key)
         if not ent:
             return None
         now = time.monotonic()
         if ent.expires_at <= now:
-            self._store.pop(key, None)
+            self._drop_locked(key)
+            self._counters["expired"] += 1
             return None
 
         if isinstance(min_last_sync, str) and min_last_sync.strip():
@@ -71,9 +146,16 @@ class SessionSnapshotCache:
             cached_ts = self._iso_to_epoch(cached_sync)
             min_ts = self._iso_to_epoch(min_last_sync)
             if cached_ts is not None and min_ts is not None and cached_ts < min_ts:
+                self._counters["stale"] += 1
                 return None
+        self._store.move_to_end(key)
         return ent.value
 
+    def _drop_locked(self, key: _Key) -> None:
+        ent = self._store.pop(key, None)
+        if ent is not None:
+            self._bytes -= ent.size
+
     def set(
         self,
         *,
@@ -87,16 +169,154 @@ class SessionSnapshotCache:
         if ttl <= 0:
             ttl = 60
         key = (session_id, db_keys_csv)
-        self._store[key] = _CacheEntry(expires_at=now + float(ttl), value=value)
+        size = _approx_size(value)
+        with self._lock:
+            self._drop_locked(key)
+            if self.max_bytes and size > self.max_bytes:
+                self._counters["evicted"] += 1
+                return
+            self._store[key] = _CacheEntry(
+                expires_at=now + float(ttl), value=value, size=size
+            )
+            self._bytes += size
+            while len(self._store) > self.max_entries or (
+                self.max_bytes and self._bytes > self.max_bytes
+            ):
+                old_key, _ = next(iter(self._store.items()))
+                self._drop_locked(old_key)
+                self._counters["evicted"] += 1
+        self._ensure_sweeper()
+
+    async def get_or_build(
+        self,
+        *,
+        session_id: str,
+        db_keys_csv: str,
+        build: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        ttl_seconds: int,
+        min_last_sync: Optional[str] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Return (snapshot, coalesced) for a miss, building it at most once.
+
+        Concurrent callers for the same key await the first caller's build
+        instead of starting their own; `coalesced` is True for those. Only
+        non-empty dict results are cached. Build errors propagate to every
+        waiter and nothing is cached.
+        """
+
+        key = (session_id, db_keys_csv)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            value = self._lookup_locked(key, min_last_sync)
+            if value is not None:
+                self._counters["hits"] += 1
+                return value, False
+            shared = self._inflight.get(key)
+            if shared is not None and shared.get_loop() is loop and not shared.done():
+                self._counters["coalesced"] += 1
+            else:
+                shared = None
+                generation = self._generation
+                fut = loop.create_future()
+                self._inflight[key] = fut
+                self._counters["builds"] += 1
+        if shared is not None:
+            try:
+                return await asyncio.shield(shared), True
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+            # The owning request was cancelled mid-build; take over.
+            return await self.get_or_build(
+                session_id=session_id,
+                db_keys_csv=db_keys_csv,
+                build=build,
+                ttl_seconds=ttl_seconds,
+                min_last_sync=min_last_sync,
+            )
+
+        try:
+            result = await build()
+        except BaseException as e:
+            with self._lock:
+                if self._inflight.get(key) is fut:
+                    del self._inflight[key]
+            if isinstance(e, Exception):
+                fut.set_exception(e)
+                fut.exception()  # mark retrieved when nobody else is waiting
+            else:
+                fut.cancel()
+            raise
+        if isinstance(result, dict) and result and generation == self._generation:
+            self.set(
+                session_id=session_id,
+                db_keys_csv=db_keys_csv,
+                value=result,
+                ttl_seconds=ttl_seconds,
+            )
+        with self._lock:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+        fut.set_result(result)
+        return result, False
+
+    def sweep_expired(self) -> int:
+        """Drop every expired entry; returns how many were removed."""
+
+        now = time.monotonic()
+        with self._lock:
+            dead = [k for k, ent in self._store.items() if ent.expires_at <= now]
+            for k in dead:
+                self._drop_locked(k)
+            self._counters["expired"] += len(dead)
+        return len(dead)
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweep_seconds <= 0:
+            return
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        ref = weakref.ref(self)
+        interval = float(self._sweep_seconds)
+
+        def _run() -> None:
+            while True:
+                time.sleep(interval)
+                cache = ref()
+                if cache is None:
+                    return
+                cache.sweep_expired()
+                del cache
+
+        self._sweeper = threading.Thread(
+            target=_run, name="session-snapshot-cache-sweep", daemon=True
+        )
+        self._sweeper.start()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters plus current size, for the chat trace."""
+
+        with self._lock:
+            out = dict(self._counters)
+            out["entries"] = len(self._store)
+            out["bytes"] = int(self._bytes)
+            out["inflight"] = len(self._inflight)
+            return out
 
     def clear(self) -> int:
         """Clear all cached snapshots.
 
         Returns number of entries removed.
         """
-        n = len(self._store)
-        self._store.clear()
-        return int(n)
+        with self._lock:
+            n = len(self._store)
+            self._store.clear()
+            self._bytes = 0
+            self._generation += 1
+            # Builds started before the clear may still finish; new callers
+            # must not join them.
+            self._inflight.clear()
+            return int(n)
 
 
 # SSOT singleton cache
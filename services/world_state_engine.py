@@ -2,15 +2,24 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-from services.notion_service import try_get_notion_service
+from services.notion_service import (
+    current_notion_budget,
+    notion_budget_context,
+    try_get_notion_service,
+)
 
 JsonDict = Dict[str, Any]
 
 SNAPSHOT_VERSION = "sotw.v1"
 
+# Notion caps database query page_size at 100; larger values are clamped
+# server-side, so rows beyond the first page need cursor pagination.
+NOTION_MAX_PAGE_SIZE = 100
+
 
 # ============================================================
 # Helpers (deterministic / safe)
@@ -36,6 +45,14 @@ def safe_int(x: Any, default: int = 0) -> int:
         return default
 
 
+def env_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return int(raw)
+    except Exception:
+        return int(default)
+
+
 def parse_iso(s: Any) -> Optional[datetime]:
     if not isinstance(s, str):
         return None
@@ -527,15 +544,47 @@ class WorldStateEngine:
             trace_sources: List[JsonDict] = []
             alerts: List[JsonDict] = []
 
-            goals_pages, goals_trace = await self._fetch("goals", "GoalsDB")
-            tasks_pages, tasks_trace = await self._fetch("tasks", "TasksDB")
-            projects_pages, projects_trace = await self._fetch("projects", "ProjectsDB")
+            # The three DBs are independent: fetch concurrently under one shared
+            # budget (gathered tasks inherit the same budget state), so latency
+            # is the slowest DB instead of the sum.
+            max_calls = env_int("WORLD_STATE_NOTION_MAX_CALLS", 12)
+            max_latency_ms = env_int("WORLD_STATE_NOTION_MAX_LATENCY_MS", 20000)
+            outer = current_notion_budget()
+            if outer is not None:
+                # Nested under a caller's budget: take the tighter of the two
+                # limits (negative means unbounded) and charge our calls to it.
+                if outer.max_calls is not None and outer.max_calls >= 0:
+                    left = max(0, outer.max_calls - outer.calls)
+                    max_calls = left if max_calls < 0 else min(max_calls, left)
+                outer_ms = outer.remaining_ms()
+                if outer_ms is not None:
+                    left_ms = int(outer_ms)
+                    max_latency_ms = (
+                        left_ms if max_latency_ms < 0 else min(max_latency_ms, left_ms)
+                    )
+            async with notion_budget_context(
+                max_calls=max_calls,
+                max_latency_ms=max_latency_ms,
+            ) as budget:
+                try:
+                    (
+                        (goals_pages, goals_trace),
+                        (tasks_pages, tasks_trace),
+                        (projects_pages, projects_trace),
+                    ) = await asyncio.gather(
+                        self._fetch("goals", "GoalsDB"),
+                        self._fetch("tasks", "TasksDB"),
+                        self._fetch("projects", "ProjectsDB"),
+                    )
+                finally:
+                    if outer is not None:
+                        outer.calls += budget.calls
 
             trace_sources += [goals_trace, tasks_trace, projects_trace]
 
-            goals = self._build_goals(goals_pages, tasks_pages)
+            goals = self._build_goals(goals_pages)
             tasks = self._build_tasks(tasks_pages)
-            projects = self._build_projects(projects_pages, tasks_pages)
+            projects = self._build_projects(projects_pages)
 
             # KPI / Agents / Summaries not wired → explicit UNKNOWN
             kpis = {"summary": [], "alerts": [], "as_of": iso(tw_end)}
@@ -656,6 +705,10 @@ class WorldStateEngine:
         CANON:
           - Never hard-require Notion singleton at import-time
           - Deterministic output even if Notion is not initialized
+
+        Follows next_cursor (page_size <= 100) up to WORLD_STATE_MAX_ROWS_PER_DB
+        rows. On a mid-pagination error (e.g. budget exceeded) the rows fetched
+        so far are kept and the trace carries the error.
         """
         notion = try_get_notion_service()
         if notion is None:
@@ -671,25 +724,40 @@ class WorldStateEngine:
 
         pages: List[JsonDict] = []
         err: Optional[str] = None
+        truncated = False
+        requests = 0
+        max_rows = max(1, env_int("WORLD_STATE_MAX_ROWS_PER_DB", 200))
 
         try:
-            res = await notion.query_database(
-                db_key=db_key,
-                query={
+            cursor: Optional[str] = None
+            while True:
+                query: JsonDict = {
                     "sorts": [
                         {
                             "timestamp": "last_edited_time",
                             "direction": "descending",
                         }
                     ],
-                    "page_size": 200,
-                },
-            )
-            pages = res.get("results", []) or []
-            if not isinstance(pages, list):
-                pages = []
+                    "page_size": min(NOTION_MAX_PAGE_SIZE, max_rows - len(pages)),
+                }
+                if cursor:
+                    query["start_cursor"] = cursor
+
+                res = await notion.query_database(db_key=db_key, query=query)
+                requests += 1
+                res = res if isinstance(res, dict) else {}
+                batch = res.get("results", []) or []
+                if isinstance(batch, list):
+                    pages.extend(batch)
+
+                nxt = res.get("next_cursor")
+                if not (res.get("has_more") is True and isinstance(nxt, str) and nxt):
+                    break
+                if len(pages) >= max_rows:
+                    truncated = True
+                    break
+                cursor = nxt
         except Exception as exc:
-            pages = []
             err = f"{type(exc).__name__}: {exc}"
 
         last_edit = "UNKNOWN"
@@ -706,6 +774,8 @@ class WorldStateEngine:
             "rows_after_filter": len(pages),
             "last_edited_at_max": last_edit,
             "ok": err is None,
+            "requests": requests,
+            "truncated": truncated,
         }
         if err:
             trace["error"] = err
@@ -715,9 +785,7 @@ class WorldStateEngine:
     # ============================================================
     # Builders
     # ============================================================
-    def _build_goals(
-        self, goals_pages: List[JsonDict], tasks_pages: List[JsonDict]
-    ) -> JsonDict:
+    def _build_goals(self, goals_pages: List[JsonDict]) -> JsonDict:
         goals = []
         blocked = []
         stale = []
@@ -770,9 +838,7 @@ class WorldStateEngine:
             },
         }
 
-    def _build_projects(
-        self, project_pages: List[JsonDict], task_pages: List[JsonDict]
-    ) -> JsonDict:
+    def _build_projects(self, project_pages: List[JsonDict]) -> JsonDict:
         projects = []
         at_risk = []
         blocked = []
@@ -14,6 +14,13 @@ from pathlib import Path
 
 import pytest
 
+# Notion transport: tests use mocked clients, so real-time throttling/backoff
+# would only add wall-clock sleeps (and hang under patched monotonic clocks).
+os.environ.setdefault("NOTION_RATE_LIMIT_RPS", "0")
+os.environ.setdefault("NOTION_RETRY_BACKOFF_BASE_MS", "0")
+# CEO console dashboard cache: every test builds against its own stubs.
+os.environ.setdefault("CEO_CONSOLE_SNAPSHOT_CACHE_TTL_S", "0")
+
 
 @pytest.fixture(scope="session", autouse=True)
 def _isolate_notion_armed_store_path(tmp_path_factory: pytest.TempPathFactory):
@@ -0,0 +1,237 @@
+"""Legacy KB rankings: golden oracle for services/kb_search_index.py.
+
+Verbatim copies of the full-scan KB rankings (KBNotionStore.search and
+GroundingPackService._retrieve_kb) as they were before KBSearchIndex, a
+synthetic corpus, and the parity check against the indexed implementation.
+Used by tests/test_kb_search_index_parity.py and tools/bench_kb_search_index.py.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.kb_search_index import KBSearchIndex
+from services.text_normalization import (
+    kb_entry_searchable_text,
+    normalize_text,
+    tokenize_normalized,
+)
+
+
+_LOW_SIGNAL = {"plan", "plans", "planning"}
+_STOP = {
+    "kao",
+    "da",
+    "sam",
+    "si",
+    "smo",
+    "ste",
+    "su",
+    "ali",
+    "samo",
+    "objasni",
+    "objasnite",
+    "koristi",
+}
+
+_WORDS = (
+    "strategija prodaja cilj zadatak projekt budzet rizik tim kvartal prihod "
+    "marketing klijent ugovor plan planning wysiati odluka sastanak izvjestaj "
+    "kpi okr roadmap pipeline lead konverzija churn onboarding sop proces "
+    "kvaliteta isporuka dobavljac cijena marza investicija hiring kultura "
+    "šef čovjek đak žurba leadership growth revenue ops finance legal"
+).split()
+_INTENTS = ("advisory", "state_query", "identity", "ops", "all")
+
+
+def _applies_to(e: Dict[str, Any]) -> List[str]:
+    raw = e.get("applies_to")
+    if isinstance(raw, list):
+        out = [
+            str(x).strip().lower() for x in raw if isinstance(x, str) and str(x).strip()
+        ]
+        return out or ["all"]
+    return ["all"]
+
+
+def legacy_notion_search(
+    entries: List[Dict[str, Any]], query: str, *, top_k: int, intent: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Full scan, verbatim from the pre-index KBNotionStore.search."""
+    q = (query or "").strip()
+    q_norm = normalize_text(q)
+    q_toks = tokenize_normalized(q)
+    q_toks_sig = [
+        t for t in q_toks if len(t) >= 3 and t not in _LOW_SIGNAL and t not in _STOP
+    ]
+    q_toks_sig_set = set(q_toks_sig)
+    q_has_wysiati = "wysiati" in set(q_toks)
+    intent_norm = (intent or "").strip().lower()
+    gate_enabled = intent_norm in {"advisory", "state_query", "identity"}
+
+    hits: List[Tuple[int, int, int, int, str, Dict[str, Any]]] = []
+    if not q_norm:
+        return []
+    for e in entries:
+        if not isinstance(e, dict):
+            continue
+        if gate_enabled:
+            at = _applies_to(e)
+            if intent_norm not in at and "all" not in at:
+                continue
+        entry_id = str(e.get("id") or "")
+        title_norm = normalize_text(str(e.get("title") or ""))
+        search_norm = normalize_text(kb_entry_searchable_text(e))
+        id_norm = normalize_text(entry_id)
+        id_title_tokens = set(tokenize_normalized(f"{id_norm} {title_norm}"))
+        title_hit = 1 if q_norm in title_norm else 0
+        phrase_hit = q_norm in search_norm
+        token_hit = False
+        must_include = False
+        if not phrase_hit and (q_toks_sig or q_has_wysiati):
+            content_tokens = set(tokenize_normalized(search_norm))
+            if q_has_wysiati and (
+                "wysiati" in id_title_tokens or "wysiati" in content_tokens
+            ):
+                must_include = True
+                token_hit = True
+            if not token_hit and q_toks_sig:
+                overlap_total = sum(1 for t in q_toks_sig_set if t in content_tokens)
+                overlap_id_title = sum(
+                    1 for t in q_toks_sig_set if t in id_title_tokens
+                )
+                if len(q_toks_sig) >= 2:
+                    token_hit = overlap_total >= 2 or (
+                        overlap_total >= 1 and overlap_id_title >= 1
+                    )
+                else:
+                    token_hit = overlap_total >= 1
+        if not (phrase_hit or token_hit):
+            continue
+        occurrences = search_norm.count(q_norm)
+        id_title_hits = sum(1 for t in q_toks_sig_set if t in id_title_tokens)
+        hits.append(
+            (
+                1 if must_include else 0,
+                id_title_hits,
+                title_hit,
+                occurrences,
+                entry_id,
+                e,
+            )
+        )
+    hits.sort(key=lambda t: (-t[0], -t[1], -t[2], -t[3], t[4]))
+    return [e for *_, e in hits[:top_k]]
+
+
+def legacy_retrieve(
+    entries: List[Dict[str, Any]], prompt: str, *, limit: int, intent: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Full scan, verbatim from the pre-index GroundingPackService._retrieve_kb."""
+    toks_all = tokenize_normalized(prompt)
+    toks_sig_set = {
+        t for t in toks_all if len(t) >= 3 and t not in _LOW_SIGNAL and t not in _STOP
+    }
+    q_has_wysiati = "wysiati" in set(toks_all)
+    intent_norm = (intent or "").strip().lower()
+    gate_enabled = intent_norm in {"advisory", "state_query", "identity"}
+
+    scored: List[Tuple[float, Dict[str, Any]]] = []
+    for e in entries:
+        if not isinstance(e, dict):
+            continue
+        if gate_enabled:
+            at = _applies_to(e)
+            if intent_norm not in at and "all" not in at:
+                continue
+        id_norm = normalize_text(str(e.get("id") or ""))
+        title_norm = normalize_text(str(e.get("title") or ""))
+        search_norm = normalize_text(kb_entry_searchable_text(e))
+        content_tokens = set(tokenize_normalized(search_norm))
+        id_title_tokens = set(tokenize_normalized(f"{id_norm} {title_norm}"))
+        must_include = q_has_wysiati and (
+            "wysiati" in id_title_tokens or "wysiati" in content_tokens
+        )
+        id_title_hits = sum(1 for t in toks_sig_set if t in id_title_tokens)
+        content_hits = sum(1 for t in toks_sig_set if t in content_tokens)
+        prompt_norm = normalize_text(prompt)
+        phrase_hit = bool(prompt_norm) and (
+            prompt_norm in search_norm
+            or prompt_norm in title_norm
+            or prompt_norm in id_norm
+        )
+        if not (must_include or phrase_hit or id_title_hits or content_hits):
+            continue
+        try:
+            prf = float(e.get("priority"))
+        except Exception:
+            prf = 0.0
+        score = 0.0
+        if must_include:
+            score += 1_000_000.0
+        if phrase_hit:
+            score += 50_000.0
+        score += float(id_title_hits) * 10_000.0
+        score += float(content_hits) * 100.0
+        score += prf
+        scored.append((score, e))
+    scored.sort(key=lambda pair: (-pair[0], str(pair[1].get("id") or "")))
+    return [e for _, e in scored[:limit]]
+
+
+def synthetic_entries(n: int, *, seed: int = 7) -> List[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    out: List[Dict[str, Any]] = []
+    for i in range(n):
+        title = " ".join(rnd.choices(_WORDS, k=rnd.randint(1, 4))).title()
+        content = " ".join(rnd.choices(_WORDS, k=rnd.randint(20, 80)))
+        out.append(
+            {
+                "id": f"kb_{rnd.choice(_WORDS)}_{i:05d}",
+                "title": title,
+                "tags": rnd.sample(_WORDS, k=rnd.randint(0, 3)),
+                "applies_to": rnd.sample(_INTENTS, k=rnd.randint(1, 2)),
+                "priority": round(rnd.random(), 3),
+                "content": content,
+                "updated_at": None,
+            }
+        )
+    return out
+
+
+def synthetic_queries(n: int, *, seed: int = 11) -> List[Tuple[str, Optional[str]]]:
+    rnd = random.Random(seed)
+    out: List[Tuple[str, Optional[str]]] = []
+    for _ in range(n):
+        q = " ".join(rnd.choices(_WORDS, k=rnd.randint(1, 5)))
+        if rnd.random() < 0.2:
+            q = f"Objasni {q} kao da sam novi"
+        intent = rnd.choice((None, "advisory", "state_query", "identity", "ops"))
+        out.append((q, intent))
+    return out
+
+
+def _ids(xs: List[Dict[str, Any]]) -> List[str]:
+    return [str(x.get("id")) for x in xs]
+
+
+def check_parity(
+    entries: List[Dict[str, Any]],
+    queries: List[Tuple[str, Optional[str]]],
+    *,
+    top_k: int = 12,
+) -> List[str]:
+    """Returns a list of mismatch descriptions (empty means identical rankings)."""
+    index = KBSearchIndex(entries)
+    mismatches: List[str] = []
+    for q, intent in queries:
+        a = _ids(legacy_notion_search(entries, q, top_k=top_k, intent=intent))
+        b = _ids(index.search(q, top_k=top_k, intent=intent))
+        if a != b:
+            mismatches.append(f"search {q!r} intent={intent}: {a} != {b}")
+        a = _ids(legacy_retrieve(entries, q, limit=top_k, intent=intent))
+        b = _ids(index.retrieve(q, limit=top_k, intent=intent))
+        if a != b:
+            mismatches.append(f"retrieve {q!r} intent={intent}: {a} != {b}")
+    return mismatches
@@ -0,0 +1,679 @@
+"""Legacy intent predicates: golden oracle for services/prompt_features.py.
+
+Verbatim copies of the intent/meta-question predicates (each re-normalizing
+the prompt and running its own regex list) as they were before the shared
+PromptFeatures analysis, plus the parity check against the current versions.
+Used by tests/test_prompt_features_golden.py and tools/bench_prompt_features.py.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from services.ceo_advisor_agent import _parse_memory_write_allowlist_command
+from services.intent_classifier import IntentClassifier
+
+_TESTS_DIR = Path(__file__).resolve().parent
+
+
+# ---------------------------------------------------------------------------
+# Legacy predicates (verbatim)
+# ---------------------------------------------------------------------------
+
+
+def _is_propose_only_request(user_text: str) -> bool:
+    t = (user_text or "").strip().lower()
+    if not t:
+        return False
+    signals = (
+        "propose",
+        "proposed_commands",
+        "do not execute",
+        "ne izvršavaj",
+        "nemoj izvršiti",
+        "samo predloži",
+        "return proposed",
+    )
+    return any(s in t for s in signals)
+
+
+def _has_explicit_action_for_goal_task(user_text: str) -> tuple[bool, str]:
+    """Detect explicit imperative action for goal/task.
+
+    Returns:
+      (True, "goal") or (True, "task") only when BOTH are present in the same string:
+      - ACTION_VERB (word-boundary)
+      - TARGET (word-boundary)
+    Otherwise returns (False, "").
+    """
+
+    t = (user_text or "").strip().lower()
+    if not t:
+        return (False, "")
+
+    action_re = r"(?i)\b(kreiraj|napravi|dodaj|upi\u0161i|upisi|unesi|postavi|set|create|add|write)\b"
+    if not re.search(action_re, t):
+        return (False, "")
+
+    goal_re = r"(?i)\b(cilj|goal)\b"
+    task_re = r"(?i)\b(task|zad|zadatak)\b"
+
+    if re.search(goal_re, t):
+        return (True, "goal")
+    if re.search(task_re, t):
+        return (True, "task")
+    return (False, "")
+
+
+def _wants_notion_task_or_goal(user_text: str) -> bool:
+    t = (user_text or "").lower()
+    if "notion" not in t:
+        return False
+    ok, kind = _has_explicit_action_for_goal_task(t)
+    return bool(ok and kind in {"goal", "task"})
+
+
+def _defers_notion_execution_or_wants_discussion_first(user_text: str) -> bool:
+    """True when the user explicitly says: not now / let's talk first / prep/analysis.
+
+    This is used to avoid short-circuiting into the SSOT snapshot_read_summary
+    response for planning/discussion prompts.
+    """
+
+    t = (user_text or "").strip().lower()
+    if not t:
+        return False
+
+    # Direct "talk first" markers.
+    if any(
+        s in t
+        for s in (
+            "prvo razgovaramo",
+            "prvo da razgovaramo",
+            "prvo razgovor",
+            "prvo da popricamo",
+            "prvo da popričamo",
+            "prvo da pricamo",
+            "da prvo razgovaramo",
+            "let's talk first",
+            "lets talk first",
+            "before we do that",
+        )
+    ):
+        return True
+
+    # "Not now" markers, typically paired with execution verbs.
+    not_now = any(
+        s in t
+        for s in (
+            "neću sad",
+            "necu sad",
+            "neću sada",
+            "necu sada",
+            "ne sada",
+            "ne sad",
+            "neću još",
+            "necu jos",
+            "neću jos",
+            "ne jos",
+        )
+    )
+    if not_now and any(
+        v in t
+        for v in (
+            "postav",
+            "podes",
+            "upi",
+            "upis",
+            "unes",
+            "kreir",
+            "dodaj",
+            "napravi",
+            "set ",
+            "create ",
+            "write ",
+        )
+    ):
+        return True
+
+    # Prep/analysis wording that implies discussion before execution.
+    if any(s in t for s in ("priprem", "priprema", "razrad", "razrada")) and any(
+        s in t for s in ("prvo", "before", "najprije", "najpre")
+    ):
+        return True
+
+    return False
+
+
+def _wants_task(user_text: str) -> bool:
+    ok, kind = _has_explicit_action_for_goal_task(user_text)
+    return bool(ok and kind == "task")
+
+
+def _wants_goal(user_text: str) -> bool:
+    ok, kind = _has_explicit_action_for_goal_task(user_text)
+    return bool(ok and kind == "goal")
+
+
+def _is_empty_state_kickoff_prompt(user_text: str) -> bool:
+    t = (user_text or "").strip().lower()
+    if not t:
+        return False
+    # User is explicitly asking how to start from an empty state.
+    return bool(
+        re.search(
+            r"(?i)\b(prazn\w*\s+stanj\w*|nema\s+(cilj\w*|goal\w*|task\w*|zadat\w*)|kako\s+da\s+pocn\w*|kako\s+da\s+po\u010dn\w*)\b",
+            t,
+        )
+    )
+
+
+def _is_memory_capability_question(user_text: str) -> bool:
+    t = (user_text or "").strip()
+    if not t:
+        return False
+
+    # Hard priority: explicit allowlisted memory write/learn commands must never
+    # be treated as a capability question.
+    if _parse_memory_write_allowlist_command(t) is not None:
+        return False
+
+    t_cf = t.casefold()
+
+    # Invariant: memory capability Q&A should activate ONLY when the user is
+    # clearly asking about the assistant/system memory (2nd person or identity).
+    # This prevents false positives when talking about human memory.
+    has_identity_marker = bool(
+        re.search(
+            r"(?i)\b(adnan(\.ai)?|assistant|ceo\s*advisor|sistem|system|agent)\b",
+            t_cf,
+        )
+    )
+
+    has_second_person_marker = bool(
+        re.search(
+            r"(?i)\b("
+            r"tvoj\w*|"
+            r"mo\u017ee\u0161|mozes|"
+            r"koristi\u0161|koristis|"
+            r"pamti\u0161|pamtis|"
+            r"zapamti\u0161|zapamtis|"
+            r"your"
+            r")\b",
+            t_cf,
+        )
+    )
+
+    has_memory_keyword = bool(re.search(r"(?i)\b(memorij\w*|memory)\b", t_cf))
+
+    # Explicit second-person question forms about remembering (no need to also
+    # mention 'memory'/'memorija'). Still guarded against human-memory phrasing.
+    has_explicit_assistant_remember_question = bool(
+        re.search(
+            r"(?i)\b("
+            r"mo\u017ee\u0161\s+li\s+(za)?pamt\w*|"
+            r"mozes\s+li\s+(za)?pamt\w*|"
+            r"da\s+li\s+pamti\u0161\b|da\s+li\s+pamtis\b|"
+            r"pamti\u0161\s+li\b|pamtis\s+li\b|"
+            r"can\s+you\s+remember\b|do\s+you\s+remember\b|"
+            r"can\s+you\s+store\b|do\s+you\s+store\b"
+            r")",
+            t_cf,
+        )
+    )
+
+    if has_explicit_assistant_remember_question:
+        return True
+
+    if has_memory_keyword and (has_identity_marker or has_second_person_marker):
+        return True
+
+    return False
+
+
+def _is_trace_status_query(user_text: str) -> bool:
+    """Detect user intent to ask for provenance / trace status.
+
+    This must have higher priority than memory capability/governance classifiers.
+    """
+
+    t = (user_text or "").strip().lower()
+    if not t:
+        return False
+
+    # Strong triggers (BHS + EN)
+    if re.search(
+        r"(?i)\b("
+        r"provenance|sources\s+used|status\s+izvora|"
+        r"izvor|izvori|izvori\s+znanja|"
+        r"odakle\s+ti(\s+info|\s+ovo)?|odakle\s+podaci|"
+        r"na\s+osnovu\s+\u010dega|na\s+osnovu\s+cega|"
+        r"sta\s+je\s+koristen\w*|\u0161ta\s+je\s+kori\u0161ten\w*|"
+        r"sta\s+je\s+preskocen\w*|\u0161ta\s+je\s+presko\u010den\w*|"
+        r"za\u0161to\s+presko\u010den\w*|zasto\s+preskocen\w*|"
+        r"trace"
+        r")\b",
+        t,
+    ):
+        return True
+
+    # Source-list phrasing like "KB/Identity/Memory/Notion"
+    if "kb" in t and "identity" in t and "notion" in t and "memory" in t:
+        return True
+
+    return False
+
+
+def _is_dashboard_intent(user_text: str) -> bool:
+    """True only for explicit dashboard/listing/status intent.
+
+    Note: merely mentioning 'goal/task' is not enough.
+    """
+
+    t = (user_text or "").strip().lower()
+    if not t:
+        return False
+
+    if _is_show_request(t):
+        return True
+
+    wants_targets = bool(
+        re.search(r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*|kpi\w*)\b", t)
+    )
+    if not wants_targets:
+        return False
+
+    return any(
+        k in t
+        for k in (
+            "dashboard",
+            "snapshot",
+            "status",
+            "stanje",
+            "sažetak",
+            "sazetak",
+            "prioritet",
+            "priority",
+            "top 3",
+            "top3",
+            "top 5",
+            "top5",
+        )
+    )
+
+
+def _is_fact_sensitive_query(user_text: str) -> bool:
+    """Detect prompts that would require grounded business facts.
+
+    We allow general coaching without snapshot, but we must not assert
+    business state (blocked/at-risk/KPI counts/status) without SSOT data.
+    """
+
+    t = (user_text or "").strip().lower()
+    if not t:
+        return False
+
+    risk_terms = (
+        "blocked",
+        "blokiran",
+        "blokada",
+        "at risk",
+        "u riziku",
+        "risk",
+        "kasni",
+        "kašn",
+        "delayed",
+        "critical",
+        "kritic",
+        "incident",
+        "p0",
+    )
+    if any(s in t for s in risk_terms):
+        return True
+
+    # KPI/finance terms are assumed to be business-fact sensitive in CEO context.
+    # Without SSOT snapshot, we must not assert values or status.
+    kpi_terms = (
+        "revenue",
+        "prihod",
+        "mrr",
+        "arr",
+        "profit",
+        "dobit",
+        "margin",
+        "marža",
+        "ebitda",
+        "cash",
+        "gotovina",
+        "burn",
+        "runway",
+        "churn",
+        "ltv",
+        "cac",
+        "gmv",
+        "arpu",
+    )
+    if any(s in t for s in kpi_terms):
+        return True
+
+    # "status/stanje" questions become fact-sensitive when tied to goals/tasks/KPIs.
+    wants_status = bool(re.search(r"(?i)\b(status|stanje|progress|napredak)\b", t))
+    wants_target = bool(
+        re.search(
+            r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*|kpi\w*|project\w*|projekat\w*|revenue|prihod|profit|dobit|margin|marža|ebitda)\b",
+            t,
+        )
+    )
+    if wants_status and wants_target:
+        return True
+
+    # Count/number queries about goals/tasks are fact-sensitive.
+    wants_count = bool(re.search(r"(?i)\b(koliko|broj|how\s+many)\b", t))
+    if wants_count and wants_target:
+        return True
+
+    return False
+
+
+def _is_show_request(user_text: str) -> bool:
+    t = (user_text or "").strip().lower()
+    if not t:
+        return False
+
+    # Explicit Bosnian list-tasks phrases (deterministic; bypass LLM).
+    if any(
+        s in t
+        for s in (
+            "koji su taskovi",
+            "navedi taskove",
+            "koje taskove imamo",
+            "lista taskova",
+        )
+    ):
+        return True
+
+    show = bool(
+        re.search(
+            r"(?i)\b(pokazi|poka\u017ei|prika\u017ei|prikazi|izlistaj|navedi|lista|show|list|pogledaj)\b",
+            t,
+        )
+    )
+    target = bool(re.search(r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*)\b", t))
+
+    # Also treat common interrogative forms as "show" when they ask what tasks/goals exist.
+    # Example: "Koje taskove imamo u sistemu?"
+    q_show = bool(re.search(r"(?i)^\s*(koje|kakve|koji|kakav)\b", t)) and (
+        "?" in t or "imamo" in t or "navedi" in t or "lista" in t
+    )
+    show = bool(show or q_show)
+    return show and target
+
+
+_SHOW_GOALS_TASKS_RE = re.compile(
+    r"(?i)"
+    r"(?:"
+    r"\b(?:poka(?:z|\u017e)\w*|prika(?:z|\u017e)\w*|izlistaj|navedi|lista|pregled|overview)\b"
+    r".*\b(?:cilj\w*|goal\w*|task\w*|zadac\w*|zadat\w*)"
+    r"|"
+    r"\b(?:cilj\w*|goal\w*|task\w*|zadac\w*|zadat\w*)\b"
+    r".*\b(?:poka(?:z|\u017e)\w*|prika(?:z|\u017e)\w*|izlistaj|navedi|lista|pregled|overview)\b"
+    r"|"
+    # Natural question forms (Bosnian): "Kakve imamo ciljeve?", "Koje ciljeve imamo?"
+    r"\b(?:kakv\w*|koje|koji|sta|\u0161ta)\b\s+\b(?:imamo|su)\b"
+    r".*\b(?:cilj\w*|goal\w*|task\w*|zadac\w*|zadat\w*)\b"
+    r")"
+)
+
+
+_TOP_GOAL_RE = re.compile(
+    r"(?i)(?:"
+    # Order A: adjective/keyword before 'goal'
+    r"\b(?:najbitnij\w*|najvaznij\w*|najprioritetnij\w*|top|glavn\w*|main|most\s+important|highest\s+priority|primary)\b.*\b(?:cilj\w*|goal\w*)\b"
+    r"|"
+    # Order B: 'goal' before adjective/keyword (e.g., 'Koji cilj je glavni?')
+    r"\b(?:cilj\w*|goal\w*)\b.*\b(?:najbitnij\w*|najvaznij\w*|najprioritetnij\w*|top|glavn\w*|main|most\s+important|highest\s+priority|primary)\b"
+    r")"
+)
+
+
+def _is_top_goal_intent(text: str) -> bool:
+    t = (text or "").strip()
+    if not t:
+        return False
+    # Guard: "Zašto je ... cilj glavni?" is a WHY follow-up, not a top-goal listing request.
+    if re.search(r"(?i)\b(zasto|zašto)\b", t):
+        return False
+    return bool(_TOP_GOAL_RE.search(t))
+
+
+def _is_show_goals_tasks_intent(text: str) -> bool:
+    """Return True when the prompt is a Bosnian/English show/list goals+tasks intent."""
+    t = (text or "").strip()
+    if not t:
+        return False
+
+    def _norm_bhs_ascii(text: str) -> str:
+        s = (text or "").strip().lower()
+        return (
+            s.replace("č", "c")
+            .replace("ć", "c")
+            .replace("š", "s")
+            .replace("đ", "dj")
+            .replace("ž", "z")
+        )
+
+    # Guard: do NOT treat goal-scoped task follow-ups as a global "show goals+tasks" intent.
+    # Examples:
+    #   - "Koji su zadaci povezani sa ovim ciljem?"
+    #   - "Imamo li aktivne zadatke za taj cilj?"
+    t0 = _norm_bhs_ascii(t)
+    if re.search(r"(?i)\b(task\w*|zadat\w*|zadac\w*)\b", t0) and re.search(
+        r"(?i)\b(ovaj|ovom|ovog|ovome|ovo|taj|tom|tog|tome|ovim)\b(?:\W+\w+){0,3}\W+\b(cilj\w*|goal\w*)\b",
+        t0,
+    ):
+        return False
+
+    if _SHOW_GOALS_TASKS_RE.search(t):
+        return True
+
+    has_show_cue = bool(
+        re.search(
+            r"(?i)\b(pokaz\w*|prikaz\w*|izlistaj|navedi|lista|pregled|overview)\b",
+            t0,
+        )
+    )
+    has_subject = bool(
+        re.search(r"(?i)\b(cilj\w*|goal\w*|task\w*|zadat\w*|zadac\w*)\b", t0)
+    )
+    has_have_question = bool(
+        re.search(r"(?i)\b(kakv\w*|koje|koji|sta|shta)\b\s+\b(imamo|su)\b", t0)
+    )
+
+    return bool((has_show_cue and has_subject) or (has_have_question and has_subject))
+
+
+def _bhs_normalize(text: str) -> str:
+    t0 = (text or "").strip().lower()
+    return (
+        t0.replace("č", "c")
+        .replace("ć", "c")
+        .replace("š", "s")
+        .replace("đ", "dj")
+        .replace("ž", "z")
+    )
+
+
+def _user_explicitly_asked_memory_or_snapshot(prompt: str) -> bool:
+    t = _bhs_normalize(prompt)
+    if not t:
+        return False
+    return bool(
+        re.search(
+            r"(?i)\b(pamcenj\w*|memorij\w*|snapshot|grounding|governance|sistemsk\w*\s+tekst|system\s+text)\b",
+            t,
+        )
+    )
+
+
+def _user_explicitly_asked_identity_or_howto(prompt: str) -> bool:
+    t = _bhs_normalize(prompt)
+    if not t:
+        return False
+
+    # Enterprise hardening: do not allowlist long pasted content (e.g., plan text).
+    # Meta questions should be short and explicit.
+    if len(t) > 300:
+        return False
+
+    # Never allowlist plan-analysis prompts.
+    if re.search(r"(?i)\b(plan|analiz\w*|analysis|review|procitaj)\b", t):
+        return False
+
+    # Strict allowlist (enterprise): only allow intro/how-to template when explicitly asked.
+    return bool(
+        re.search(
+            r"(?i)\b("
+            r"ko\s+si|"
+            r"sta\s+si|"
+            r"\u0161ta\s+si|"
+            r"kako\s+radis|"
+            r"kako\s+da\s+pitam|"
+            r"uputstv\w*|"
+            r"help|guidelines|"
+            r"who\s+are\s+you|how\s+do\s+you\s+work|how\s+to\s+ask"
+            r")\b",
+            t,
+        )
+    )
+
+
+def legacy_intent_classify(text: str) -> Tuple[str, float]:
+    """IntentClassifier.classify pattern loop, verbatim (type, confidence)."""
+    c = IntentClassifier
+    lowered = (text or "").lower().strip()
+    for pattern in c.CONFIRM_PATTERNS:
+        if re.fullmatch(pattern, lowered):
+            return ("CONFIRM", 0.99)
+    for pattern in c.CANCEL_PATTERNS:
+        if re.fullmatch(pattern, lowered):
+            return ("CANCEL", 0.99)
+    for pattern in c.SYSTEM_QUERY_PATTERNS:
+        if re.search(pattern, lowered):
+            return ("SYSTEM_QUERY", 0.95)
+    for pattern in c.GOALS_LIST_PATTERNS:
+        if re.search(pattern, lowered):
+            return ("GOALS_LIST", 0.92)
+    for pattern in c.SOP_LIST_PATTERNS:
+        if re.search(pattern, lowered):
+            return ("LIST_SOPS", 0.92)
+    for pattern in c.SOP_VIEW_PATTERNS:
+        if re.search(pattern, lowered):
+            return ("VIEW_SOP", 0.93)
+    for pattern in c.GOAL_CREATE_PATTERNS:
+        if re.search(pattern, lowered):
+            return ("GOAL_CREATE", 0.90)
+    for pattern in c.IDENTITY_PATTERNS:
+        if re.search(pattern, lowered):
+            return ("CHAT", 0.9)
+    return ("CHAT", 0.4)
+
+
+# ---------------------------------------------------------------------------
+# Current predicates
+# ---------------------------------------------------------------------------
+
+_CEO_PREDICATES = (
+    "_is_propose_only_request",
+    "_has_explicit_action_for_goal_task",
+    "_wants_notion_task_or_goal",
+    "_defers_notion_execution_or_wants_discussion_first",
+    "_wants_task",
+    "_wants_goal",
+    "_is_empty_state_kickoff_prompt",
+    "_is_memory_capability_question",
+    "_is_trace_status_query",
+    "_is_show_request",
+    "_is_dashboard_intent",
+    "_is_fact_sensitive_query",
+)
+_ROUTER_PREDICATES = ("_is_top_goal_intent", "_is_show_goals_tasks_intent")
+_GATEWAY_PREDICATES = (
+    "_user_explicitly_asked_memory_or_snapshot",
+    "_user_explicitly_asked_identity_or_howto",
+)
+
+
+def _current_intent_classify(text: str) -> Tuple[str, float]:
+    intent = IntentClassifier().classify(text, source="bench")
+    t = getattr(intent.type, "name", intent.type)
+    return (str(t), float(intent.confidence))
+
+
+def predicate_pairs() -> List[Tuple[str, Callable[[Any], Any], Callable[[Any], Any]]]:
+    """(name, legacy, current) for every predicate backed by PromptFeatures."""
+    import gateway.gateway_server as gw
+    import routers.chat_router as router
+    import services.ceo_advisor_agent as ceo
+
+    legacy = globals()
+    pairs = []
+    for mod, names in (
+        (ceo, _CEO_PREDICATES),
+        (router, _ROUTER_PREDICATES),
+        (gw, _GATEWAY_PREDICATES),
+    ):
+        for name in names:
+            pairs.append((name, legacy[name], getattr(mod, name)))
+    pairs.append(
+        ("IntentClassifier.classify", legacy_intent_classify, _current_intent_classify)
+    )
+    return pairs
+
+
+# ---------------------------------------------------------------------------
+# Corpus + parity
+# ---------------------------------------------------------------------------
+
+
+def suite_prompt_corpus(tests_dir: Optional[Path] = None) -> List[Optional[str]]:
+    """Every string literal in tests/*.py that contains a letter (deduplicated)."""
+    root = tests_dir or _TESTS_DIR
+    seen = set()
+    out: List[Optional[str]] = [None, "", "   ", "\n\t"]
+    for path in sorted(root.glob("*.py")):
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Constant) and isinstance(node.value, str)):
+                continue
+            s = node.value
+            if s in seen or len(s) > 4000 or not any(ch.isalpha() for ch in s):
+                continue
+            seen.add(s)
+            out.append(s)
+    return out
+
+
+def _outcome(fn: Callable[[Any], Any], prompt: Any) -> Any:
+    try:
+        return fn(prompt)
+    except Exception as exc:  # parity includes the failure mode
+        return ("raises", type(exc).__name__)
+
+
+def check_parity(prompts: List[Any]) -> List[str]:
+    """Returns a list of mismatch descriptions (empty means identical results)."""
+    mismatches: List[str] = []
+    pairs = predicate_pairs()
+    for p in prompts:
+        for name, legacy_fn, current_fn in pairs:
+            a = _outcome(legacy_fn, p)
+            b = _outcome(current_fn, p)
+            if a != b:
+                mismatches.append(f"{name}({p!r:.80}): {a!r} != {b!r}")
+    return mismatches
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 
 def _load_app():
@@ -18,7 +19,9 @@ def _disable_grounding(monkeypatch) -> None:
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -37,7 +38,9 @@ def test_api_chat_state_question_uses_snapshot_even_when_kb_has_hits(monkeypatch
         "memory_snapshot": {"payload": {"active_decision": None}},
     }
 
-    monkeypatch.setattr(GroundingPackService, "build", lambda **_k: gp)
+    monkeypatch.setattr(
+        GroundingPackService, "abuild", AsyncMock(side_effect=lambda **_k: gp)
+    )
 
     # Stub the executor so no network is used, but the router still exercises the full flow.
     class _Exec:
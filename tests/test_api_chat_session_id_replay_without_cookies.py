@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 
 def _load_app():
@@ -38,7 +39,9 @@ def test_api_chat_generates_session_id_and_replays_pending_proposal(
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     app = _load_app()
@@ -145,3 +145,105 @@ def test_api_chat_stream_error_event_then_done(monkeypatch):
     err = next(e for e in evts if e.get("type") == "error")
     msg = str((err.get("data") or {}).get("message") or "")
     assert "boom" in msg
+
+
+def _streaming_route(*, final_text: str, tokens: list[str], require_sink: bool = True):
+    async def _route(self, *_args, **_kwargs):
+        import asyncio
+
+        from services.agent_router.openai_streaming import open_token_stream
+
+        on_token = open_token_stream()
+        if require_sink:
+            assert on_token is not None
+        for tok in tokens if on_token is not None else []:
+            on_token(tok)
+            await asyncio.sleep(0)
+        return AgentOutput(
+            text=final_text,
+            proposed_commands=[],
+            agent_id="ceo_advisor",
+            read_only=True,
+            trace={},
+        )
+
+    return _route
+
+
+def test_api_chat_stream_emits_live_deltas_before_final(monkeypatch):
+    monkeypatch.setenv("CHAT_STREAMING_ENABLED", "true")
+    text = "Prvi red\nDrugi red"
+    raw = json.dumps({"text": text}, ensure_ascii=False)
+    monkeypatch.setattr(
+        "services.agent_router_service.AgentRouterService.route",
+        _streaming_route(
+            final_text=text, tokens=[raw[i : i + 4] for i in range(0, len(raw), 4)]
+        ),
+    )
+
+    r = TestClient(_load_app()).post(
+        "/api/chat/stream", json=_payload(), headers={"X-Live-Deltas": "1"}
+    )
+    evts = _parse_ndjson(r.text)
+    types = [e.get("type") for e in evts]
+
+    deltas = [e["data"]["delta_text"] for e in evts if e["type"] == "assistant.delta"]
+    assert deltas[0] == "Prvi red\n"
+    assert "".join(deltas) == text
+    assert "assistant.reset" not in types
+    assert types.index("assistant.final") > types.index("assistant.delta")
+
+
+def test_api_chat_stream_resets_when_final_text_diverges(monkeypatch):
+    monkeypatch.setenv("CHAT_STREAMING_ENABLED", "true")
+    raw = json.dumps({"text": "nacrt odgovora\n"})
+    monkeypatch.setattr(
+        "services.agent_router_service.AgentRouterService.route",
+        _streaming_route(final_text="konacni odgovor", tokens=[raw]),
+    )
+
+    r = TestClient(_load_app()).post(
+        "/api/chat/stream", json=_payload(), headers={"X-Live-Deltas": "1"}
+    )
+    evts = _parse_ndjson(r.text)
+    types = [e.get("type") for e in evts]
+
+    reset_at = types.index("assistant.reset")
+    after = [
+        e["data"]["delta_text"]
+        for e in evts[reset_at:]
+        if e["type"] == "assistant.delta"
+    ]
+    assert "".join(after) == "konacni odgovor"
+
+
+def test_api_chat_stream_live_deltas_are_opt_in(monkeypatch):
+    monkeypatch.setenv("CHAT_STREAMING_ENABLED", "true")
+    raw = json.dumps({"text": "nacrt odgovora\n"})
+    monkeypatch.setattr(
+        "services.agent_router_service.AgentRouterService.route",
+        _streaming_route(
+            final_text="konacni odgovor", tokens=[raw], require_sink=False
+        ),
+    )
+
+    r = TestClient(_load_app()).post("/api/chat/stream", json=_payload())
+    evts = _parse_ndjson(r.text)
+    types = [e.get("type") for e in evts]
+
+    # Without the opt-in the draft tokens are never sent and no reset is needed.
+    assert evts[0]["data"]["capabilities"]["delta_reset"] is False
+    assert "assistant.reset" not in types
+    deltas = [e["data"]["delta_text"] for e in evts if e["type"] == "assistant.delta"]
+    assert "".join(deltas) == "konacni odgovor"
+    assert not any("nacrt" in d for d in deltas)
+
+
+def test_incremental_sanitizer_withholds_internal_template_lines():
+    from gateway.gateway_server import IncrementalResponseSanitizer
+
+    s = IncrementalResponseSanitizer(prompt="koji je plan za Q3?")
+    assert s.feed("Plan za Q3:\n- prodaja") == "Plan za Q3:\n"
+    assert s.feed("\nJa sam CEO Advisor u ovom workspace-u\n") == ""
+    assert s.withheld and s.flush() == ""
+    assert s.released == "Plan za Q3:\n"
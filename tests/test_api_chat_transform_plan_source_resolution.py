@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -23,7 +24,9 @@ def _disable_grounding(monkeypatch) -> None:
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
 
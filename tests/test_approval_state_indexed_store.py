@@ -0,0 +1,142 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import services.approval_state_service as ass
+from services.approval_state_service import ApprovalStateService
+
+
+def _reset_globals(monkeypatch) -> None:
+    monkeypatch.setattr(ApprovalStateService, "_GLOBAL_APPROVALS", {})
+    monkeypatch.setattr(ApprovalStateService, "_GLOBAL_INDEX", ass._ApprovalIndex())
+    monkeypatch.setattr(ApprovalStateService, "_GLOBAL_ARCHIVE", ass._ApprovalArchive())
+    monkeypatch.setattr(ApprovalStateService, "_GLOBAL_JOURNAL", None)
+    monkeypatch.setattr(ApprovalStateService, "_LOADED_FROM_DISK", False)
+
+
+@pytest.fixture
+def store_path(monkeypatch, tmp_path):
+    path = tmp_path / "approval_state.json"
+    monkeypatch.setattr(ass, "_APPROVAL_FILE", path)
+    _reset_globals(monkeypatch)
+    return path
+
+
+def _create(svc: ApprovalStateService, execution_id: str, **payload):
+    return svc.create(
+        command="create_task",
+        payload_summary=payload or {"title": "x"},
+        scope="notion",
+        risk_level="standard",
+        execution_id=execution_id,
+    )
+
+
+def test_idempotent_create_and_archive_on_reject(store_path, monkeypatch):
+    svc = ApprovalStateService()
+    a1 = _create(svc, "exec-1", title="A", n=1)
+    again = _create(svc, "exec-1", n=1, title="A")
+    assert again["approval_id"] == a1["approval_id"]
+
+    svc.reject(a1["approval_id"], rejected_by="ceo")
+    # Terminal approvals leave the hot set but stay readable.
+    assert a1["approval_id"] not in ApprovalStateService._GLOBAL_APPROVALS
+    assert svc.get(a1["approval_id"])["status"] == "rejected"
+    assert [a["approval_id"] for a in svc.list_approvals(status="rejected")] == [
+        a1["approval_id"]
+    ]
+
+    # A rejected approval no longer satisfies idempotency.
+    a2 = _create(svc, "exec-1", title="A", n=1)
+    assert a2["approval_id"] != a1["approval_id"]
+    svc.approve(a2["approval_id"], approved_by="ceo")
+    assert [a["approval_id"] for a in svc.list_approvals()] == [a2["approval_id"]]
+    assert [a["approval_id"] for a in svc.list_approvals(include_archived=True)] == [
+        a1["approval_id"],
+        a2["approval_id"],
+    ]
+
+    # Restart: snapshot + journal + archive rebuild the same state.
+    _reset_globals(monkeypatch)
+    svc2 = ApprovalStateService()
+    assert svc2.is_fully_approved(a2["approval_id"]) is True
+    assert svc2.get(a1["approval_id"])["status"] == "rejected"
+    assert _create(svc2, "exec-1", title="A", n=1)["approval_id"] == a2["approval_id"]
+    snapshot = json.loads(store_path.read_text(encoding="utf-8"))
+    assert set(snapshot) == {a2["approval_id"]}
+
+
+def test_executed_approvals_are_archived_and_counted(store_path, monkeypatch):
+    svc = ApprovalStateService()
+    done = _create(svc, "exec-done")
+    _create(svc, "exec-pending")
+    rejected = _create(svc, "exec-rejected")
+    svc.approve(done["approval_id"], approved_by="ceo")
+    svc.reject(rejected["approval_id"], rejected_by="ceo")
+    assert svc.count_by_status() == {"pending": 1, "approved": 1, "rejected": 1}
+
+    svc.mark_executed(done["approval_id"], execution_state="COMPLETED")
+    assert done["approval_id"] not in ApprovalStateService._GLOBAL_APPROVALS
+    assert svc.count_by_status() == {"pending": 1, "approved": 1, "rejected": 1}
+    assert svc.is_fully_approved(done["approval_id"]) is True
+    assert svc.get(done["approval_id"])["execution_state"] == "COMPLETED"
+
+    # Restart: archived counts and idempotency survive without the hot set.
+    _reset_globals(monkeypatch)
+    svc2 = ApprovalStateService()
+    assert svc2.count_by_status() == {"pending": 1, "approved": 1, "rejected": 1}
+    assert svc2.is_fully_approved(done["approval_id"]) is True
+    assert _create(svc2, "exec-done")["approval_id"] == done["approval_id"]
+    assert [a["status"] for a in svc2.list_approvals()] == ["pending"]
+
+
+def test_ttl_expiry_uses_heap_and_archives(store_path, monkeypatch):
+    monkeypatch.setattr(ass, "_PENDING_TTL_SECONDS", 3600)
+    svc = ApprovalStateService()
+    old = _create(svc, "exec-old")
+    fresh = _create(svc, "exec-fresh")
+
+    # Age the first approval past the TTL and re-index it.
+    rec = ApprovalStateService._GLOBAL_APPROVALS[old["approval_id"]]
+    rec["created_at"] = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+    ApprovalStateService._GLOBAL_INDEX.add(rec)
+
+    assert [a["approval_id"] for a in svc.list_pending()] == [fresh["approval_id"]]
+    with pytest.raises(ValueError):
+        svc.approve(old["approval_id"])
+    assert svc.get(old["approval_id"])["note"] == "expired_by_ttl"
+
+
+def test_journal_compaction(store_path, monkeypatch):
+    monkeypatch.setenv("APPROVAL_JOURNAL_COMPACT_RECORDS", "3")
+    svc = ApprovalStateService()
+    ids = [_create(svc, f"exec-{i}")["approval_id"] for i in range(4)]
+
+    journal = ass.journal_path_for(store_path)
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 1
+    assert set(json.loads(store_path.read_text(encoding="utf-8"))) == set(ids[:3])
+
+    _reset_globals(monkeypatch)
+    assert len(ApprovalStateService().list_pending()) == 4
+
+
+def test_torn_archive_tail_does_not_swallow_next_archived(store_path, monkeypatch):
+    svc = ApprovalStateService()
+    a1 = _create(svc, "exec-a1")
+    svc.reject(a1["approval_id"], rejected_by="ceo")
+    # Crash mid-append: an archive record without its trailing newline.
+    with open(ass._archive_path(), "ab") as f:
+        f.write(b'{"approval_id": "a2", "status": "rej')
+
+    a3 = _create(svc, "exec-a3")
+    svc.reject(a3["approval_id"], rejected_by="ceo")
+
+    _reset_globals(monkeypatch)
+    svc2 = ApprovalStateService()
+    archived = svc2.list_approvals(status="rejected")
+    assert [a["approval_id"] for a in archived] == [
+        a1["approval_id"],
+        a3["approval_id"],
+    ]
+    assert svc2.get(a3["approval_id"])["status"] == "rejected"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 
 def _load_app():
@@ -55,7 +56,9 @@ def test_business_plan_offer_yes_delivers_template_not_json(monkeypatch, tmp_pat
             "diagnostics": {},
         }
 
-    monkeypatch.setattr(GroundingPackService, "build", staticmethod(_stub_gp_build))
+    monkeypatch.setattr(
+        GroundingPackService, "abuild", AsyncMock(side_effect=_stub_gp_build)
+    )
 
     # Stub the LLM executor:
     # - first call returns KB-backed text that includes the explicit offer sentence
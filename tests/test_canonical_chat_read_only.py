@@ -1,4 +1,5 @@
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 from models.agent_contract import AgentOutput, ProposedCommand
 from services.approval_state_service import get_approval_state
@@ -144,7 +145,9 @@ def test_api_chat_preview_request_returns_structured_notion_preview(monkeypatch)
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     wrapper_prompt = (
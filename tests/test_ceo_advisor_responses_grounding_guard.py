@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -46,7 +47,9 @@ def test_responses_mode_calls_executor_with_non_empty_instructions(monkeypatch):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: _grounding_pack_full()
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: _grounding_pack_full()),
     )
 
     captured: Dict[str, Any] = {}
@@ -90,7 +93,9 @@ def test_responses_mode_blocks_executor_when_grounding_missing(monkeypatch):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):
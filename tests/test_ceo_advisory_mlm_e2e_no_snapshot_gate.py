@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 
 def _load_app():
@@ -40,7 +41,9 @@ def test_ceo_advisory_mlm_prompt_does_not_trigger_snapshot_gate(monkeypatch, tmp
             "diagnostics": {},
         }
 
-    monkeypatch.setattr(GroundingPackService, "build", staticmethod(_stub_gp_build))
+    monkeypatch.setattr(
+        GroundingPackService, "abuild", AsyncMock(side_effect=_stub_gp_build)
+    )
 
     app = _load_app()
     client = TestClient(app)
@@ -0,0 +1,52 @@
+from fastapi.testclient import TestClient
+
+import services.approval_state_service as ass
+from services.approval_state_service import ApprovalStateService
+from tests.auth_utils import auth_headers
+
+
+def _reset_globals(monkeypatch) -> None:
+    monkeypatch.setattr(ApprovalStateService, "_GLOBAL_APPROVALS", {})
+    monkeypatch.setattr(ApprovalStateService, "_GLOBAL_INDEX", ass._ApprovalIndex())
+    monkeypatch.setattr(ApprovalStateService, "_GLOBAL_ARCHIVE", ass._ApprovalArchive())
+    monkeypatch.setattr(ApprovalStateService, "_GLOBAL_JOURNAL", None)
+    monkeypatch.setattr(ApprovalStateService, "_LOADED_FROM_DISK", False)
+
+
+def test_snapshot_counts_archived_approvals(monkeypatch, tmp_path):
+    import gateway.gateway_server as gs  # noqa: PLC0415
+
+    monkeypatch.setattr(ass, "_APPROVAL_FILE", tmp_path / "approval_state.json")
+    _reset_globals(monkeypatch)
+    svc = ApprovalStateService()
+    monkeypatch.setattr(gs, "get_approval_state", lambda: svc)
+
+    ids = []
+    for n in range(3):
+        a = svc.create(
+            command="create_task",
+            payload_summary={"title": f"t{n}"},
+            scope="notion",
+            risk_level="standard",
+            execution_id=f"exec-snap-{n}",
+        )
+        ids.append(a["approval_id"])
+    svc.reject(ids[0], rejected_by="ceo")
+    svc.approve(ids[1], approved_by="ceo")
+    svc.mark_executed(ids[1], execution_state="COMPLETED")
+    # Rejected and executed approvals are archived out of the hot set.
+    assert ids[0] not in ApprovalStateService._GLOBAL_APPROVALS
+    assert ids[1] not in ApprovalStateService._GLOBAL_APPROVALS
+
+    client = TestClient(gs.app)
+    r = client.get(
+        "/api/ceo/console/snapshot", headers=auth_headers(sub="snapshot-approvals")
+    )
+    assert r.status_code == 200
+
+    approvals = r.json()["approvals"]
+    assert approvals["total"] == 3
+    assert approvals["rejected_count"] == 1
+    assert approvals["approved_count"] == 1
+    assert approvals["pending_count"] == 1
+    assert [a["approval_id"] for a in approvals["pending"]] == [ids[2]]
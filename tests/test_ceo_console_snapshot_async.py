@@ -0,0 +1,213 @@
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+import services.ceo_console_snapshot_service as ccs
+from services.ceo_console_snapshot_service import (
+    CeoConsoleSnapshotService,
+    _AsyncNotionClient,
+    _NotionConfig,
+)
+from services.knowledge_snapshot_service import KnowledgeSnapshotService
+
+
+def _row(pid: str, title: str) -> Dict[str, Any]:
+    return {
+        "id": pid,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": title}]},
+            "Status": {"type": "select", "select": {"name": "Pending"}},
+        },
+    }
+
+
+def _cfg() -> _NotionConfig:
+    return _NotionConfig(
+        token="t",
+        version="2022-06-28",
+        goals_db_id="goals",
+        tasks_db_id="tasks",
+        approvals_db_id="approvals",
+        plans_db_id="plans",
+        time_management_page_id="tm",
+    )
+
+
+class _FakeAsyncNotion:
+    def __init__(self, *, delay_s: float = 0.0) -> None:
+        self.delay_s = delay_s
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _enter(self, name: str) -> None:
+        self.calls.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_s)
+        finally:
+            self.in_flight -= 1
+
+    async def query_database(self, database_id, filter_=None, sorts=None, **_kw):
+        await self._enter(f"query:{database_id}")
+        return [_row(f"{database_id}-1", f"{database_id} one")]
+
+    async def retrieve_page(self, page_id):
+        await self._enter(f"page:{page_id}")
+        return {"properties": {"title": {"title": [{"plain_text": "TM"}]}}}
+
+    async def list_block_children(self, block_id, page_size=50, max_blocks=100):
+        await self._enter(f"blocks:{block_id}")
+        return [
+            {"type": "paragraph", "paragraph": {"rich_text": [{"plain_text": "x"}]}}
+        ]
+
+
+class _SyncFromAsync:
+    """Sync _NotionClient facade over the same fake data."""
+
+    def __init__(self, fake: _FakeAsyncNotion) -> None:
+        self._fake = fake
+
+    def query_database(self, *a, **kw):
+        return asyncio.run(self._fake.query_database(*a, **kw))
+
+    def retrieve_page(self, *a, **kw):
+        return asyncio.run(self._fake.retrieve_page(*a, **kw))
+
+    def list_block_children(self, *a, **kw):
+        return asyncio.run(self._fake.list_block_children(*a, **kw))
+
+
+def _service(fake: _FakeAsyncNotion) -> CeoConsoleSnapshotService:
+    svc = CeoConsoleSnapshotService(notion_client=_SyncFromAsync(fake), config=_cfg())
+    svc._anotion = fake  # type: ignore[assignment]
+    return svc
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        KnowledgeSnapshotService,
+        "get_snapshot",
+        classmethod(lambda cls: {"ready": True, "trace": {"ttl_seconds": 60}}),
+        raising=True,
+    )
+    ccs.clear_dashboard_cache()
+    yield
+    ccs.clear_dashboard_cache()
+
+
+def test_asnapshot_fans_out_and_matches_sync_snapshot():
+    fake = _FakeAsyncNotion(delay_s=0.02)
+    out = asyncio.run(_service(fake).asnapshot())
+
+    assert out["available"] is True
+    assert out["ttl_seconds"] == 60
+    # goals, tasks, approvals, plans, page, blocks all in flight together.
+    assert fake.max_in_flight == 6
+    assert out["knowledge"]["time_management"]["excerpt"] == ["x"]
+
+    sync_out = _service(_FakeAsyncNotion()).snapshot()
+    for o in (out, sync_out):
+        o.pop("generated_at")
+        o["dashboard"].pop("generated_at")
+    assert out == sync_out
+
+
+def test_concurrent_asnapshot_calls_share_one_sweep(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("CEO_CONSOLE_SNAPSHOT_CACHE_TTL_S", "60")
+    fake = _FakeAsyncNotion(delay_s=0.02)
+
+    async def _run():
+        return await asyncio.gather(*[_service(fake).asnapshot() for _ in range(5)])
+
+    outs = asyncio.run(_run())
+    assert all(o["available"] for o in outs)
+    assert len(fake.calls) == 6
+
+    # Within the TTL both paths are served from the cache.
+    asyncio.run(_service(fake).asnapshot())
+    _service(fake).snapshot()
+    assert len(fake.calls) == 6
+
+    # Callers get private copies.
+    outs[0]["dashboard"]["goals"].clear()
+    assert outs[1]["dashboard"]["goals"]
+
+
+def test_async_client_follows_cursor_and_truncates(monkeypatch: pytest.MonkeyPatch):
+    seen: List[Any] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        seen.append(body)
+        cursor = b"c1" if b'"start_cursor"' not in body else None
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"id": f"r{len(seen)}-{i}"} for i in range(2)],
+                "next_cursor": cursor.decode() if cursor else None,
+            },
+        )
+
+    async def _run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        monkeypatch.setattr(ccs, "_pooled_async_client", lambda *_a: client)
+        monkeypatch.setattr(ccs, "NOTION_API_URL", "http://test/v1")
+        try:
+            notion = _AsyncNotionClient(_cfg())
+            all_rows = await notion.query_database("db")
+            capped = await notion.query_database("db", max_rows=1)
+        finally:
+            await client.aclose()
+        return all_rows, capped
+
+    all_rows, capped = asyncio.run(_run())
+    assert [r["id"] for r in all_rows] == ["r1-0", "r1-1", "r2-0", "r2-1"]
+    assert b'"start_cursor":"c1"' in seen[1].replace(b" ", b"")
+    assert [r["id"] for r in capped] == ["r3-0"]
+    assert len(seen) == 3
+
+
+def test_async_client_uses_token_limiter_and_retries_429_and_5xx(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from services.notion_rate_limiter import (
+        get_rate_limiter_for_token,
+        reset_rate_limiters_for_tests,
+    )
+
+    statuses = [429, 503, 200]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        if status == 429:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={})
+        if status != 200:
+            return httpx.Response(status, json={})
+        return httpx.Response(200, json={"id": "p1"})
+
+    async def _run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        monkeypatch.setattr(ccs, "_pooled_async_client", lambda *_a: client)
+        monkeypatch.setattr(ccs, "NOTION_API_URL", "http://test/v1")
+        try:
+            return await _AsyncNotionClient(_cfg()).retrieve_page("p1")
+        finally:
+            await client.aclose()
+
+    reset_rate_limiters_for_tests()
+    try:
+        assert asyncio.run(_run()) == {"id": "p1"}
+        stats = get_rate_limiter_for_token(_cfg().token).stats()
+    finally:
+        reset_rate_limiters_for_tests()
+    assert statuses == []
+    assert stats["throttled_429"] == 1
+    assert stats["transient_errors"] == 1
+    assert stats["retries"] == 2
+    assert stats["in_flight"] == 0
@@ -93,10 +93,13 @@ def test_ceo_console_snapshot_adds_world_state_snapshot_without_notion_calls(
     # Arrange: stub legacy ceo_dashboard_snapshot builder to guarantee zero external IO.
     import gateway.gateway_server as gs
 
+    async def _stub_asnapshot(self: Any) -> Dict[str, Any]:
+        return {"ok": True, "source": "test_stub"}
+
     monkeypatch.setattr(
         gs.CEOConsoleSnapshotService,
-        "snapshot",
-        lambda self: {"ok": True, "source": "test_stub"},
+        "asnapshot",
+        _stub_asnapshot,
         raising=True,
     )
 
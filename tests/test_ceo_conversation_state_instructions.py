@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -50,7 +51,9 @@ def test_conversation_state_is_injected_into_responses_instructions(
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: _grounding_pack_full()
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: _grounding_pack_full()),
     )
 
     captured: Dict[str, Any] = {}
@@ -0,0 +1,116 @@
+import json
+import os
+
+import pytest
+
+from services import ceo_conversation_state_store as store
+from services.ceo_conversation_state_store import ConversationStateStore
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch, tmp_path):
+    monkeypatch.setenv("MEMORY_BACKEND", "file")
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_PATH", str(tmp_path / "state.json"))
+    monkeypatch.delenv("CEO_CONVERSATION_STATE_DIR", raising=False)
+    store.clear_conversation_state_cache()
+    yield
+    store.clear_conversation_state_cache()
+
+
+def _exercise():
+    for i in range(5):
+        ConversationStateStore.append_turn(
+            conversation_id="c1", user_text=f"u{i}", assistant_text=f"a{i}", max_turns=3
+        )
+    ConversationStateStore.append_turn(
+        conversation_id="c2", user_text="x", assistant_text="y"
+    )
+    ConversationStateStore.update_meta(conversation_id="c1", updates={"k": 1})
+    ConversationStateStore.update_meta(conversation_id="c1", updates={"k": 2, "j": 3})
+    out = {}
+    for cid in ("c1", "c2", "missing"):
+        turns = ConversationStateStore.get_recent_turns(conversation_id=cid)
+        out[cid] = (
+            [(t["user"], t["assistant"]) for t in turns],
+            ConversationStateStore.get_meta(conversation_id=cid),
+            ConversationStateStore.get_summary(conversation_id=cid).summary_text,
+        )
+    return out
+
+
+def test_sharded_layout_matches_single_file_layout(monkeypatch, tmp_path):
+    legacy = _exercise()
+
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_LAYOUT", "sharded")
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_PATH", str(tmp_path / "other.json"))
+    assert _exercise() == legacy
+    assert legacy["c1"][0] == [("u2", "a2"), ("u3", "a3"), ("u4", "a4")]
+
+    segments = [
+        os.path.join(d, f)
+        for d, _, files in os.walk(tmp_path / "other.json.d")
+        for f in files
+    ]
+    assert len(segments) == 2
+    assert not (tmp_path / "other.json").exists()
+
+
+def test_compaction_rewrites_segment_as_snapshot(monkeypatch):
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_LAYOUT", "sharded")
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_COMPACT_RECORDS", "4")
+    for i in range(10):
+        ConversationStateStore.append_turn(
+            conversation_id="c1", user_text=f"u{i}", assistant_text="a", max_turns=2
+        )
+
+    with open(store._segment_path("c1"), encoding="utf-8") as f:
+        recs = [json.loads(line) for line in f]
+    assert len(recs) < 4
+    assert recs[0]["op"] == "snapshot" and recs[0]["cid"] == "c1"
+
+    store.clear_conversation_state_cache()
+    turns = ConversationStateStore.get_recent_turns(conversation_id="c1")
+    assert [t["user"] for t in turns] == ["u8", "u9"]
+
+
+def test_seeds_from_legacy_file_and_sees_external_appends(monkeypatch):
+    ConversationStateStore.append_turn(
+        conversation_id="c1", user_text="old", assistant_text="a"
+    )
+    ConversationStateStore.update_meta(conversation_id="c1", updates={"m": True})
+
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_LAYOUT", "sharded")
+    assert ConversationStateStore.get_meta(conversation_id="c1") == {"m": True}
+    ConversationStateStore.append_turn(
+        conversation_id="c1", user_text="new", assistant_text="b"
+    )
+
+    # Another worker process appends to the same segment.
+    with open(store._segment_path("c1"), "a", encoding="utf-8") as f:
+        f.write(json.dumps({"op": "meta", "updates": {"w": 2}}) + "\n")
+
+    assert ConversationStateStore.get_meta(conversation_id="c1") == {
+        "m": True,
+        "w": 2,
+    }
+    turns = ConversationStateStore.get_recent_turns(conversation_id="c1")
+    assert [t["user"] for t in turns] == ["old", "new"]
+
+
+def test_torn_segment_tail_does_not_swallow_next_append(monkeypatch):
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_LAYOUT", "sharded")
+    ConversationStateStore.append_turn(
+        conversation_id="c1", user_text="u0", assistant_text="a0"
+    )
+    # Crash mid-append: a record without its trailing newline.
+    with open(store._segment_path("c1"), "a", encoding="utf-8") as f:
+        f.write('{"op": "meta", "updates": {"torn"')
+
+    ConversationStateStore.append_turn(
+        conversation_id="c1", user_text="u1", assistant_text="a1"
+    )
+
+    store.clear_conversation_state_cache()
+    turns = ConversationStateStore.get_recent_turns(conversation_id="c1")
+    assert [t["user"] for t in turns] == ["u0", "u1"]
+    assert ConversationStateStore.get_meta(conversation_id="c1") == {}
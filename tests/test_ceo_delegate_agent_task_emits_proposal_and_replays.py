@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 
 def _load_app():
@@ -38,7 +39,9 @@ def test_delegate_agent_task_emits_proposal_and_replays_on_short_confirm(
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 
 def _load_app():
@@ -40,7 +41,9 @@ def test_deliverable_decline_cancels_pending_and_no_unknown_mode(monkeypatch, tm
             "diagnostics": {},
         }
 
-    monkeypatch.setattr(GroundingPackService, "build", staticmethod(_stub_gp_build))
+    monkeypatch.setattr(
+        GroundingPackService, "abuild", AsyncMock(side_effect=_stub_gp_build)
+    )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
         raise AssertionError("LLM/executor must not be called")
@@ -129,7 +132,9 @@ def test_advisory_with_pasted_deliverable_keywords_does_not_offer_delegation(
             "diagnostics": {},
         }
 
-    monkeypatch.setattr(GroundingPackService, "build", staticmethod(_stub_gp_build))
+    monkeypatch.setattr(
+        GroundingPackService, "abuild", AsyncMock(side_effect=_stub_gp_build)
+    )
 
     app = _load_app()
     client = TestClient(app)
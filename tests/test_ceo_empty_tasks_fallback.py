@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -36,7 +37,9 @@ def test_empty_tasks_fallback_generates_priorities_and_proposal_no_executor(
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):
@@ -104,7 +107,9 @@ def test_empty_tasks_fallback_refuses_without_signals_no_executor(
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):
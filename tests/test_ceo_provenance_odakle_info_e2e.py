@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 
 def _load_app():
@@ -50,7 +51,9 @@ def test_api_chat_provenance_odakle_info_does_not_return_unknown_mode(
             "diagnostics": {},
         }
 
-    monkeypatch.setattr(GroundingPackService, "build", staticmethod(_stub_gp_build))
+    monkeypatch.setattr(
+        GroundingPackService, "abuild", AsyncMock(side_effect=_stub_gp_build)
+    )
 
     app = _load_app()
     client = TestClient(app)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -40,7 +41,9 @@ def test_deliverable_proposal_then_confirm_executes_rgo_no_notion(
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -165,7 +168,9 @@ def test_weekly_explicit_does_not_call_rgo(monkeypatch, tmp_path):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     calls: list[int] = []
@@ -238,7 +243,9 @@ def test_pasted_deliverable_keywords_without_request_verbs_does_not_propose_dele
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -292,7 +299,9 @@ def test_moze_phrase_is_not_treated_as_deliverable_confirm(monkeypatch, tmp_path
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -367,7 +376,9 @@ def test_pending_proposal_decline_clears_replay(monkeypatch, tmp_path):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -436,7 +447,9 @@ def test_pending_new_request_cancels_and_routes(monkeypatch, tmp_path):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -496,7 +509,9 @@ def test_pending_unknown_twice_prompts_once_then_auto_cancels(monkeypatch, tmp_p
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -599,7 +614,9 @@ def test_pending_decline_then_advisory_cancels_pending_and_continues(
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -686,7 +703,9 @@ def test_ssot_missing_no_hallucinated_goals_tasks(monkeypatch, tmp_path):
             "memory_snapshot": {"payload": {}},
         }
 
-    monkeypatch.setattr(GroundingPackService, "build", _fake_gp_build)
+    monkeypatch.setattr(
+        GroundingPackService, "abuild", AsyncMock(side_effect=_fake_gp_build)
+    )
 
     class _FakeExecutor:
         async def ceo_command(self, text, context):  # noqa: ANN001
@@ -738,7 +757,9 @@ def test_decline_deliverables_new_request_does_not_loop(monkeypatch, tmp_path):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
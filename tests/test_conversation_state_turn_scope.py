@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import pytest
+
+import services.ceo_conversation_state_store as store_mod
+from services.ceo_conversation_state_store import (
+    ConversationStateStore,
+    conversation_state_turn,
+    conversation_state_turn_stats,
+)
+
+
+@pytest.fixture(params=["json", "sharded"])
+def layout(request, tmp_path, monkeypatch):
+    monkeypatch.setenv("MEMORY_BACKEND", "file")
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_LAYOUT", request.param)
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_PATH", str(tmp_path / "state.json"))
+    monkeypatch.delenv("CEO_CONVERSATION_STATE_DIR", raising=False)
+    store_mod.clear_conversation_state_cache()
+    yield request.param
+    store_mod.clear_conversation_state_cache()
+
+
+def _count_backend_calls(monkeypatch):
+    calls = {"load": 0, "save": 0, "append": 0, "segment": 0}
+
+    def _wrap(name, key):
+        orig = getattr(store_mod, name)
+
+        def _inner(*args, **kwargs):
+            calls[key] += 1
+            return orig(*args, **kwargs)
+
+        monkeypatch.setattr(store_mod, name, _inner)
+
+    _wrap("_load_db", "load")
+    _wrap("_save_db", "save")
+    _wrap("_append_records", "append")
+    _wrap("_sharded_state", "segment")
+    return calls
+
+
+def test_turn_loads_once_serves_own_writes_and_flushes_once(layout, monkeypatch):
+    ConversationStateStore.append_turn(
+        conversation_id="c1", user_text="u0", assistant_text="a0"
+    )
+    ConversationStateStore.update_meta(conversation_id="c1", updates={"k": 1})
+    calls = _count_backend_calls(monkeypatch)
+
+    with conversation_state_turn():
+        assert ConversationStateStore.get_meta(conversation_id="c1") == {"k": 1}
+        ConversationStateStore.update_meta(conversation_id="c1", updates={"k": 2})
+        ConversationStateStore.append_turn(
+            conversation_id="c1", user_text="u1", assistant_text="a1", max_turns=2
+        )
+        ConversationStateStore.append_turn(
+            conversation_id="c1", user_text="u2", assistant_text="a2", max_turns=2
+        )
+        recent = ConversationStateStore.get_recent_turns(conversation_id="c1")
+        summary = ConversationStateStore.get_summary(conversation_id="c1")
+        assert ConversationStateStore.get_meta(conversation_id="c1") == {"k": 2}
+        assert [t["user"] for t in recent] == ["u1", "u2"]
+        assert summary.turns_used == 2
+        stats = conversation_state_turn_stats()
+        assert stats is not None
+        assert stats["loads"] == 1 and stats["pending_flushes"] == 1
+        assert stats["round_trips"] == 2
+
+    if layout == "sharded":
+        assert calls["segment"] == 1 and calls["append"] == 1
+    else:
+        # one read at load time, one read-modify-write at flush
+        assert calls["load"] == 2 and calls["save"] == 1
+
+    store_mod.clear_conversation_state_cache()
+    assert [
+        t["user"] for t in ConversationStateStore.get_recent_turns(conversation_id="c1")
+    ] == ["u1", "u2"]
+    assert ConversationStateStore.get_meta(conversation_id="c1") == {"k": 2}
+
+
+def test_flush_runs_on_error_and_scope_is_not_reused(layout):
+    with pytest.raises(RuntimeError):
+        with conversation_state_turn():
+            ConversationStateStore.update_meta(
+                conversation_id="c2", updates={"pending": True}
+            )
+            raise RuntimeError("boom")
+
+    assert conversation_state_turn_stats() is None
+    assert ConversationStateStore.get_meta(conversation_id="c2") == {"pending": True}
+
+
+def test_json_flush_keeps_concurrent_writes(tmp_path, monkeypatch):
+    monkeypatch.setenv("MEMORY_BACKEND", "file")
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_LAYOUT", "json")
+    monkeypatch.setenv("CEO_CONVERSATION_STATE_PATH", str(tmp_path / "state.json"))
+
+    with conversation_state_turn():
+        ConversationStateStore.update_meta(conversation_id="c3", updates={"a": 1})
+        # Another request writes the same conversation meanwhile.
+        store_mod._flush_records("c3", [{"op": "meta", "updates": {"b": 2}}])
+
+    assert ConversationStateStore.get_meta(conversation_id="c3") == {"a": 1, "b": 2}
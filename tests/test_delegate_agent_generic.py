@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -33,7 +34,9 @@ def test_delegate_to_named_agent_is_read_only_and_no_toggle(monkeypatch, tmp_pat
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     calls: list[dict] = []
@@ -103,7 +106,9 @@ def test_delegate_unknown_agent_returns_read_only_no_proposals(monkeypatch, tmp_
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     app = _load_app()
@@ -139,7 +144,9 @@ def test_delegate_missing_target_prompts_agent_picker(monkeypatch, tmp_path):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     app = _load_app()
@@ -177,7 +184,9 @@ def test_delegate_missing_target_with_comma_prompts_picker(monkeypatch, tmp_path
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     app = _load_app()
@@ -209,7 +218,9 @@ def test_delegate_to_rgo_without_colon_still_delegates(monkeypatch, tmp_path):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     calls: list[dict] = []
@@ -269,7 +280,9 @@ def test_delegate_target_before_word_agentu(monkeypatch, tmp_path):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     calls: list[dict] = []
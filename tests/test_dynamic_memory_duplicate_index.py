@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import random
+
+from services.decision_engine.duplicate_index import bounded_distance, max_distance
+from services.decision_engine.dynamic_memory import DynamicMemoryEngine
+
+
+def _legacy(engine: DynamicMemoryEngine, title: str):
+    normalized_new = engine.normalize(title)
+    out = []
+    for t in engine.memory["tasks"]:
+        ratio = engine.levenshtein_ratio(normalized_new, engine.normalize(t))
+        if ratio >= 0.75:
+            out.append({"task": t, "similarity": ratio})
+    return out
+
+
+def _mutate(rnd: random.Random, s: str) -> str:
+    chars = list(s)
+    for _ in range(rnd.randint(0, 4)):
+        pos = rnd.randrange(len(chars) + 1)
+        op = rnd.random()
+        if op < 0.4 and chars:
+            chars[min(pos, len(chars) - 1)] = rnd.choice("aeiočšž -!")
+        elif op < 0.7:
+            chars.insert(pos, rnd.choice("abcčćđ "))
+        elif chars:
+            del chars[min(pos, len(chars) - 1)]
+    return "".join(chars)
+
+
+def test_index_matches_full_scan_on_random_titles():
+    rnd = random.Random(3)
+    words = [
+        "plan",
+        "prodaja",
+        "Čišćenje",
+        "ŠEF",
+        "đak",
+        "ugovor",
+        "Q1",
+        "2024",
+        "-",
+        "á",
+    ]
+    titles = [" ".join(rnd.choices(words, k=rnd.randint(1, 4))) for _ in range(150)]
+    titles += ["", "ab", "abc", "  !!  "]
+    engine = DynamicMemoryEngine({"dynamic_memory": {"tasks": titles}})
+
+    queries = [_mutate(rnd, rnd.choice(titles)) for _ in range(120)] + ["", "x", "á "]
+    for q in queries:
+        assert engine.check_duplicates(q) == _legacy(engine, q), q
+
+
+def test_index_follows_add_task_and_external_list_changes():
+    session = {"dynamic_memory": {"tasks": ["Pripremi izvještaj"]}}
+    engine = DynamicMemoryEngine(session)
+    assert [d["task"] for d in engine.check_duplicates("pripremi izvjestaj")] == [
+        "Pripremi izvještaj"
+    ]
+
+    engine.add_task("Pošalji ponudu klijentu")
+    engine.add_task("Pošalji ponudu klijentu")
+    assert engine.memory["tasks"] == ["Pripremi izvještaj", "Pošalji ponudu klijentu"]
+    assert engine.check_duplicates("posalji ponudu klijentu")[0]["similarity"] == 1.0
+
+    # Append izvana (bez add_task), zamjena elementa usred liste i zamjena
+    # cijele liste.
+    engine.memory["tasks"].append("Sastanak tima")
+    assert engine.check_duplicates("sastanak tim")
+    engine.memory["tasks"][0] = "Revizija ugovora"
+    assert engine.check_duplicates("pripremi izvjestaj") == []
+    assert engine.check_duplicates("revizija ugovora")[0]["task"] == "Revizija ugovora"
+    engine.add_task("Pripremi izvještaj")
+    assert engine.memory["tasks"][-1] == "Pripremi izvještaj"
+    engine.memory["tasks"] = ["Budžet 2025"]
+    assert engine.check_duplicates("sastanak tima") == []
+    assert engine.check_duplicates("budzet 2025")[0]["task"] == "Budžet 2025"
+
+
+def test_bounded_distance_and_max_distance():
+    assert bounded_distance("kitten", "sitting", 3) == 3
+    assert bounded_distance("kitten", "sitting", 2) is None
+    assert bounded_distance("", "abc", 3) == 3
+    for n in range(1, 40):
+        k = max_distance(n)
+        assert 1 - (k / n) >= 0.75 and 1 - ((k + 1) / n) < 0.75
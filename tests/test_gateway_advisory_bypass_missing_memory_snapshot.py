@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from typing import Any, Dict
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -74,7 +75,7 @@ def test_gateway_advisory_bypass_missing_memory_snapshot_a(monkeypatch):
     monkeypatch.setattr(
         gw,
         "_build_ceo_read_context",
-        lambda **_k: _ctx_bridge_missing_memory_snapshot(),
+        AsyncMock(side_effect=lambda **_k: _ctx_bridge_missing_memory_snapshot()),
     )
 
     async def _fake_create_ceo_advisor_agent(_agent_in, _agent_ctx):  # noqa: ANN001
@@ -129,7 +130,7 @@ def test_gateway_advisory_bypass_missing_memory_snapshot_b(monkeypatch):
     monkeypatch.setattr(
         gw,
         "_build_ceo_read_context",
-        lambda **_k: _ctx_bridge_missing_memory_snapshot(),
+        AsyncMock(side_effect=lambda **_k: _ctx_bridge_missing_memory_snapshot()),
     )
 
     async def _fake_create_ceo_advisor_agent(_agent_in, _agent_ctx):  # noqa: ANN001
@@ -181,7 +182,7 @@ def test_gateway_fact_lookup_missing_memory_snapshot_still_returns_canonical_no_
     monkeypatch.setattr(
         gw,
         "_build_ceo_read_context",
-        lambda **_k: _ctx_bridge_missing_memory_snapshot(),
+        AsyncMock(side_effect=lambda **_k: _ctx_bridge_missing_memory_snapshot()),
     )
 
     async def _boom(*_a, **_k):  # noqa: ANN001
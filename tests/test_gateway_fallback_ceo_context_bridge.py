@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from typing import Any, Dict
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -84,7 +85,8 @@ def test_gateway_fallback_context_bridge_uses_context_and_llm(monkeypatch):
         }
 
     monkeypatch.setattr(
-        "services.grounding_pack_service.GroundingPackService.build", _fake_gp_build
+        "services.grounding_pack_service.GroundingPackService.abuild",
+        AsyncMock(side_effect=_fake_gp_build),
     )
 
     # Patch CEO agent to avoid hitting OpenAI and to echo context deterministically.
@@ -204,7 +206,9 @@ def test_gateway_fallback_disarmed_strips_notion_only(monkeypatch):
             "trace": {},
         }
 
-    monkeypatch.setattr(gw, "_build_ceo_read_context", _fake_ctx_bridge)
+    monkeypatch.setattr(
+        gw, "_build_ceo_read_context", AsyncMock(side_effect=_fake_ctx_bridge)
+    )
 
     class _FakeAgentOut:
         def __init__(self, payload: Dict[str, Any]):
@@ -299,7 +303,9 @@ def test_gateway_fallback_trace_contract(monkeypatch):
             "trace": {},
         }
 
-    monkeypatch.setattr(gw, "_build_ceo_read_context", _fake_ctx_bridge)
+    monkeypatch.setattr(
+        gw, "_build_ceo_read_context", AsyncMock(side_effect=_fake_ctx_bridge)
+    )
 
     class _FakeAgentOut:
         def __init__(self, payload: Dict[str, Any]):
@@ -396,7 +402,8 @@ def test_gateway_fallback_missing_grounding_blocks(monkeypatch):
         }
 
     monkeypatch.setattr(
-        "services.grounding_pack_service.GroundingPackService.build", _fake_gp_build
+        "services.grounding_pack_service.GroundingPackService.abuild",
+        AsyncMock(side_effect=_fake_gp_build),
     )
 
     # Ensure we do not accidentally call the executor in this path.
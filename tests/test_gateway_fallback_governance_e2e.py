@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict, Optional
+from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
@@ -85,7 +86,11 @@ def test_gateway_fallback_bridge_injects_context_and_trace_contract(monkeypatch)
     monkeypatch.setattr("services.notion_ops_state.is_armed", _fake_is_armed)
 
     # Provide deterministic read-context bridge.
-    monkeypatch.setattr(gw, "_build_ceo_read_context", lambda *a, **k: _mk_ctx_bridge())
+    monkeypatch.setattr(
+        gw,
+        "_build_ceo_read_context",
+        AsyncMock(side_effect=lambda *a, **k: _mk_ctx_bridge()),
+    )
 
     captured: Dict[str, Any] = {}
 
@@ -190,7 +195,9 @@ def test_gateway_fallback_bridge_allows_notion_write_when_armed(monkeypatch):
     monkeypatch.setattr("services.notion_ops_state.is_armed", _fake_is_armed)
 
     monkeypatch.setattr(
-        gw, "_build_ceo_read_context", lambda *a, **k: _mk_ctx_bridge(kb_ids=["KB-900"])
+        gw,
+        "_build_ceo_read_context",
+        AsyncMock(side_effect=lambda *a, **k: _mk_ctx_bridge(kb_ids=["KB-900"])),
     )
 
     class _FakeExecutor:
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
+
+from services.grounding_pack_service import GroundingPackService
+
+
+class _LoopRecordingKBStore:
+    """Notion-like store: async I/O that must run on the caller's event loop."""
+
+    def __init__(self) -> None:
+        self.loops: List[asyncio.AbstractEventLoop] = []
+        self.threads: List[str] = []
+        self._entries = [
+            {"id": "kb_alpha", "title": "Alpha strategija", "content": "prodaja"},
+            {"id": "kb_beta", "title": "Beta", "content": "marketing plan"},
+        ]
+
+    def _record(self) -> None:
+        self.loops.append(asyncio.get_running_loop())
+        self.threads.append(threading.current_thread().name)
+
+    def get_meta(self) -> Dict[str, Any]:
+        return {"source": "notion", "mode": "notion", "total_entries": 2}
+
+    async def get_entries(self, ctx: Optional[Dict[str, Any]] = None):
+        self._record()
+        return list(self._entries)
+
+    async def search(
+        self, query: str, *, top_k: int = 8, intent: Optional[str] = None
+    ) -> Dict[str, Any]:
+        self._record()
+        return {
+            "entries": [self._entries[0]],
+            "used_entry_ids": ["kb_alpha"],
+            "meta": self.get_meta(),
+        }
+
+
+def _kwargs() -> Dict[str, Any]:
+    return {
+        "prompt": "alpha strategija",
+        "knowledge_snapshot": {"payload": {"goals": [], "tasks": [], "projects": []}},
+        "memory_public_snapshot": {},
+        "legacy_trace": {"intent": "advisory", "request_id": "req-1"},
+        "agent_id": "pytest",
+    }
+
+
+def _stable(out: Dict[str, Any]) -> Dict[str, Any]:
+    tr = dict(out.get("trace") or {})
+    for k in list(tr.keys()):
+        if k.endswith("_ms") or k.endswith("_at"):
+            tr.pop(k)
+    return {
+        "kb_retrieved": out.get("kb_retrieved"),
+        "trace": tr,
+        "trace_keys": sorted((out.get("trace") or {}).keys()),
+    }
+
+
+def test_abuild_runs_kb_io_on_callers_loop(monkeypatch) -> None:
+    monkeypatch.setenv("CEO_GROUNDING_PACK_ENABLED", "true")
+    store = _LoopRecordingKBStore()
+    monkeypatch.setattr("services.kb_get_store.get_kb_store", lambda: store)
+
+    async def _main():
+        loop = asyncio.get_running_loop()
+        out = await GroundingPackService.abuild(**_kwargs())
+        return loop, out
+
+    loop, out = asyncio.run(_main())
+
+    assert store.loops and all(x is loop for x in store.loops)
+    assert set(store.threads) == {threading.current_thread().name}
+    assert out["kb_retrieved"]["used_entry_ids"] == ["kb_alpha"]
+
+
+def test_sync_build_is_thin_wrapper_with_identical_trace(monkeypatch) -> None:
+    monkeypatch.setenv("CEO_GROUNDING_PACK_ENABLED", "true")
+    store = _LoopRecordingKBStore()
+    monkeypatch.setattr("services.kb_get_store.get_kb_store", lambda: store)
+
+    sync_out = GroundingPackService.build(**_kwargs())
+    async_out = asyncio.run(GroundingPackService.abuild(**_kwargs()))
+
+    assert _stable(sync_out) == _stable(async_out)
+    # No running loop in the sync caller: no worker thread hop either.
+    assert set(store.threads) == {threading.current_thread().name}
+
+
+def test_disabled_build_and_abuild_short_circuit(monkeypatch) -> None:
+    monkeypatch.setenv("CEO_GROUNDING_PACK_ENABLED", "false")
+    expected = {
+        "enabled": False,
+        "feature_flags": {"CEO_GROUNDING_PACK_ENABLED": False},
+    }
+    assert GroundingPackService.build(**_kwargs()) == expected
+    assert asyncio.run(GroundingPackService.abuild(**_kwargs())) == expected
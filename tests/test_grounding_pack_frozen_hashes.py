@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import shutil
+
+from services.frozen_payload import FrozenPayload, published, stable_json_dumps
+
+
+def _legacy_sha(obj) -> str:
+    return hashlib.sha256(stable_json_dumps(obj).encode("utf-8")).hexdigest()
+
+
+def _write_kb(path, title: str) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "version": "1",
+                "description": "kb",
+                "entries": [{"id": "kb_alpha", "title": title, "content": "prodaja"}],
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_identity_pack_frozen_once_per_generation(tmp_path, monkeypatch):
+    from services import identity_loader
+
+    src = os.path.join(os.path.dirname(__file__), "..", "identity")
+    ident_dir = tmp_path / "identity"
+    shutil.copytree(src, ident_dir)
+    monkeypatch.setenv("IDENTITY_PATH", str(ident_dir))
+
+    a = identity_loader.load_ceo_identity_pack_frozen()
+    b = identity_loader.load_ceo_identity_pack_frozen()
+    assert a is b
+    assert published(a.value) is a
+    assert a.sha256 == _legacy_sha(a.value)
+    assert a.serialized == stable_json_dumps(a.value)
+
+    # Public loader hands out a private deep copy.
+    copy = identity_loader.load_ceo_identity_pack()
+    assert copy == a.value and copy is not a.value
+    copy["identity"]["name"] = "mutated"
+    copy["errors"].append({"section": "x"})
+    assert identity_loader.load_ceo_identity_pack_frozen().value == a.value
+    assert a.sha256 == _legacy_sha(a.value)
+
+    # A changed identity file starts a new generation.
+    kernel = ident_dir / "kernel.json"
+    st = kernel.stat()
+    os.utime(kernel, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    c = identity_loader.load_ceo_identity_pack_frozen()
+    assert c is not a
+    assert c.generation != a.generation
+
+
+def test_file_kb_store_publishes_kb_file_per_version(tmp_path, monkeypatch):
+    from services.kb_file_store import FileKBStore
+
+    kb_path = tmp_path / "kb.json"
+    _write_kb(kb_path, "Alpha")
+    monkeypatch.setenv("IDENTITY_KNOWLEDGE_PATH", str(kb_path))
+
+    store = FileKBStore()
+    f1 = store.load_kb_file()
+    assert store.load_kb_file() is f1
+    assert published(f1.value) is f1
+
+    # Same shape/hash as the legacy payload + parsed entries assembly.
+    payload, entries = store.load_payload_and_entries()
+    payload["entries"] = entries
+    assert f1.value == payload
+    assert f1.sha256 == _legacy_sha(payload)
+
+    _write_kb(kb_path, "Alpha changed title")
+    st = kb_path.stat()
+    os.utime(kb_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    f2 = store.load_kb_file()
+    assert f2 is not f1 and f2.sha256 != f1.sha256
+
+
+def test_grounding_pack_reuses_published_hashes(tmp_path, monkeypatch):
+    from services.grounding_pack_service import GroundingPackService
+
+    monkeypatch.setenv("CEO_GROUNDING_PACK_ENABLED", "true")
+    monkeypatch.delenv("KB_SOURCE", raising=False)
+    kb_path = tmp_path / "kb.json"
+    _write_kb(kb_path, "Alpha")
+    monkeypatch.setenv("IDENTITY_KNOWLEDGE_PATH", str(kb_path))
+
+    kwargs = {
+        "prompt": "alpha prodaja",
+        "knowledge_snapshot": {"payload": {"goals": [], "tasks": [], "projects": []}},
+        "memory_public_snapshot": {"decision_outcomes": []},
+        "legacy_trace": None,
+        "agent_id": "pytest",
+    }
+    gp1 = GroundingPackService.build(**kwargs)
+
+    frozen_values = []
+    real_of = FrozenPayload.of.__func__
+
+    def _spy(cls, value, *, generation=None):
+        frozen_values.append(value)
+        return real_of(cls, value, generation=generation)
+
+    monkeypatch.setattr(FrozenPayload, "of", classmethod(_spy))
+    gp2 = GroundingPackService.build(**kwargs)
+
+    # Only the per-request memory snapshot is serialized on a warm path.
+    assert frozen_values == [kwargs["memory_public_snapshot"]]
+
+    for gp in (gp1, gp2):
+        ip = gp["identity_pack"]
+        kb = gp["kb_snapshot"]
+        assert ip["hash"] == _legacy_sha(ip["payload"])
+        assert kb["hash"] == _legacy_sha(kb["payload"])
+    assert gp1["kb_snapshot"]["hash"] == gp2["kb_snapshot"]["hash"]
+    assert gp1["identity_pack"]["hash"] == gp2["identity_pack"]["hash"]
+
+    # Shared payloads go into the pack by reference (no per-turn copies);
+    # the selected KB entries are per-pack copies callers may reshape.
+    assert gp1["identity_pack"]["payload"] is gp2["identity_pack"]["payload"]
+    assert gp1["kb_snapshot"]["payload"] is gp2["kb_snapshot"]["payload"]
+    selected = gp1["kb_retrieved"]["entries"]
+    assert selected and selected[0] is not gp1["kb_snapshot"]["payload"]["entries"][0]
+    selected[0]["title"] = "mutated"
+    assert gp2["kb_snapshot"]["payload"]["entries"][0]["title"] == "Alpha"
+    assert gp2["kb_retrieved"]["entries"][0]["title"] == "Alpha"
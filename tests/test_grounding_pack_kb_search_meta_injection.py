@@ -56,12 +56,12 @@ def test_grounding_pack_kb_search_meta_falls_back_to_loader_meta(
         "cache_hit": True,
     }
 
-    def _fake_load_kb_file(
+    async def _fake_load_kb_file(
         *, ctx: Optional[Dict[str, Any]] = None
     ) -> Tuple[Dict[str, Any], Dict[str, Any], Any]:
         return kb_file, kb_meta, kb_store
 
-    monkeypatch.setattr(GroundingPackService, "_load_kb_file", _fake_load_kb_file)
+    monkeypatch.setattr(GroundingPackService, "_aload_kb_file", _fake_load_kb_file)
     monkeypatch.setattr(
         GroundingPackService, "_load_identity_pack", lambda: {"available": True}
     )
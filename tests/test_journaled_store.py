@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from services.journaled_store import JournaledStore
+
+
+@pytest.fixture(autouse=True)
+def _no_fsync(monkeypatch):
+    monkeypatch.setenv("JOURNALED_STORE_FSYNC", "0")
+
+
+def _lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_hot_set_is_bounded_and_evicted_keys_read_lazily(tmp_path):
+    path = tmp_path / "registry.json.journal.jsonl"
+    store = JournaledStore(path, name="t", hot_max=2)
+    store.load()
+    for i in range(5):
+        store.put(f"e{i}", {"n": i, "state": "REGISTERED"})
+    assert store.flush()
+
+    assert len(store._hot) == 2
+    assert store.get("e0") == {"n": 0, "state": "REGISTERED"}
+    assert store.stats["disk_reads"] == 1
+    assert sorted(store.keys()) == ["e0", "e1", "e2", "e3", "e4"]
+
+    rec = store.get("e1")
+    rec["state"] = "COMPLETED"
+    store.put("e1", rec)
+    assert store.flush()
+    assert len(_lines(path)) == 6
+
+    seen = []
+    reopened = JournaledStore(path, name="t", hot_max=2)
+    reopened.load(on_record=lambda k, v: seen.append(k))
+    assert seen == ["e0", "e1", "e2", "e3", "e4", "e1"]
+    assert reopened.get("e1")["state"] == "COMPLETED"
+    assert dict(reopened.items())["e1"]["state"] == "COMPLETED"
+
+
+def test_compaction_keeps_latest_version_per_key(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOURNALED_STORE_COMPACT_MIN_GARBAGE", "3")
+    path = tmp_path / "registry.json.journal.jsonl"
+    store = JournaledStore(path, name="t", hot_max=1)
+    store.load()
+    for state in ("REGISTERED", "BLOCKED", "COMPLETED"):
+        store.put("a", {"state": state})
+        store.put("b", {"state": state})
+        assert store.flush()
+
+    assert store.stats["compactions"] >= 1
+    assert len(_lines(path)) == 2
+    assert store.get("a") == {"state": "COMPLETED"}
+    assert store.get("b") == {"state": "COMPLETED"}
+
+
+def test_torn_tail_is_dropped_and_legacy_snapshot_migrated(tmp_path):
+    legacy = {"x": {"state": "FAILED"}, "y": {"state": "BLOCKED"}}
+    path = tmp_path / "registry.json.journal.jsonl"
+    store = JournaledStore(path, name="t", legacy_loader=lambda: legacy)
+    store.load()
+    assert store.get("x") == {"state": "FAILED"}
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"k": "z", "v": {"sta')
+
+    reopened = JournaledStore(path, name="t", legacy_loader=lambda: {})
+    reopened.load()
+    assert sorted(reopened.keys()) == ["x", "y"]
+    reopened.put("z", {"state": "REGISTERED"})
+    assert reopened.flush()
+    assert [json.loads(line)["k"] for line in _lines(path)] == ["x", "y", "z"]
@@ -0,0 +1,67 @@
+from services.json_journal import (
+    JsonJournal,
+    append_jsonl,
+    encode_jsonl,
+    scan_jsonl,
+    write_jsonl_atomic,
+)
+
+
+def test_torn_tail_is_not_replayed_and_next_append_survives(tmp_path):
+    path = tmp_path / "state.json.journal.jsonl"
+    j = JsonJournal(path, fsync=False)
+    j.append({"id": "a", "n": 1})
+    j.close()
+    # Crash mid-append: the last line never got its newline.
+    with open(path, "ab") as f:
+        f.write(b'{"id": "b", "n"')
+
+    assert JsonJournal(path, fsync=False).replay() == [{"id": "a", "n": 1}]
+
+    j2 = JsonJournal(path, fsync=False)
+    j2.append({"id": "c", "n": 3})
+    j2.close()
+    assert JsonJournal(path, fsync=False).replay() == [
+        {"id": "a", "n": 1},
+        {"id": "c", "n": 3},
+    ]
+    assert path.read_bytes().count(b"\n") == 2
+
+
+def test_complete_but_corrupt_lines_are_skipped(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_bytes(b'{"a": 1}\nnot json\n[1, 2]\n{"b": 2}\n{"c"')
+
+    assert [(off, rec) for off, rec in scan_jsonl(path)] == [
+        (0, {"a": 1}),
+        (25, {"b": 2}),
+    ]
+    assert list(scan_jsonl(tmp_path / "missing.jsonl")) == []
+
+
+def test_append_jsonl_reports_offset_after_cutting_torn_tail(tmp_path):
+    path = tmp_path / "store.jsonl"
+    first = encode_jsonl([{"k": "a"}])
+    assert append_jsonl(path, first) == 0
+    with open(path, "ab") as f:
+        f.write(b'{"k": "b", "v": {"n"')
+
+    assert append_jsonl(path, encode_jsonl([{"k": "c"}])) == len(first)
+    assert [off for off, _ in scan_jsonl(path)] == [0, len(first)]
+
+    write_jsonl_atomic(path, encode_jsonl([{"k": "z"}]), fsync=False)
+    assert [rec for _, rec in scan_jsonl(path)] == [{"k": "z"}]
+    assert not path.with_name(path.name + ".tmp").exists()
+
+
+def test_group_commit_append_defers_fsync_until_sync(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr("services.json_journal.os.fsync", synced.append)
+    j = JsonJournal(tmp_path / "wal.jsonl", default=None)
+    j.append({"seq": 1}, fsync=False)
+    j.append({"seq": 2}, fsync=False)
+    assert synced == []
+    j.sync()
+    j.sync()
+    assert len(synced) == 1
+    assert j.replay() == [{"seq": 1}, {"seq": 2}]
@@ -58,3 +58,31 @@ def test_kb_retrieval_missing_applies_to_defaults_to_all():
         prompt="hello world", kb=kb, intent="advisory"
     )
     assert out.used_entry_ids == ["C"]
+
+
+def test_kb_retrieval_fallback_reuses_cached_index(monkeypatch):
+    from services import kb_search_index
+    from services.grounding_pack_service import GroundingPackService
+
+    kb = {
+        "version": "test",
+        "entries": [{"id": "D", "title": "D", "content": "hello world"}],
+    }
+    built = []
+    real_init = kb_search_index.KBSearchIndex.__init__
+
+    def _spy(self, entries):
+        built.append(len(entries))
+        real_init(self, entries)
+
+    kb_search_index.clear_kb_search_index_cache()
+    monkeypatch.setattr(kb_search_index.KBSearchIndex, "__init__", _spy)
+    for _ in range(3):
+        out = GroundingPackService._retrieve_kb(prompt="hello world", kb=kb)
+        assert out.used_entry_ids == ["D"]
+    assert built == [1]
+
+    kb["entries"].append({"id": "E", "title": "E", "content": "hello world"})
+    out = GroundingPackService._retrieve_kb(prompt="hello world", kb=kb)
+    assert out.used_entry_ids == ["D", "E"]
+    assert built == [1, 2]
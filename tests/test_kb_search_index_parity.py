@@ -0,0 +1,41 @@
+from services.kb_search_index import KBSearchIndex
+from tests.kb_search_legacy import (
+    check_parity,
+    synthetic_entries,
+    synthetic_queries,
+)
+
+
+def test_kb_search_index_matches_legacy_rankings_on_synthetic_corpus():
+    entries = synthetic_entries(300, seed=3)
+    queries = synthetic_queries(40, seed=5)
+    assert check_parity(entries, queries) == []
+
+
+def test_kb_search_index_phrase_substring_and_must_include_edge_cases():
+    entries = [
+        {"id": "a_001", "title": "Planiranje", "content": "Kvartalno planiranje."},
+        {"id": "b_002", "title": "Other", "content": "WYSIATI heuristic note."},
+        {"id": "c_003", "title": "Šef tima", "content": "Čovjek koji vodi tim."},
+        {
+            "id": "d_004",
+            "title": "Gated",
+            "content": "planiranje",
+            "applies_to": ["ops"],
+        },
+        "not-a-dict",
+    ]
+    queries = [
+        ("planir", None),  # phrase hit inside a longer token
+        ("wysiati", "advisory"),
+        ("sef tima", None),  # diacritics-insensitive phrase
+        ("planiranje", "advisory"),  # applies_to gating
+        ("", None),
+    ]
+    assert check_parity(entries, queries) == []
+
+    idx = KBSearchIndex(entries)
+    assert [e["id"] for e in idx.search("planir", top_k=8)] == ["a_001", "d_004"]
+    assert [e["id"] for e in idx.search("planiranje", top_k=8, intent="advisory")] == [
+        "a_001"
+    ]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+
+import services.ceo_conversation_state_store as store_mod
+from services.ceo_conversation_state_store import (
+    ConversationStateStore,
+    aconversation_state_turn,
+    conversation_state_turn_stats,
+)
+
+
+class _SyncPg:
+    """Must not be touched once the async backend is in play."""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"sync postgres call on the event loop: {name}")
+
+
+class _AsyncPg:
+    def __init__(self):
+        self.turns = [{"t": 1.0, "user": "u0", "assistant": "a0"}]
+        self.meta = {"k": 1}
+        self.calls = []
+
+    async def get_conversation_state(self, *, conversation_id, max_turns):
+        self.calls.append(("state", conversation_id, max_turns))
+        return list(self.turns), dict(self.meta)
+
+    async def get_conversation_meta(self, *, conversation_id):
+        self.calls.append(("meta", conversation_id))
+        return dict(self.meta)
+
+    async def apply_conversation_records(self, *, conversation_id, records):
+        self.calls.append(("apply", conversation_id, [r["op"] for r in records]))
+
+
+def _use_fake_pg(monkeypatch):
+    apg = _AsyncPg()
+    monkeypatch.setattr(store_mod, "_pg_backend_required", lambda: _SyncPg())
+    monkeypatch.setattr(store_mod, "_apg_backend_required", lambda: apg)
+    return apg
+
+
+def test_async_turn_prefetches_and_flushes_on_async_backend(monkeypatch):
+    apg = _use_fake_pg(monkeypatch)
+
+    async def _run():
+        async with aconversation_state_turn() as turn:
+            await turn.aprefetch("c1")
+            # Sync call sites inside the turn are now memory hits.
+            assert ConversationStateStore.get_meta(conversation_id="c1") == {"k": 1}
+            ConversationStateStore.update_meta(conversation_id="c1", updates={"k": 2})
+            ConversationStateStore.append_turn(
+                conversation_id="c1", user_text="u1", assistant_text="a1"
+            )
+            recent = await ConversationStateStore.aget_recent_turns(
+                conversation_id="c1"
+            )
+            assert [t["user"] for t in recent] == ["u0", "u1"]
+            assert await ConversationStateStore.aget_meta(conversation_id="c1") == {
+                "k": 2
+            }
+            return conversation_state_turn_stats()
+
+    stats = asyncio.run(_run())
+    assert apg.calls == [
+        ("state", "c1", 50),
+        ("apply", "c1", ["meta", "turn"]),
+    ]
+    assert stats["loads"] == 1 and stats["round_trips"] == 2
+
+
+def test_async_paths_outside_a_turn_use_async_backend(monkeypatch):
+    apg = _use_fake_pg(monkeypatch)
+
+    meta = asyncio.run(ConversationStateStore.aget_meta(conversation_id="c2"))
+    assert meta == {"k": 1}
+    assert apg.calls == [("meta", "c2")]
+
+
+def test_turn_trimming_is_amortized(monkeypatch):
+    import services.memory_postgres_backend as pgb
+
+    monkeypatch.setenv("MEMORY_PG_TURN_TRIM_EVERY", "4")
+    monkeypatch.setattr(pgb, "_TRIM_COUNTS", {})
+    trims = [pgb.should_trim_turns("c") for _ in range(8)]
+    assert trims == [True, False, False, True, False, False, False, True]
+
+    monkeypatch.setenv("MEMORY_PG_TURN_TRIM_EVERY", "1")
+    assert all(pgb.should_trim_turns("c") for _ in range(3))
+
+
+def test_record_steps_batch_meta_and_forget_conversation(monkeypatch):
+    import json
+
+    import services.memory_postgres_backend as pgb
+
+    monkeypatch.setenv("MEMORY_PG_TURN_TRIM_EVERY", "1")
+    steps = pgb.conversation_record_steps(
+        "c",
+        [
+            {"op": "meta", "updates": {" a ": 1, "b": {"x": 2}, "": 3}},
+            {"op": "meta", "updates": {}},
+            {"op": "turn", "t": 5.0, "user": "u", "assistant": "a", "max_turns": 3},
+            {"op": "turn", "user": "u", "assistant": "a", "max_turns": 0},
+        ],
+    )
+    sqls = [sql for sql, _ in steps]
+    assert sqls == [
+        pgb.SQL_META_UPSERT_MANY,
+        pgb.SQL_TURN_INSERT,
+        pgb.SQL_TURN_TRIM,
+        pgb.SQL_TURN_INSERT,
+        pgb.SQL_TURN_DELETE_ALL,
+    ]
+    assert json.loads(steps[0][1]["updates"]) == {"a": 1, "b": {"x": 2}}
+    assert steps[1][1]["t_unix"] == 5.0
+
+
+def test_async_database_url_maps_sync_drivers():
+    from services.memory_postgres_async_backend import async_database_url
+
+    assert async_database_url("postgresql://u@h/db") == "postgresql+psycopg://u@h/db"
+    assert (
+        async_database_url("postgresql+psycopg2://u@h/db")
+        == "postgresql+psycopg://u@h/db"
+    )
+    assert (
+        async_database_url("postgresql+asyncpg://u@h/db")
+        == "postgresql+asyncpg://u@h/db"
+    )
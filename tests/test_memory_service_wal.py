@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from services import memory_service as ms
+from services.memory_service import MemoryService
+
+
+@pytest.fixture(autouse=True)
+def _wal_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("MEMORY_BACKEND", "file")
+    monkeypatch.setenv("MEMORY_PATH", str(tmp_path))
+    monkeypatch.setenv("MEMORY_FILE_MODE", "wal")
+    monkeypatch.setenv("MEMORY_WAL_FSYNC_MS", "0")
+    monkeypatch.setattr(ms, "_WAL_LOGS", {})
+    yield
+
+
+def _mutate(svc: MemoryService) -> None:
+    svc.set(scope_type="session", scope_id="s1", key="a", value={"x": 1})
+    svc.set(scope_type="session", scope_id="s1", key="b", value=2)
+    svc.delete(scope_type="session", scope_id="s1", key="b")
+    svc.set(scope_type="user", scope_id="u1", key="k", value="v")
+    svc.clear_scope(scope_type="user", scope_id="u1")
+    svc.process("hello")
+    svc.set_active_decision({"d": 1})
+    svc.store_decision_outcome(
+        "sop", "ctx", "sop_b", True, metadata={"previous_sop": "sop_a"}
+    )
+    for i in range(3):
+        svc.append_write_audit_event({"i": i})
+
+
+def test_mutations_append_to_wal_and_replay_after_crash(tmp_path):
+    svc = MemoryService()
+    snapshot_before = (tmp_path / "memory.json").read_text(encoding="utf-8")
+    _mutate(svc)
+
+    # Writes go to the log only; the snapshot is untouched.
+    assert (tmp_path / "memory.json").read_text(encoding="utf-8") == snapshot_before
+    wal_lines = (tmp_path / "memory.json.wal").read_text(encoding="utf-8").splitlines()
+    assert len(wal_lines) == 12
+
+    # Simulate a crash: fresh process state, torn trailing record.
+    with open(tmp_path / "memory.json.wal", "a", encoding="utf-8") as f:
+        f.write('{"op": "set", "path": ["active_')
+    ms._WAL_LOGS.clear()
+
+    recovered = MemoryService()
+    assert recovered.memory["scopes"] == svc.memory["scopes"]
+    assert recovered.memory["entries"] == svc.memory["entries"]
+    assert recovered.memory["active_decision"] == svc.memory["active_decision"]
+    assert recovered.memory["decision_outcomes"] == svc.memory["decision_outcomes"]
+    assert recovered.memory["cross_sop_relations"] == svc.memory["cross_sop_relations"]
+    assert recovered.memory["write_audit_events"] == svc.memory["write_audit_events"]
+
+    # Recovery folded the log into the snapshot.
+    assert (tmp_path / "memory.json.wal").read_text(encoding="utf-8") == ""
+    assert "_wal_seq" not in recovered.memory
+
+
+def test_compaction_snapshots_and_skips_already_folded_records(monkeypatch, tmp_path):
+    monkeypatch.setenv("MEMORY_WAL_COMPACT_RECORDS", "4")
+    svc = MemoryService()
+    for i in range(6):
+        svc.append_write_audit_event({"i": i})
+
+    snap = json.loads((tmp_path / "memory.json").read_text(encoding="utf-8"))
+    assert [e["i"] for e in snap["write_audit_events"]] == [0, 1, 2, 3]
+    assert snap["_wal_seq"] == 4
+
+    # A crash between snapshot and truncate leaves folded records behind.
+    wal = (tmp_path / "memory.json.wal").read_text(encoding="utf-8")
+    stale = json.dumps(
+        {"op": "append", "path": ["write_audit_events"], "value": {"i": 3}, "seq": 4}
+    )
+    (tmp_path / "memory.json.wal").write_text(stale + "\n" + wal, encoding="utf-8")
+    ms._WAL_LOGS.clear()
+
+    recovered = MemoryService()
+    assert [e["i"] for e in recovered.memory["write_audit_events"]] == list(range(6))
+
+
+def test_expired_keys_read_as_missing_without_disk_write(monkeypatch, tmp_path):
+    svc = MemoryService()
+    svc.set(scope_type="task", scope_id="t1", key="k", value=1, ttl_seconds=5)
+    wal_before = (tmp_path / "memory.json.wal").read_text(encoding="utf-8")
+
+    monkeypatch.setattr(svc, "_now", lambda: 10**12)
+    assert svc.get(scope_type="task", scope_id="t1", key="k", default="gone") == "gone"
+    assert (tmp_path / "memory.json.wal").read_text(encoding="utf-8") == wal_before
+
+    svc._compact()
+    snap = json.loads((tmp_path / "memory.json").read_text(encoding="utf-8"))
+    assert snap["scopes"]["task"]["t1"] == {}
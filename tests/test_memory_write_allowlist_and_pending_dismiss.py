@@ -1,4 +1,5 @@
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 from models.canon import PROPOSAL_WRAPPER_INTENT
 
@@ -93,7 +94,9 @@ def _setup_pending_proposal_env(monkeypatch, tmp_path, *, state_filename: str):
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):  # noqa: ANN001
@@ -0,0 +1,137 @@
+import asyncio
+import os
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from models.ai_command import AICommand
+from services.notion_service import NotionService
+
+
+def _goal_page(pid: str, title: str) -> dict:
+    return {
+        "id": pid,
+        "properties": {"Name": {"type": "title", "title": [{"plain_text": title}]}},
+    }
+
+
+class TestNotionBatchParallelExecution(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = NotionService(
+            api_key="test_api_key",
+            goals_db_id="test-goals-db-id",
+            tasks_db_id="test-tasks-db-id",
+            projects_db_id="test-projects-db-id",
+        )
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.events = []
+        self.queries = []
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+
+    async def _fake_safe_request(self, method, url, payload=None, params=None):
+        if method == "GET" and "/databases/" in url:
+            return {"properties": {}}
+        if method == "POST" and url.endswith("/query"):
+            self.queries.append(payload or {})
+            return {
+                "results": [
+                    _goal_page("goal-a-id", "Goal A"),
+                    _goal_page("goal-b-id", "Goal B"),
+                    _goal_page("goal-b2-id", "Goal B extra"),
+                ],
+                "has_more": False,
+            }
+        if method == "POST" and url.endswith("/pages"):
+            props = (payload or {}).get("properties") or {}
+            title = props["Name"]["title"][0]["text"]["content"]
+            self.events.append(("start", title))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            self.events.append(("end", title))
+            return {"id": f"id-{title}", "url": f"https://notion.so/{title}"}
+        return {}
+
+    async def _run_batch(self, operations):
+        command = AICommand(
+            command="notion_write",
+            intent="batch_request",
+            params={"operations": operations},
+            approval_id="approval-batch",
+            execution_id="exec-batch",
+            read_only=False,
+        )
+        with patch.object(
+            self.service,
+            "_safe_request",
+            AsyncMock(side_effect=self._fake_safe_request),
+        ), patch.object(
+            self.service, "_update_page_relations", new_callable=AsyncMock
+        ) as self.update_relations, patch.dict(
+            os.environ, {"NOTION_BATCH_CONCURRENCY": "3"}
+        ):
+            return await self.service.execute(command)
+
+    async def test_independent_ops_run_concurrently_in_input_order(self):
+        ops = [
+            {"op_id": f"t{i}", "intent": "create_task", "payload": {"title": f"T{i}"}}
+            for i in range(6)
+        ]
+        result = await self._run_batch(ops)
+
+        self.assertTrue(result["ok"], msg=str(result))
+        self.assertEqual(self.max_in_flight, 3)
+        out = result["result"]["operations"]
+        self.assertEqual([o["op_id"] for o in out], [f"t{i}" for i in range(6)])
+        self.assertEqual([o["page_id"] for o in out], [f"id-T{i}" for i in range(6)])
+        self.assertEqual(list(result["result"]["ref_map"]), [f"t{i}" for i in range(6)])
+
+    async def test_op_waits_for_referenced_op(self):
+        ops = [
+            {"op_id": "g1", "intent": "create_goal", "payload": {"title": "G"}},
+            {"op_id": "t1", "intent": "create_task", "payload": {"title": "Free"}},
+            {
+                "op_id": "t2",
+                "intent": "create_task",
+                "payload": {"title": "Linked", "goal_id": "$g1"},
+            },
+        ]
+        result = await self._run_batch(ops)
+
+        self.assertTrue(result["ok"], msg=str(result))
+        # Free task overlaps the goal; the linked one starts after the goal ends.
+        self.assertLess(
+            self.events.index(("start", "Free")), self.events.index(("end", "G"))
+        )
+        self.assertGreater(
+            self.events.index(("start", "Linked")), self.events.index(("end", "G"))
+        )
+        self.update_relations.assert_called_once_with(
+            page_id="id-Linked", goal_id="id-G", project_id=""
+        )
+
+    async def test_goal_titles_resolved_with_one_or_query(self):
+        ops = [
+            {
+                "intent": "create_task",
+                "payload": {"title": f"T{i}", "goal_title": gt},
+            }
+            for i, gt in enumerate(["Goal A", "Goal B", "Goal A"])
+        ]
+        result = await self._run_batch(ops)
+
+        self.assertTrue(result["ok"], msg=str(result))
+        self.assertEqual(len(self.queries), 1)
+        flt = self.queries[0]["filter"]["or"]
+        self.assertEqual([f["title"]["contains"] for f in flt], ["Goal A", "Goal B"])
+        linked = {
+            c.kwargs["page_id"]: c.kwargs["goal_id"]
+            for c in self.update_relations.call_args_list
+        }
+        # "Goal B" also matches "Goal B extra"; the exact title wins.
+        self.assertEqual(
+            linked, {"id-T0": "goal-a-id", "id-T1": "goal-b-id", "id-T2": "goal-a-id"}
+        )
@@ -0,0 +1,117 @@
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+import services.notion_service as notion_service_mod
+from main import app
+from tests.auth_utils import auth_headers, set_auth_env
+
+
+class _FakeNotion:
+    """query_database stand-in: 5 rows per DB, paginated, tracks concurrency."""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def query_database(self, *, db_key: str, query: Dict[str, Any]):
+        self.calls.append({"db_key": db_key, **query})
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        start = int(query.get("start_cursor") or 0)
+        size = int(query.get("page_size") or 2)
+        rows = [{"id": f"{db_key}-{i}"} for i in range(start, min(start + size, 5))]
+        end = start + len(rows)
+        return {
+            "results": rows,
+            "has_more": end < 5,
+            "next_cursor": str(end) if end < 5 else None,
+            "database_id": f"db-{db_key}",
+        }
+
+
+@pytest.fixture
+def fake_notion(monkeypatch: pytest.MonkeyPatch) -> _FakeNotion:
+    fake = _FakeNotion()
+    monkeypatch.setattr(notion_service_mod, "get_notion_service", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+async def client(monkeypatch: pytest.MonkeyPatch):
+    set_auth_env(monkeypatch)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _post(client, payload):
+    r = await client.post(
+        "/notion-ops/bulk/query",
+        headers=auth_headers(None, sub="bulk-query-user", roles=["admin"]),
+        json=payload,
+    )
+    assert r.status_code == 200, r.text
+    return r.json()["results"]
+
+
+@pytest.mark.anyio
+async def test_bulk_query_runs_concurrently_and_keeps_order(
+    client, fake_notion, monkeypatch
+):
+    monkeypatch.setenv("NOTION_BULK_QUERY_CONCURRENCY", "2")
+    keys = ["goals", "tasks", "projects", "kpi"]
+    results = await _post(client, {"queries": [{"db_key": k} for k in keys]})
+
+    assert [r["db_key"] for r in results] == keys
+    assert fake_notion.peak == 2
+    # Default (non-compact) shape is unchanged.
+    assert results[0]["notion"] == results[0]["response"]
+    assert results[0]["items"] == [{"id": "goals-0"}, {"id": "goals-1"}]
+
+
+@pytest.mark.anyio
+async def test_bulk_query_compact_paginates_up_to_cap(client, fake_notion):
+    results = await _post(
+        client,
+        {
+            "compact": True,
+            "queries": [
+                {"db_key": "tasks", "paginate": True, "max_items": 3, "page_size": 2},
+                {"db_key": "goals", "paginate": True},
+                {
+                    "db_key": "projects",
+                    "paginate": True,
+                    "max_items": 2,
+                    "page_size": 4,
+                },
+            ],
+        },
+    )
+
+    capped, full, first_only = results
+    assert "notion" not in capped and "response" not in capped
+    assert [i["id"] for i in capped["items"]] == ["tasks-0", "tasks-1", "tasks-2"]
+    assert capped["has_more"] is True
+    assert capped["next_cursor"] == "3"
+    assert capped["pages"] == 2
+    assert len(full["items"]) == 5
+    assert full["has_more"] is False
+
+    # Later pages are sized to the remaining budget.
+    task_calls = [c for c in fake_notion.calls if c["db_key"] == "tasks"]
+    assert task_calls[1] == {"db_key": "tasks", "start_cursor": "2", "page_size": 1}
+
+    # So is the first one: page_size above max_items is clamped, and the
+    # cursor points right after the last returned item.
+    assert [i["id"] for i in first_only["items"]] == ["projects-0", "projects-1"]
+    assert first_only["next_cursor"] == "2" and "pages" not in first_only
+    project_calls = [c for c in fake_notion.calls if c["db_key"] == "projects"]
+    assert project_calls == [{"db_key": "projects", "page_size": 2}]
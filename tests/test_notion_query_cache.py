@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from services.notion_query_cache import NotionQueryCache
+
+
+@pytest.fixture(autouse=True)
+def _enable_cache(monkeypatch):
+    monkeypatch.setenv("NOTION_QUERY_CACHE_ENABLED", "true")
+    monkeypatch.setenv("NOTION_QUERY_CACHE_TTL_SECONDS", "60")
+
+
+class _Fetcher:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"results": [{"id": f"p{self.calls}"}], "has_more": False}
+
+
+def test_hits_are_keyed_by_normalized_db_and_canonical_body():
+    cache = NotionQueryCache()
+    fetch = _Fetcher()
+
+    async def _run():
+        a = await cache.read_through(
+            "AB-CD", {"page_size": 10, "filter": {"a": 1}}, fetch
+        )
+        a["results"].append({"id": "mutated"})
+        b = await cache.read_through(
+            "abcd", {"filter": {"a": 1}, "page_size": 10}, fetch
+        )
+        c = await cache.read_through(
+            "abcd", {"page_size": 10, "start_cursor": "x"}, fetch
+        )
+        return a, b, c
+
+    a, b, c = asyncio.run(_run())
+    assert fetch.calls == 2
+    assert b == {"results": [{"id": "p1"}], "has_more": False}
+    assert c["results"] == [{"id": "p2"}]
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["calls_saved"] == 1
+
+
+def test_invalidation_and_concurrent_misses():
+    cache = NotionQueryCache()
+    fetch = _Fetcher()
+
+    async def _run():
+        await asyncio.gather(*[cache.read_through("db1", {}, fetch) for _ in range(4)])
+        await cache.read_through("db2", {}, fetch)
+        cache.invalidate_database("db-1")
+        await cache.read_through("db1", {}, fetch)
+        await cache.read_through("db2", {}, fetch)
+
+    asyncio.run(_run())
+    # 1 shared build for 4 callers, 1 for db2, 1 refetch after invalidation.
+    assert fetch.calls == 3
+    stats = cache.stats()
+    assert stats["coalesced"] == 3
+    assert stats["calls_saved"] == 4
+
+
+def test_write_during_fetch_is_not_cached():
+    cache = NotionQueryCache()
+    fetch = _Fetcher()
+
+    async def _racing_fetch():
+        res = await fetch()
+        cache.invalidate_database("db1")  # our own write lands mid-query
+        return res
+
+    async def _run():
+        await cache.read_through("db1", {}, _racing_fetch)
+        await cache.read_through("db1", {}, fetch)
+
+    asyncio.run(_run())
+    assert fetch.calls == 2
+
+
+def test_disabled_under_tests_by_default(monkeypatch):
+    monkeypatch.delenv("NOTION_QUERY_CACHE_ENABLED")
+    cache = NotionQueryCache()
+    fetch = _Fetcher()
+
+    async def _run():
+        await cache.read_through("db1", {}, fetch)
+        await cache.read_through("db1", {}, fetch)
+
+    asyncio.run(_run())
+    assert fetch.calls == 2
+    assert cache.stats()["bypassed"] == 2
+
+
+def test_notion_service_writes_invalidate_parent_database(monkeypatch):
+    import services.notion_query_cache as nqc
+    from services.notion_service import NotionService
+
+    cache = NotionQueryCache()
+    monkeypatch.setattr(nqc, "_NOTION_QUERY_CACHE", cache)
+    fetch = _Fetcher()
+
+    async def _prime():
+        await cache.read_through("db1", {}, fetch)
+        await cache.read_through("db2", {}, fetch)
+
+    asyncio.run(_prime())
+    NotionService._invalidate_query_cache_for_write(
+        "https://api.notion.com/v1/pages",
+        {"parent": {"database_id": "db1"}},
+        None,
+    )
+    assert cache.stats()["entries"] == 1
+    NotionService._invalidate_query_cache_for_write(
+        "https://api.notion.com/v1/blocks/b1/children", {}, {}
+    )
+    assert cache.stats()["entries"] == 1
+    NotionService._invalidate_query_cache_for_write(
+        "https://api.notion.com/v1/pages/p1", {"archived": True}, None
+    )
+    assert cache.stats()["entries"] == 0
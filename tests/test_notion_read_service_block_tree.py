@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+import services.notion_read_service as nrs
+from services.notion_read_service import NotionReadService
+from services.notion_service import notion_budget_context
+
+
+def _block(block_id: str, text: str, *, children: bool = False):
+    return {
+        "id": block_id,
+        "type": "bulleted_list_item",
+        "has_children": children,
+        "bulleted_list_item": {"rich_text": [{"plain_text": text}]},
+    }
+
+
+class _FakeNotion:
+    """blocks/{id}/children stand-in: page -> 4 toggles -> 1 child each."""
+
+    def __init__(self):
+        self.tree = {
+            "page": [_block(f"t{i}", f"toggle {i}", children=True) for i in range(4)],
+            **{f"t{i}": [_block(f"c{i}", f"child {i}")] for i in range(4)},
+        }
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _safe_request(self, method: str, url: str, payload=None):
+        from services.notion_service import current_notion_budget
+
+        budget = current_notion_budget()
+        if budget is not None:
+            budget.check_and_consume_call()
+        block_id = url.split("/blocks/", 1)[1].split("/", 1)[0]
+        self.calls.append(block_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        return {"results": self.tree.get(block_id, []), "has_more": False}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    nrs.clear_page_markdown_cache()
+    yield
+    nrs.clear_page_markdown_cache()
+
+
+PAGE = {"id": "page", "last_edited_time": "2026-01-01T00:00:00.000Z"}
+
+
+@pytest.mark.anyio
+async def test_nested_levels_fetch_in_parallel_and_render_in_order(monkeypatch):
+    monkeypatch.setenv("NOTION_BLOCK_FETCH_CONCURRENCY", "2")
+    notion = _FakeNotion()
+    md = await NotionReadService(notion).render_page_to_markdown(PAGE)  # type: ignore[arg-type]
+
+    assert md.splitlines() == [
+        line for i in range(4) for line in (f"- toggle {i}", f"  - child {i}")
+    ]
+    assert notion.calls[0] == "page"
+    assert sorted(notion.calls[1:]) == ["t0", "t1", "t2", "t3"]
+    assert notion.peak == 2
+
+
+@pytest.mark.anyio
+async def test_rendered_markdown_cached_per_last_edited_time():
+    notion = _FakeNotion()
+    svc = NotionReadService(notion)  # type: ignore[arg-type]
+
+    first = await svc.render_page_to_markdown(PAGE)
+    assert await svc.render_page_to_markdown(dict(PAGE)) == first
+    assert len(notion.calls) == 5
+
+    await svc.render_page_to_markdown(
+        {"id": "page", "last_edited_time": "2026-01-02T00:00:00.000Z"}
+    )
+    assert len(notion.calls) == 10
+
+
+@pytest.mark.anyio
+async def test_cached_markdown_expires_after_ttl(monkeypatch):
+    # Same last_edited_time (minute granularity, child-page edits) must not
+    # pin a render forever.
+    monkeypatch.setenv("NOTION_PAGE_MARKDOWN_CACHE_TTL_S", "60")
+    now = [1000.0]
+    monkeypatch.setattr(nrs, "_cache_clock", lambda: now[0])
+    notion = _FakeNotion()
+    svc = NotionReadService(notion)  # type: ignore[arg-type]
+
+    await svc.render_page_to_markdown(PAGE)
+    now[0] += 59
+    await svc.render_page_to_markdown(PAGE)
+    assert len(notion.calls) == 5
+
+    now[0] += 1
+    await svc.render_page_to_markdown(PAGE)
+    assert len(notion.calls) == 10
+
+
+@pytest.mark.anyio
+async def test_call_budget_truncates_nested_levels_without_caching():
+    notion = _FakeNotion()
+    svc = NotionReadService(notion)  # type: ignore[arg-type]
+
+    async with notion_budget_context(max_calls=3, max_latency_ms=5000):
+        md = await svc.render_page_to_markdown(PAGE)
+
+    # 1 call for the page, 2 of the 4 toggles expanded.
+    assert len(notion.calls) == 3
+    assert md.count("- toggle") == 4 and md.count("- child") == 2
+
+    await svc.render_page_to_markdown(PAGE)
+    assert len(notion.calls) == 8
@@ -0,0 +1,221 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from services.notion_rate_limiter import NotionRateLimiter, parse_retry_after_s
+from services.notion_service import (
+    NotionBudgetExceeded,
+    NotionService,
+    notion_budget_context,
+)
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, text: str = "{}", headers=None) -> None:
+        self.status_code = int(status_code)
+        self.text = text
+        self.headers = headers or {}
+
+    def json(self):  # noqa: ANN201
+        return {"ok": True}
+
+
+class TestNotionSafeRequestRateLimitRetry(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.service = NotionService(
+            api_key="test-rate-limit",
+            goals_db_id="g",
+            tasks_db_id="t",
+            projects_db_id="p",
+        )
+        # Fresh limiter per test (the registry shares one per token process-wide).
+        self.service._rate_limiter = NotionRateLimiter(
+            rate_per_s=0, burst=1, max_in_flight=3
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.service.aclose()
+
+    async def _run(self, responses, method="POST", url=None, budget=None):
+        fake_client = AsyncMock()
+        fake_client.request = AsyncMock(side_effect=responses)
+        with (
+            patch.object(
+                self.service, "_get_client", new=AsyncMock(return_value=fake_client)
+            ),
+            patch("services.notion_service.asyncio.sleep", new=AsyncMock()) as sleep,
+        ):
+            try:
+                if budget is None:
+                    res = await self.service._safe_request(
+                        method,
+                        url or "https://api.notion.com/v1/databases/x/query",
+                        payload={"page_size": 1},
+                    )
+                else:
+                    async with notion_budget_context(**budget):
+                        res = await self.service._safe_request(
+                            method,
+                            url or "https://api.notion.com/v1/databases/x/query",
+                            payload={"page_size": 1},
+                        )
+            except Exception as exc:  # noqa: BLE001
+                res = exc
+        return res, fake_client.request.await_count, sleep
+
+    async def test_429_honors_retry_after_then_succeeds(self) -> None:
+        res, calls, sleep = await self._run(
+            [
+                _FakeResponse(429, "{}", {"Retry-After": "2"}),
+                _FakeResponse(200, "{}"),
+            ]
+        )
+        self.assertEqual(res, {"ok": True})
+        self.assertEqual(calls, 2)
+        self.assertGreaterEqual(sleep.await_args.args[0], 2.0)
+
+        transport = self.service.client_stats()["transport"]
+        self.assertGreaterEqual(transport["throttled_429"], 1)
+        self.assertGreaterEqual(transport["retry_after_honored"], 1)
+
+    async def test_transient_5xx_retried_for_reads_only(self) -> None:
+        res, calls, _ = await self._run(
+            [_FakeResponse(503, "busy"), _FakeResponse(200, "{}")]
+        )
+        self.assertEqual(res, {"ok": True})
+        self.assertEqual(calls, 2)
+
+        res, calls, _ = await self._run(
+            [_FakeResponse(503, "busy"), _FakeResponse(200, "{}")],
+            method="PATCH",
+            url="https://api.notion.com/v1/pages/abc",
+        )
+        self.assertIsInstance(res, RuntimeError)
+        self.assertIn("Notion HTTP 503", str(res))
+        self.assertEqual(calls, 1)
+
+    async def test_401_is_never_retried(self) -> None:
+        res, calls, _ = await self._run([_FakeResponse(401, "unauthorized")])
+        self.assertIsInstance(res, RuntimeError)
+        self.assertEqual(calls, 1)
+
+    async def test_429_is_retried_for_writes(self) -> None:
+        res, calls, _ = await self._run(
+            [
+                _FakeResponse(429, "{}", {"Retry-After": "0"}),
+                _FakeResponse(200, "{}"),
+            ],
+            method="PATCH",
+            url="https://api.notion.com/v1/pages/abc",
+        )
+        self.assertEqual(res, {"ok": True})
+        self.assertEqual(calls, 2)
+
+    async def test_retry_abandoned_when_call_budget_is_spent(self) -> None:
+        res, calls, sleep = await self._run(
+            [_FakeResponse(503, "busy"), _FakeResponse(200, "{}")],
+            budget={"max_calls": 1, "max_latency_ms": 60_000},
+        )
+        # The real HTTP error surfaces; the budget is not masked/consumed.
+        self.assertNotIsInstance(res, NotionBudgetExceeded)
+        self.assertIn("Notion HTTP 503", str(res))
+        self.assertEqual(calls, 1)
+        sleep.assert_not_awaited()
+
+    async def test_retry_abandoned_when_retry_after_exceeds_latency_window(
+        self,
+    ) -> None:
+        res, calls, sleep = await self._run(
+            [
+                _FakeResponse(429, "{}", {"Retry-After": "30"}),
+                _FakeResponse(200, "{}"),
+            ],
+            budget={"max_calls": 10, "max_latency_ms": 1_000},
+        )
+        self.assertIn("Notion HTTP 429", str(res))
+        self.assertEqual(calls, 1)
+        sleep.assert_not_awaited()
+
+    async def test_token_bucket_wait_applies_inside_safe_request(self) -> None:
+        # Frozen limiter clock: no refill between the two requests.
+        self.service._rate_limiter = NotionRateLimiter(
+            rate_per_s=2.0, burst=1, max_in_flight=3, clock=lambda: 100.0
+        )
+        res, calls, sleep = await self._run(
+            [_FakeResponse(200, "{}"), _FakeResponse(200, "{}")]
+        )
+        self.assertEqual(res, {"ok": True})
+        sleep.assert_not_awaited()
+
+        res, calls, sleep = await self._run([_FakeResponse(200, "{}")])
+        self.assertEqual(res, {"ok": True})
+        self.assertEqual(sleep.await_args.args[0], 0.5)
+        self.assertGreater(
+            self.service.client_stats()["transport"]["throttle_wait_ms"], 0
+        )
+
+    async def test_token_bucket_wait_beyond_latency_budget_fails_fast(self) -> None:
+        self.service._rate_limiter = NotionRateLimiter(
+            rate_per_s=0.01, burst=1, max_in_flight=3
+        )
+        await self._run([_FakeResponse(200, "{}")])
+
+        res, calls, sleep = await self._run(
+            [_FakeResponse(200, "{}")],
+            budget={"max_calls": 10, "max_latency_ms": 1_000},
+        )
+        self.assertIsInstance(res, NotionBudgetExceeded)
+        self.assertEqual(res.kind, "max_latency_ms")
+        self.assertEqual(calls, 0)
+        sleep.assert_not_awaited()
+        # The reserved token was refunded (no debt left behind).
+        self.assertGreaterEqual(self.service._rate_limiter._tokens, 0.0)
+
+    async def test_cancelled_requests_release_in_flight_slots(self) -> None:
+        never = asyncio.Event()
+
+        async def _hang(*_args, **_kwargs):
+            await never.wait()
+
+        fake_client = AsyncMock()
+        fake_client.request = _hang
+        with patch.object(
+            self.service, "_get_client", new=AsyncMock(return_value=fake_client)
+        ):
+            tasks = [
+                asyncio.create_task(
+                    self.service._safe_request(
+                        "GET", "https://api.notion.com/v1/users/me"
+                    )
+                )
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            self.assertEqual(self.service._rate_limiter.stats()["in_flight"], 3)
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.assertEqual(self.service._rate_limiter.stats()["in_flight"], 0)
+
+        # The limiter is still usable afterwards (no deadlock).
+        res, calls, _ = await self._run([_FakeResponse(200, "{}")])
+        self.assertEqual(res, {"ok": True})
+
+
+class TestNotionRateLimiter(unittest.TestCase):
+    def test_token_bucket_reserves_beyond_burst(self) -> None:
+        lim = NotionRateLimiter(rate_per_s=3.0, burst=3, max_in_flight=3)
+        waits = [lim.reserve() for _ in range(4)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertGreater(waits[3], 0.0)
+
+    def test_throttle_halves_in_flight_limit(self) -> None:
+        lim = NotionRateLimiter(rate_per_s=0, burst=1, max_in_flight=4)
+        lim.record_throttled(retry_after_s=None)
+        self.assertEqual(lim.stats()["in_flight_limit"], 2)
+
+    def test_parse_retry_after(self) -> None:
+        self.assertEqual(parse_retry_after_s("1.5"), 1.5)
+        self.assertIsNone(parse_retry_after_s(""))
+        self.assertIsNone(parse_retry_after_s("garbage"))
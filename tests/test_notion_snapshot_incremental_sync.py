@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from services.knowledge_snapshot_service import KnowledgeSnapshotService
+from services.notion_service import NotionService
+
+
+def _page(n: int, edited: str, title: str = "") -> dict:
+    return {
+        "id": f"0000000{n}-aaaa-bbbb-cccc-dddddddddddd",
+        "url": f"https://notion.so/{n}",
+        "created_time": "2026-01-01T00:00:00.000Z",
+        "last_edited_time": edited,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": title or f"T{n}"}]}
+        },
+    }
+
+
+class _FakeDb:
+    """query_database stand-in honoring the last_edited_time filter/sorts."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.queries = []
+
+    async def query_database(self, *, db_key, query):
+        self.queries.append(dict(query))
+        rows = list(self.pages)
+        flt = query.get("filter") or {}
+        since = (flt.get("last_edited_time") or {}).get("on_or_after")
+        if since:
+            rows = [p for p in rows if p["last_edited_time"] >= since]
+        for s in query.get("sorts") or []:
+            rows.sort(
+                key=lambda p: p["last_edited_time"],
+                reverse=s.get("direction") == "descending",
+            )
+        size = int(query["page_size"])
+        start = int(query.get("start_cursor") or 0)
+        chunk = rows[start : start + size]
+        more = start + size < len(rows)
+        return {
+            "results": chunk,
+            "has_more": more,
+            "next_cursor": str(start + size) if more else None,
+        }
+
+
+class TestNotionSnapshotIncrementalSync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.svc = NotionService(
+            api_key="test_api_key",
+            goals_db_id="test-goals-db-id",
+            tasks_db_id="test-tasks-db-id",
+            projects_db_id="test-projects-db-id",
+        )
+        self.db = _FakeDb(
+            [_page(i, f"2026-01-0{i}T00:00:00.000Z") for i in range(1, 5)]
+        )
+        self.svc.query_database = self.db.query_database  # type: ignore[method-assign]
+
+    async def _build(self, prev_payload=None, **kw):
+        with patch.object(
+            KnowledgeSnapshotService, "get_payload", return_value=prev_payload or {}
+        ):
+            return await self.svc.build_knowledge_snapshot(
+                db_keys=["goals"], max_items_by_db={"goals": 3}, incremental=True, **kw
+            )
+
+    async def test_delta_refresh_queries_changes_only_and_merges_by_id(self) -> None:
+        first = await self._build()
+        sec = first["payload"]["databases"]["goals"]
+        self.assertEqual(sec["sync_mode"], "full")
+        self.assertEqual(sec["high_water_mark"], "2026-01-04T00:00:00.000Z")
+        self.assertEqual(
+            [it["title"] for it in first["payload"]["goals"]], ["T4", "T3", "T2"]
+        )
+
+        # Page 2 edited, page 5 created.
+        self.db.pages[1] = _page(2, "2026-01-06T00:00:00.000Z", "T2 edited")
+        self.db.pages.append(_page(5, "2026-01-05T00:00:00.000Z"))
+        self.db.queries.clear()
+
+        second = await self._build(first["payload"])
+        sec2 = second["payload"]["databases"]["goals"]
+        self.assertEqual(sec2["sync_mode"], "delta")
+        self.assertEqual(len(self.db.queries), 1)
+        self.assertEqual(
+            self.db.queries[0]["filter"]["last_edited_time"]["on_or_after"],
+            "2026-01-04T00:00:00.000Z",
+        )
+        self.assertEqual(second["meta"]["db_stats"]["goals"]["delta_count"], 3)
+        self.assertEqual(
+            [it["title"] for it in second["payload"]["goals"]],
+            ["T2 edited", "T5", "T4"],
+        )
+        self.assertEqual(sec2["full_sweep_at"], sec["full_sweep_at"])
+
+    async def test_full_sweep_drops_deleted_pages(self) -> None:
+        first = await self._build()
+        del self.db.pages[3]  # page 4 archived
+
+        delta = await self._build(first["payload"])
+        self.assertIn("T4", [it["title"] for it in delta["payload"]["goals"]])
+
+        with patch.dict("os.environ", {"NOTION_SNAPSHOT_FULL_SWEEP_S": "0"}):
+            swept = await self._build(delta["payload"])
+        self.assertEqual(swept["payload"]["databases"]["goals"]["sync_mode"], "full")
+        self.assertEqual(
+            [it["title"] for it in swept["payload"]["goals"]], ["T3", "T2", "T1"]
+        )
+
+    async def test_default_mode_is_unchanged(self) -> None:
+        with patch.dict("os.environ", {"NOTION_SNAPSHOT_INCREMENTAL": ""}):
+            out = await self.svc.build_knowledge_snapshot(db_keys=["goals"])
+        self.assertNotIn("sorts", self.db.queries[0])
+        self.assertNotIn("sync_mode", out["payload"]["databases"]["goals"])
+        self.assertNotIn("sync_mode", out["meta"]["db_stats"]["goals"])
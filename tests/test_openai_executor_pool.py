@@ -0,0 +1,62 @@
+import pytest
+
+from services.agent_router import executor_factory
+from services.agent_router import openai_client_pool as pool
+
+
+@pytest.fixture(autouse=True)
+def _fake_pool(monkeypatch):
+    built = []
+
+    def _build_client(*, api_key, base_url, limits, http2, is_async=False):
+        client = type("FakeClient", (), {"api_key": api_key})()
+        built.append(client)
+        return client, None
+
+    monkeypatch.setattr(pool, "_build_client", _build_client)
+    monkeypatch.setattr(
+        pool, "get_openai_key_diag", lambda: {"fingerprint": "fp", "present": True}
+    )
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-live-1")
+    executor_factory.reset_executor_pool()
+    yield built
+    executor_factory.reset_executor_pool()
+
+
+def test_executors_are_reused_per_purpose_mode_and_model(monkeypatch, _fake_pool):
+    monkeypatch.setenv("OPENAI_API_MODE", "responses")
+    monkeypatch.setenv("OPENAI_RESPONSES_MODEL", "m1")
+
+    a = executor_factory.get_executor(purpose="ceo_advisor")
+    assert executor_factory.get_executor(purpose="ceo_advisor") is a
+    b = executor_factory.get_executor(purpose="ops_planner")
+    assert b is not a and b.client is a.client
+
+    monkeypatch.setenv("OPENAI_RESPONSES_MODEL", "m2")
+    assert executor_factory.get_executor(purpose="ceo_advisor") is not a
+
+    stats = executor_factory.executor_pool_stats()
+    assert stats["hits"] == 1 and stats["builds"] == 3
+    assert stats["client_pool"]["generation"] >= 1
+    assert len(_fake_pool) == 1
+
+
+def test_key_rotation_rebuilds_client_and_executors(monkeypatch, _fake_pool):
+    monkeypatch.setenv("OPENAI_API_MODE", "assistants")
+    a = executor_factory.get_executor(purpose="agent_router")
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-live-2")
+    b = executor_factory.get_executor(purpose="agent_router")
+
+    assert b is not a
+    assert b.client.api_key == "sk-live-2"
+    stats = executor_factory.executor_pool_stats()
+    assert stats["executors"] == ["agent_router:assistants:-"]
+    assert stats["client_pool"]["generation"] >= 2
+
+
+def test_missing_key_raises(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    with pytest.raises(RuntimeError, match="OPENAI_API_KEY is missing"):
+        executor_factory.get_executor(purpose="agent_router")
@@ -0,0 +1,166 @@
+import asyncio
+from types import SimpleNamespace as NS
+
+import pytest
+
+from services.agent_router.executor_errors import ExecutorToolCallAttempt
+from services.agent_router.openai_assistants_executor import OpenAIAssistantsExecutor
+from services.agent_router.openai_responses_executor import OpenAIResponsesExecutor
+from services.agent_router.openai_streaming import (
+    StreamMetrics,
+    consume_run_stream,
+    stream_metrics_stats,
+)
+
+
+class _Stream:
+    def __init__(self, events):
+        self._events = list(events)
+        self.closed = False
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for e in self._events:
+            yield e
+
+    async def close(self):
+        self.closed = True
+
+
+class _AsyncResponses:
+    def __init__(self, events):
+        self.stream = _Stream(events)
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.stream
+
+
+def test_responses_executor_streams_events_on_async_client():
+    final = NS(output_text='{"ok": true}', output=[])
+    responses = _AsyncResponses(
+        [
+            NS(type="response.created"),
+            NS(type="response.output_text.delta", delta='{"ok"'),
+            NS(type="response.completed", response=final),
+        ]
+    )
+    ex = OpenAIResponsesExecutor(client=NS(responses=responses))
+
+    out = asyncio.run(ex.execute({"input": "Q", "instructions": "Return JSON"}))
+
+    assert out == {"ok": True}
+    assert responses.calls[0]["stream"] is True
+    assert responses.calls[0]["tool_choice"] == "none"
+    assert responses.stream.closed
+    last = stream_metrics_stats()["responses"]["last"]
+    assert last["streamed"] is True and last["ttft_ms"] is not None
+
+
+class _AsyncThreads:
+    def __init__(self, run_events):
+        self.runs = NS(create=self._create_run, cancel=self._cancel)
+        self.messages = NS(create=self._create_msg, list=self._list)
+        self._run_events = run_events
+        self.cancelled = []
+
+    async def create(self):
+        return NS(id="th_1")
+
+    async def _create_msg(self, **kwargs):
+        return NS(id="msg_in")
+
+    async def _create_run(self, **kwargs):
+        assert kwargs["stream"] is True
+        return _Stream(self._run_events)
+
+    async def _cancel(self, **kwargs):
+        self.cancelled.append(kwargs["run_id"])
+
+    async def _list(self, **kwargs):
+        raise AssertionError("streamed runs must not re-list messages")
+
+
+def _assistants_executor(run_events):
+    threads = _AsyncThreads(run_events)
+    beta = NS(
+        threads=NS(create=threads.create, runs=threads.runs, messages=threads.messages)
+    )
+    return OpenAIAssistantsExecutor(client=NS(beta=beta)), threads
+
+
+def _text_message(value):
+    return NS(role="assistant", content=[NS(text=NS(value=value))])
+
+
+def test_assistants_executor_completes_on_terminal_event_without_polling():
+    ex, _ = _assistants_executor(
+        [
+            NS(event="thread.run.created", data=NS(id="run_1", status="queued")),
+            NS(event="thread.message.delta", data=NS()),
+            NS(event="thread.message.completed", data=_text_message('{"a": 1}')),
+            NS(event="thread.run.completed", data=NS(id="run_1", status="completed")),
+        ]
+    )
+
+    out = asyncio.run(ex.execute({"assistant_id": "asst_1", "content": "hi"}))
+    assert out == {"a": 1}
+
+
+def test_assistants_executor_stream_requires_action_is_cancelled_and_blocked():
+    ex, threads = _assistants_executor(
+        [
+            NS(event="thread.run.created", data=NS(id="run_9", status="queued")),
+            NS(
+                event="thread.run.requires_action",
+                data=NS(id="run_9", status="requires_action"),
+            ),
+        ]
+    )
+
+    with pytest.raises(ExecutorToolCallAttempt):
+        asyncio.run(ex.execute({"assistant_id": "asst_1", "content": "hi"}))
+    assert threads.cancelled == ["run_9"]
+
+
+def test_run_stream_step_events_do_not_overwrite_run_state():
+    stream = _Stream(
+        [
+            NS(event="thread.run.created", data=NS(id="run_3", status="queued")),
+            NS(
+                event="thread.run.in_progress",
+                data=NS(id="run_3", status="in_progress"),
+            ),
+            NS(
+                event="thread.run.step.created",
+                data=NS(id="step_1", status="in_progress"),
+            ),
+            NS(
+                event="thread.run.step.completed",
+                data=NS(id="step_1", status="completed"),
+            ),
+        ]
+    )
+
+    out = asyncio.run(
+        consume_run_stream(stream, metrics=StreamMetrics(kind="assistants"))
+    )
+    assert out.run_id == "run_3"
+    assert out.status == "in_progress"
+    assert out.run.id == "run_3"
+    assert stream.closed
+
+
+def test_json_text_field_decoder_streams_only_the_text_value():
+    import json
+
+    from services.agent_router.openai_streaming import JsonTextFieldDecoder
+
+    doc = json.dumps({"meta": {"text": "x"}, "text": 'A "b"\nč😀', "plan": []})
+    d = JsonTextFieldDecoder("text")
+    out = "".join(d.feed(doc[i : i + 3]) for i in range(0, len(doc), 3))
+    assert out == 'A "b"\nč😀'
+    assert d.done
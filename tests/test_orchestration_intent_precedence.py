@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+from unittest.mock import AsyncMock
 
 from models.agent_contract import AgentInput, AgentOutput
 from services.agent_registry_service import AgentRegistryService
@@ -141,7 +142,9 @@ def test_weekly_request_tasks_empty_uses_ceo_weekly_flow_no_growth_delegation(
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **kwargs: {"enabled": False}
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **kwargs: {"enabled": False}),
     )
 
     def _boom(*args, **kwargs):
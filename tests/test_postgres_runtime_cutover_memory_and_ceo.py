@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from typing import Any, Dict
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -79,7 +80,9 @@ def test_postgres_ceo_conversation_continuity_no_file_fallback(monkeypatch, tmp_
     from services.grounding_pack_service import GroundingPackService
 
     monkeypatch.setattr(
-        GroundingPackService, "build", lambda **_kwargs: _grounding_pack_full()
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **_kwargs: _grounding_pack_full()),
     )
 
     captured: Dict[str, Any] = {}
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+import services.prompt_features as pf_mod
+from services.prompt_features import (
+    analyze_prompt,
+    prompt_keywords,
+    prompt_pattern,
+    reset_prompt_features_cache,
+)
+
+
+def test_intent_predicates_match_legacy_on_test_suite_corpus():
+    # Golden: every predicate backed by PromptFeatures classifies every string
+    # literal of the test suite exactly like its pre-refactor implementation.
+    from tests.prompt_features_legacy import check_parity, suite_prompt_corpus
+
+    assert check_parity(suite_prompt_corpus()) == []
+
+
+def test_features_are_deduplicated_and_evaluated_once(monkeypatch):
+    reset_prompt_features_cache()
+    a = prompt_pattern(r"(?i)\b(cilj\w*|goal\w*)\b")
+    assert prompt_pattern(r"(?i)\b(cilj\w*|goal\w*)\b") is a
+    assert prompt_pattern(r"(?i)\b(cilj\w*|goal\w*)\b", view="bhs") is not a
+
+    pf = analyze_prompt("  Pokaži CILJEVE  ")
+    assert analyze_prompt("  Pokaži CILJEVE  ") is pf
+    assert pf.lower == "pokaži ciljeve" and pf.bhs == "pokazi ciljeve"
+
+    calls = []
+    test = a._test
+    monkeypatch.setattr(a, "_test", lambda t: calls.append(t) or test(t))
+    assert pf.has(a) and pf.has(a)
+    assert calls == ["pokaži ciljeve"]
+
+
+def test_pattern_lists_and_keywords_keep_original_semantics():
+    confirm = prompt_pattern([r"^da$", r"^ok$"], fullmatch=True)
+    assert analyze_prompt(" OK ").has(confirm)
+    assert not analyze_prompt("ok?").has(confirm)
+
+    mixed = prompt_pattern([r"(?i)\bSISTEM\b", r"\bgoals list\b"])
+    assert analyze_prompt("Status: SISTEM").has(mixed)
+    assert analyze_prompt("goals list").has(mixed)
+    assert not analyze_prompt("sistemski").has(mixed)
+
+    assert not analyze_prompt("bilo sta").has(prompt_pattern([]))
+    kw = prompt_keywords(("top 3", "kašn"))
+    assert analyze_prompt("Kašnjenje").has(kw)
+    assert not analyze_prompt("top3").has(kw)
+
+
+def test_non_string_prompts_behave_like_the_inline_checks():
+    feat = prompt_pattern(r"x")
+    assert analyze_prompt(None).lower == ""
+    assert not analyze_prompt(None).has(feat)
+    with pytest.raises(AttributeError):
+        analyze_prompt(5).has(feat)
+
+
+def test_prompt_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(pf_mod, "_CACHE_SIZE", 2)
+    reset_prompt_features_cache()
+    first = analyze_prompt("a")
+    analyze_prompt("b")
+    analyze_prompt("c")
+    assert len(pf_mod._CACHE) == 2
+    assert analyze_prompt("a") is not first
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+from services.response_contract_hook import (
+    ContractJSONResponse,
+    begin_chat_contract_turn,
+    current_chat_contract_turn,
+    end_chat_contract_turn,
+    note_chat_contract_request,
+)
+
+
+def _recording_enforcer(calls: List[Dict[str, Any]]):
+    def _enforce(*, body_obj, prompt, session_id, conversation_id):
+        calls.append(
+            {
+                "prompt": prompt,
+                "session_id": session_id,
+                "conversation_id": conversation_id,
+            }
+        )
+        out = dict(body_obj)
+        out["text"] = "SANITIZED"
+        return out
+
+    return _enforce
+
+
+def test_contract_response_is_noop_without_turn():
+    resp = ContractJSONResponse(content={"text": "Vrste pamćenja koje koristim"})
+    assert resp.contract_enforced is False
+    assert json.loads(resp.body)["text"] == "Vrste pamćenja koje koristim"
+
+
+def test_contract_response_sanitizes_before_first_encoding():
+    calls: List[Dict[str, Any]] = []
+    token = begin_chat_contract_turn(
+        enforce=_recording_enforcer(calls), session_id="hdr-session"
+    )
+    try:
+        note_chat_contract_request(prompt="Kakvu memoriju koristiš?", session_id="")
+        resp = ContractJSONResponse(content={"text": "raw", "read_only": True})
+        turn = current_chat_contract_turn()
+    finally:
+        end_chat_contract_turn(token)
+
+    assert resp.contract_enforced is True
+    assert turn is not None and turn["enforced"] is True
+    assert json.loads(resp.body) == {"text": "SANITIZED", "read_only": True}
+    # Header session id is kept when the body has none; conversation id
+    # defaults to the session id, as in the old middleware.
+    assert calls == [
+        {
+            "prompt": "Kakvu memoriju koristiš?",
+            "session_id": "hdr-session",
+            "conversation_id": "hdr-session",
+        }
+    ]
+    assert current_chat_contract_turn() is None
+
+
+def test_contract_response_skips_enforcer_without_text_but_marks_turn():
+    calls: List[Dict[str, Any]] = []
+    token = begin_chat_contract_turn(enforce=_recording_enforcer(calls))
+    try:
+        note_chat_contract_request(prompt="x", session_id="s1", conversation_id="c1")
+        resp = ContractJSONResponse(content={"error": "nope"}, status_code=400)
+    finally:
+        end_chat_contract_turn(token)
+
+    assert calls == []
+    assert resp.contract_enforced is True
+    assert json.loads(resp.body) == {"error": "nope"}
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+
+from services.session_snapshot_cache import SessionSnapshotCache
+
+
+def _set(cache: SessionSnapshotCache, sid: str, value, ttl: int = 60) -> None:
+    cache.set(session_id=sid, db_keys_csv="tasks", value=value, ttl_seconds=ttl)
+
+
+def _get(cache: SessionSnapshotCache, sid: str):
+    return cache.get(session_id=sid, db_keys_csv="tasks")
+
+
+def test_lru_bounds_entries_and_bytes():
+    cache = SessionSnapshotCache(max_entries=2, max_bytes=0, sweep_seconds=0)
+    _set(cache, "a", {"payload": {"tasks": [1]}})
+    _set(cache, "b", {"payload": {"tasks": [2]}})
+    assert _get(cache, "a") is not None  # "a" is now most recently used
+    _set(cache, "c", {"payload": {"tasks": [3]}})
+
+    assert _get(cache, "b") is None
+    assert _get(cache, "a") is not None and _get(cache, "c") is not None
+
+    small = {"payload": {"tasks": ["x" * 10]}}
+    sized = SessionSnapshotCache(max_entries=100, max_bytes=90, sweep_seconds=0)
+    for sid in ("s1", "s2", "s3"):
+        _set(sized, sid, small)
+    stats = sized.stats()
+    assert stats["entries"] == 2 and stats["bytes"] <= 90
+    assert stats["evicted"] == 1
+    assert _get(sized, "s1") is None
+
+
+def test_sweep_drops_expired_entries(monkeypatch):
+    import services.session_snapshot_cache as mod
+
+    now = [1000.0]
+    monkeypatch.setattr(mod.time, "monotonic", lambda: now[0])
+    cache = SessionSnapshotCache(sweep_seconds=0)
+    _set(cache, "old", {"payload": {}}, ttl=10)
+    _set(cache, "new", {"payload": {}}, ttl=100)
+
+    now[0] += 50
+    assert cache.sweep_expired() == 1
+    assert cache.stats()["entries"] == 1
+    assert _get(cache, "new") is not None
+
+
+def test_concurrent_misses_share_one_build():
+    cache = SessionSnapshotCache(sweep_seconds=0)
+    calls = []
+
+    async def build():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"payload": {"tasks": [1]}}
+
+    async def _run():
+        return await asyncio.gather(
+            *[
+                cache.get_or_build(
+                    session_id="s", db_keys_csv="tasks", build=build, ttl_seconds=60
+                )
+                for _ in range(5)
+            ]
+        )
+
+    results = asyncio.run(_run())
+
+    assert len(calls) == 1
+    assert [coalesced for _, coalesced in results].count(True) == 4
+    assert all(snap == {"payload": {"tasks": [1]}} for snap, _ in results)
+    assert _get(cache, "s") == {"payload": {"tasks": [1]}}
+    stats = cache.stats()
+    assert stats["builds"] == 1 and stats["coalesced"] == 4
+    assert stats["inflight"] == 0
+
+
+def test_failed_build_is_not_cached_and_reaches_waiters():
+    cache = SessionSnapshotCache(sweep_seconds=0)
+
+    async def build():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("notion down")
+
+    async def _run():
+        return await asyncio.gather(
+            *[
+                cache.get_or_build(
+                    session_id="s", db_keys_csv="tasks", build=build, ttl_seconds=60
+                )
+                for _ in range(3)
+            ],
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(_run())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert _get(cache, "s") is None
+    assert cache.stats()["inflight"] == 0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
 
 
 def _load_app():
@@ -29,7 +30,11 @@ def test_planning_discussion_first_does_not_return_ssot_snapshot_template(
 
     from services.grounding_pack_service import GroundingPackService
 
-    monkeypatch.setattr(GroundingPackService, "build", lambda **_k: {"enabled": False})
+    monkeypatch.setattr(
+        GroundingPackService,
+        "abuild",
+        AsyncMock(side_effect=lambda **_k: {"enabled": False}),
+    )
 
     from services.knowledge_snapshot_service import KnowledgeSnapshotService
 
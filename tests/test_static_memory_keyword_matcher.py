@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import difflib
+import random
+
+from services.decision_engine.keyword_matcher import KeywordAutomaton
+from services.decision_engine.static_memory_engine import StaticMemoryEngine
+
+
+def _legacy_evaluate(rules, text):
+    text_lower = text.lower()
+    triggered = []
+    total = {"alignment_bonus": 0, "trust_bonus": 0, "priority_bonus": 0}
+    for rule in rules:
+        impact = rule.get("impact", {})
+        for kw in rule.get("keywords", []):
+            t, k = text_lower.lower(), kw.lower()
+            if (
+                k in t
+                or all(tok in t for tok in k.split())
+                or difflib.SequenceMatcher(None, k, t).ratio() >= 0.75
+            ):
+                triggered.append(rule.get("id"))
+                for key in total:
+                    total[key] += impact.get(key, 0)
+                break
+    return {"rules_triggered": triggered, "impact": total}
+
+
+def test_automaton_finds_overlapping_patterns():
+    ac = KeywordAutomaton(["he", "she", "his", "hers", "", "x"])
+    found = {ac.patterns[i] for i in ac.find("ushers")}
+    assert found == {"he", "she", "hers", ""}
+    ac.add("us")
+    assert "us" in {ac.patterns[i] for i in ac.find("ushers")}
+
+
+def test_compiled_evaluate_matches_legacy():
+    rnd = random.Random(5)
+    words = ["q1", "kvartal", "ključni", "cilj", "HITNO", "asap", "šef", "plan", "sada"]
+    rules = [
+        {
+            "id": f"r{i}",
+            "keywords": [
+                " ".join(rnd.choices(words, k=rnd.randint(1, 3)))
+                for _ in range(rnd.randint(1, 3))
+            ],
+            "impact": {"alignment_bonus": 0.1, "trust_bonus": i, "priority_bonus": 1},
+        }
+        for i in range(40)
+    ]
+    rules.append({"id": "blank", "keywords": ["   "], "impact": {}})
+    engine = StaticMemoryEngine({"rules": rules})
+    prompts = ["", "Kvartl", "ključni Q1 cilj"] + [
+        " ".join(rnd.choices(words + ["ops", "tim"], k=rnd.randint(1, 30)))
+        for _ in range(80)
+    ]
+    for p in prompts:
+        assert engine.evaluate(p) == _legacy_evaluate(rules, p), p
+
+
+def test_rules_replacement_and_uncompilable_rules():
+    engine = StaticMemoryEngine({"rules": [{"id": "a", "keywords": ["hitno"]}]})
+    assert engine.evaluate("HITNO uradi")["rules_triggered"] == ["a"]
+
+    engine.rules = [{"id": "b", "keywords": ("strategija",)}]
+    assert engine.evaluate("strategija")["rules_triggered"] == ["b"]
+
+    # keywords kao string: stari put iterira znakove
+    engine.rules.append({"id": "c", "keywords": "zq"})
+    assert engine.evaluate("q")["rules_triggered"] == ["c"]
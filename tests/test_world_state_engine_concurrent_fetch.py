@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from services.notion_service import _NOTION_BUDGET_STATE, notion_budget_context
+from services.world_state_engine import WorldStateEngine
+
+
+def _page(pid: str) -> dict:
+    return {
+        "id": pid,
+        "last_edited_time": "2026-01-01T00:00:00.000Z",
+        "properties": {"Name": {"title": [{"plain_text": pid}]}},
+    }
+
+
+class _FakeNotion:
+    """Paginated query_database; each DB holds `rows[db_key]` pages."""
+
+    def __init__(self, rows, *, delay_s: float = 0.0) -> None:
+        self.rows = rows
+        self.delay_s = delay_s
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def query_database(self, *, db_key, query):
+        # Mirrors NotionService._safe_request budget accounting.
+        budget = _NOTION_BUDGET_STATE.get()
+        if budget is not None:
+            budget.check_and_consume_call()
+        self.queries.append((db_key, dict(query)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_s)
+        finally:
+            self.in_flight -= 1
+        start = int(query.get("start_cursor") or 0)
+        size = int(query["page_size"])
+        all_rows = [_page(f"{db_key}-{i}") for i in range(self.rows.get(db_key, 0))]
+        chunk = all_rows[start : start + size]
+        end = start + len(chunk)
+        has_more = end < len(all_rows)
+        return {
+            "results": chunk,
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None,
+        }
+
+    def client_stats(self):
+        return {}
+
+
+class TestWorldStateEngineConcurrentFetch(unittest.IsolatedAsyncioTestCase):
+    async def _build(self, notion):
+        with patch(
+            "services.world_state_engine.try_get_notion_service", return_value=notion
+        ):
+            return await WorldStateEngine().abuild_snapshot()
+
+    async def test_sources_are_fetched_concurrently(self) -> None:
+        notion = _FakeNotion({"goals": 1, "tasks": 1, "projects": 1}, delay_s=0.05)
+        snap = await self._build(notion)
+        self.assertTrue(snap["ready"])
+        self.assertEqual(notion.max_in_flight, 3)
+
+    async def test_paginates_with_cursor_and_capped_page_size(self) -> None:
+        notion = _FakeNotion({"goals": 2, "tasks": 250, "projects": 0})
+        snap = await self._build(notion)
+
+        task_queries = [q for k, q in notion.queries if k == "tasks"]
+        self.assertTrue(all(q["page_size"] <= 100 for _, q in notion.queries))
+        self.assertEqual([q.get("start_cursor") for q in task_queries], [None, "100"])
+
+        by_source = {t["source"]: t for t in snap["trace"]["sources_loaded"]}
+        self.assertEqual(by_source["TasksDB"]["rows_fetched"], 200)
+        self.assertTrue(by_source["TasksDB"]["truncated"])
+        self.assertEqual(by_source["TasksDB"]["requests"], 2)
+        self.assertEqual(by_source["GoalsDB"]["rows_fetched"], 2)
+        self.assertFalse(by_source["GoalsDB"]["truncated"])
+
+    async def test_shared_call_budget_keeps_partial_rows(self) -> None:
+        notion = _FakeNotion({"goals": 0, "tasks": 250, "projects": 0})
+        with patch.dict("os.environ", {"WORLD_STATE_NOTION_MAX_CALLS": "3"}):
+            with patch.dict("os.environ", {"WORLD_STATE_MAX_ROWS_PER_DB": "1000"}):
+                snap = await self._build(notion)
+
+        # goals + projects spend 2 calls; tasks gets 1 page before the budget trips.
+        self.assertEqual(len(notion.queries), 3)
+        by_source = {t["source"]: t for t in snap["trace"]["sources_loaded"]}
+        self.assertEqual(by_source["TasksDB"]["rows_fetched"], 100)
+        self.assertFalse(by_source["TasksDB"]["ok"])
+        self.assertIn("NotionBudgetExceeded", by_source["TasksDB"]["error"])
+
+    async def test_nested_budget_takes_the_tighter_caller_limits(self) -> None:
+        notion = _FakeNotion({"goals": 0, "tasks": 250, "projects": 0})
+        with patch.dict("os.environ", {"WORLD_STATE_MAX_ROWS_PER_DB": "1000"}):
+            async with notion_budget_context(max_calls=3, max_latency_ms=5000) as outer:
+                outer.calls = 1
+                snap = await self._build(notion)
+
+        # The caller has 2 calls left (< WORLD_STATE_NOTION_MAX_CALLS=12).
+        self.assertEqual(len(notion.queries), 2)
+        self.assertEqual(outer.calls, 3)
+        by_source = {t["source"]: t for t in snap["trace"]["sources_loaded"]}
+        self.assertFalse(by_source["TasksDB"]["ok"])
+        self.assertIn("NotionBudgetExceeded", by_source["TasksDB"]["error"])
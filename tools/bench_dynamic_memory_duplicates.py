@@ -0,0 +1,145 @@
+"""DynamicMemoryEngine duplicate-detection benchmark + parity check.
+
+Compares the legacy full scan (check_duplicates as it was before
+DuplicateTitleIndex: levenshtein_ratio against every stored title) with the
+indexed implementation on a synthetic task-title corpus, and reports
+per-query latency.
+
+Usage:
+  python tools/bench_dynamic_memory_duplicates.py [--titles 10000] [--queries 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+# Ensure repo root is on sys.path when running as a script.
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from services.decision_engine.dynamic_memory import DynamicMemoryEngine  # noqa: E402
+
+
+_WORDS = (
+    "pripremi posalji izvjestaj prodaja kvartal klijent ugovor sastanak plan "
+    "budzet marketing kampanja onboarding tim hiring ponuda faktura dobavljac "
+    "revizija strategija cilj kpi roadmap lansiranje proizvod podrska čišćenje "
+    "šef đak žurba analiza prezentacija"
+).split()
+
+
+def legacy_check_duplicates(
+    engine: DynamicMemoryEngine, title: str
+) -> List[Dict[str, Any]]:
+    """Full scan, verbatim from the pre-index check_duplicates."""
+    normalized_new = engine.normalize(title)
+
+    duplicates = []
+    for t in engine.memory["tasks"]:
+        ratio = engine.levenshtein_ratio(normalized_new, engine.normalize(t))
+        if ratio >= 0.75:  # fuzzy match threshold
+            duplicates.append({"task": t, "similarity": ratio})
+
+    return duplicates
+
+
+def _mutate(rnd: random.Random, title: str) -> str:
+    chars = list(title)
+    for _ in range(rnd.randint(0, 4)):
+        op = rnd.random()
+        pos = rnd.randrange(len(chars) + 1)
+        if op < 0.4 and chars:
+            chars[min(pos, len(chars) - 1)] = rnd.choice("abcdeikmnorsčšž ")
+        elif op < 0.7:
+            chars.insert(pos, rnd.choice("abcdeikmnorst "))
+        elif chars:
+            del chars[min(pos, len(chars) - 1)]
+    out = "".join(chars)
+    return out.upper() if rnd.random() < 0.1 else out
+
+
+def synthetic_titles(n: int, *, seed: int = 7) -> List[str]:
+    rnd = random.Random(seed)
+    out: List[str] = []
+    for i in range(n):
+        words = rnd.choices(_WORDS, k=rnd.randint(2, 6))
+        title = " ".join(words).capitalize()
+        if rnd.random() < 0.3:
+            title += f" Q{rnd.randint(1, 4)} {2020 + i % 7}"
+        out.append(title)
+    return out
+
+
+def synthetic_queries(titles: List[str], n: int, *, seed: int = 11) -> List[str]:
+    rnd = random.Random(seed)
+    out: List[str] = []
+    for _ in range(n):
+        if rnd.random() < 0.6:
+            out.append(_mutate(rnd, rnd.choice(titles)))
+        else:
+            out.append(" ".join(rnd.choices(_WORDS, k=rnd.randint(1, 6))))
+    return out
+
+
+def check_parity(titles: List[str], queries: List[str]) -> List[str]:
+    """Returns a list of mismatch descriptions (empty means identical results)."""
+    engine = DynamicMemoryEngine({"dynamic_memory": {"tasks": list(titles)}})
+    mismatches: List[str] = []
+    for q in queries:
+        a = legacy_check_duplicates(engine, q)
+        b = engine.check_duplicates(q)
+        if a != b:
+            mismatches.append(f"{q!r}: {len(a)} legacy vs {len(b)} indexed")
+    return mismatches
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--titles", type=int, default=10_000)
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+
+    titles = synthetic_titles(args.titles)
+    queries = synthetic_queries(titles, args.queries)
+    engine = DynamicMemoryEngine({"dynamic_memory": {"tasks": list(titles)}})
+
+    t0 = time.perf_counter()
+    engine.check_duplicates("")  # builds the index
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    # Legacy scan is O(titles * len^2) per query; time (and verify) a prefix.
+    legacy_queries = queries[: max(1, min(len(queries), 20))]
+    t0 = time.perf_counter()
+    legacy = [legacy_check_duplicates(engine, q) for q in legacy_queries]
+    legacy_ms = (time.perf_counter() - t0) * 1000.0 / len(legacy_queries)
+
+    t0 = time.perf_counter()
+    indexed = [engine.check_duplicates(q) for q in queries]
+    indexed_ms = (time.perf_counter() - t0) * 1000.0 / len(queries)
+
+    mismatches = [
+        f"{q!r}: {len(a)} legacy vs {len(b)} indexed"
+        for q, a, b in zip(legacy_queries, legacy, indexed)
+        if a != b
+    ]
+
+    print(f"titles={len(titles)} queries={len(queries)}")
+    print(f"index_build_ms={build_ms:.1f}")
+    print(f"legacy_ms_per_query={legacy_ms:.2f} (first {len(legacy_queries)} queries)")
+    print(f"indexed_ms_per_query={indexed_ms:.2f}")
+    print(f"speedup={legacy_ms / max(indexed_ms, 1e-9):.1f}x")
+    print(f"mismatches={len(mismatches)}")
+    for m in mismatches[:10]:
+        print("  " + m)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
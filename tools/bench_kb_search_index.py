@@ -0,0 +1,70 @@
+"""KB search index benchmark + ranking parity check.
+
+Times the legacy full-scan KB rankings (tests/kb_search_legacy.py, as they were
+before KBSearchIndex) against the indexed implementation on a synthetic corpus,
+and reports per-query latency plus ranking mismatches.
+
+Usage:
+  python tools/bench_kb_search_index.py [--entries 10000] [--queries 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+# Ensure repo root is on sys.path when running as a script.
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from services.kb_search_index import KBSearchIndex  # noqa: E402
+from tests.kb_search_legacy import (  # noqa: E402
+    check_parity,
+    legacy_notion_search,
+    synthetic_entries,
+    synthetic_queries,
+)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--entries", type=int, default=10_000)
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+
+    entries = synthetic_entries(args.entries)
+    queries = synthetic_queries(args.queries)
+
+    t0 = time.perf_counter()
+    index = KBSearchIndex(entries)
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    t0 = time.perf_counter()
+    for q, intent in queries:
+        legacy_notion_search(entries, q, top_k=12, intent=intent)
+    legacy_ms = (time.perf_counter() - t0) * 1000.0 / len(queries)
+
+    t0 = time.perf_counter()
+    for q, intent in queries:
+        index.search(q, top_k=12, intent=intent)
+    indexed_ms = (time.perf_counter() - t0) * 1000.0 / len(queries)
+
+    mismatches = check_parity(entries, queries)
+
+    print(f"entries={len(entries)} queries={len(queries)}")
+    print(f"index_build_ms={build_ms:.1f}")
+    print(f"legacy_search_ms_per_query={legacy_ms:.2f}")
+    print(f"indexed_search_ms_per_query={indexed_ms:.2f}")
+    print(f"speedup={legacy_ms / max(indexed_ms, 1e-9):.1f}x")
+    print(f"ranking_mismatches={len(mismatches)}")
+    for m in mismatches[:10]:
+        print("  " + m)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
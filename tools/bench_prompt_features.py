@@ -0,0 +1,75 @@
+"""Prompt-feature benchmark for intent predicates.
+
+Times the legacy intent/meta-question predicates (tests/prompt_features_legacy.py,
+as they were before services/prompt_features.py) against the current
+shared-analysis versions on the string corpus of the test suite, and reports
+per-turn latency plus any parity mismatches.
+
+Usage:
+  python tools/bench_prompt_features.py [--turns 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+
+# Ensure repo root is on sys.path when running as a script.
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from services.prompt_features import reset_prompt_features_cache  # noqa: E402
+from tests.prompt_features_legacy import (  # noqa: E402
+    _outcome,
+    check_parity,
+    predicate_pairs,
+    suite_prompt_corpus,
+)
+
+
+def _run_turns(
+    fns: List[Callable[[Any], Any]], prompts: List[Any], turns: int
+) -> float:
+    t0 = time.perf_counter()
+    for p in prompts:
+        reset_prompt_features_cache()
+        for _ in range(turns):
+            for fn in fns:
+                _outcome(fn, p)
+    return (time.perf_counter() - t0) * 1000.0 / max(1, len(prompts))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--turns",
+        type=int,
+        default=3,
+        help="times each predicate runs per prompt (chat turns call several twice)",
+    )
+    args = ap.parse_args()
+
+    prompts = suite_prompt_corpus()
+    pairs = predicate_pairs()
+
+    legacy_ms = _run_turns([p[1] for p in pairs], prompts, args.turns)
+    current_ms = _run_turns([p[2] for p in pairs], prompts, args.turns)
+    mismatches = check_parity(prompts)
+
+    print(f"prompts={len(prompts)} predicates={len(pairs)} turns={args.turns}")
+    print(f"legacy_ms_per_prompt={legacy_ms:.3f}")
+    print(f"shared_ms_per_prompt={current_ms:.3f}")
+    print(f"speedup={legacy_ms / max(current_ms, 1e-9):.1f}x")
+    print(f"mismatches={len(mismatches)}")
+    for m in mismatches[:10]:
+        print("  " + m)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,224 @@
+"""Chat response-contract middleware benchmark.
+
+Measures per-request overhead of the legacy `@app.middleware("http")` leak
+enforcer (BaseHTTPMiddleware: request body re-read, response drain, JSON
+decode + re-encode) against the pure-ASGI layering used by the gateway now
+(RequestTraceMiddleware / ResponseContractMiddleware shapes, inlined here so
+the gateway itself is not booted) with the route-level ContractJSONResponse
+hook. Requests are driven straight through the ASGI app (no HTTP client /
+socket) so only middleware cost is measured.
+
+Usage:
+  python tools/bench_response_contract_middleware.py [--requests 2000] [--text-kb 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+
+# Ensure repo root is on sys.path when running as a script.
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from starlette.datastructures import Headers, MutableHeaders  # noqa: E402
+
+from services.response_contract_hook import (  # noqa: E402
+    ContractJSONResponse,
+    begin_chat_contract_turn,
+    end_chat_contract_turn,
+    note_chat_contract_request,
+)
+
+
+def _enforce(*, body_obj: Dict[str, Any], **_kw: Any) -> Dict[str, Any]:
+    # Same shape as the gateway sanitizer's no-trigger path (shallow copy).
+    return dict(body_obj)
+
+
+def _payload(text_kb: int) -> Dict[str, Any]:
+    return {
+        "text": ("Plan za kvartal: fokus na prodaju i isporuku. " * 24)[:1024]
+        * text_kb,
+        "proposed_commands": [],
+        "agent_id": "ceo_advisor",
+        "read_only": True,
+        "trace": {"intent": "advisory", "kb_ids_used": [f"kb_{i}" for i in range(12)]},
+    }
+
+
+def _is_chat(path: str) -> bool:
+    return path.startswith("/api/chat") or path == "/chat" or path.startswith("/chat/")
+
+
+def build_legacy_app(content: Dict[str, Any]) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/chat")
+    async def chat(request: Request):
+        return JSONResponse(content=dict(content))
+
+    @app.post("/api/other")
+    async def other(request: Request):
+        return JSONResponse(content=dict(content))
+
+    @app.middleware("http")
+    async def request_trace_middleware(request: Request, call_next):
+        resp = await call_next(request)
+        resp.headers["X-Request-ID"] = "bench"
+        return resp
+
+    @app.middleware("http")
+    async def prevent_internal_text_leak_middleware(request: Request, call_next):
+        """Verbatim shape of the pre-ASGI gateway middleware."""
+        if (request.method or "").upper() != "POST" or not _is_chat(request.url.path):
+            return await call_next(request)
+        prompt = ""
+        try:
+            raw = await request.body()
+            if raw:
+                req_obj = json.loads(raw.decode("utf-8"))
+                if isinstance(req_obj, dict):
+                    prompt = str(req_obj.get("message") or "")
+        except Exception:
+            pass
+        resp = await call_next(request)
+        if "application/json" not in (resp.headers.get("content-type") or "").lower():
+            return resp
+        chunks: List[bytes] = []
+        async for chunk in resp.body_iterator:  # type: ignore[attr-defined]
+            chunks.append(bytes(chunk))
+        body_bytes = b"".join(chunks)
+        rebuilt = Response(content=body_bytes, status_code=resp.status_code)
+        for k, v in resp.headers.items():
+            if k.lower() != "content-length":
+                rebuilt.headers[k] = v
+        body_obj = json.loads(body_bytes.decode("utf-8"))
+        enforced = _enforce(body_obj=body_obj, prompt=prompt)
+        new_resp = JSONResponse(content=enforced, status_code=rebuilt.status_code)
+        for k, v in rebuilt.headers.items():
+            if k.lower() != "content-length":
+                new_resp.headers[k] = v
+        return new_resp
+
+    return app
+
+
+def build_asgi_app(content: Dict[str, Any]) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/chat")
+    async def chat(request: Request):
+        note_chat_contract_request(prompt="bench")
+        return ContractJSONResponse(content=dict(content))
+
+    @app.post("/api/other")
+    async def other(request: Request):
+        return JSONResponse(content=dict(content))
+
+    class _Trace:
+        def __init__(self, app: Any) -> None:
+            self.app = app
+
+        async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+            async def _send(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message)["X-Request-ID"] = "bench"
+                await send(message)
+
+            await self.app(scope, receive, _send)
+
+    class _Contract:
+        def __init__(self, app: Any) -> None:
+            self.app = app
+
+        async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+            if scope.get("method") != "POST" or not _is_chat(scope.get("path") or ""):
+                await self.app(scope, receive, send)
+                return
+            sid = Headers(scope=scope).get("x-session-id") or ""
+            token = begin_chat_contract_turn(enforce=_enforce, session_id=sid)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                end_chat_contract_turn(token)
+
+    app.add_middleware(_Trace)
+    app.add_middleware(_Contract)
+    return app
+
+
+async def _drive(app: Any, path: str, body: bytes, n: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+
+    async def _receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def _send(_message: Dict[str, Any]) -> None:
+        return None
+
+    for _ in range(min(50, n)):
+        await app(dict(scope), _receive, _send)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        await app(dict(scope), _receive, _send)
+    return (time.perf_counter() - t0) * 1_000_000.0 / n
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--text-kb", type=int, default=4)
+    args = ap.parse_args()
+
+    content = _payload(args.text_kb)
+    req = json.dumps({"message": "Šta je plan za kvartal?"}).encode("utf-8")
+    builders: Dict[str, Callable[[Dict[str, Any]], FastAPI]] = {
+        "legacy": build_legacy_app,
+        "asgi": build_asgi_app,
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, build in builders.items():
+        app = build(content)
+        results[name] = {
+            path: asyncio.run(_drive(app, path, req, args.requests))
+            for path in ("/api/chat", "/api/other")
+        }
+
+    print(f"requests={args.requests} response_bytes={len(json.dumps(content))}")
+    for name, r in results.items():
+        print(
+            f"{name}: chat_us_per_req={r['/api/chat']:.1f} "
+            f"non_chat_us_per_req={r['/api/other']:.1f}"
+        )
+    for path in ("/api/chat", "/api/other"):
+        saved = results["legacy"][path] - results["asgi"][path]
+        print(f"saved_us_per_req[{path}]={saved:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
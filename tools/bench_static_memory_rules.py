@@ -0,0 +1,155 @@
+"""StaticMemoryEngine rule-matching benchmark + parity check.
+
+Compares the legacy per-keyword evaluate (substring, token and difflib checks
+for every rule/keyword pair, as it was before the compiled KeywordAutomaton)
+with the compiled implementation on a synthetic rule set, and reports
+per-prompt latency.
+
+Usage:
+  python tools/bench_static_memory_rules.py [--rules 300] [--prompts 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+# Ensure repo root is on sys.path when running as a script.
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from services.decision_engine.static_memory_engine import (  # noqa: E402
+    StaticMemoryEngine,
+)
+
+
+_WORDS = (
+    "q1 kvartal quarter strategija strategic ključni cilj odmah hitno asap sada "
+    "prodaja budžet rizik tim prihod marketing klijent ugovor plan odluka "
+    "sastanak izvještaj kpi okr roadmap pipeline lead konverzija churn "
+    "onboarding sop proces isporuka dobavljač cijena marža hiring šef đak "
+    "žurba growth revenue ops finance legal"
+).split()
+
+
+def _legacy_fuzzy_match(text: str, keyword: str) -> bool:
+    t = text.lower()
+    kw = keyword.lower()
+
+    if kw in t:
+        return True
+
+    kw_tokens = kw.split()
+    if all(token in t for token in kw_tokens):
+        return True
+
+    ratio = difflib.SequenceMatcher(None, kw, t).ratio()
+    if ratio >= 0.75:
+        return True
+
+    return False
+
+
+def legacy_evaluate(rules: List[Dict[str, Any]], text: str) -> Dict[str, Any]:
+    """Verbatim from the pre-compiler StaticMemoryEngine.evaluate."""
+    text_lower = text.lower()
+
+    triggered = []
+    total_impact = {"alignment_bonus": 0, "trust_bonus": 0, "priority_bonus": 0}
+
+    for rule in rules:
+        rule_id = rule.get("id")
+        keywords = rule.get("keywords", [])
+        impact = rule.get("impact", {})
+
+        for kw in keywords:
+            if _legacy_fuzzy_match(text_lower, kw):
+                triggered.append(rule_id)
+
+                total_impact["alignment_bonus"] += impact.get("alignment_bonus", 0)
+                total_impact["trust_bonus"] += impact.get("trust_bonus", 0)
+                total_impact["priority_bonus"] += impact.get("priority_bonus", 0)
+
+                break  # one rule triggered once
+
+    return {"rules_triggered": triggered, "impact": total_impact}
+
+
+def synthetic_rules(n: int, *, seed: int = 7) -> List[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    out: List[Dict[str, Any]] = []
+    for i in range(n):
+        keywords = [
+            " ".join(rnd.choices(_WORDS, k=rnd.randint(1, 3)))
+            for _ in range(rnd.randint(1, 5))
+        ]
+        out.append(
+            {
+                "id": f"rule_{i:04d}",
+                "keywords": keywords,
+                "impact": {
+                    "alignment_bonus": round(rnd.random() / 5, 2),
+                    "trust_bonus": round(rnd.random() / 5, 2),
+                    "priority_bonus": round(rnd.random() / 5, 2),
+                },
+            }
+        )
+    return out
+
+
+def synthetic_prompts(n: int, *, seed: int = 11) -> List[str]:
+    rnd = random.Random(seed)
+    out: List[str] = []
+    for _ in range(n):
+        k = rnd.choice((1, 2, 3, 8, 40, 150, 400))
+        out.append(" ".join(rnd.choices(_WORDS, k=k)).capitalize())
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rules", type=int, default=300)
+    ap.add_argument("--prompts", type=int, default=200)
+    args = ap.parse_args()
+
+    rules = synthetic_rules(args.rules)
+    prompts = synthetic_prompts(args.prompts)
+
+    t0 = time.perf_counter()
+    engine = StaticMemoryEngine({"rules": rules})
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    t0 = time.perf_counter()
+    legacy = [legacy_evaluate(rules, p) for p in prompts]
+    legacy_ms = (time.perf_counter() - t0) * 1000.0 / len(prompts)
+
+    t0 = time.perf_counter()
+    compiled = [engine.evaluate(p) for p in prompts]
+    compiled_ms = (time.perf_counter() - t0) * 1000.0 / len(prompts)
+
+    mismatches = [
+        f"{p[:60]!r}: {a['rules_triggered']} != {b['rules_triggered']}"
+        for p, a, b in zip(prompts, legacy, compiled)
+        if a != b
+    ]
+
+    print(f"rules={len(rules)} prompts={len(prompts)}")
+    print(f"compile_ms={build_ms:.1f}")
+    print(f"legacy_ms_per_prompt={legacy_ms:.2f}")
+    print(f"compiled_ms_per_prompt={compiled_ms:.2f}")
+    print(f"speedup={legacy_ms / max(compiled_ms, 1e-9):.1f}x")
+    print(f"mismatches={len(mismatches)}")
+    for m in mismatches[:10]:
+        print("  " + m)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())